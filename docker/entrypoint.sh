@@ -58,6 +58,9 @@ run_as_app_user "python manage.py collectstatic --noinput --clear"
 echo "Applying database migrations..."
 run_as_app_user "python manage.py migrate --noinput"
 
+# Fill full-text search vectors for rows created before they were stored
+run_as_app_user "python manage.py backfill_search_vectors"
+
 # Create superuser if env vars are set (idempotent: skip if exists)
 if [ ! -z "$DJANGO_SUPERUSER_USERNAME" ] && [ ! -z "$DJANGO_SUPERUSER_PASSWORD" ]; then
     echo "Checking/creating superuser..."
@@ -16,7 +16,7 @@ from nova.models.MemoryDirectory import MemoryDirectory
 from nova.models.MemoryDocument import MemoryDocument
 from nova.models.Message import Message
 from nova.models.Provider import LLMProvider
-from nova.models.Task import Task
+from nova.models.Task import Task, TaskProgressEntry
 from nova.models.TaskDefinition import TaskDefinition
 from nova.models.Thread import Thread
 from nova.models.TerminalCommandFailureMetric import TerminalCommandFailureMetric
@@ -26,6 +26,7 @@ from nova.models.UserFile import UserFile
 from nova.models.UserObjects import UserParameters, UserProfile
 from nova.models.WebApp import WebApp
 from nova.models.OIDCIdentity import OIDCIdentity, OIDCIdentityLinkAudit
+from nova.storage_deletion import defer_storage_deletion
 
 
 admin.site.site_header = "Nova Admin"
@@ -293,12 +294,21 @@ class APIToolOperationAdmin(admin.ModelAdmin):
     search_fields = ("tool__name", "name", "slug", "path_template", "description")
 
 
+class TaskProgressEntryInline(admin.TabularInline):
+    model = TaskProgressEntry
+    fields = ("created_at", "severity", "category", "step")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ("id", "user", "thread", "agent_config", "status", "created_at")
     list_filter = ("status", "created_at")
     search_fields = ("user__username", "thread__subject", "agent_config__name")
     ordering = ("-created_at",)
+    inlines = [TaskProgressEntryInline]
 
 
 class UserParametersInline(admin.StackedInline):
@@ -316,6 +326,16 @@ class UserProfileInline(admin.StackedInline):
 class UserAdmin(BaseUserAdmin):
     inlines = [UserParametersInline, UserProfileInline]
 
+    # Deleting a user cascades to all of their files: collect the storage
+    # keys and remove them in bulk once the deletion has committed.
+    def delete_model(self, request, obj):
+        with defer_storage_deletion():
+            super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        with defer_storage_deletion():
+            super().delete_queryset(request, queryset)
+
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
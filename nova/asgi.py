@@ -7,6 +7,7 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
 
+import atexit
 import importlib
 import os
 
@@ -23,6 +24,11 @@ django_asgi_app = get_asgi_application()
 
 # Load routing after Django initialization so consumers can import models safely.
 routing = importlib.import_module("nova.routing")
+storage_clients = importlib.import_module("nova.storage_clients")
+
+# Daphne does not speak the ASGI lifespan protocol, so release pooled storage
+# connections when the server process exits.
+atexit.register(storage_clients.close_s3_clients)
 
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
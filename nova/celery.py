@@ -18,3 +18,10 @@ def close_connections_before_task(**kwargs):
 @signals.task_postrun.connect
 def close_connections_after_task(**kwargs):
     close_old_connections()
+
+
+@signals.worker_process_shutdown.connect
+def close_storage_clients_on_shutdown(**kwargs):
+    from nova.storage_clients import close_s3_clients
+
+    close_s3_clients()
@@ -5,15 +5,23 @@ from __future__ import annotations
 import datetime as dt
 import hashlib
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, List, Optional, Tuple
 
+from django.core.cache import cache
+from django.db.models import Count, Max
 from django.utils import timezone
 
 from nova.continuous.utils import get_day_label_for_user
+from nova.llm.tokenizer import count_tokens
 from nova.models.DaySegment import DaySegment
 from nova.models.Message import Actor, Message, MessageType
 
+# Cached context state is also invalidated by Message/DaySegment signals; the
+# timeout only bounds how long an orphaned entry can linger.
+CONTINUOUS_CONTEXT_CACHE_TIMEOUT = 60 * 60
+PREVIOUS_SUMMARIES_TOKEN_BUDGET = 4000
+
 
 @dataclass(frozen=True)
 class ContinuousContextSnapshot:
@@ -87,8 +95,7 @@ def _approx_tokens(text: str) -> int:
     s = (text or "").strip()
     if not s:
         return 0
-    # Conservative/cheap estimate.
-    return max(1, len(s) // 4)
+    return max(1, count_tokens(s))
 
 
 def _trim_to_token_budget(text: str, budget_tokens: int) -> tuple[str, bool, int]:
@@ -205,26 +212,46 @@ def get_live_continuous_message_ids(
     )
 
 
-def load_continuous_context(
-    user,
-    thread,
-    *,
-    exclude_message_id: Optional[int] = None,
-    exclude_interaction_ids: Optional[set[int]] = None,
-) -> Tuple[ContinuousContextSnapshot, List[dict[str, Any]]]:
-    """Build the messages to inject for the continuous context window.
+def _continuous_context_cache_key(thread_id: int) -> str:
+    return f"nova:continuous_context:{thread_id}"
 
-    Policy:
-    - Previous two *available* summarized days (before today) as System messages.
-    - Strict combined token budget for these summaries.
-    - If truncated by budget, include explicit fallback guidance toward
-      conversation_search / conversation_get.
-    - Today raw window: messages between today's DaySegment start and next DaySegment start.
 
-    Returns (snapshot, messages)
+def invalidate_continuous_context_cache(*, thread_id: int | None) -> None:
+    """Drop the cached continuous context of `thread_id`."""
+
+    if thread_id:
+        cache.delete(_continuous_context_cache_key(thread_id))
+
+
+def _continuous_context_state_fingerprint(user, thread, today: dt.date) -> str:
+    """Cheap fingerprint of everything the cached context state depends on.
+
+    Guards against writes that bypass model signals (e.g. `QuerySet.update`).
+    """
+
+    seg_stats = DaySegment.objects.filter(user=user, thread=thread).aggregate(
+        count=Count("id"),
+        last_updated_at=Max("updated_at"),
+    )
+    last_message_id = Message.objects.filter(user=user, thread=thread).aggregate(last_id=Max("id"))["last_id"]
+    last_updated_at = seg_stats["last_updated_at"]
+    raw = "|".join(
+        [
+            f"today={today.isoformat()}",
+            f"segments={seg_stats['count']}",
+            f"segments_updated_at={last_updated_at.isoformat() if last_updated_at else ''}",
+            f"last_message_id={last_message_id or ''}",
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _build_continuous_context_state(user, thread, today: dt.date) -> dict[str, Any]:
+    """Assemble the summary block and live messages of the continuous window.
+
+    The state is independent of per-turn exclusions so it can be cached.
     """
 
-    today = get_day_label_for_user(user)
     previous_summary_segments = list(
         DaySegment.objects.filter(
             user=user,
@@ -258,8 +285,6 @@ def load_continuous_context(
             today_end_dt = next_seg.starts_at_message.created_at
 
     # Build summary messages for previous days with strict budget.
-    PREVIOUS_SUMMARIES_TOKEN_BUDGET = 4000
-
     p1_summary_raw = (p1_seg.summary_markdown if p1_seg else "") or ""
     p2_summary_raw = (p2_seg.summary_markdown if p2_seg else "") or ""
     p1_label = f"Summary of {p1_seg.day_label.isoformat()}" if p1_seg else ""
@@ -274,13 +299,13 @@ def load_continuous_context(
 
     previous_summaries_truncated = p1_truncated or p2_truncated
 
-    out: List[dict[str, Any]] = []
+    summary_messages: List[dict[str, Any]] = []
     if p1_summary:
-        out.extend(_make_summary_system_message(p1_label, p1_summary))
+        summary_messages.extend(_make_summary_system_message(p1_label, p1_summary))
     if p2_summary:
-        out.extend(_make_summary_system_message(p2_label, p2_summary))
+        summary_messages.extend(_make_summary_system_message(p2_label, p2_summary))
     if previous_summaries_truncated:
-        out.append(
+        summary_messages.append(
             {
                 "role": "system",
                 "content": (
@@ -293,8 +318,6 @@ def load_continuous_context(
             }
         )
 
-    today_last_message_id: Optional[int] = None
-
     # If we have a summary for today and it defines a boundary, inject the
     # summary and include only messages AFTER the summary boundary.
     #
@@ -304,25 +327,26 @@ def load_continuous_context(
         today_summary_raw = (t_seg.summary_markdown or "").strip()
         if today_summary_raw and t_seg.summary_until_message_id:
             today_summary_until_message_id = t_seg.summary_until_message_id
-            out.extend(
+            summary_messages.extend(
                 _make_summary_system_message(
                     f"Summary of {today.isoformat()}",
                     today_summary_raw,
                 )
             )
 
+    # Live messages keep the fields needed to apply per-turn exclusions later.
+    live_messages: List[dict[str, Any]] = []
     if today_start_dt:
-        live_message_ids = get_live_continuous_message_ids(
-            user,
-            thread,
-            exclude_message_id=exclude_message_id,
-            exclude_interaction_ids=exclude_interaction_ids,
-        )
+        live_message_ids = get_live_continuous_message_ids(user, thread)
         for m in Message.objects.filter(id__in=live_message_ids).order_by("created_at", "id"):
-            msg = _message_to_runtime_message(m)
-            if msg is not None:
-                out.append(msg)
-            today_last_message_id = m.id
+            live_messages.append(
+                {
+                    "id": m.id,
+                    "message_type": m.message_type,
+                    "interaction_id": m.interaction_id,
+                    "message": _message_to_runtime_message(m),
+                }
+            )
 
     snapshot = ContinuousContextSnapshot(
         today=today,
@@ -338,6 +362,60 @@ def load_continuous_context(
         today_start_dt=today_start_dt,
         today_end_dt=today_end_dt,
         today_summary_until_message_id=today_summary_until_message_id,
-        today_last_message_id=today_last_message_id,
+        today_last_message_id=None,
     )
+    return {
+        "snapshot": snapshot,
+        "summary_messages": summary_messages,
+        "live_messages": live_messages,
+    }
+
+
+def load_continuous_context(
+    user,
+    thread,
+    *,
+    exclude_message_id: Optional[int] = None,
+    exclude_interaction_ids: Optional[set[int]] = None,
+) -> Tuple[ContinuousContextSnapshot, List[dict[str, Any]]]:
+    """Build the messages to inject for the continuous context window.
+
+    Policy:
+    - Previous two *available* summarized days (before today) as System messages.
+    - Strict combined token budget for these summaries.
+    - If truncated by budget, include explicit fallback guidance toward
+      conversation_search / conversation_get.
+    - Today raw window: messages between today's DaySegment start and next DaySegment start.
+
+    The assembled window is cached per thread and reused while its
+    fingerprint (today, segment updates, last message) is unchanged.
+
+    Returns (snapshot, messages)
+    """
+
+    today = get_day_label_for_user(user)
+    fingerprint = _continuous_context_state_fingerprint(user, thread, today)
+    cache_key = _continuous_context_cache_key(thread.id)
+    state = cache.get(cache_key)
+    if not state or state.get("fingerprint") != fingerprint:
+        state = _build_continuous_context_state(user, thread, today)
+        state["fingerprint"] = fingerprint
+        cache.set(cache_key, state, timeout=CONTINUOUS_CONTEXT_CACHE_TIMEOUT)
+
+    out: List[dict[str, Any]] = list(state["summary_messages"])
+    today_last_message_id: Optional[int] = None
+    for entry in state["live_messages"]:
+        if exclude_message_id and entry["id"] == exclude_message_id:
+            continue
+        if (
+            exclude_interaction_ids
+            and entry["message_type"] == MessageType.INTERACTION_ANSWER
+            and entry["interaction_id"] in exclude_interaction_ids
+        ):
+            continue
+        if entry["message"] is not None:
+            out.append(entry["message"])
+        today_last_message_id = entry["id"]
+
+    snapshot = replace(state["snapshot"], today_last_message_id=today_last_message_id)
     return snapshot, out
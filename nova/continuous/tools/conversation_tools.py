@@ -24,6 +24,7 @@ from django.db.models import F
 from django.utils import timezone
 
 from nova.llm.hybrid_search import (
+    ann_search,
     blend_semantic_fts,
     minmax_bounds,
     minmax_normalize,
@@ -31,6 +32,7 @@ from nova.llm.hybrid_search import (
     score_fts_saturated,
     semantic_similarity_from_distance,
 )
+from nova.llm.vector_index import semantic_candidates
 from nova.models.DaySegment import DaySegment
 from nova.models.Message import Message
 from nova.models.Thread import Thread
@@ -338,28 +340,113 @@ async def conversation_search(
             # Chunk cutoff by day_segment.day_label for the same recency window.
             chunk_qs = chunk_qs.filter(day_segment__day_label__gte=cutoff)
 
+        def _rank_hits(seg_hits: list, chunk_hits: list) -> Dict[str, Any]:
+            """Score candidates annotated with `fts_rank`, `distance` and `headline`."""
+            scored: List[Dict[str, Any]] = []
+
+            def _semantic_sim(distance: Optional[float]) -> float:
+                return semantic_similarity_from_distance(distance, enabled=(vec is not None))
+
+            semantic_vals = [
+                _semantic_sim(getattr(seg, "distance", None)) for seg in seg_hits
+            ] + [
+                _semantic_sim(getattr(ch, "distance", None)) for ch in chunk_hits
+            ]
+            sem_min, sem_max = minmax_bounds(semantic_vals)
+
+            for seg in seg_hits:
+                fts_raw = float(getattr(seg, "fts_rank", 0.0) or 0.0)
+                fts_sat = score_fts_saturated(fts_raw)
+                sem_norm = minmax_normalize(
+                    _semantic_sim(getattr(seg, "distance", None)),
+                    vmin=sem_min,
+                    vmax=sem_max,
+                )
+                blended = blend_semantic_fts(semantic=sem_norm, fts=fts_sat) if vec is not None else fts_sat
+                score = 1.0 * _recency_multiplier(seg.updated_at) * blended
+                scored.append(
+                    {
+                        "kind": "summary",
+                        "score": score,
+                        "day_label": seg.day_label.isoformat() if seg.day_label else None,
+                        "day_segment_id": seg.id,
+                        "summary_snippet": _focused_snippet(
+                            text=seg.summary_markdown or "",
+                            query=query,
+                            headline=getattr(seg, "headline", None) if fts_raw > 0 else None,
+                            max_len=240,
+                        ),
+                    }
+                )
+
+            for ch in chunk_hits:
+                fts_raw = float(getattr(ch, "fts_rank", 0.0) or 0.0)
+                fts_sat = score_fts_saturated(fts_raw)
+                sem_norm = minmax_normalize(
+                    _semantic_sim(getattr(ch, "distance", None)),
+                    vmin=sem_min,
+                    vmax=sem_max,
+                )
+                blended = blend_semantic_fts(semantic=sem_norm, fts=fts_sat) if vec is not None else fts_sat
+                score = 0.92 * _recency_multiplier(ch.created_at) * blended
+                day_label = None
+                if ch.day_segment and ch.day_segment.day_label:
+                    day_label = ch.day_segment.day_label.isoformat()
+                scored.append(
+                    {
+                        "kind": "message",
+                        "score": score,
+                        "day_label": day_label,
+                        "day_segment_id": ch.day_segment_id,
+                        "message_id": ch.start_message_id,
+                        "snippet": _focused_snippet(
+                            text=ch.content_text or "",
+                            query=query,
+                            headline=getattr(ch, "headline", None) if fts_raw > 0 else None,
+                            max_len=240,
+                        ),
+                    }
+                )
+
+            scored.sort(
+                key=lambda r: (
+                    -float(r.get("score", 0.0) or 0.0),
+                    r.get("day_label") or "",
+                    r.get("day_segment_id") or 0,
+                )
+            )
+            page = scored[offset: offset + limit]
+            return {
+                "results": page,
+                "notes": [
+                    "semantic ranking enabled only when embeddings provider is configured and vectors are ready",
+                ],
+            }
+
         engine = connection.vendor
         results: List[Dict[str, Any]] = []
 
         if engine == "postgresql":
-            from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+            from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
             from pgvector.django import CosineDistance
 
-            q = SearchQuery(query)
-            vector_summary = SearchVector("summary_markdown", config="english")
-            vector_chunk = SearchVector("content_text", config="english")
+            q = SearchQuery(query, config="english")
+            vector_summary = F("search_vector")
+            vector_chunk = F("search_vector")
 
             # 1) candidate retrieval
             K = 200
 
             seg_fts_ids = list(
-                seg_qs.annotate(rank=SearchRank(vector_summary, q))
+                seg_qs.filter(search_vector=q)
+                .annotate(rank=SearchRank(vector_summary, q))
                 .filter(rank__gt=0.0)
                 .order_by(F("rank").desc(), F("day_label").desc())
                 .values_list("id", flat=True)[:K]
             )
             chunk_fts_ids = list(
-                chunk_qs.annotate(rank=SearchRank(vector_chunk, q))
+                chunk_qs.filter(search_vector=q)
+                .annotate(rank=SearchRank(vector_chunk, q))
                 .filter(rank__gt=0.0)
                 .order_by(F("rank").desc(), F("start_message_id").desc())
                 .values_list("id", flat=True)[:K]
@@ -368,18 +455,19 @@ async def conversation_search(
             seg_sem_ids: List[int] = []
             chunk_sem_ids: List[int] = []
             if vec is not None:
-                seg_sem_ids = list(
-                    seg_qs.filter(embedding__state="ready")
-                    .annotate(distance=CosineDistance("embedding__vector", vec))
-                    .order_by(F("distance").asc(), F("updated_at").desc())
-                    .values_list("id", flat=True)[:K]
-                )
-                chunk_sem_ids = list(
-                    chunk_qs.filter(embedding__state="ready")
-                    .annotate(distance=CosineDistance("embedding__vector", vec))
-                    .order_by(F("distance").asc(), F("created_at").desc())
-                    .values_list("id", flat=True)[:K]
-                )
+                with ann_search(candidate_limit=K):
+                    seg_sem_ids = list(
+                        seg_qs.filter(embedding__state="ready")
+                        .annotate(distance=CosineDistance("embedding__vector", vec))
+                        .order_by(F("distance").asc(), F("updated_at").desc())
+                        .values_list("id", flat=True)[:K]
+                    )
+                    chunk_sem_ids = list(
+                        chunk_qs.filter(embedding__state="ready")
+                        .annotate(distance=CosineDistance("embedding__vector", vec))
+                        .order_by(F("distance").asc(), F("created_at").desc())
+                        .values_list("id", flat=True)[:K]
+                    )
 
             seg_ids = list(dict.fromkeys([*seg_sem_ids, *seg_fts_ids]))
             chunk_ids = list(dict.fromkeys([*chunk_sem_ids, *chunk_fts_ids]))
@@ -434,88 +522,54 @@ async def conversation_search(
             seg_hits = list(seg_candidates)
             chunk_hits = list(chunk_candidates)
 
-            scored: List[Dict[str, Any]] = []
-
-            def _semantic_sim(distance: Optional[float]) -> float:
-                return semantic_similarity_from_distance(distance, enabled=(vec is not None))
-
-            semantic_vals = [
-                _semantic_sim(getattr(seg, "distance", None)) for seg in seg_hits
-            ] + [
-                _semantic_sim(getattr(ch, "distance", None)) for ch in chunk_hits
-            ]
-            sem_min, sem_max = minmax_bounds(semantic_vals)
-
-            for seg in seg_hits:
-                fts_raw = float(getattr(seg, "fts_rank", 0.0) or 0.0)
-                fts_sat = score_fts_saturated(fts_raw)
-                sem_norm = minmax_normalize(
-                    _semantic_sim(getattr(seg, "distance", None)),
-                    vmin=sem_min,
-                    vmax=sem_max,
-                )
-                blended = blend_semantic_fts(semantic=sem_norm, fts=fts_sat) if vec is not None else fts_sat
-                score = 1.0 * _recency_multiplier(seg.updated_at) * blended
-                scored.append(
-                    {
-                        "kind": "summary",
-                        "score": score,
-                        "day_label": seg.day_label.isoformat() if seg.day_label else None,
-                        "day_segment_id": seg.id,
-                        "summary_snippet": _focused_snippet(
-                            text=seg.summary_markdown or "",
-                            query=query,
-                            headline=getattr(seg, "headline", None) if fts_raw > 0 else None,
-                            max_len=240,
-                        ),
-                    }
-                )
-
-            for ch in chunk_hits:
-                fts_raw = float(getattr(ch, "fts_rank", 0.0) or 0.0)
-                fts_sat = score_fts_saturated(fts_raw)
-                sem_norm = minmax_normalize(
-                    _semantic_sim(getattr(ch, "distance", None)),
-                    vmin=sem_min,
-                    vmax=sem_max,
+            return _rank_hits(seg_hits, chunk_hits)
+
+        # Other backends: semantic candidates come from the in-process vector
+        # index, with substring matches standing in for the FTS rank.
+        seg_distances: Dict[int, float] = {}
+        chunk_distances: Dict[int, float] = {}
+        if vec is not None:
+            seg_distances = dict(
+                semantic_candidates(
+                    user_id=agent.user.id,
+                    kind="day_segment",
+                    vector=vec,
+                    limit=200,
+                    allowed_ids=seg_qs.values_list("id", flat=True),
                 )
-                blended = blend_semantic_fts(semantic=sem_norm, fts=fts_sat) if vec is not None else fts_sat
-                score = 0.92 * _recency_multiplier(ch.created_at) * blended
-                day_label = None
-                if ch.day_segment and ch.day_segment.day_label:
-                    day_label = ch.day_segment.day_label.isoformat()
-                scored.append(
-                    {
-                        "kind": "message",
-                        "score": score,
-                        "day_label": day_label,
-                        "day_segment_id": ch.day_segment_id,
-                        "message_id": ch.start_message_id,
-                        "snippet": _focused_snippet(
-                            text=ch.content_text or "",
-                            query=query,
-                            headline=getattr(ch, "headline", None) if fts_raw > 0 else None,
-                            max_len=240,
-                        ),
-                    }
+            )
+            chunk_distances = dict(
+                semantic_candidates(
+                    user_id=agent.user.id,
+                    kind="transcript_chunk",
+                    vector=vec,
+                    limit=200,
+                    allowed_ids=chunk_qs.values_list("id", flat=True),
                 )
+            )
 
-            scored.sort(
-                key=lambda r: (
-                    -float(r.get("score", 0.0) or 0.0),
-                    r.get("day_label") or "",
-                    r.get("day_segment_id") or 0,
+        if seg_distances or chunk_distances:
+            seg_lexical_ids = set(
+                seg_qs.filter(summary_markdown__icontains=query).values_list("id", flat=True)[:200]
+            )
+            chunk_lexical_ids = set(
+                chunk_qs.filter(content_text__icontains=query).values_list("id", flat=True)[:400]
+            )
+            seg_hits = list(seg_qs.filter(id__in=[*seg_distances, *seg_lexical_ids]))
+            chunk_hits = list(
+                chunk_qs.filter(id__in=[*chunk_distances, *chunk_lexical_ids]).select_related(
+                    "day_segment", "start_message"
                 )
             )
-            page = scored[offset: offset + limit]
-            return {
-                "results": page,
-                "notes": [
-                    "semantic ranking enabled only when embeddings provider is configured and vectors are ready",
-                ],
-            }
+            for seg in seg_hits:
+                seg.distance = seg_distances.get(seg.id)
+                seg.fts_rank = 1.0 if seg.id in seg_lexical_ids else 0.0
+            for ch in chunk_hits:
+                ch.distance = chunk_distances.get(ch.id)
+                ch.fts_rank = 1.0 if ch.id in chunk_lexical_ids else 0.0
+            return _rank_hits(seg_hits, chunk_hits)
 
-        # SQLite/tests fallback: icontains.
+        # SQLite/tests fallback without vectors: icontains.
         seg_hits = seg_qs.filter(summary_markdown__icontains=query).order_by(F("day_label").desc())
         for seg in seg_hits[:200]:
             results.append(
@@ -164,3 +164,31 @@ def get_or_create_day_segment(user, thread: Thread, day_label: dt.date, *, start
             )
         except IntegrityError:
             return DaySegment.objects.get(user=user, thread=thread, day_label=day_label)
+
+
+def mark_day_segment_dirty(message) -> int:
+    """Flag the DaySegment containing `message` for nightly re-summarization.
+
+    The segment is the latest one of the thread starting at or before the
+    message. Already-dirty segments are left untouched.
+    """
+    from django.db.models import OuterRef, Subquery
+
+    from nova.models.DaySegment import DaySegment
+
+    if not message.thread_id or not message.created_at:
+        return 0
+
+    containing = (
+        DaySegment.objects.filter(
+            thread_id=OuterRef("thread_id"),
+            starts_at_message__created_at__lte=message.created_at,
+        )
+        .order_by("-day_label")
+        .values("id")[:1]
+    )
+    return DaySegment.objects.filter(
+        thread_id=message.thread_id,
+        summary_dirty=False,
+        id=Subquery(containing),
+    ).update(summary_dirty=True)
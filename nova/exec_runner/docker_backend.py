@@ -6,10 +6,11 @@ import json
 import logging
 import os
 import secrets
-import tempfile
 import textwrap
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
+from time import monotonic
+from typing import Any
 
 from nova.exec_runner.shared import (
     ExecRunnerError,
@@ -19,7 +20,12 @@ from nova.exec_runner.shared import (
     RUNNER_CWD_FILENAME,
     RUNNER_ENV_FILENAME,
     RUNNER_INTERNAL_DIRNAME,
+    RUNNER_MANIFEST_FILENAME,
+    SYNC_MODE_DELTA,
+    SYNC_MODE_FULL,
+    ExecRunnerSyncConflict,
     SandboxShellResult,
+    SandboxSyncPlan,
     encode_environment_script,
     normalize_sandbox_path,
     rewrite_output_paths_from_workspace,
@@ -31,9 +37,7 @@ from nova.exec_runner.shared import (
 WORKSPACE_ROOT_IN_CONTAINER = Path("/srv/nova-session/workspace")
 SESSION_ROOT_IN_CONTAINER = Path("/srv/nova-session")
 CACHE_ROOT_IN_CONTAINER = Path("/srv/nova-cache")
-BEFORE_MANIFEST_PATH = WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME / "before.json"
-DIFF_BUNDLE_PATH = WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME / "diff.tar.gz"
-DIFF_METADATA_PATH = WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME / "diff.json"
+MANIFEST_PATH = WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME / RUNNER_MANIFEST_FILENAME
 COMMAND_PATH = WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME / RUNNER_COMMAND_FILENAME
 CWD_PATH = WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME / RUNNER_CWD_FILENAME
 ENV_PATH = WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME / RUNNER_ENV_FILENAME
@@ -46,8 +50,389 @@ THREAD_ID_LABEL_KEY = "nova.exec_runner.thread_id"
 AGENT_ID_LABEL_KEY = "nova.exec_runner.agent_id"
 SESSION_RESOURCE_LABEL_VALUE = "session"
 CACHE_RESOURCE_LABEL_VALUE = "cache"
+WARM_POOL_RESOURCE_LABEL_VALUE = "pool"
 CACHE_RECENT_GUARD_SECONDS = 3600
 CACHE_VOLUME_PREFIX = "nova-exec-cache-user-"
+WARM_POOL_CONTAINER_PREFIX = "nova-exec-pool-"
+WARM_POOL_VOLUME_PREFIX = "nova-exec-session-pool-"
+AGENT_PING_TIMEOUT_SECONDS = 10
+AGENT_REPLY_GRACE_SECONDS = 30
+
+# Long-lived agent started once per sandbox container over `docker exec -i`.
+# Syncing the workspace, running a command and collecting its diff go through
+# this one connection instead of a docker CLI call each. Every request and
+# reply is a `<meta size> <payload size>` line, a JSON meta object and a raw
+# payload.
+#   sync:      replace the workspace (full) or apply a delta on top of the
+#              manifest it was built from (delta).
+#   exec:      run a command script, then stop the processes it left behind.
+#              Output and exit status are written next to the script, so
+#   exec_result: collects them from a new agent when the command killed the
+#              previous one (e.g. `pkill -f python`).
+#   diff:      bundle the files changed by a command and store the new manifest.
+#   manifest, read_file, write_file, ping.
+# The manifest maps each path to `{sha256, size, mtime_ns}`; a file is only
+# hashed again when its size or mtime changed.
+_SANDBOX_AGENT_SCRIPT = textwrap.dedent(
+    """\
+    import hashlib
+    import io
+    import json
+    import os
+    import shutil
+    import signal
+    import subprocess
+    import sys
+    import tarfile
+    import time
+    from pathlib import Path
+
+    workspace_root = Path(sys.argv[1])
+    internal_dirname = sys.argv[2]
+    manifest_path = Path(sys.argv[3])
+    read_only_roots = ("skills", "inbox", "history")
+
+
+    class SyncConflict(Exception):
+        pass
+
+
+    def is_read_only(path):
+        return any(path == f"/{root}" or path.startswith(f"/{root}/") for root in read_only_roots)
+
+
+    def load_manifest():
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            manifest = {}
+        return dict(manifest.get("files") or {}), list(manifest.get("directories") or [])
+
+
+    def manifest_digest(files):
+        payload = json.dumps(
+            sorted((path, entry.get("sha256")) for path, entry in files.items()),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+    def file_digest(path):
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+    def scan(previous_files):
+        files = {}
+        directories = []
+        for current_root, dirnames, filenames in os.walk(workspace_root):
+            relative_root = Path(current_root).relative_to(workspace_root)
+            if relative_root.parts:
+                directories.append("/" + relative_root.as_posix())
+            else:
+                dirnames[:] = [name for name in dirnames if name != internal_dirname]
+            for filename in filenames:
+                relative_path = relative_root / filename
+                normalized = "/" + relative_path.as_posix()
+                source = workspace_root / relative_path
+                try:
+                    info = source.stat()
+                except OSError:
+                    continue
+                previous = previous_files.get(normalized) or {}
+                if previous.get("size") == info.st_size and previous.get("mtime_ns") == info.st_mtime_ns:
+                    digest = previous.get("sha256")
+                else:
+                    digest = file_digest(source)
+                files[normalized] = {"sha256": digest, "size": info.st_size, "mtime_ns": info.st_mtime_ns}
+        return files, sorted(directories)
+
+
+    def save_manifest(files, directories):
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(
+            json.dumps({"files": files, "directories": directories}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+
+    def workspace_path(path):
+        return workspace_root / str(path).lstrip("/")
+
+
+    def set_writable(root, writable):
+        for current_root, _dirnames, filenames in os.walk(root):
+            for entry in [current_root, *(os.path.join(current_root, name) for name in filenames)]:
+                if os.path.islink(entry):
+                    continue
+                try:
+                    mode = os.stat(entry).st_mode
+                    os.chmod(entry, mode | 0o200 if writable else mode & ~0o222)
+                except OSError:
+                    continue
+
+
+    def extract_bundle(archive):
+        try:
+            archive.extractall(workspace_root, filter="data")
+        except TypeError:
+            archive.extractall(workspace_root)
+
+
+    def replace_workspace(payload):
+        workspace_path(internal_dirname).mkdir(parents=True, exist_ok=True)
+        for child in workspace_root.iterdir():
+            if child.name == internal_dirname:
+                continue
+            if child.is_dir() and not child.is_symlink():
+                shutil.rmtree(child, ignore_errors=True)
+            else:
+                child.unlink(missing_ok=True)
+        if payload:
+            with tarfile.open(fileobj=io.BytesIO(payload), mode="r:gz") as archive:
+                extract_bundle(archive)
+        save_manifest(*scan({}))
+
+
+    def apply_delta(meta, payload):
+        files, directories = load_manifest()
+        if manifest_digest(files) != meta.get("base_manifest_digest"):
+            raise SyncConflict("The sandbox workspace changed since its manifest was read.")
+        for path in meta.get("removed_paths") or []:
+            workspace_path(path).unlink(missing_ok=True)
+            files.pop(path, None)
+        desired_directories = set(meta.get("directory_paths") or [])
+        for path in sorted(set(directories) - desired_directories, reverse=True):
+            shutil.rmtree(workspace_path(path), ignore_errors=True)
+        for path in sorted(desired_directories):
+            workspace_path(path).mkdir(parents=True, exist_ok=True)
+        if payload:
+            with tarfile.open(fileobj=io.BytesIO(payload), mode="r:gz") as archive:
+                for member in archive.getmembers():
+                    if member.isfile():
+                        # Extracted files are hashed again even if size and mtime match.
+                        files.pop("/" + member.name.lstrip("/"), None)
+                        workspace_path(member.name).unlink(missing_ok=True)
+                extract_bundle(archive)
+        save_manifest(*scan(files))
+
+
+    def handle_sync(meta, payload):
+        projected_roots = [workspace_root / root for root in read_only_roots]
+        for root in projected_roots:
+            set_writable(root, True)
+        try:
+            if meta.get("mode") == "delta":
+                apply_delta(meta, payload)
+            else:
+                replace_workspace(payload)
+        finally:
+            for root in projected_roots:
+                set_writable(root, False)
+        return {}, b""
+
+
+    def process_running(pid):
+        try:
+            state = Path("/proc", str(pid), "stat").read_text().rsplit(")", 1)[1].split()[0]
+        except (OSError, IndexError):
+            return False
+        return state != "Z"
+
+
+    def live_pids():
+        protected = {1, os.getpid()}
+        return [
+            int(name)
+            for name in os.listdir("/proc")
+            if name.isdigit() and int(name) not in protected and process_running(name)
+        ]
+
+
+    def reap_processes():
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            pids = live_pids()
+            if not pids:
+                return
+            for pid in pids:
+                try:
+                    os.kill(pid, sig)
+                except OSError:
+                    continue
+            deadline = time.monotonic() + 1
+            while sig == signal.SIGTERM and live_pids() and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+
+    def exec_paths(meta):
+        command_path = Path(meta["command_path"])
+        return {
+            name: command_path.with_name(f"{command_path.name}.{name}")
+            for name in ("job", "status", "stdout", "stderr")
+        }
+
+
+    def handle_exec(meta, payload):
+        command_path = Path(meta["command_path"])
+        command_path.parent.mkdir(parents=True, exist_ok=True)
+        paths = exec_paths(meta)
+        for path in paths.values():
+            path.unlink(missing_ok=True)
+        command_path.write_bytes(payload)
+        with open(paths["stdout"], "wb") as stdout, open(paths["stderr"], "wb") as stderr:
+            process = subprocess.Popen(
+                ["bash", "-c", 'bash -l "$1"; echo $? > "$2"', "bash", str(command_path), str(paths["status"])],
+                stdin=subprocess.DEVNULL,
+                stdout=stdout,
+                stderr=stderr,
+                start_new_session=True,
+            )
+        timeout = meta.get("command_timeout")
+        job = {"pid": process.pid, "deadline": None if timeout is None else time.monotonic() + timeout}
+        paths["job"].write_text(json.dumps(job), encoding="utf-8")
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            process.wait()
+        return collect_exec(meta, paths, job)
+
+
+    def handle_exec_result(meta, payload):
+        paths = exec_paths(meta)
+        try:
+            job = json.loads(paths["job"].read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raise RuntimeError("No sandbox command result to collect.")
+        deadline = job.get("deadline")
+        while process_running(job["pid"]) and (deadline is None or time.monotonic() < deadline):
+            time.sleep(0.05)
+        if process_running(job["pid"]):
+            try:
+                os.killpg(job["pid"], signal.SIGKILL)
+            except OSError:
+                pass
+        return collect_exec(meta, paths, job)
+
+
+    def collect_exec(meta, paths, job):
+        if meta.get("reap_processes"):
+            reap_processes()
+        try:
+            status = int(paths["status"].read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            deadline = job.get("deadline")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError("The sandbox command timed out.")
+            raise RuntimeError("The sandbox command was killed before it finished.")
+        try:
+            cwd = Path(meta["cwd_path"]).read_text(encoding="utf-8")
+        except OSError:
+            cwd = ""
+        stdout = paths["stdout"].read_bytes()
+        return {"status": status, "cwd": cwd, "stdout_size": len(stdout)}, stdout + paths["stderr"].read_bytes()
+
+
+    def handle_diff(meta, payload):
+        before_files, _directories = load_manifest()
+        after_files, directories = scan(before_files)
+        changed = sorted(
+            path
+            for path, entry in after_files.items()
+            if not is_read_only(path) and (before_files.get(path) or {}).get("sha256") != entry["sha256"]
+        )
+        removed = sorted(path for path in before_files if path not in after_files and not is_read_only(path))
+        bundle = io.BytesIO()
+        with tarfile.open(fileobj=bundle, mode="w:gz") as archive:
+            for path in changed:
+                archive.add(workspace_path(path), arcname=path.lstrip("/"))
+        save_manifest(after_files, directories)
+        return {
+            "removed_paths": removed,
+            "directory_paths": [path for path in directories if not is_read_only(path)],
+            "changed_paths": changed,
+        }, bundle.getvalue()
+
+
+    def handle_manifest(meta, payload):
+        files, _directories = load_manifest()
+        return {"files": {path: entry.get("sha256") for path, entry in files.items()}}, b""
+
+
+    def handle_read_file(meta, payload):
+        try:
+            return {"exists": True}, Path(meta["path"]).read_bytes()
+        except FileNotFoundError:
+            return {"exists": False}, b""
+
+
+    def handle_write_file(meta, payload):
+        target = Path(meta["path"])
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(payload)
+        return {}, b""
+
+
+    HANDLERS = {
+        "ping": lambda meta, payload: ({}, b""),
+        "sync": handle_sync,
+        "exec": handle_exec,
+        "exec_result": handle_exec_result,
+        "diff": handle_diff,
+        "manifest": handle_manifest,
+        "read_file": handle_read_file,
+        "write_file": handle_write_file,
+    }
+
+
+    def read_exact(stream, size):
+        data = stream.read(size) if size else b""
+        if len(data) != size:
+            raise EOFError
+        return data
+
+
+    def serve():
+        # Keep the protocol on private descriptors so stray output cannot corrupt it.
+        requests = os.fdopen(os.dup(0), "rb")
+        replies = os.fdopen(os.dup(1), "wb")
+        os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+        os.dup2(2, 1)
+        while True:
+            line = requests.readline()
+            if not line:
+                return
+            try:
+                meta_size, payload_size = (int(value) for value in line.split())
+                meta = json.loads(read_exact(requests, meta_size) or b"{}")
+                payload = read_exact(requests, payload_size)
+            except (ValueError, EOFError):
+                return
+            try:
+                handler = HANDLERS.get(meta.get("op"))
+                if handler is None:
+                    raise ValueError(f"Unknown sandbox agent request: {meta.get('op')}")
+                reply, reply_payload = handler(meta, payload)
+                reply = {"ok": True, **reply}
+            except SyncConflict as exc:
+                reply, reply_payload = {"ok": False, "conflict": True, "error": str(exc)}, b""
+            except Exception as exc:
+                reply, reply_payload = {"ok": False, "error": str(exc) or exc.__class__.__name__}, b""
+            encoded = json.dumps(reply, ensure_ascii=False).encode("utf-8")
+            replies.write(f"{len(encoded)} {len(reply_payload)}\\n".encode("ascii") + encoded + reply_payload)
+            replies.flush()
+
+
+    serve()
+    """
+)
 
 _CACHE_PRUNE_SCRIPT = textwrap.dedent(
     """\
@@ -168,6 +553,9 @@ class ExecRunnerConfig:
     cache_max_age_days: int
     sandbox_no_new_privileges: bool = True
     command_timeout_seconds: int = 300
+    warm_pool_size: int = 1
+    warm_pool_max_idle: int = 8
+    warm_pool_ttl_seconds: int = 1800
 
 
 @dataclass(slots=True, frozen=True)
@@ -192,6 +580,14 @@ class ManagedSessionRecord:
     metadata_path: Path
 
 
+@dataclass(slots=True, frozen=True)
+class WarmSandbox:
+    container_name: str
+    volume_name: str
+    user_id: str
+    created_at: float
+
+
 @dataclass(slots=True, frozen=True)
 class ExecResponse:
     result: SandboxShellResult
@@ -223,6 +619,9 @@ def load_exec_runner_config_from_env() -> ExecRunnerConfig:
     proxy_port = max(int(os.getenv("EXEC_RUNNER_PROXY_PORT", "8091")), 1)
     proxy_url = str(os.getenv("EXEC_RUNNER_PROXY_URL", f"http://exec-runner:{proxy_port}")).strip()
     command_timeout_seconds = max(int(os.getenv("EXEC_RUNNER_COMMAND_TIMEOUT_SECONDS", "300")), 5)
+    warm_pool_size = max(int(os.getenv("EXEC_RUNNER_WARM_POOL_SIZE", "1")), 0)
+    warm_pool_max_idle = max(int(os.getenv("EXEC_RUNNER_WARM_POOL_MAX_IDLE", "8")), 0)
+    warm_pool_ttl_seconds = max(int(os.getenv("EXEC_RUNNER_WARM_POOL_TTL_SECONDS", "1800")), 60)
     return ExecRunnerConfig(
         shared_token=shared_token,
         state_root=state_root,
@@ -241,14 +640,121 @@ def load_exec_runner_config_from_env() -> ExecRunnerConfig:
         cache_target_bytes=cache_target_bytes,
         cache_max_age_days=cache_max_age_days,
         command_timeout_seconds=command_timeout_seconds,
+        warm_pool_size=warm_pool_size,
+        warm_pool_max_idle=warm_pool_max_idle,
+        warm_pool_ttl_seconds=warm_pool_ttl_seconds,
     )
 
 
+class SandboxAgentStopped(ExecRunnerError):
+    """The sandbox agent exited while handling a request."""
+
+
+class SandboxAgentConnection:
+    """Framed request/reply channel to the agent running in one sandbox container."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self._process = process
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+    @classmethod
+    async def start(cls, command: list[str]) -> SandboxAgentConnection:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        return cls(process)
+
+    @property
+    def is_alive(self) -> bool:
+        return not self._closed and self._process.returncode is None
+
+    async def request(
+        self,
+        op: str,
+        *,
+        timeout: float,
+        payload: bytes = b"",
+        **params: Any,
+    ) -> tuple[dict[str, Any], bytes]:
+        meta = json.dumps({"op": op, **params}, ensure_ascii=False).encode("utf-8")
+        async with self._lock:
+            if not self.is_alive:
+                raise ExecRunnerError("The sandbox agent is not running.")
+            try:
+                reply, reply_payload = await asyncio.wait_for(
+                    self._exchange(f"{len(meta)} {len(payload)}\n".encode("ascii") + meta + payload),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError as exc:
+                detail = await self._close_locked()
+                raise ExecRunnerError(detail or "The sandbox agent stopped responding.") from exc
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError) as exc:
+                detail = await self._close_locked()
+                raise SandboxAgentStopped(detail or "The sandbox agent stopped responding.") from exc
+            except asyncio.CancelledError:
+                # The reply may be half read; the channel cannot be reused.
+                self._closed = True
+                if self._process.returncode is None:
+                    self._process.kill()
+                raise
+        if not reply.get("ok"):
+            message = str(reply.get("error") or "The sandbox agent request failed.")
+            if reply.get("conflict"):
+                raise ExecRunnerSyncConflict(message)
+            raise ExecRunnerError(message)
+        return reply, reply_payload
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._close_locked()
+
+    async def _exchange(self, frame: bytes) -> tuple[dict[str, Any], bytes]:
+        stdin = self._process.stdin
+        stdout = self._process.stdout
+        assert stdin is not None and stdout is not None
+        stdin.write(frame)
+        await stdin.drain()
+        header = await stdout.readline()
+        if not header:
+            raise asyncio.IncompleteReadError(header, None)
+        meta_size, payload_size = (int(value) for value in header.split())
+        reply = json.loads(await stdout.readexactly(meta_size))
+        if not isinstance(reply, dict):
+            raise ValueError("Invalid sandbox agent reply.")
+        return reply, await stdout.readexactly(payload_size)
+
+    async def _close_locked(self) -> str:
+        """Stop the agent and return the last line it wrote to stderr."""
+        self._closed = True
+        process = self._process
+        if process.returncode is None:
+            if process.stdin is not None:
+                process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        stderr = await process.stderr.read() if process.stderr is not None else b""
+        lines = stderr.decode("utf-8", errors="replace").strip().splitlines()
+        return lines[-1] if lines else ""
+
+
 class DockerExecRunnerBackend:
     def __init__(self, config: ExecRunnerConfig):
         self.config = config
         self._initialized = False
         self._maintenance_lock = asyncio.Lock()
+        self._agents: dict[str, SandboxAgentConnection] = {}
+        self._agents_lock = asyncio.Lock()
+        self._warm_pool: dict[str, list[WarmSandbox]] = {}
+        self._warm_pool_demand: dict[str, float] = {}
+        self._warm_pool_lock = asyncio.Lock()
+        self._warm_pool_task: asyncio.Task | None = None
 
     async def initialize(self) -> None:
         if self._initialized:
@@ -256,8 +762,23 @@ class DockerExecRunnerBackend:
         await asyncio.to_thread(self.config.state_root.mkdir, parents=True, exist_ok=True)
         await self._run_docker("version", "--format", "{{json .Server.Version}}")
         await self._gc_expired_sessions()
+        await self._remove_stale_warm_sandboxes()
         self._initialized = True
 
+    async def close(self) -> None:
+        if self._warm_pool_task is not None:
+            self._warm_pool_task.cancel()
+            try:
+                await self._warm_pool_task
+            except asyncio.CancelledError:
+                pass
+        for spares in list(self._warm_pool.values()):
+            for spare in spares:
+                await self._discard_warm_sandbox(spare)
+        self._warm_pool.clear()
+        for container_name in list(self._agents):
+            await self._close_agent(container_name)
+
     async def healthcheck(self) -> dict[str, str]:
         await self.initialize()
         return {
@@ -267,7 +788,7 @@ class DockerExecRunnerBackend:
         }
 
     async def delete_session(self, selector: ExecSessionSelector) -> None:
-        session = self._session(selector)
+        session = await self._recorded_session(selector) or self._session(selector)
         await self._delete_session_artifacts(
             ManagedSessionRecord(
                 session_id=selector.session_id,
@@ -330,6 +851,63 @@ class DockerExecRunnerBackend:
             )
         return len(removed_session_ids) or max(len(removed_container_names), len(removed_volume_names))
 
+    async def maintain_warm_pool(self) -> dict[str, int]:
+        """Expire idle warm sandboxes and top the pool up for recently active users.
+
+        Warm sandboxes mount their user's package cache, so they are kept per
+        user rather than shared: up to `warm_pool_size` for each user seen in
+        the last `warm_pool_ttl_seconds`, and `warm_pool_max_idle` overall.
+        """
+        summary = {"warm_sandboxes_created": 0, "warm_sandboxes_removed": 0, "errors": 0}
+        if self.config.warm_pool_size <= 0:
+            return summary
+        await self.initialize()
+        async with self._warm_pool_lock:
+            now = monotonic()
+            ttl_seconds = self.config.warm_pool_ttl_seconds
+            expired: list[WarmSandbox] = []
+            for spares in self._warm_pool.values():
+                kept = [
+                    spare
+                    for spare in spares
+                    if now - spare.created_at <= ttl_seconds and self._warm_sandbox_alive(spare)
+                ]
+                expired.extend(spare for spare in spares if spare not in kept)
+                # Updated in place: a claim in progress may hold this list.
+                spares[:] = kept
+            for spare in expired:
+                await self._discard_warm_sandbox(spare)
+                summary["warm_sandboxes_removed"] += 1
+
+            self._warm_pool_demand = {
+                user_id: seen_at
+                for user_id, seen_at in self._warm_pool_demand.items()
+                if now - seen_at <= ttl_seconds
+            }
+            idle_count = sum(len(spares) for spares in self._warm_pool.values())
+            for user_id in sorted(self._warm_pool_demand, key=self._warm_pool_demand.__getitem__, reverse=True):
+                while (
+                    len(self._warm_pool.get(user_id, [])) < self.config.warm_pool_size
+                    and idle_count < self.config.warm_pool_max_idle
+                ):
+                    try:
+                        spare = await self._provision_warm_sandbox(user_id)
+                    except ExecRunnerError:
+                        summary["errors"] += 1
+                        logger.warning("Failed to provision a warm exec-runner sandbox for user=%s", user_id, exc_info=True)
+                        break
+                    self._warm_pool.setdefault(user_id, []).append(spare)
+                    idle_count += 1
+                    summary["warm_sandboxes_created"] += 1
+        if any(summary.values()):
+            logger.info(
+                "exec-runner warm pool: created=%s removed=%s errors=%s",
+                summary["warm_sandboxes_created"],
+                summary["warm_sandboxes_removed"],
+                summary["errors"],
+            )
+        return summary
+
     async def run_maintenance_cycle(self) -> dict[str, int]:
         await self.initialize()
         async with self._maintenance_lock:
@@ -366,6 +944,7 @@ class DockerExecRunnerBackend:
         cwd: str,
         sync_bundle_bytes: bytes,
         ensure_python: bool = False,
+        sync_plan: SandboxSyncPlan | None = None,
     ) -> ExecResponse:
         if len(sync_bundle_bytes) > self.config.max_sync_bytes:
             raise ExecRunnerError("Incoming sync bundle exceeds the configured size limit.")
@@ -373,7 +952,7 @@ class DockerExecRunnerBackend:
         await self._gc_expired_sessions()
         session = await self._ensure_session(selector)
         await self._write_session_metadata(session)
-        await self._sync_bundle_into_session(session, sync_bundle_bytes)
+        await self._sync_workspace(session, sync_bundle_bytes, sync_plan)
         result = await self._run_session_command(
             session,
             command=command,
@@ -391,6 +970,13 @@ class DockerExecRunnerBackend:
             diff_bundle_bytes=diff_bundle_bytes,
         )
 
+    async def read_manifest(self, selector: ExecSessionSelector) -> dict[str, str]:
+        """Return the `{path: sha256}` manifest of the session workspace."""
+        await self.initialize()
+        session = await self._ensure_session(selector)
+        reply, _payload = await self._agent_request(session, "manifest")
+        return {str(path): str(digest or "") for path, digest in (reply.get("files") or {}).items()}
+
     def _session(self, selector: ExecSessionSelector) -> ExecSession:
         session_id = selector.session_id
         container_name = f"nova-exec-{session_id}"
@@ -405,9 +991,29 @@ class DockerExecRunnerBackend:
             metadata_path=metadata_path,
         )
 
-    async def _ensure_session(self, selector: ExecSessionSelector) -> ExecSession:
+    async def _recorded_session(self, selector: ExecSessionSelector) -> ExecSession | None:
+        """Return the session described by its metadata, which may use a warm pool volume."""
         session = self._session(selector)
-        await asyncio.to_thread(session.metadata_dir.mkdir, parents=True, exist_ok=True)
+        record = await asyncio.to_thread(self._load_session_record_from_path, session.metadata_path)
+        if record is None:
+            return None
+        if record.volume_name and record.volume_name != session.volume_name:
+            session = replace(session, volume_name=record.volume_name)
+        return session
+
+    async def _ensure_session(self, selector: ExecSessionSelector) -> ExecSession:
+        self._warm_pool_demand[str(selector.user_id)] = monotonic()
+        session = await self._recorded_session(selector)
+        if session is None:
+            session = self._session(selector)
+            await asyncio.to_thread(session.metadata_dir.mkdir, parents=True, exist_ok=True)
+            claimed = await self._claim_warm_sandbox(session)
+            if claimed is not None:
+                return claimed
+            self._schedule_warm_pool_refill()
+        if await self._agent_responds(session.container_name):
+            # A live agent means the container is running with its mounts.
+            return session
         await self._ensure_volume(
             session.volume_name,
             SESSION_ROOT_IN_CONTAINER,
@@ -479,12 +1085,26 @@ class DockerExecRunnerBackend:
         return created
 
     async def _create_container(self, session: ExecSession) -> None:
-        labels = self._session_resource_labels(session.selector)
+        await self._start_sandbox_container(
+            session.container_name,
+            volume_name=session.volume_name,
+            user_id=session.selector.user_id,
+            labels=self._session_resource_labels(session.selector),
+        )
+
+    async def _start_sandbox_container(
+        self,
+        container_name: str,
+        *,
+        volume_name: str,
+        user_id: int | str,
+        labels: dict[str, str],
+    ) -> None:
         docker_args = [
             "run",
             "-d",
             "--name",
-            session.container_name,
+            container_name,
             "--network",
             self.config.sandbox_network,
             "--read-only",
@@ -500,9 +1120,9 @@ class DockerExecRunnerBackend:
                 "--tmpfs",
                 "/tmp:rw,nodev,nosuid,size=256m,mode=1777",
                 "--mount",
-                f"source={session.volume_name},target={SESSION_ROOT_IN_CONTAINER}",
+                f"source={volume_name},target={SESSION_ROOT_IN_CONTAINER}",
                 "--mount",
-                f"source={self._cache_volume_name(session.selector.user_id)},target={CACHE_ROOT_IN_CONTAINER}",
+                f"source={self._cache_volume_name(user_id)},target={CACHE_ROOT_IN_CONTAINER}",
                 "--memory",
                 f"{self.config.sandbox_memory_limit_mb}m",
                 "--cpus",
@@ -545,58 +1165,21 @@ class DockerExecRunnerBackend:
         if not running:
             await self._run_docker("start", container_name)
 
-    async def _sync_bundle_into_session(self, session: ExecSession, sync_bundle_bytes: bytes) -> None:
-        remote_bundle_path = Path("/tmp/nova-sync.tar.gz")
-        await self._write_bytes_into_container(
-            session.container_name,
-            remote_bundle_path,
-            sync_bundle_bytes,
-        )
-        await self._docker_exec(
-            session.container_name,
-            (
-                f'set -euo pipefail; '
-                f'mkdir -p "{WORKSPACE_ROOT_IN_CONTAINER / RUNNER_INTERNAL_DIRNAME}"; '
-                f'for root in "{WORKSPACE_ROOT_IN_CONTAINER / "skills"}" "{WORKSPACE_ROOT_IN_CONTAINER / "inbox"}" "{WORKSPACE_ROOT_IN_CONTAINER / "history"}"; do '
-                f'  if [ -e "$root" ]; then chmod -R u+w "$root" || true; rm -rf "$root"; fi; '
-                f'done; '
-                f'find "{WORKSPACE_ROOT_IN_CONTAINER}" -mindepth 1 -maxdepth 1 '
-                f'! -name "{RUNNER_INTERNAL_DIRNAME}" '
-                f'! -name "skills" ! -name "inbox" ! -name "history" '
-                f'-exec rm -rf {{}} +; '
-                f'tar -xzf "{remote_bundle_path}" -C "{WORKSPACE_ROOT_IN_CONTAINER}"; '
-                f'rm -f "{remote_bundle_path}"; '
-                f'python3 - <<\'PY\'\n'
-                f'import hashlib, json, os\n'
-                f'from pathlib import Path\n'
-                f'workspace_root = Path("{WORKSPACE_ROOT_IN_CONTAINER}")\n'
-                f'before_path = Path("{BEFORE_MANIFEST_PATH}")\n'
-                f'read_only_roots = {list(root.lstrip("/") for root in ("/skills", "/inbox", "/history"))!r}\n'
-                f'manifest = {{"files": {{}}, "directories": []}}\n'
-                f'for current_root, dirnames, filenames in os.walk(workspace_root):\n'
-                f'    current = Path(current_root)\n'
-                f'    relative_root = current.relative_to(workspace_root)\n'
-                f'    if relative_root.parts and relative_root.parts[0] == "{RUNNER_INTERNAL_DIRNAME}":\n'
-                f'        dirnames[:] = []\n'
-                f'        continue\n'
-                f'    normalized_dir = "/" if not relative_root.parts else "/" + "/".join(relative_root.parts)\n'
-                f'    if normalized_dir != "/" and not any(normalized_dir == f"/{{root}}" or normalized_dir.startswith(f"/{{root}}/") for root in read_only_roots):\n'
-                f'        manifest["directories"].append(normalized_dir)\n'
-                f'    for filename in filenames:\n'
-                f'        relative_path = relative_root / filename if relative_root.parts else Path(filename)\n'
-                f'        normalized = "/" + relative_path.as_posix()\n'
-                f'        if any(normalized == f"/{{root}}" or normalized.startswith(f"/{{root}}/") for root in read_only_roots):\n'
-                f'            continue\n'
-                f'        with (workspace_root / relative_path).open("rb") as handle:\n'
-                f'            digest = hashlib.sha256(handle.read()).hexdigest()\n'
-                f'        manifest["files"][normalized] = digest\n'
-                f'before_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")\n'
-                f'PY\n'
-                f'for root in "{WORKSPACE_ROOT_IN_CONTAINER / "skills"}" "{WORKSPACE_ROOT_IN_CONTAINER / "inbox"}" "{WORKSPACE_ROOT_IN_CONTAINER / "history"}"; do '
-                f'  if [ -e "$root" ]; then chmod -R a-w "$root" || true; fi; '
-                f'done'
-            ),
-        )
+    async def _sync_workspace(
+        self,
+        session: ExecSession,
+        sync_bundle_bytes: bytes,
+        sync_plan: SandboxSyncPlan | None = None,
+    ) -> None:
+        params: dict[str, Any] = {"mode": SYNC_MODE_FULL}
+        if sync_plan is not None and sync_plan.mode == SYNC_MODE_DELTA:
+            params = {
+                "mode": SYNC_MODE_DELTA,
+                "base_manifest_digest": sync_plan.base_manifest_digest,
+                "removed_paths": list(sync_plan.removed_paths),
+                "directory_paths": list(sync_plan.directory_paths),
+            }
+        await self._agent_request(session, "sync", payload=sync_bundle_bytes, **params)
 
     async def _run_session_command(
         self,
@@ -606,7 +1189,7 @@ class DockerExecRunnerBackend:
         cwd: str,
         ensure_python: bool = False,
     ) -> SandboxShellResult:
-        persisted_env = await self._load_persisted_env(session.container_name)
+        persisted_env = await self._load_persisted_env(session)
         env = self._base_environment()
         env.update({key: value for key, value in persisted_env.items() if not key.startswith("NOVA_")})
         restore_python_env_lines: list[str] = []
@@ -631,10 +1214,11 @@ class DockerExecRunnerBackend:
         rewritten_command = rewrite_shell_command_for_workspace(command, WORKSPACE_ROOT_IN_CONTAINER)
         rendered_env = encode_environment_script(env)
         if ensure_python:
-            await self._write_text_into_container(
-                session.container_name,
-                SITECUSTOMIZE_PATH,
-                PYTHON_WORKSPACE_SITECUSTOMIZE_SOURCE,
+            await self._agent_request(
+                session,
+                "write_file",
+                payload=PYTHON_WORKSPACE_SITECUSTOMIZE_SOURCE.encode("utf-8"),
+                path=str(SITECUSTOMIZE_PATH),
             )
         command_script = "\n".join(
             [
@@ -652,92 +1236,50 @@ class DockerExecRunnerBackend:
                 "exit $status",
             ]
         )
-        await self._write_text_into_container(session.container_name, COMMAND_PATH, command_script)
-        stdout, stderr, returncode = await self._docker_exec_capture(
-            session.container_name,
-            f'set -euo pipefail; bash -lc \'. "{COMMAND_PATH}"\'',
-        )
-        await self._cleanup_processes(session.container_name)
-        cwd_after = await self._read_text_from_container(session.container_name, CWD_PATH, default="/")
+        exec_params = {
+            "timeout": self.config.command_timeout_seconds + AGENT_REPLY_GRACE_SECONDS,
+            "command_path": str(COMMAND_PATH),
+            "cwd_path": str(CWD_PATH),
+            "reap_processes": True,
+        }
+        try:
+            reply, output = await self._agent_request(
+                session,
+                "exec",
+                payload=command_script.encode("utf-8"),
+                command_timeout=self.config.command_timeout_seconds,
+                **exec_params,
+            )
+        except SandboxAgentStopped:
+            # The command can kill the agent (e.g. `pkill -f python`); a new
+            # agent waits for it and reads the result it left on disk.
+            logger.info("Sandbox agent of %s exited during a command; collecting its result.", session.container_name)
+            reply, output = await self._agent_request(session, "exec_result", **exec_params)
+        stdout_size = int(reply.get("stdout_size") or 0)
+        stdout = output[:stdout_size].decode("utf-8", errors="replace")
+        stderr = output[stdout_size:].decode("utf-8", errors="replace")
         normalized_cwd_after = vfs_path_for_workspace_path(
             WORKSPACE_ROOT_IN_CONTAINER,
-            cwd_after.strip(),
+            str(reply.get("cwd") or "").strip(),
         )
         return SandboxShellResult(
             stdout=rewrite_output_paths_from_workspace(stdout, WORKSPACE_ROOT_IN_CONTAINER),
             stderr=rewrite_output_paths_from_workspace(stderr, WORKSPACE_ROOT_IN_CONTAINER),
-            status=int(returncode or 0),
+            status=int(reply.get("status") or 0),
             cwd_after=normalized_cwd_after,
         )
 
     async def _collect_diff_bundle(self, session: ExecSession) -> tuple[bytes, list[str], list[str]]:
-        metadata_text = await self._docker_exec_stdout(
-            session.container_name,
-            (
-                f'set -euo pipefail; '
-                f'python3 - <<\'PY\'\n'
-                f'import hashlib, json, os, tarfile\n'
-                f'from pathlib import Path\n'
-                f'workspace_root = Path("{WORKSPACE_ROOT_IN_CONTAINER}")\n'
-                f'before_path = Path("{BEFORE_MANIFEST_PATH}")\n'
-                f'diff_path = Path("{DIFF_BUNDLE_PATH}")\n'
-                f'metadata_path = Path("{DIFF_METADATA_PATH}")\n'
-                f'if before_path.exists():\n'
-                f'    before = json.loads(before_path.read_text(encoding="utf-8"))\n'
-                f'else:\n'
-                f'    before = {{"files": {{}}, "directories": []}}\n'
-                f'read_only_roots = {list(root.lstrip("/") for root in ("/skills", "/inbox", "/history"))!r}\n'
-                f'after_files = {{}}\n'
-                f'directories = []\n'
-                f'for current_root, dirnames, filenames in os.walk(workspace_root):\n'
-                f'    current = Path(current_root)\n'
-                f'    relative_root = current.relative_to(workspace_root)\n'
-                f'    if relative_root.parts and relative_root.parts[0] == "{RUNNER_INTERNAL_DIRNAME}":\n'
-                f'        dirnames[:] = []\n'
-                f'        continue\n'
-                f'    normalized_dir = "/" if not relative_root.parts else "/" + "/".join(relative_root.parts)\n'
-                f'    if normalized_dir != "/" and not any(normalized_dir == f"/{{root}}" or normalized_dir.startswith(f"/{{root}}/") for root in read_only_roots):\n'
-                f'        directories.append(normalized_dir)\n'
-                f'    for filename in filenames:\n'
-                f'        relative_path = relative_root / filename if relative_root.parts else Path(filename)\n'
-                f'        normalized = "/" + relative_path.as_posix()\n'
-                f'        if any(normalized == f"/{{root}}" or normalized.startswith(f"/{{root}}/") for root in read_only_roots):\n'
-                f'            continue\n'
-                f'        with (workspace_root / relative_path).open("rb") as handle:\n'
-                f'            digest = hashlib.sha256(handle.read()).hexdigest()\n'
-                f'        after_files[normalized] = digest\n'
-                f'changed = sorted(path for path, digest in after_files.items() if before.get("files", {{}}).get(path) != digest)\n'
-                f'removed = sorted(path for path in before.get("files", {{}}).keys() if path not in after_files)\n'
-                f'with tarfile.open(diff_path, "w:gz") as archive:\n'
-                f'    for normalized in changed:\n'
-                f'        source = workspace_root / normalized.lstrip("/")\n'
-                f'        archive.add(source, arcname=normalized.lstrip("/"))\n'
-                f'metadata = {{"removed_paths": removed, "directory_paths": sorted(set(directories)), "changed_paths": changed}}\n'
-                f'metadata_path.write_text(json.dumps(metadata, ensure_ascii=False), encoding="utf-8")\n'
-                f'print(json.dumps(metadata, ensure_ascii=False))\n'
-                f'PY'
-            ),
-        )
-        metadata = json.loads(metadata_text or "{}")
-        with tempfile.NamedTemporaryFile(prefix="nova-diff-", suffix=".tar.gz", delete=False) as handle:
-            local_path = Path(handle.name)
-        try:
-            await self._run_docker("cp", f"{session.container_name}:{DIFF_BUNDLE_PATH}", str(local_path))
-            diff_bundle_bytes = await asyncio.to_thread(local_path.read_bytes)
-        finally:
-            local_path.unlink(missing_ok=True)
-            await self._docker_exec(
-                session.container_name,
-                f'rm -f "{DIFF_BUNDLE_PATH}" "{DIFF_METADATA_PATH}"',
-            )
+        metadata, diff_bundle_bytes = await self._agent_request(session, "diff")
         return (
             diff_bundle_bytes,
             list(metadata.get("removed_paths") or []),
             list(metadata.get("directory_paths") or []),
         )
 
-    async def _load_persisted_env(self, container_name: str) -> dict[str, str]:
-        text = await self._read_text_from_container(container_name, ENV_PATH, default="")
+    async def _load_persisted_env(self, session: ExecSession) -> dict[str, str]:
+        _reply, content = await self._agent_request(session, "read_file", path=str(ENV_PATH))
+        text = content.decode("utf-8", errors="replace")
         if not text.strip():
             return {}
         try:
@@ -774,19 +1316,148 @@ class DockerExecRunnerBackend:
             "NO_PROXY": "127.0.0.1,localhost",
         }
 
-    async def _cleanup_processes(self, container_name: str) -> None:
-        await self._docker_exec(
+    def _agent_command(self, container_name: str) -> list[str]:
+        return [
+            "docker",
+            "exec",
+            "-i",
+            "-u",
+            "nova",
             container_name,
-            (
-                "set +e; self_pid=$$; "
-                "pids=$(ps -eo pid= | awk -v self=\"$self_pid\" '$1 != 1 && $1 != self {print $1}'); "
-                "if [ -n \"$pids\" ]; then kill -TERM $pids 2>/dev/null || true; sleep 1; fi; "
-                "pids=$(ps -eo pid= | awk -v self=\"$self_pid\" '$1 != 1 && $1 != self {print $1}'); "
-                "if [ -n \"$pids\" ]; then kill -KILL $pids 2>/dev/null || true; fi; "
-                "exit 0"
-            ),
+            "python3",
+            "-c",
+            _SANDBOX_AGENT_SCRIPT,
+            str(WORKSPACE_ROOT_IN_CONTAINER),
+            RUNNER_INTERNAL_DIRNAME,
+            str(MANIFEST_PATH),
+        ]
+
+    async def _session_agent(self, session: ExecSession) -> SandboxAgentConnection:
+        async with self._agents_lock:
+            agent = self._agents.get(session.container_name)
+            if agent is None or not agent.is_alive:
+                agent = await SandboxAgentConnection.start(self._agent_command(session.container_name))
+                self._agents[session.container_name] = agent
+            return agent
+
+    async def _agent_request(
+        self,
+        session: ExecSession,
+        op: str,
+        *,
+        payload: bytes = b"",
+        timeout: float | None = None,
+        **params: Any,
+    ) -> tuple[dict[str, Any], bytes]:
+        agent = await self._session_agent(session)
+        return await agent.request(
+            op,
+            timeout=timeout or self.config.command_timeout_seconds,
+            payload=payload,
+            **params,
         )
 
+    async def _agent_responds(self, container_name: str) -> bool:
+        agent = self._agents.get(container_name)
+        if agent is None or not agent.is_alive:
+            return False
+        try:
+            await agent.request("ping", timeout=AGENT_PING_TIMEOUT_SECONDS)
+        except ExecRunnerError:
+            return False
+        return True
+
+    async def _close_agent(self, container_name: str) -> None:
+        agent = self._agents.pop(container_name, None)
+        if agent is not None:
+            await agent.close()
+
+    def _warm_sandbox_alive(self, spare: WarmSandbox) -> bool:
+        agent = self._agents.get(spare.container_name)
+        return agent is not None and agent.is_alive
+
+    async def _provision_warm_sandbox(self, user_id: str) -> WarmSandbox:
+        token = secrets.token_hex(6)
+        spare = WarmSandbox(
+            container_name=f"{WARM_POOL_CONTAINER_PREFIX}{token}",
+            volume_name=f"{WARM_POOL_VOLUME_PREFIX}{token}",
+            user_id=user_id,
+            created_at=monotonic(),
+        )
+        labels = {
+            MANAGED_LABEL_KEY: "true",
+            RESOURCE_LABEL_KEY: WARM_POOL_RESOURCE_LABEL_VALUE,
+            USER_ID_LABEL_KEY: user_id,
+        }
+        try:
+            await self._ensure_volume(spare.volume_name, SESSION_ROOT_IN_CONTAINER, labels=labels)
+            await self._ensure_user_cache_volume(user_id)
+            await self._start_sandbox_container(
+                spare.container_name,
+                volume_name=spare.volume_name,
+                user_id=user_id,
+                labels=labels,
+            )
+            agent = await SandboxAgentConnection.start(self._agent_command(spare.container_name))
+            self._agents[spare.container_name] = agent
+            await agent.request("ping", timeout=AGENT_PING_TIMEOUT_SECONDS)
+        except ExecRunnerError:
+            await self._discard_warm_sandbox(spare)
+            raise
+        return spare
+
+    async def _discard_warm_sandbox(self, spare: WarmSandbox) -> None:
+        await self._remove_container(spare.container_name)
+        await self._remove_volume(spare.volume_name)
+
+    async def _claim_warm_sandbox(self, session: ExecSession) -> ExecSession | None:
+        spares = self._warm_pool.get(str(session.selector.user_id)) or []
+        while spares:
+            spare = spares.pop(0)
+            if not self._warm_sandbox_alive(spare):
+                await self._discard_warm_sandbox(spare)
+                continue
+            try:
+                await self._run_docker("rename", spare.container_name, session.container_name)
+            except ExecRunnerError:
+                await self._discard_warm_sandbox(spare)
+                continue
+            # The agent's `docker exec` is bound to the container, not to its name.
+            agent = self._agents.pop(spare.container_name, None)
+            if agent is not None:
+                self._agents[session.container_name] = agent
+            claimed = replace(session, volume_name=spare.volume_name)
+            await self._write_session_metadata(claimed)
+            self._schedule_warm_pool_refill()
+            return claimed
+        return None
+
+    def _schedule_warm_pool_refill(self) -> None:
+        if self.config.warm_pool_size <= 0:
+            return
+        if self._warm_pool_task is None or self._warm_pool_task.done():
+            self._warm_pool_task = asyncio.create_task(self._refill_warm_pool())
+
+    async def _refill_warm_pool(self) -> None:
+        try:
+            await self.maintain_warm_pool()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("exec-runner warm pool refill failed")
+
+    async def _remove_stale_warm_sandboxes(self) -> None:
+        """Remove warm sandboxes left unclaimed by a previous runner process."""
+        for name in await self._list_docker_items(
+            "ps", "-a", "--format", "{{.Names}}", "--filter", f"name={WARM_POOL_CONTAINER_PREFIX}"
+        ):
+            if name.startswith(WARM_POOL_CONTAINER_PREFIX):
+                await self._remove_container(name)
+        recorded_volumes = {record.volume_name for record in await self._load_session_records()}
+        for name in await self._list_docker_items("volume", "ls", "-q", "--filter", f"name={WARM_POOL_VOLUME_PREFIX}"):
+            if name.startswith(WARM_POOL_VOLUME_PREFIX) and name not in recorded_volumes:
+                await self._remove_volume(name)
+
     def _session_resource_labels(self, selector: ExecSessionSelector) -> dict[str, str]:
         return {
             MANAGED_LABEL_KEY: "true",
@@ -1026,7 +1697,9 @@ class DockerExecRunnerBackend:
         return age_seconds > self.config.session_ttl_seconds
 
     async def _sweep_orphaned_resources_locked(self) -> dict[str, int]:
-        records = {record.session_id for record in await self._load_session_records()}
+        session_records = await self._load_session_records()
+        records = {record.session_id for record in session_records}
+        recorded_volumes = {record.volume_name for record in session_records if record.volume_name}
         containers, volumes = await self._list_managed_resources()
         containers_removed = 0
         volumes_removed = 0
@@ -1053,6 +1726,8 @@ class DockerExecRunnerBackend:
             session_id = str(resource.get("session_id") or self._session_id_from_volume_name(str(resource.get("name") or "")) or "").strip()
             if session_id and session_id in records:
                 continue
+            if str(resource.get("name") or "") in recorded_volumes:
+                continue
             if session_id and not self._is_resource_older_than_ttl(str(resource.get("created_at") or "")):
                 continue
             try:
@@ -1164,6 +1839,7 @@ class DockerExecRunnerBackend:
     async def _remove_container(self, container_name: str) -> bool:
         if not container_name:
             return False
+        await self._close_agent(container_name)
         try:
             await self._run_docker("rm", "-f", container_name)
             return True
@@ -1179,67 +1855,6 @@ class DockerExecRunnerBackend:
         except ExecRunnerError:
             return False
 
-    async def _write_text_into_container(self, container_name: str, path: Path, text: str) -> None:
-        await self._write_bytes_into_container(container_name, path, text.encode("utf-8"))
-
-    async def _write_bytes_into_container(self, container_name: str, path: Path, content: bytes) -> None:
-        stdout, stderr, status = await self._run_process(
-            [
-                "docker",
-                "exec",
-                "-i",
-                "-u",
-                "nova",
-                container_name,
-                "python3",
-                "-c",
-                (
-                    "from pathlib import Path; import sys; "
-                    "target = Path(sys.argv[1]); "
-                    "target.parent.mkdir(parents=True, exist_ok=True); "
-                    "target.write_bytes(sys.stdin.buffer.read())"
-                ),
-                str(path),
-            ],
-            timeout=self.config.command_timeout_seconds,
-            input_bytes=content,
-        )
-        if status != 0:
-            raise ExecRunnerError(stderr.strip() or f"Docker exec failed while writing {path}.")
-
-    async def _read_text_from_container(self, container_name: str, path: Path, *, default: str = "") -> str:
-        try:
-            return await self._docker_exec_stdout(
-                container_name,
-                f'if [ -f "{path}" ]; then cat "{path}"; fi',
-            )
-        except ExecRunnerError:
-            return default
-
-    async def _docker_exec_stdout(self, container_name: str, command: str) -> str:
-        stdout, _stderr, _status = await self._docker_exec_capture(container_name, command)
-        return stdout
-
-    async def _docker_exec(self, container_name: str, command: str) -> None:
-        _stdout, stderr, status = await self._docker_exec_capture(container_name, command)
-        if status != 0:
-            raise ExecRunnerError(stderr.strip() or f"Docker exec failed with status {status}.")
-
-    async def _docker_exec_capture(self, container_name: str, command: str) -> tuple[str, str, int]:
-        return await self._run_process(
-            [
-                "docker",
-                "exec",
-                "-u",
-                "nova",
-                container_name,
-                "bash",
-                "-lc",
-                command,
-            ],
-            timeout=self.config.command_timeout_seconds,
-        )
-
     async def _run_docker(self, *args: str) -> str:
         stdout, stderr, status = await self._run_process(
             ["docker", *args],
@@ -19,10 +19,13 @@ from nova.exec_runner.docker_backend import (
     ExecSessionSelector,
     load_exec_runner_config_from_env,
 )
+from nova.exec_runner.shared import SYNC_MODE_FULL, ExecRunnerSyncConflict, SandboxSyncPlan
 from nova.exec_runner.proxy import ExecRunnerProxyConfig, ExecRunnerProxyServer
 
 logger = logging.getLogger(__name__)
 
+WARM_POOL_INTERVAL_SECONDS = 60
+
 
 def _extract_bearer_token(request: Request) -> str:
     auth_header = str(request.headers.get("authorization") or "").strip()
@@ -102,6 +105,13 @@ async def _exec(request: Request) -> Response:
         thread_id=selector_data.get("thread_id") or "unknown",
         agent_id=selector_data.get("agent_id") or "unknown",
     )
+    sync_data = metadata.get("sync") or {}
+    sync_plan = SandboxSyncPlan(
+        mode=str(sync_data.get("mode") or SYNC_MODE_FULL),
+        base_manifest_digest=str(sync_data.get("base_manifest_digest") or ""),
+        removed_paths=tuple(str(path) for path in sync_data.get("removed_paths") or []),
+        directory_paths=tuple(str(path) for path in sync_data.get("directory_paths") or []),
+    )
     sync_bundle_bytes = await upload.read()
     try:
         result = await app.state.backend.execute(
@@ -110,7 +120,10 @@ async def _exec(request: Request) -> Response:
             cwd=str(metadata.get("cwd") or "/"),
             sync_bundle_bytes=sync_bundle_bytes,
             ensure_python=bool(metadata.get("ensure_python")),
+            sync_plan=sync_plan,
         )
+    except ExecRunnerSyncConflict as exc:
+        return JSONResponse({"status": "error", "message": str(exc)}, status_code=409)
     except ExecRunnerError as exc:
         return JSONResponse({"status": "error", "message": str(exc)}, status_code=400)
 
@@ -126,24 +139,43 @@ async def _exec(request: Request) -> Response:
     return _multipart_response(response_metadata, result.diff_bundle_bytes)
 
 
-async def _delete_session(request: Request) -> JSONResponse:
-    app = request.app
-    token = _extract_bearer_token(request)
-    if not _is_authorized(app, token):
-        return JSONResponse({"status": "error", "message": "Forbidden"}, status_code=403)
-    session_id = str(request.path_params.get("session_id") or "").strip()
-    if not session_id:
-        return JSONResponse({"status": "error", "message": "Missing session id."}, status_code=400)
+def _selector_from_session_id(session_id: str) -> ExecSessionSelector:
     parts = dict(
         item.split("-", 1)
         for item in session_id.split("--")
         if "-" in item
     )
-    selector = ExecSessionSelector(
+    return ExecSessionSelector(
         user_id=parts.get("user", "unknown"),
         thread_id=parts.get("thread", "unknown"),
         agent_id=parts.get("agent", "unknown"),
     )
+
+
+async def _session_manifest(request: Request) -> JSONResponse:
+    app = request.app
+    token = _extract_bearer_token(request)
+    if not _is_authorized(app, token):
+        return JSONResponse({"status": "error", "message": "Forbidden"}, status_code=403)
+    session_id = str(request.path_params.get("session_id") or "").strip()
+    if not session_id:
+        return JSONResponse({"status": "error", "message": "Missing session id."}, status_code=400)
+    try:
+        files = await app.state.backend.read_manifest(_selector_from_session_id(session_id))
+    except ExecRunnerError as exc:
+        return JSONResponse({"status": "error", "message": str(exc)}, status_code=400)
+    return JSONResponse({"status": "success", "files": files})
+
+
+async def _delete_session(request: Request) -> JSONResponse:
+    app = request.app
+    token = _extract_bearer_token(request)
+    if not _is_authorized(app, token):
+        return JSONResponse({"status": "error", "message": "Forbidden"}, status_code=403)
+    session_id = str(request.path_params.get("session_id") or "").strip()
+    if not session_id:
+        return JSONResponse({"status": "error", "message": "Missing session id."}, status_code=400)
+    selector = _selector_from_session_id(session_id)
     try:
         await app.state.backend.delete_session(selector)
     except ExecRunnerError as exc:
@@ -179,6 +211,17 @@ async def _maintenance_loop(app: Starlette) -> None:
         await asyncio.sleep(interval_seconds)
 
 
+async def _warm_pool_loop(app: Starlette) -> None:
+    while True:
+        try:
+            await app.state.backend.maintain_warm_pool()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("exec-runner warm pool maintenance failed")
+        await asyncio.sleep(WARM_POOL_INTERVAL_SECONDS)
+
+
 def build_app() -> Starlette:
     config = load_exec_runner_config_from_env()
     backend = DockerExecRunnerBackend(config)
@@ -190,15 +233,19 @@ def build_app() -> Starlette:
         await app.state.backend.initialize()
         await app.state.proxy_server.start()
         maintenance_task = asyncio.create_task(_maintenance_loop(app))
+        warm_pool_task = asyncio.create_task(_warm_pool_loop(app))
         app.state.maintenance_task = maintenance_task
+        app.state.warm_pool_task = warm_pool_task
         try:
             yield
         finally:
-            maintenance_task.cancel()
-            try:
-                await maintenance_task
-            except asyncio.CancelledError:
-                pass
+            for task in (warm_pool_task, maintenance_task):
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            await app.state.backend.close()
             await app.state.proxy_server.close()
 
     app = Starlette(
@@ -206,6 +253,7 @@ def build_app() -> Starlette:
         routes=[
             Route("/healthz", _healthz, methods=["GET"]),
             Route("/v1/sessions/exec", _exec, methods=["POST"]),
+            Route("/v1/sessions/{session_id}/manifest", _session_manifest, methods=["GET"]),
             Route("/v1/sessions/{session_id}", _delete_session, methods=["DELETE"]),
             Route("/v1/users/{user_id}/threads/{thread_id}/sessions", _delete_thread_sessions, methods=["DELETE"]),
         ],
@@ -1,30 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 import mimetypes
 import posixpath
 import tarfile
-import tempfile
 from email.parser import BytesParser
 from email.policy import default as email_policy
-from pathlib import Path
 
 import httpx
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from nova.memory.service import MEMORY_ROOT
+from nova.models.UserFile import UserFile
 from nova.runtime.vfs import HISTORY_ROOT, INBOX_ROOT, VFSError, VirtualFileSystem, normalize_vfs_path
 from nova.webdav.service import WEBDAV_VFS_ROOT
 
 from .shared import (
     EXCLUDED_SYNC_PREFIXES,
     EXCLUDED_SYNC_ROOTS,
+    SYNC_MODE_DELTA,
+    SYNC_MODE_FULL,
     ExecRunnerError,
+    ExecRunnerSyncConflict,
     ExecSessionSelector,
     SandboxOutputFile,
     SandboxShellResult,
+    SandboxSyncPlan,
+    manifest_digest,
 )
 
 
@@ -98,6 +104,8 @@ async def _runner_request(
     except httpx.HTTPError as exc:
         raise ExecRunnerError(f"Could not reach the Nova exec runner: {exc}") from exc
 
+    if response.status_code == 409:
+        raise ExecRunnerSyncConflict(_runner_error_message(response, default_error_message))
     if response.status_code >= 400:
         raise ExecRunnerError(_runner_error_message(response, default_error_message))
     return response
@@ -126,67 +134,139 @@ async def _add_file_entry(
     *,
     vfs: VirtualFileSystem,
     path: str,
+    content: bytes | None = None,
 ) -> None:
-    content, _mime_type = await vfs.read_bytes(path)
+    if content is None:
+        content, _mime_type = await vfs.read_bytes(path)
     info = tarfile.TarInfo(name=path.lstrip("/"))
     info.size = len(content)
     info.mode = 0o644
     archive.addfile(info, io.BytesIO(content))
 
 
-async def _build_sync_bundle(vfs: VirtualFileSystem) -> bytes:
-    with tempfile.NamedTemporaryFile(prefix="nova-sync-", suffix=".tar.gz", delete=False) as handle:
-        bundle_path = Path(handle.name)
-    try:
-        with tarfile.open(bundle_path, "w:gz") as archive:
-            desired_dirs: set[str] = {"/tmp", INBOX_ROOT, HISTORY_ROOT, "/skills"}
-            desired_files: set[str] = set()
+async def _collect_sync_tree(vfs: VirtualFileSystem) -> tuple[set[str], set[str]]:
+    desired_dirs: set[str] = {"/tmp", INBOX_ROOT, HISTORY_ROOT, "/skills"}
+    desired_files: set[str] = set()
 
-            for path in sorted(set(await vfs.find("/", ""))):
+    for path in sorted(set(await vfs.find("/", ""))):
+        normalized = normalize_vfs_path(path, cwd="/")
+        if normalized in {MEMORY_ROOT, WEBDAV_VFS_ROOT}:
+            continue
+        if normalized in EXCLUDED_SYNC_ROOTS or normalized.startswith(EXCLUDED_SYNC_PREFIXES):
+            continue
+        if await vfs.is_dir(normalized):
+            if normalized != "/":
+                desired_dirs.add(normalized)
+            continue
+        desired_files.add(normalized)
+        parent = normalized.rsplit("/", 1)[0] or "/"
+        while parent and parent != "/":
+            desired_dirs.add(parent)
+            parent = parent.rsplit("/", 1)[0] or "/"
+
+    for root_path in ("/skills", INBOX_ROOT, HISTORY_ROOT):
+        if await vfs.path_exists(root_path):
+            if await vfs.is_dir(root_path):
+                desired_dirs.add(root_path)
+            for path in sorted(set(await vfs.find(root_path, ""))):
                 normalized = normalize_vfs_path(path, cwd="/")
-                if normalized in {MEMORY_ROOT, WEBDAV_VFS_ROOT}:
-                    continue
-                if normalized in EXCLUDED_SYNC_ROOTS or normalized.startswith(EXCLUDED_SYNC_PREFIXES):
+                if normalized == root_path:
+                    if await vfs.is_dir(normalized):
+                        desired_dirs.add(normalized)
                     continue
                 if await vfs.is_dir(normalized):
-                    if normalized != "/":
-                        desired_dirs.add(normalized)
+                    desired_dirs.add(normalized)
                     continue
                 desired_files.add(normalized)
                 parent = normalized.rsplit("/", 1)[0] or "/"
                 while parent and parent != "/":
                     desired_dirs.add(parent)
+                    if parent == root_path:
+                        break
                     parent = parent.rsplit("/", 1)[0] or "/"
 
-            for root_path in ("/skills", INBOX_ROOT, HISTORY_ROOT):
-                if await vfs.path_exists(root_path):
-                    if await vfs.is_dir(root_path):
-                        desired_dirs.add(root_path)
-                    for path in sorted(set(await vfs.find(root_path, ""))):
-                        normalized = normalize_vfs_path(path, cwd="/")
-                        if normalized == root_path:
-                            if await vfs.is_dir(normalized):
-                                desired_dirs.add(normalized)
-                            continue
-                        if await vfs.is_dir(normalized):
-                            desired_dirs.add(normalized)
-                            continue
-                        desired_files.add(normalized)
-                        parent = normalized.rsplit("/", 1)[0] or "/"
-                        while parent and parent != "/":
-                            desired_dirs.add(parent)
-                            if parent == root_path:
-                                break
-                            parent = parent.rsplit("/", 1)[0] or "/"
-
-            for directory in sorted(desired_dirs):
-                _add_directory_entry(archive, directory)
-            for path in sorted(desired_files):
-                await _add_file_entry(archive, vfs=vfs, path=path)
-
-        return bundle_path.read_bytes()
-    finally:
-        bundle_path.unlink(missing_ok=True)
+    return desired_dirs, desired_files
+
+
+def _store_content_digest(user_file_id: int, digest: str) -> None:
+    UserFile.objects.filter(id=user_file_id).update(content_sha256=digest)
+
+
+async def _file_digest(vfs: VirtualFileSystem, path: str) -> tuple[str, bytes | None]:
+    """Return the SHA-256 of a file, and its content when it had to be read.
+
+    Digests of stored files are cached on their `UserFile`, so a file is only
+    downloaded to be hashed once.
+    """
+    item = await vfs.get_real_file(path)
+    user_file = getattr(item, "user_file", None)
+    cached_digest = str(getattr(user_file, "content_sha256", "") or "")
+    if cached_digest:
+        return cached_digest, None
+    content, _mime_type = await vfs.read_bytes(path)
+    digest = hashlib.sha256(content).hexdigest()
+    if user_file is not None and user_file.id:
+        await sync_to_async(_store_content_digest, thread_sensitive=True)(user_file.id, digest)
+        user_file.content_sha256 = digest
+    return digest, content
+
+
+async def _build_sync_bundle(
+    vfs: VirtualFileSystem,
+    *,
+    runner_files: dict[str, str] | None = None,
+) -> tuple[SandboxSyncPlan, bytes]:
+    """Build the sync plan and bundle for the sandbox workspace.
+
+    With the `{path: sha256}` manifest of the runner, only files whose digest
+    differs are bundled (delta sync). Without one, or when the runner
+    workspace is empty, every file is bundled and the workspace is replaced.
+    """
+    desired_dirs, desired_files = await _collect_sync_tree(vfs)
+    delta = bool(runner_files)
+    bundled: dict[str, bytes | None] = {}
+    for path in sorted(desired_files):
+        if not delta:
+            bundled[path] = None
+            continue
+        digest, content = await _file_digest(vfs, path)
+        if runner_files.get(path) != digest:
+            bundled[path] = content
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for directory in sorted(desired_dirs):
+            _add_directory_entry(archive, directory)
+        for path, content in bundled.items():
+            await _add_file_entry(archive, vfs=vfs, path=path, content=content)
+
+    if not delta:
+        return SandboxSyncPlan(mode=SYNC_MODE_FULL), buffer.getvalue()
+    return (
+        SandboxSyncPlan(
+            mode=SYNC_MODE_DELTA,
+            base_manifest_digest=manifest_digest(runner_files),
+            removed_paths=tuple(sorted(set(runner_files) - desired_files)),
+            directory_paths=tuple(sorted(desired_dirs)),
+        ),
+        buffer.getvalue(),
+    )
+
+
+async def _fetch_runner_manifest(selector: ExecSessionSelector) -> dict[str, str] | None:
+    try:
+        response = await _runner_request(
+            "GET",
+            f"/v1/sessions/{selector.session_id}/manifest",
+            default_error_message="Exec runner manifest request failed.",
+        )
+        payload = response.json()
+    except (ExecRunnerError, ValueError):
+        return None
+    files = payload.get("files") if isinstance(payload, dict) else None
+    if not isinstance(files, dict):
+        return None
+    return {str(path): str(digest) for path, digest in files.items()}
 
 
 def _parse_multipart_response(response: httpx.Response) -> tuple[dict, bytes]:
@@ -270,48 +350,66 @@ async def execute_sandbox_shell_command(
     if cwd in {"/skills", INBOX_ROOT, HISTORY_ROOT, MEMORY_ROOT, WEBDAV_VFS_ROOT}:
         cwd = "/"
 
-    sync_bundle_bytes = await _build_sync_bundle(vfs)
+    selector = _selector_for_vfs(vfs)
     metadata = {
         "selector": {
-            "user_id": getattr(vfs.user, "id", "anon"),
-            "thread_id": getattr(vfs.thread, "id", "thread"),
-            "agent_id": getattr(vfs.agent_config, "id", "agent"),
+            "user_id": selector.user_id,
+            "thread_id": selector.thread_id,
+            "agent_id": selector.agent_id,
         },
         "command": str(command or ""),
         "cwd": cwd,
         "ensure_python": bool(ensure_python),
     }
 
-    with tempfile.NamedTemporaryFile(prefix="nova-sync-request-", suffix=".tar.gz", delete=False) as handle:
-        request_bundle_path = Path(handle.name)
-        handle.write(sync_bundle_bytes)
+    runner_files = await _fetch_runner_manifest(selector)
+    sync_plan, sync_bundle_bytes = await _build_sync_bundle(vfs, runner_files=runner_files)
     try:
-        with request_bundle_path.open("rb") as bundle_handle:
-            response = await _runner_request(
-                "POST",
-                "/v1/sessions/exec",
-                default_error_message="Exec runner request failed.",
-                data={"metadata": json.dumps(metadata, ensure_ascii=False)},
-                files={"sync_bundle": ("sync.tar.gz", bundle_handle, "application/gzip")},
-            )
-        response_metadata, diff_bundle_bytes = _parse_multipart_response(response)
-        sync_meta = await _apply_diff_bundle(
-            vfs,
-            diff_bundle_bytes=diff_bundle_bytes,
-            removed_paths=list(response_metadata.get("removed_paths") or []),
-            directory_paths=list(response_metadata.get("directory_paths") or []),
-        )
-        result = SandboxShellResult(
-            stdout=str(response_metadata.get("stdout") or ""),
-            stderr=str(response_metadata.get("stderr") or ""),
-            status=int(response_metadata.get("status") or 0),
-            cwd_after=normalize_vfs_path(str(response_metadata.get("cwd_after") or "/"), cwd="/"),
-            execution_plane=str(response_metadata.get("execution_plane") or "sandbox"),
-        )
-        vfs.set_cwd(result.cwd_after)
-        return result, sync_meta
-    finally:
-        request_bundle_path.unlink(missing_ok=True)
+        response = await _post_exec_request(metadata, sync_plan, sync_bundle_bytes)
+    except ExecRunnerSyncConflict:
+        # The workspace changed since the manifest was read: replace it.
+        sync_plan, sync_bundle_bytes = await _build_sync_bundle(vfs)
+        response = await _post_exec_request(metadata, sync_plan, sync_bundle_bytes)
+
+    response_metadata, diff_bundle_bytes = _parse_multipart_response(response)
+    sync_meta = await _apply_diff_bundle(
+        vfs,
+        diff_bundle_bytes=diff_bundle_bytes,
+        removed_paths=list(response_metadata.get("removed_paths") or []),
+        directory_paths=list(response_metadata.get("directory_paths") or []),
+    )
+    result = SandboxShellResult(
+        stdout=str(response_metadata.get("stdout") or ""),
+        stderr=str(response_metadata.get("stderr") or ""),
+        status=int(response_metadata.get("status") or 0),
+        cwd_after=normalize_vfs_path(str(response_metadata.get("cwd_after") or "/"), cwd="/"),
+        execution_plane=str(response_metadata.get("execution_plane") or "sandbox"),
+    )
+    vfs.set_cwd(result.cwd_after)
+    return result, sync_meta
+
+
+async def _post_exec_request(
+    metadata: dict,
+    sync_plan: SandboxSyncPlan,
+    sync_bundle_bytes: bytes,
+) -> httpx.Response:
+    payload = {
+        **metadata,
+        "sync": {
+            "mode": sync_plan.mode,
+            "base_manifest_digest": sync_plan.base_manifest_digest,
+            "removed_paths": list(sync_plan.removed_paths),
+            "directory_paths": list(sync_plan.directory_paths),
+        },
+    }
+    return await _runner_request(
+        "POST",
+        "/v1/sessions/exec",
+        default_error_message="Exec runner request failed.",
+        data={"metadata": json.dumps(payload, ensure_ascii=False)},
+        files={"sync_bundle": ("sync.tar.gz", sync_bundle_bytes, "application/gzip")},
+    )
 
 
 async def execute_sandbox_python_command(
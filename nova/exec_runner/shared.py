@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import posixpath
 import shlex
@@ -18,6 +20,9 @@ RUNNER_INTERNAL_DIRNAME = ".nova_runner"
 RUNNER_COMMAND_FILENAME = "command.sh"
 RUNNER_ENV_FILENAME = "env.json"
 RUNNER_CWD_FILENAME = "cwd.txt"
+RUNNER_MANIFEST_FILENAME = "manifest.json"
+SYNC_MODE_FULL = "full"
+SYNC_MODE_DELTA = "delta"
 
 READ_ONLY_PROJECTION_ROOTS = (SKILLS_ROOT, INBOX_ROOT, HISTORY_ROOT)
 SHELL_SPECIAL_PATH_PREFIXES = (
@@ -196,6 +201,10 @@ class ExecRunnerError(Exception):
     pass
 
 
+class ExecRunnerSyncConflict(ExecRunnerError):
+    """The session workspace no longer matches the manifest a delta sync was built from."""
+
+
 @dataclass(slots=True, frozen=True)
 class ExecSessionSelector:
     user_id: int | str
@@ -228,6 +237,14 @@ class SandboxShellResult:
     execution_plane: str = "sandbox"
 
 
+@dataclass(slots=True, frozen=True)
+class SandboxSyncPlan:
+    mode: str = SYNC_MODE_FULL
+    base_manifest_digest: str = ""
+    removed_paths: tuple[str, ...] = ()
+    directory_paths: tuple[str, ...] = ()
+
+
 @dataclass(slots=True, frozen=True)
 class SandboxOutputFile:
     path: str
@@ -235,6 +252,15 @@ class SandboxOutputFile:
     mime_type: str = "application/octet-stream"
 
 
+def manifest_digest(files: dict[str, str]) -> str:
+    """Digest of a `{path: sha256}` workspace manifest.
+
+    `_WORKSPACE_SYNC_SCRIPT` in the runner computes the same value.
+    """
+    payload = json.dumps(sorted(files.items()), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def normalize_sandbox_path(raw_path: str, *, cwd: str = "/") -> str:
     candidate = str(raw_path or "").strip()
     if not candidate:
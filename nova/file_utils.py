@@ -1,22 +1,28 @@
 # nova/utils/file_utils.py
+import asyncio
+import hashlib
 import logging
 import posixpath
 from collections import defaultdict
-from typing import List, Dict, Tuple
+from typing import Any, AsyncIterator, List, Dict, Tuple
 from django.core.exceptions import PermissionDenied
 from django.conf import settings
 from asgiref.sync import sync_to_async
-import aioboto3  # For async S3 operations
 import magic  # For MIME detection
 
 from nova.models.UserFile import UserFile
 from nova.models.Thread import Thread
+from nova.storage_clients import get_async_s3_client
 
 logger = logging.getLogger(__name__)
 
 # Constants
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 MULTIPART_THRESHOLD = 5 * 1024 * 1024  # 5MB threshold for multipart
+MULTIPART_PART_SIZE = 5 * 1024 * 1024  # S3 minimum part size (except the last part)
+DEFAULT_MULTIPART_CONCURRENCY = 4
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+MIME_SNIFF_BYTES = 8192
 MESSAGE_ATTACHMENT_STORAGE_PREFIX = "/.message_attachments"
 
 
@@ -41,61 +47,200 @@ def sanitize_user_path(raw: str) -> str:
     return '/' + '/'.join(parts)
 
 
+def _build_storage_key(path: str, thread: Thread, user) -> str:
+    safe_path = sanitize_user_path(path)  # e.g. "/dir/file.txt"
+    return f"users/{user.id}/threads/{thread.id}{safe_path}"
+
+
+def _multipart_concurrency(concurrency: int | None) -> int:
+    if concurrency is None:
+        concurrency = getattr(settings, 'MINIO_MULTIPART_CONCURRENCY', DEFAULT_MULTIPART_CONCURRENCY)
+    return max(1, int(concurrency))
+
+
+async def _iter_source_chunks(source: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield raw chunks from bytes, an async iterable or a sync file object."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for offset in range(0, len(view), chunk_size):
+            yield bytes(view[offset:offset + chunk_size])
+        return
+    if hasattr(source, '__aiter__'):
+        async for chunk in source:
+            if chunk:
+                yield bytes(chunk)
+        return
+    # Sync file-like objects (SpooledTemporaryFile, Django UploadedFile, ...)
+    read = sync_to_async(source.read, thread_sensitive=False)
+    while True:
+        chunk = await read(chunk_size)
+        if not chunk:
+            return
+        yield bytes(chunk)
+
+
+async def _iter_parts(source: Any, part_size: int) -> AsyncIterator[bytes]:
+    """Re-chunk ``source`` into ``part_size`` parts (the last one may be shorter)."""
+    buffer = bytearray()
+    async for chunk in _iter_source_chunks(source, part_size):
+        buffer.extend(chunk)
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _multipart_upload(s3_client, key: str, parts: AsyncIterator[bytes],
+                            extra_args: dict, concurrency: int) -> int:
+    """Upload parts concurrently while holding at most ``concurrency`` parts in memory."""
+    mpu = await s3_client.create_multipart_upload(Bucket=settings.MINIO_BUCKET_NAME, Key=key, **extra_args)
+    upload_id = mpu['UploadId']
+    slots = asyncio.Semaphore(concurrency)
+    pending: list[asyncio.Task] = []
+    total_size = 0
+
+    async def _upload_part(part_num: int, chunk: bytes) -> dict:
+        try:
+            part = await s3_client.upload_part(
+                Bucket=settings.MINIO_BUCKET_NAME, Key=key,
+                PartNumber=part_num,
+                UploadId=upload_id, Body=chunk
+            )
+            return {'PartNumber': part_num, 'ETag': part['ETag']}
+        finally:
+            slots.release()
+
+    try:
+        part_num = 0
+        async for chunk in parts:
+            await slots.acquire()
+            failed = [task for task in pending if task.done() and task.exception() is not None]
+            if failed:
+                slots.release()
+                raise failed[0].exception()
+            part_num += 1
+            total_size += len(chunk)
+            pending.append(asyncio.create_task(_upload_part(part_num, chunk)))
+        uploaded = await asyncio.gather(*pending)
+        await s3_client.complete_multipart_upload(
+            Bucket=settings.MINIO_BUCKET_NAME, Key=key,
+            UploadId=upload_id, MultipartUpload={'Parts': sorted(uploaded, key=lambda p: p['PartNumber'])}
+        )
+        return total_size
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        try:
+            await s3_client.abort_multipart_upload(
+                Bucket=settings.MINIO_BUCKET_NAME, Key=key, UploadId=upload_id,
+            )
+        except Exception as abort_error:
+            logger.warning(f"Could not abort multipart upload {upload_id} for {key}: {abort_error}")
+        raise
+
+
 async def upload_file_to_minio(content: bytes, path: str, mime: str,
                                thread: Thread, user) -> str:
     """Async upload content to MinIO and return key."""
-    safe_path = sanitize_user_path(path)  # e.g. "/dir/file.txt"
-    key = f"users/{user.id}/threads/{thread.id}{safe_path}"
-    session = aioboto3.Session()
-    async with session.client(
-        's3', endpoint_url=settings.MINIO_ENDPOINT_URL,
-        aws_access_key_id=settings.MINIO_ACCESS_KEY,
-        aws_secret_access_key=settings.MINIO_SECRET_KEY
-    ) as s3_client:
-        try:
-            extra_args = {'ContentType': mime}  # Add MIME
-            if len(content) > MULTIPART_THRESHOLD:
-                # Multipart upload for large files
-                mpu = await s3_client.create_multipart_upload(Bucket=settings.MINIO_BUCKET_NAME, Key=key, **extra_args)
-                parts = []
-                chunk_size = 5 * 1024 * 1024  # 5MB chunks
-                for i in range(0, len(content), chunk_size):
-                    chunk = content[i:i + chunk_size]
-                    part_num = len(parts) + 1
-                    part = await s3_client.upload_part(
-                        Bucket=settings.MINIO_BUCKET_NAME, Key=key,
-                        PartNumber=part_num,
-                        UploadId=mpu['UploadId'], Body=chunk
-                    )
-                    parts.append({'PartNumber': part_num, 'ETag': part['ETag']})
-                await s3_client.complete_multipart_upload(
-                    Bucket=settings.MINIO_BUCKET_NAME, Key=key,
-                    UploadId=mpu['UploadId'], MultipartUpload={'Parts': parts}
-                )
-            else:
-                # Single put for small files
-                await s3_client.put_object(Bucket=settings.MINIO_BUCKET_NAME,
-                                           Key=key, Body=content, **extra_args)
-            return key
-        except Exception as e:  # Catch aioboto3 errors
-            logger.error(f"Error uploading to MinIO: {e}")
-            raise
+    key = _build_storage_key(path, thread, user)
+    s3_client = await get_async_s3_client()
+    try:
+        extra_args = {'ContentType': mime}  # Add MIME
+        if len(content) > MULTIPART_THRESHOLD:
+            # Multipart upload for large files, parts sent concurrently
+            await _multipart_upload(s3_client, key, _iter_parts(content, MULTIPART_PART_SIZE),
+                                    extra_args, _multipart_concurrency(None))
+        else:
+            # Single put for small files
+            await s3_client.put_object(Bucket=settings.MINIO_BUCKET_NAME,
+                                       Key=key, Body=content, **extra_args)
+        return key
+    except Exception as e:  # Catch aioboto3 errors
+        logger.error(f"Error uploading to MinIO: {e}")
+        raise
+
+
+async def upload_stream_to_minio(source: Any, path: str, mime: str,
+                                 thread: Thread, user, *,
+                                 part_size: int = MULTIPART_PART_SIZE,
+                                 concurrency: int | None = None) -> Tuple[str, int]:
+    """Stream ``source`` to MinIO and return ``(key, size)``.
+
+    ``source`` may be bytes, an async iterable of bytes or a sync file-like
+    object. Only ``concurrency`` parts of ``part_size`` bytes are buffered at
+    once; a payload that fits in one part is sent with a single put.
+    """
+    part_size = max(int(part_size), MULTIPART_PART_SIZE)
+    key = _build_storage_key(path, thread, user)
+    s3_client = await get_async_s3_client()
+    try:
+        extra_args = {'ContentType': mime}
+        parts = _iter_parts(source, part_size)
+        first_part = await anext(parts, b'')
+        second_part = await anext(parts, None)
+        if second_part is None:
+            await s3_client.put_object(Bucket=settings.MINIO_BUCKET_NAME,
+                                       Key=key, Body=first_part, **extra_args)
+            return key, len(first_part)
+
+        async def _all_parts():
+            yield first_part
+            yield second_part
+            async for part in parts:
+                yield part
+
+        size = await _multipart_upload(s3_client, key, _all_parts(), extra_args,
+                                       _multipart_concurrency(concurrency))
+        return key, size
+    except Exception as e:
+        logger.error(f"Error streaming upload to MinIO: {e}")
+        raise
+
+
+async def _read_head(source: Any, size: int) -> bytes:
+    """Return the first ``size`` bytes of a sync file object and rewind it."""
+    def _read():
+        source.seek(0)
+        head = source.read(size)
+        source.seek(0)
+        return head
+    return await sync_to_async(_read, thread_sensitive=False)()
+
+
+async def _hashed_chunks(source: Any, digest) -> AsyncIterator[bytes]:
+    async for chunk in _iter_source_chunks(source, MULTIPART_PART_SIZE):
+        digest.update(chunk)
+        yield chunk
 
 
 async def download_file_content(user_file: UserFile) -> bytes:
     """Download file bytes from MinIO."""
-    session = aioboto3.Session()
-    async with session.client(
-        's3',
-        endpoint_url=settings.MINIO_ENDPOINT_URL,
-        aws_access_key_id=settings.MINIO_ACCESS_KEY,
-        aws_secret_access_key=settings.MINIO_SECRET_KEY
-    ) as s3_client:
-        response = await s3_client.get_object(
-            Bucket=settings.MINIO_BUCKET_NAME,
-            Key=user_file.key,
-        )
-        return await response['Body'].read()
+    s3_client = await get_async_s3_client()
+    response = await s3_client.get_object(
+        Bucket=settings.MINIO_BUCKET_NAME,
+        Key=user_file.key,
+    )
+    async with response['Body'] as body:
+        return await body.read()
+
+
+async def iter_file_content(key: str, start: int | None = None, end: int | None = None, *,
+                            chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Stream an object, or the inclusive byte range ``start``-``end`` of it."""
+    params = {'Bucket': settings.MINIO_BUCKET_NAME, 'Key': key}
+    if start is not None or end is not None:
+        range_start = max(int(start or 0), 0)
+        range_end = '' if end is None else int(end)
+        if range_end != '' and range_end < range_start:
+            return
+        params['Range'] = f"bytes={range_start}-{range_end}"
+    s3_client = await get_async_s3_client()
+    response = await s3_client.get_object(**params)
+    async with response['Body'] as body:
+        async for chunk in body.iter_chunks(chunk_size):
+            yield chunk
 
 
 def build_message_attachment_path(message_id: int, filename: str) -> str:
@@ -190,7 +335,11 @@ async def batch_upload_files(thread: Thread, user,
                              allowed_mime_types: List[str] | None = None,
                              allowed_mime_prefixes: Tuple[str, ...] = ()) -> Tuple[List[Dict], List[str]]:
     """Async process batch of files with paths, upload, and
-       return created files + errors."""
+       return created files + errors.
+
+       Items carry either ``content`` bytes or a ``source`` file object with
+       its ``size``; sources are streamed to storage instead of being read
+       into memory."""
     created_files = []
     errors = []
     allowed_types = (
@@ -211,18 +360,20 @@ async def batch_upload_files(thread: Thread, user,
                 raise PermissionDenied(f"Access denied: User {user.id} trying to upload to thread {thread.id}")
 
             proposed_path = item['path']
-            content = item['content']
+            source = item.get('source')
+            content = item.get('content') or b''
+            size = int(item.get('size') or 0) if source is not None else len(content)
             explicit_mime = str(item.get('mime_type') or '').strip().lower()
 
-            if not content or len(content) == 0:
+            if size == 0:
                 errors.append(f"Empty content for {proposed_path}")
                 continue
 
-            if len(content) > max_file_size:
+            if size > max_file_size:
                 errors.append(f"File too large: {proposed_path}")
                 continue
 
-            mime = detect_mime(content)
+            mime = detect_mime(content if source is None else await _read_head(source, MIME_SNIFF_BYTES))
             if enforce_mime_policy:
                 mime_is_allowed = _mime_matches_policy(mime, allowed_types, allowed_prefixes)
                 explicit_mime_is_allowed = _mime_matches_policy(explicit_mime, allowed_types, allowed_prefixes)
@@ -238,16 +389,24 @@ async def batch_upload_files(thread: Thread, user,
             if renamed_path != proposed_path:
                 logger.info(f"Auto-renamed {proposed_path} to {renamed_path}")
 
-            key = await upload_file_to_minio(content, renamed_path, mime,
-                                             thread, user)
+            if source is None:
+                key = await upload_file_to_minio(content, renamed_path, mime,
+                                                 thread, user)
+                content_sha256 = hashlib.sha256(content).hexdigest()
+            else:
+                digest = hashlib.sha256()
+                key, size = await upload_stream_to_minio(_hashed_chunks(source, digest), renamed_path,
+                                                         mime, thread, user)
+                content_sha256 = digest.hexdigest()
 
             # Async-safe ORM create
             @sync_to_async
             def create_user_file():
                 return UserFile.objects.create(
                     user=user, thread=thread, original_filename=renamed_path,
-                    mime_type=mime, size=len(content), key=key, scope=scope,
+                    mime_type=mime, size=size, key=key, scope=scope,
                     source_message=source_message,
+                    content_sha256=content_sha256,
                 )
             user_file = await create_user_file()
             created_file = {
@@ -255,7 +414,7 @@ async def batch_upload_files(thread: Thread, user,
                 'path': renamed_path,
                 'filename': posixpath.basename(renamed_path),
                 'mime_type': mime,
-                'size': len(content),
+                'size': size,
                 'scope': scope,
             }
             if 'request_id' in item:
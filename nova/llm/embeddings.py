@@ -9,20 +9,26 @@ Provider resolution is explicit and independent from the LLM runtime:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 import hashlib
 import json
 import logging
+import time
 from typing import List, Optional
 
 import httpx
 from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.utils import timezone
 
+from nova.models.EmbeddingCache import EmbeddingCacheEntry
 from nova.models.EmbeddingsSystemState import EmbeddingsSystemState
 from nova.models.UserObjects import MemoryEmbeddingsSource, UserParameters
 from nova.web.network_policy import (
     LOCAL_DEVELOPMENT_HOSTS,
+    assert_allowed_egress_url,
     build_allowed_private_hosts,
 )
 from nova.web.safe_http import safe_http_request
@@ -31,6 +37,12 @@ from nova.web.safe_http import safe_http_request
 logger = logging.getLogger(__name__)
 
 EMBEDDING_DIMENSIONS = 1024
+DEFAULT_EMBEDDINGS_BATCH_SIZE = 32
+EMBEDDINGS_PROVIDER_CACHE_TIMEOUT = 300
+EMBEDDINGS_PROVIDER_CACHE_MAX_ENTRIES = 4096
+# Expired cache rows of a user are deleted at most once per interval.
+EMBEDDING_CACHE_PRUNE_INTERVAL = 3600
+_PROVIDER_CACHE_MISS = object()
 
 
 @dataclass(frozen=True)
@@ -40,6 +52,7 @@ class EmbeddingsProvider:
     model: str
     api_key: str | None = None
     allowed_private_hosts: tuple[str, ...] = ()
+    max_batch_size: int = DEFAULT_EMBEDDINGS_BATCH_SIZE
 
 
 @dataclass(frozen=True)
@@ -71,6 +84,7 @@ def get_custom_http_provider(
     model: str | None,
     api_key: str | None,
     allowed_private_hosts: tuple[str, ...] = (),
+    max_batch_size: int | None = None,
 ) -> Optional[EmbeddingsProvider]:
     """Build a custom HTTP embeddings provider from raw values."""
 
@@ -84,6 +98,7 @@ def get_custom_http_provider(
         model=(model or "").strip(),
         api_key=api_key or None,
         allowed_private_hosts=tuple(allowed_private_hosts or ()),
+        max_batch_size=max(1, int(max_batch_size or DEFAULT_EMBEDDINGS_BATCH_SIZE)),
     )
 
 
@@ -97,6 +112,7 @@ def get_system_embeddings_provider() -> Optional[EmbeddingsProvider]:
         allowed_private_hosts=build_allowed_private_hosts(
             urls=(getattr(settings, "MEMORY_EMBEDDINGS_URL", None),),
         ),
+        max_batch_size=getattr(settings, "MEMORY_EMBEDDINGS_BATCH_SIZE", None),
     )
 
 
@@ -304,43 +320,186 @@ async def aget_resolved_embeddings_provider(*, user_id: int | None = None) -> Re
     )
 
 
+@dataclass(frozen=True)
+class _CachedEmbeddingsProvider:
+    version: int
+    expires_at: float
+    provider: EmbeddingsProvider | None
+
+
+# Resolved providers carry API keys, so they stay in process memory. The shared
+# cache only holds a per-user version that invalidation bumps for every process.
+_provider_cache: dict[str, _CachedEmbeddingsProvider] = {}
+
+
+def _embeddings_provider_cache_key(user_id: int | None) -> str:
+    # The system provider fingerprint is part of the key so a change of the
+    # MEMORY_EMBEDDINGS_* settings never serves a provider resolved before it.
+    system_provider = get_system_embeddings_provider()
+    system_fingerprint = _system_provider_fingerprint(system_provider)[:16]
+    batch_size = system_provider.max_batch_size if system_provider else 0
+    user_key = user_id if user_id is not None else "none"
+    return f"{user_key}:{system_fingerprint}:{batch_size}"
+
+
+def _embeddings_provider_version_key(user_id: int | None) -> str:
+    user_key = user_id if user_id is not None else "none"
+    return f"nova:embeddings_provider_version:{user_key}"
+
+
+def _get_local_provider(cache_key: str, version: int):
+    entry = _provider_cache.get(cache_key)
+    if entry is None or entry.version != version or entry.expires_at <= time.monotonic():
+        return _PROVIDER_CACHE_MISS
+    return entry.provider
+
+
+def _set_local_provider(cache_key: str, version: int, provider: EmbeddingsProvider | None) -> None:
+    if len(_provider_cache) >= EMBEDDINGS_PROVIDER_CACHE_MAX_ENTRIES:
+        _provider_cache.clear()
+    _provider_cache[cache_key] = _CachedEmbeddingsProvider(
+        version=version,
+        expires_at=time.monotonic() + EMBEDDINGS_PROVIDER_CACHE_TIMEOUT,
+        provider=provider,
+    )
+
+
+def invalidate_embeddings_provider_cache(*, user_id: int | None) -> None:
+    """Make every process drop its cached effective provider of `user_id`."""
+
+    version_key = _embeddings_provider_version_key(user_id)
+    cache.add(version_key, 0, timeout=None)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # Evicted between add() and incr(); any new value invalidates.
+        cache.set(version_key, time.time_ns(), timeout=None)
+
+
 def get_embeddings_provider(*, user_id: int | None = None) -> Optional[EmbeddingsProvider]:
-    """Return the effective embeddings provider for a user."""
+    """Return the effective embeddings provider for a user.
+
+    Results are cached per process for `EMBEDDINGS_PROVIDER_CACHE_TIMEOUT`
+    seconds and invalidated everywhere when the user's `UserParameters` change.
+    """
+
+    cache_key = _embeddings_provider_cache_key(user_id)
+    version = cache.get(_embeddings_provider_version_key(user_id), 0)
+    provider = _get_local_provider(cache_key, version)
+    if provider is not _PROVIDER_CACHE_MISS:
+        return provider
 
-    return get_resolved_embeddings_provider(user_id=user_id).provider
+    provider = get_resolved_embeddings_provider(user_id=user_id).provider
+    _set_local_provider(cache_key, version, provider)
+    return provider
 
 
 async def aget_embeddings_provider(*, user_id: int | None = None) -> Optional[EmbeddingsProvider]:
     """Async-safe version of `get_embeddings_provider()`."""
 
+    cache_key = _embeddings_provider_cache_key(user_id)
+    version = await cache.aget(_embeddings_provider_version_key(user_id), 0)
+    provider = _get_local_provider(cache_key, version)
+    if provider is not _PROVIDER_CACHE_MISS:
+        return provider
+
     resolved = await aget_resolved_embeddings_provider(user_id=user_id)
+    _set_local_provider(cache_key, version, resolved.provider)
     return resolved.provider
 
 
-async def compute_embedding(
-    text: str,
-    *,
-    provider_override: EmbeddingsProvider | None = None,
-    user_id: int | None = None,
-) -> Optional[List[float]]:
-    """Compute an embedding vector for `text`.
+def _embedding_content_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
 
-    Returns None if embeddings are disabled.
 
-    Expected response format (OpenAI-like):
-    {
-      "data": [{"embedding": [..]}]
+def _embedding_provider_key(provider: EmbeddingsProvider) -> str:
+    payload = {
+        "provider_type": provider.provider_type,
+        "base_url": provider.base_url.rstrip("/"),
     }
-    """
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
 
-    if provider_override is not None:
-        provider = provider_override
-    elif user_id is not None:
-        provider = await aget_embeddings_provider(user_id=user_id)
-    else:
-        provider = get_embeddings_provider(user_id=None)
-    if not provider:
-        return None
+
+def _get_cached_embeddings(
+    user_id: int,
+    provider: EmbeddingsProvider,
+    content_hashes: list[str],
+) -> dict[str, List[float]]:
+    if not content_hashes:
+        return {}
+    rows = EmbeddingCacheEntry.objects.filter(
+        user_id=user_id,
+        provider_key=_embedding_provider_key(provider),
+        model=(provider.model or "").strip(),
+        dimensions=EMBEDDING_DIMENSIONS,
+        content_hash__in=content_hashes,
+        created_at__gte=_embedding_cache_cutoff(),
+    ).values_list("content_hash", "vector")
+    return {content_hash: [float(value) for value in vector] for content_hash, vector in rows}
+
+
+def _store_cached_embeddings(
+    user_id: int,
+    provider: EmbeddingsProvider,
+    vectors: dict[str, List[float]],
+) -> None:
+    if not vectors:
+        return
+    provider_key = _embedding_provider_key(provider)
+    model = (provider.model or "").strip()
+    EmbeddingCacheEntry.objects.bulk_create(
+        [
+            EmbeddingCacheEntry(
+                user_id=user_id,
+                provider_key=provider_key,
+                model=model,
+                dimensions=EMBEDDING_DIMENSIONS,
+                content_hash=content_hash,
+                vector=vector,
+            )
+            for content_hash, vector in vectors.items()
+        ],
+        # An expired row of the same text is replaced rather than kept.
+        update_conflicts=True,
+        unique_fields=["user", "provider_key", "model", "dimensions", "content_hash"],
+        update_fields=["vector", "created_at"],
+    )
+
+
+def _embedding_cache_cutoff():
+    return timezone.now() - timedelta(days=settings.EMBEDDING_CACHE_MAX_AGE_DAYS)
+
+
+def prune_embedding_cache(user_id: int) -> int:
+    """Delete cached vectors of `user_id` older than `EMBEDDING_CACHE_MAX_AGE_DAYS`."""
+
+    deleted, _ = EmbeddingCacheEntry.objects.filter(
+        user_id=user_id,
+        created_at__lt=_embedding_cache_cutoff(),
+    ).delete()
+    return deleted
+
+
+def _embedding_cache_prune_key(user_id: int) -> str:
+    return f"nova:embedding_cache_pruned:{user_id}"
+
+
+def _normalize_embedding_vector(embedding) -> List[float]:
+    if not embedding:
+        raise ValueError("Embeddings response missing data[].embedding")
+
+    if len(embedding) > EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"Embedding dimensions too large: got {len(embedding)} max {EMBEDDING_DIMENSIONS}"
+        )
+    if len(embedding) < EMBEDDING_DIMENSIONS:
+        embedding = list(embedding) + [0.0] * (EMBEDDING_DIMENSIONS - len(embedding))
+
+    return list(embedding)
+
+
+async def _request_embeddings(provider: EmbeddingsProvider, texts: list[str]) -> List[List[float]]:
+    """Send one provider request for `texts` and return vectors in input order."""
 
     headers = {}
     if provider.api_key:
@@ -348,7 +507,7 @@ async def compute_embedding(
 
     payload = {
         "model": provider.model,
-        "input": text,
+        "input": texts,
     }
 
     path = "/embeddings" if provider.base_url.rstrip("/").endswith("/v1") else ""
@@ -364,15 +523,112 @@ async def compute_embedding(
     resp.raise_for_status()
     data = resp.json()
 
-    embedding = data.get("data", [{}])[0].get("embedding")
-    if not embedding:
-        raise ValueError("Embeddings response missing data[0].embedding")
-
-    if len(embedding) > EMBEDDING_DIMENSIONS:
+    items = list(data.get("data") or [])
+    if len(items) != len(texts):
         raise ValueError(
-            f"Embedding dimensions too large: got {len(embedding)} max {EMBEDDING_DIMENSIONS}"
+            f"Embeddings response returned {len(items)} vectors for {len(texts)} inputs"
         )
-    if len(embedding) < EMBEDDING_DIMENSIONS:
-        embedding = embedding + [0.0] * (EMBEDDING_DIMENSIONS - len(embedding))
+    if all(isinstance(item.get("index"), int) for item in items):
+        items.sort(key=lambda item: item["index"])
+
+    return [_normalize_embedding_vector(item.get("embedding")) for item in items]
+
+
+async def _resolve_embeddings_provider(
+    *,
+    provider_override: EmbeddingsProvider | None,
+    user_id: int | None,
+) -> Optional[EmbeddingsProvider]:
+    if provider_override is not None:
+        return provider_override
+    if user_id is not None:
+        return await aget_embeddings_provider(user_id=user_id)
+    return get_embeddings_provider(user_id=None)
+
+
+async def compute_embeddings_batch(
+    texts: list[str],
+    *,
+    provider_override: EmbeddingsProvider | None = None,
+    user_id: int | None = None,
+) -> Optional[List[List[float]]]:
+    """Compute embedding vectors for `texts`, in input order.
+
+    Returns None if embeddings are disabled.
 
-    return embedding
+    With a `user_id`, vectors that user already computed with the same
+    provider, model, dimensions and text are read from `EmbeddingCacheEntry`.
+    The remaining distinct texts are sent in requests of at most
+    `provider.max_batch_size` inputs.
+
+    Expected response format (OpenAI-like):
+    {
+      "data": [{"index": 0, "embedding": [..]}, ...]
+    }
+    """
+
+    provider = await _resolve_embeddings_provider(provider_override=provider_override, user_id=user_id)
+    if not provider:
+        return None
+
+    texts = list(texts)
+    if not texts:
+        return []
+
+    content_hashes = [_embedding_content_hash(text) for text in texts]
+    unique_texts = dict(zip(content_hashes, texts))
+    vectors: dict[str, List[float]] = {}
+    if user_id is not None:
+        # A provider the network policy now rejects must not keep serving cached vectors.
+        await assert_allowed_egress_url(
+            provider.base_url,
+            allowed_private_hosts=tuple(provider.allowed_private_hosts or ()),
+        )
+        vectors = await sync_to_async(_get_cached_embeddings, thread_sensitive=True)(
+            user_id,
+            provider,
+            list(unique_texts),
+        )
+
+    missing = [(content_hash, text) for content_hash, text in unique_texts.items() if content_hash not in vectors]
+    if missing and user_id is not None and await cache.aadd(
+        _embedding_cache_prune_key(user_id), 1, timeout=EMBEDDING_CACHE_PRUNE_INTERVAL
+    ):
+        try:
+            await sync_to_async(prune_embedding_cache, thread_sensitive=True)(user_id)
+        except Exception:
+            logger.warning("Failed to prune embeddings cache of user %s", user_id, exc_info=True)
+    batch_size = max(1, int(provider.max_batch_size or DEFAULT_EMBEDDINGS_BATCH_SIZE))
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start:start + batch_size]
+        computed = await _request_embeddings(provider, [text for _content_hash, text in batch])
+        fresh = {content_hash: vector for (content_hash, _text), vector in zip(batch, computed)}
+        if user_id is not None:
+            try:
+                await sync_to_async(_store_cached_embeddings, thread_sensitive=True)(user_id, provider, fresh)
+            except Exception:
+                logger.warning("Failed to store %s embeddings in cache", len(fresh), exc_info=True)
+        vectors.update(fresh)
+
+    return [vectors[content_hash] for content_hash in content_hashes]
+
+
+async def compute_embedding(
+    text: str,
+    *,
+    provider_override: EmbeddingsProvider | None = None,
+    user_id: int | None = None,
+) -> Optional[List[float]]:
+    """Compute an embedding vector for `text`.
+
+    Returns None if embeddings are disabled. See `compute_embeddings_batch()`.
+    """
+
+    vectors = await compute_embeddings_batch(
+        [text],
+        provider_override=provider_override,
+        user_id=user_id,
+    )
+    if vectors is None:
+        return None
+    return vectors[0]
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
 from typing import Iterable, List, Optional, Tuple
 
+from django.conf import settings
+from django.db import connection, transaction
+
 from nova.llm.embeddings import aget_embeddings_provider, compute_embedding
 
 logger = logging.getLogger(__name__)
 
+# pgvector rejects `hnsw.ef_search` values above this.
+HNSW_EF_SEARCH_MAX = 1000
+
 
 async def resolve_query_vector(*, user_id: int, query: str) -> Optional[List[float]]:
     """Return query embedding when provider is enabled, else None."""
@@ -63,3 +70,21 @@ def minmax_normalize(value: float, *, vmin: float, vmax: float) -> float:
 
 def blend_semantic_fts(*, semantic: float, fts: float, semantic_weight: float = 0.7, fts_weight: float = 0.3) -> float:
     return semantic_weight * semantic + fts_weight * fts
+
+
+@contextmanager
+def ann_search(*, candidate_limit: int):
+    """Run pgvector candidate queries with `hnsw.ef_search` tuned for `candidate_limit`.
+
+    The setting is transaction-local, so queries run inside an atomic block.
+    On non-PostgreSQL backends this is a plain atomic block.
+    """
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            ef_search = min(
+                max(int(settings.MEMORY_VECTOR_HNSW_EF_SEARCH), int(candidate_limit)),
+                HNSW_EF_SEARCH_MAX,
+            )
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(ef_search)])
+        yield
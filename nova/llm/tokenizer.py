@@ -0,0 +1,87 @@
+"""Local token counting for context budgets.
+
+The tokenizer is pluggable and selected by `TOKENIZER_BACKEND`. The default
+`TiktokenTokenizer` needs the optional `tiktoken` package, and
+`HuggingFaceTokenizer` needs `tokenizers` plus the `tokenizer.json` file set in
+`TOKENIZER_HF_FILE`. When the configured backend cannot be loaded, counts fall
+back to the byte heuristic used so far (about one token per four UTF-8 bytes).
+
+Counts are estimates for budgeting: providers tokenize differently, so one
+local tokenizer is used for every model.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Protocol
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class Tokenizer(Protocol):
+    def count(self, text: str) -> int:
+        ...
+
+
+class HeuristicTokenizer:
+    def count(self, text: str) -> int:
+        content = str(text or "")
+        if not content:
+            return 0
+        return len(content.encode("utf-8", "ignore")) // 4 + 1
+
+
+class TiktokenTokenizer:
+    def __init__(self, encoding: str | None = None):
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding or settings.TOKENIZER_ENCODING)
+
+    def count(self, text: str) -> int:
+        content = str(text or "")
+        if not content:
+            return 0
+        return len(self._encoding.encode(content, disallowed_special=()))
+
+
+class HuggingFaceTokenizer:
+    def __init__(self, path: str | None = None):
+        from tokenizers import Tokenizer as _HFTokenizer
+
+        self._tokenizer = _HFTokenizer.from_file(path or settings.TOKENIZER_HF_FILE)
+
+    def count(self, text: str) -> int:
+        content = str(text or "")
+        if not content:
+            return 0
+        return len(self._tokenizer.encode(content, add_special_tokens=False).ids)
+
+
+_tokenizer: Tokenizer | None = None
+_tokenizer_path: str | None = None
+_tokenizer_lock = threading.Lock()
+
+
+def get_tokenizer() -> Tokenizer:
+    """Return the configured tokenizer, or the heuristic one as fallback."""
+
+    global _tokenizer, _tokenizer_path
+    path = str(getattr(settings, "TOKENIZER_BACKEND", "") or "").strip()
+    with _tokenizer_lock:
+        if _tokenizer is None or _tokenizer_path != path:
+            _tokenizer = HeuristicTokenizer()
+            if path:
+                try:
+                    _tokenizer = import_string(path)()
+                except Exception as exc:
+                    logger.info("[tokenizer] backend %s unavailable, using heuristic: %s", path, exc)
+            _tokenizer_path = path
+        return _tokenizer
+
+
+def count_tokens(text: str) -> int:
+    return get_tokenizer().count(text)
@@ -0,0 +1,413 @@
+"""In-process vector index for deployments without pgvector.
+
+PostgreSQL deployments rank embeddings with pgvector. Other database backends
+(small single-node SQLite deployments and the test suite) use a pluggable
+`VectorIndexBackend` instead, selected by `MEMORY_VECTOR_INDEX_BACKEND`.
+
+The default `NumpyVectorIndex` keeps one memory-mapped float32 matrix per user
+and embedding kind. Rows are unit-normalised so cosine distance is one minus a
+vectorised dot product. The index is synced lazily before each search: rows
+whose embedding changed are appended, rows that disappeared are tombstoned.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils.module_loading import import_string
+
+from nova.models.ConversationEmbedding import (
+    ConversationEmbeddingState,
+    DaySegmentEmbedding,
+    TranscriptChunkEmbedding,
+)
+from nova.models.MemoryChunkEmbedding import MemoryChunkEmbedding
+from nova.models.memory_common import MemoryChunkEmbeddingState
+
+logger = logging.getLogger(__name__)
+
+_TOMBSTONE = -1
+_INITIAL_CAPACITY = 256
+
+
+@dataclass(frozen=True)
+class _IndexedKind:
+    ready: Callable[[int], QuerySet]
+    key: str
+
+
+# Each kind is keyed by the id of the searched row (chunk, day segment, ...),
+# not by the id of the embedding row.
+_INDEXED_KINDS = {
+    "memory_chunk": _IndexedKind(
+        ready=lambda user_id: MemoryChunkEmbedding.objects.filter(
+            chunk__document__user_id=user_id,
+            state=MemoryChunkEmbeddingState.READY,
+            vector__isnull=False,
+        ),
+        key="chunk_id",
+    ),
+    "day_segment": _IndexedKind(
+        ready=lambda user_id: DaySegmentEmbedding.objects.filter(
+            user_id=user_id,
+            state=ConversationEmbeddingState.READY,
+            vector__isnull=False,
+        ),
+        key="day_segment_id",
+    ),
+    "transcript_chunk": _IndexedKind(
+        ready=lambda user_id: TranscriptChunkEmbedding.objects.filter(
+            user_id=user_id,
+            state=ConversationEmbeddingState.READY,
+            vector__isnull=False,
+        ),
+        key="transcript_chunk_id",
+    ),
+}
+
+
+class VectorIndexBackend:
+    """Interface of an in-process vector index.
+
+    Items are `(id, stamp, vector)` tuples; the stamp lets callers detect rows
+    whose vector changed since they were indexed.
+    """
+
+    def stamps(self, *, user_id: int, kind: str) -> dict[int, float]:
+        raise NotImplementedError
+
+    def upsert(self, *, user_id: int, kind: str, items: Sequence[tuple[int, float, Sequence[float]]]) -> None:
+        raise NotImplementedError
+
+    def remove(self, *, user_id: int, kind: str, ids: Iterable[int]) -> None:
+        raise NotImplementedError
+
+    def search(
+        self,
+        *,
+        user_id: int,
+        kind: str,
+        vector: Sequence[float],
+        k: int,
+        allowed_ids: Optional[Iterable[int]] = None,
+    ) -> list[tuple[int, float]]:
+        """Return up to `k` `(id, cosine_distance)` pairs, nearest first."""
+        raise NotImplementedError
+
+
+class _NumpySegment:
+    """One user's vectors of one kind, stored under `path`.
+
+    Callers hold the segment's file lock; `refresh()` picks up writes made by
+    other processes since the segment was last loaded.
+    """
+
+    def __init__(self, np, path: Path):
+        self.np = np
+        self.path = path
+        self.version: int | None = None
+        self._clear(0)
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.path / "meta.json"
+
+    @property
+    def _matrix_path(self) -> Path:
+        return self.path / "vectors.f32"
+
+    def _clear(self, dim: int) -> None:
+        np = self.np
+        self.dim = dim
+        self.capacity = 0
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.stamps = np.zeros(0, dtype=np.float64)
+        self.matrix = None
+
+    def _read_meta(self) -> dict | None:
+        try:
+            return json.loads(self._meta_path.read_text())
+        except FileNotFoundError:
+            return None
+
+    def refresh(self) -> None:
+        np = self.np
+        meta = self._read_meta()
+        version = meta["generation"] if meta else None
+        if version == self.version:
+            return
+        self._clear(0)
+        self.version = version
+        if meta is None:
+            return
+        self.dim = int(meta["dim"])
+        self.ids = np.load(self.path / "ids.npy")
+        self.stamps = np.load(self.path / "stamps.npy")
+        self.capacity = int(meta["capacity"])
+        if self.capacity:
+            self.matrix = np.memmap(self._matrix_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+
+    def save(self) -> None:
+        np = self.np
+        self.path.mkdir(parents=True, exist_ok=True)
+        if self.matrix is not None:
+            self.matrix.flush()
+        for name, array in (("ids.npy", self.ids), ("stamps.npy", self.stamps)):
+            tmp = self.path / f".{name}.tmp"
+            with open(tmp, "wb") as fh:
+                np.save(fh, array)
+            os.replace(tmp, self.path / name)
+        self.version = (self.version or 0) + 1
+        tmp = self.path / ".meta.json.tmp"
+        tmp.write_text(json.dumps({"dim": self.dim, "capacity": self.capacity, "generation": self.version}))
+        os.replace(tmp, self._meta_path)
+
+    def _reserve(self, rows: int) -> None:
+        np = self.np
+        needed = len(self.ids) + rows
+        if needed <= self.capacity:
+            return
+        capacity = max(_INITIAL_CAPACITY, self.capacity)
+        while capacity < needed:
+            capacity *= 2
+        self.path.mkdir(parents=True, exist_ok=True)
+        if self.matrix is not None:
+            self.matrix.flush()
+            self.matrix = None
+        with open(self._matrix_path, "ab") as fh:
+            fh.truncate(capacity * self.dim * 4)
+        self.capacity = capacity
+        self.matrix = np.memmap(self._matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def _reset(self, dim: int) -> None:
+        self.matrix = None
+        if self._matrix_path.exists():
+            self._matrix_path.unlink()
+        self._clear(dim)
+
+    def append(self, ids: list[int], stamps: list[float], vectors) -> None:
+        np = self.np
+        if not ids:
+            return
+        if self.dim != vectors.shape[1]:
+            # Embedding model changed; start over with the new dimensionality.
+            self._reset(int(vectors.shape[1]))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._reserve(len(ids))
+        start = len(self.ids)
+        self.matrix[start:start + len(ids)] = vectors / norms
+        self.ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int64)])
+        self.stamps = np.concatenate([self.stamps, np.asarray(stamps, dtype=np.float64)])
+
+    def delete(self, ids: Iterable[int]) -> None:
+        np = self.np
+        mask = np.isin(self.ids, np.fromiter(ids, dtype=np.int64))
+        if not mask.any():
+            return
+        self.ids[mask] = _TOMBSTONE
+        self.matrix[: len(mask)][mask] = 0.0
+        if int((self.ids == _TOMBSTONE).sum()) * 2 > len(self.ids):
+            self._compact()
+
+    def _compact(self) -> None:
+        live = self.ids != _TOMBSTONE
+        ids = self.ids[live]
+        stamps = self.stamps[live]
+        vectors = self.np.array(self.matrix[: len(self.ids)][live])
+        self._reset(self.dim)
+        if len(ids):
+            self.append(ids.tolist(), stamps.tolist(), vectors)
+
+    def live_stamps(self) -> dict[int, float]:
+        live = self.ids != _TOMBSTONE
+        return dict(zip(self.ids[live].tolist(), self.stamps[live].tolist()))
+
+    def search(self, query, k: int, allowed_ids) -> list[tuple[int, float]]:
+        np = self.np
+        used = len(self.ids)
+        if not used or self.matrix is None or query.shape[0] != self.dim:
+            return []
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+        scores = self.matrix[:used] @ (query / norm)
+        mask = self.ids == _TOMBSTONE
+        if allowed_ids is not None:
+            mask |= ~np.isin(self.ids, allowed_ids)
+        scores = np.where(mask, -np.inf, scores)
+        k = min(k, int((~mask).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.ids[i]), float(1.0 - scores[i])) for i in top]
+
+
+class NumpyVectorIndex(VectorIndexBackend):
+    """Memory-mapped float32 matrices under `MEMORY_VECTOR_INDEX_DIR`.
+
+    Segments are shared between processes through the filesystem and guarded
+    by `flock`, so web and worker processes can sync and search concurrently.
+    """
+
+    def __init__(self, root: str | os.PathLike | None = None):
+        import numpy
+
+        self.np = numpy
+        self.root = Path(root or settings.MEMORY_VECTOR_INDEX_DIR)
+        self._segments: dict[tuple[int, str], _NumpySegment] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _segment(self, user_id: int, kind: str, *, exclusive: bool):
+        key = (int(user_id), kind)
+        with self._lock:
+            segment = self._segments.get(key)
+            if segment is None:
+                segment = _NumpySegment(self.np, self.root / str(int(user_id)) / kind)
+                self._segments[key] = segment
+        segment.path.mkdir(parents=True, exist_ok=True)
+        # Every open() gets its own flock, so the file lock also orders threads of
+        # this process; the thread lock only covers reloading the shared segment.
+        with open(segment.path / ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                with self._lock:
+                    segment.refresh()
+                yield segment
+                if exclusive:
+                    segment.save()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def stamps(self, *, user_id: int, kind: str) -> dict[int, float]:
+        with self._segment(user_id, kind, exclusive=False) as segment:
+            return segment.live_stamps()
+
+    def upsert(self, *, user_id: int, kind: str, items: Sequence[tuple[int, float, Sequence[float]]]) -> None:
+        if not items:
+            return
+        ids = [int(item_id) for item_id, _stamp, _vector in items]
+        stamps = [float(stamp) for _id, stamp, _vector in items]
+        vectors = self.np.asarray([list(vector) for _id, _stamp, vector in items], dtype=self.np.float32)
+        with self._segment(user_id, kind, exclusive=True) as segment:
+            segment.delete(ids)
+            segment.append(ids, stamps, vectors)
+
+    def remove(self, *, user_id: int, kind: str, ids: Iterable[int]) -> None:
+        ids = list(ids)
+        if not ids:
+            return
+        with self._segment(user_id, kind, exclusive=True) as segment:
+            segment.delete(ids)
+
+    def search(
+        self,
+        *,
+        user_id: int,
+        kind: str,
+        vector: Sequence[float],
+        k: int,
+        allowed_ids: Optional[Iterable[int]] = None,
+    ) -> list[tuple[int, float]]:
+        np = self.np
+        query = np.asarray(list(vector), dtype=np.float32)
+        allowed = None if allowed_ids is None else np.fromiter(allowed_ids, dtype=np.int64)
+        with self._segment(user_id, kind, exclusive=False) as segment:
+            return segment.search(query, int(k), allowed)
+
+
+_backend: VectorIndexBackend | None = None
+_backend_path: str | None = None
+_backend_lock = threading.Lock()
+
+
+def get_vector_index() -> VectorIndexBackend | None:
+    """Return the configured in-process index, or None when pgvector is used."""
+
+    global _backend, _backend_path
+    if connection.vendor == "postgresql":
+        return None
+    path = str(getattr(settings, "MEMORY_VECTOR_INDEX_BACKEND", "") or "").strip()
+    if not path:
+        return None
+    with _backend_lock:
+        if _backend is None or _backend_path != path:
+            try:
+                _backend = import_string(path)()
+            except ImportError as exc:
+                logger.warning("[vector_index] backend %s unavailable: %s", path, exc)
+                return None
+            _backend_path = path
+        return _backend
+
+
+def _vector_values(value: Any) -> list[float]:
+    if isinstance(value, str):
+        return [float(x) for x in json.loads(value)]
+    if hasattr(value, "to_list"):
+        return [float(x) for x in value.to_list()]
+    return [float(x) for x in value]
+
+
+def sync_vector_index(backend: VectorIndexBackend, *, user_id: int, kind: str) -> None:
+    """Bring the user's index in line with their ready embedding rows."""
+
+    spec = _INDEXED_KINDS[kind]
+    ready = spec.ready(user_id)
+    current = {
+        int(item_id): updated_at.timestamp()
+        for item_id, updated_at in ready.values_list(spec.key, "updated_at")
+    }
+    indexed = backend.stamps(user_id=user_id, kind=kind)
+
+    stale = [item_id for item_id, stamp in indexed.items() if current.get(item_id) != stamp]
+    changed = [item_id for item_id, stamp in current.items() if indexed.get(item_id) != stamp]
+    if stale:
+        backend.remove(user_id=user_id, kind=kind, ids=stale)
+    if changed:
+        rows = ready.filter(**{f"{spec.key}__in": changed}).values_list(spec.key, "updated_at", "vector")
+        backend.upsert(
+            user_id=user_id,
+            kind=kind,
+            items=[
+                (int(item_id), updated_at.timestamp(), _vector_values(vector))
+                for item_id, updated_at, vector in rows
+            ],
+        )
+
+
+def semantic_candidates(
+    *,
+    user_id: int,
+    kind: str,
+    vector: Sequence[float],
+    limit: int,
+    allowed_ids: Iterable[int],
+) -> list[tuple[int, float]]:
+    """Return `(id, cosine_distance)` pairs from the in-process index, nearest first.
+
+    Returns an empty list when no in-process index is configured.
+    """
+
+    backend = get_vector_index()
+    if backend is None:
+        return []
+    try:
+        sync_vector_index(backend, user_id=user_id, kind=kind)
+        return backend.search(user_id=user_id, kind=kind, vector=vector, k=limit, allowed_ids=allowed_ids)
+    except Exception:
+        logger.warning("[vector_index] search failed user=%s kind=%s", user_id, kind, exc_info=True)
+        return []
@@ -0,0 +1,48 @@
+from django.contrib.postgres.search import SearchVector
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from nova.models.DaySegment import DaySegment
+from nova.models.MemoryChunk import MemoryChunk
+from nova.models.TranscriptChunk import TranscriptChunk
+
+SEARCH_VECTOR_SOURCES = (
+    (MemoryChunk, "content_text"),
+    (TranscriptChunk, "content_text"),
+    (DaySegment, "summary_markdown"),
+)
+
+
+class Command(BaseCommand):
+    help = "Fill stored full-text `search_vector` columns for rows that predate them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--all",
+            dest="recompute_all",
+            action="store_true",
+            help="Recompute every row, not only rows without a stored vector.",
+        )
+
+    def handle(self, *args, batch_size: int, recompute_all: bool, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write("Stored search vectors are only used on PostgreSQL; nothing to do.")
+            return
+
+        batch_size = max(1, int(batch_size))
+        for model, source in SEARCH_VECTOR_SOURCES:
+            qs = model.objects.all() if recompute_all else model.objects.filter(search_vector__isnull=True)
+            updated = 0
+            last_id = 0
+            while True:
+                ids = list(
+                    qs.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]
+                )
+                if not ids:
+                    break
+                updated += model.objects.filter(id__in=ids).update(
+                    search_vector=SearchVector(source, config="english")
+                )
+                last_id = ids[-1]
+            self.stdout.write(f"{model.__name__}: {updated} row(s) updated")
@@ -0,0 +1,24 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from nova.runtime.agent_worker import AgentWorker
+
+
+class Command(BaseCommand):
+    help = "Run the asyncio agent worker executing many agent runs concurrently in one process."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=None)
+        parser.add_argument("--per-user-limit", type=int, default=None)
+        parser.add_argument("--drain-timeout", type=float, default=None)
+        parser.add_argument("--worker-id", default=None)
+
+    def handle(self, *args, concurrency, per_user_limit, drain_timeout, worker_id, **options):
+        worker = AgentWorker(
+            concurrency=concurrency,
+            per_user_limit=per_user_limit,
+            drain_timeout=drain_timeout,
+            worker_id=worker_id,
+        )
+        asyncio.run(worker.run())
@@ -0,0 +1,137 @@
+"""Incremental markdown rendering for streamed responses.
+
+Re-rendering the whole accumulated answer on every flush costs O(n) per flush
+and O(n^2) per answer. `IncrementalMarkdownRenderer` splits the text into
+top-level blocks and renders a block once when it is complete, so each flush
+only re-renders the open trailing block.
+
+A block is complete once a blank line outside a code fence is followed by a
+full, non-indented line that cannot continue it. Lists, blockquotes and
+definition lists that span blank lines are therefore kept in a single block.
+Reference-style link, footnote and abbreviation definitions or raw HTML blocks
+can change how earlier text renders, so once one appears the renderer falls
+back to rendering the whole text as the open block.
+"""
+
+from __future__ import annotations
+
+import re
+
+from nova.utils import markdown_to_html
+
+_FENCE_RE = re.compile(r"^\s*(?P<fence>`{3,}|~{3,})")
+_LIST_ITEM_RE = re.compile(r"^(?:[-*+]|\d+[.)])(?:\s|$)")
+# Reference links, footnotes and abbreviations, or raw HTML blocks.
+_NON_LOCAL_LINE_RE = re.compile(r"^(?: {0,3}\[[^\]]+\]:|\*\[[^\]]+\]:|<)")
+
+
+def join_stream_html(stable_html: str, tail_html: str) -> str:
+    if stable_html and tail_html:
+        return f"{stable_html}\n{tail_html}"
+    return stable_html or tail_html
+
+
+class IncrementalMarkdownRenderer:
+    def __init__(self, text: str = ""):
+        # Bumped whenever previously completed blocks are dropped.
+        self.generation = 0
+        self._load(text)
+
+    def reset(self, text: str = "") -> None:
+        self.generation += 1
+        self._load(text)
+
+    def _load(self, text: str) -> None:
+        self._text = str(text or "")
+        self._scan_pos = 0
+        self._stable_end = 0
+        self._fence: str | None = None
+        self._after_blank = False
+        self._block_has_list = False
+        self._block_has_quote = False
+        self.full_render = False
+        self.stable_blocks: list[str] = []
+        self._stable_html = ""
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def stable_html(self) -> str:
+        return self._stable_html
+
+    def feed(self, delta: str) -> None:
+        self._text += delta
+
+    def update(self) -> None:
+        """Render the blocks completed since the last call."""
+        if self.full_render:
+            return
+
+        text = self._text
+        while True:
+            line_end = text.find("\n", self._scan_pos)
+            if line_end < 0:
+                break
+            line_start = self._scan_pos
+            line = text[line_start:line_end]
+            self._scan_pos = line_end + 1
+
+            if self._fence is None and _NON_LOCAL_LINE_RE.match(line):
+                self.full_render = True
+                self.generation += 1
+                self._stable_end = 0
+                self.stable_blocks = []
+                self._stable_html = ""
+                return
+
+            fence = _FENCE_RE.match(line)
+            if self._fence is not None:
+                if (
+                    fence
+                    and fence.group("fence")[0] == self._fence[0]
+                    and len(fence.group("fence")) >= len(self._fence)
+                    and line.strip() == fence.group("fence")
+                ):
+                    self._fence = None
+                continue
+
+            if not line.strip():
+                self._after_blank = True
+                continue
+
+            if self._after_blank and self._starts_new_block(line):
+                html = markdown_to_html(text[self._stable_end:line_start])
+                if html:
+                    self.stable_blocks.append(html)
+                    self._stable_html = f"{self._stable_html}\n{html}" if self._stable_html else html
+                self._stable_end = line_start
+                self._block_has_list = False
+                self._block_has_quote = False
+
+            self._after_blank = False
+            if fence:
+                self._fence = fence.group("fence")
+            elif _LIST_ITEM_RE.match(line):
+                self._block_has_list = True
+            elif line.startswith(">"):
+                self._block_has_quote = True
+
+    def render_tail(self) -> str:
+        """Render the open trailing block."""
+        return markdown_to_html(self._text[self._stable_end:])
+
+    def render(self) -> str:
+        """Render the whole text, re-rendering only the open block."""
+        self.update()
+        return join_stream_html(self._stable_html, self.render_tail())
+
+    def _starts_new_block(self, line: str) -> bool:
+        if line[0] in " \t" or line.startswith(":"):
+            return False
+        if self._block_has_list and _LIST_ITEM_RE.match(line):
+            return False
+        if self._block_has_quote and line.startswith(">"):
+            return False
+        return True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import posixpath
 import re
@@ -16,12 +17,14 @@ from django.utils.text import slugify
 
 from nova.llm.embeddings import aget_embeddings_provider
 from nova.llm.hybrid_search import (
+    ann_search,
     blend_semantic_fts,
     minmax_bounds,
     minmax_normalize,
     resolve_query_vector,
     semantic_similarity_from_distance,
 )
+from nova.llm.vector_index import semantic_candidates
 from nova.models.MemoryChunk import MemoryChunk
 from nova.models.MemoryChunkEmbedding import MemoryChunkEmbedding
 from nova.models.MemoryDirectory import MemoryDirectory
@@ -345,62 +348,91 @@ def _memory_dir_has_children(*, user, path: str) -> bool:
 def _schedule_chunk_embeddings(*, user_id: int, document_path: str, chunk_ids: list[int]) -> tuple[str, ...]:
     if not chunk_ids:
         return ()
-    try:
-        from nova.tasks.memory_tasks import compute_memory_chunk_embedding_task
-    except Exception:
+    from nova.tasks.embedding_queue_tasks import enqueue_embedding_drain
+
+    # Chunk rows are already pending; one coalesced drain embeds them all.
+    if not enqueue_embedding_drain(user_id):
         logger.warning(
             "[memory_embedding_enqueue_failed] user=%s document=%s chunk_ids=%s",
             user_id,
             document_path,
             chunk_ids,
-            exc_info=True,
         )
         return (MEMORY_EMBEDDINGS_QUEUE_WARNING,)
+    return ()
 
-    failed_chunk_ids: list[int] = []
-    for chunk_id in chunk_ids:
-        try:
-            compute_memory_chunk_embedding_task.delay(chunk_id)
-        except Exception:
-            failed_chunk_ids.append(chunk_id)
-            logger.warning(
-                "[memory_embedding_enqueue_failed] user=%s document=%s chunk_id=%s",
-                user_id,
-                document_path,
-                chunk_id,
-                exc_info=True,
-            )
 
-    if failed_chunk_ids:
-        return (MEMORY_EMBEDDINGS_QUEUE_WARNING,)
-    return ()
+def _chunk_content_hash(content_text: str) -> str:
+    return hashlib.sha256(str(content_text or "").encode("utf-8")).hexdigest()
 
 
 def _rebuild_document_chunks(*, document: MemoryDocument) -> list[int]:
-    MemoryChunk.objects.filter(
+    """Sync a document's active chunks with its Markdown; return new chunk ids.
+
+    Chunks whose text is unchanged are kept with their embeddings (only their
+    heading/anchor/position are refreshed); removed chunks are archived and
+    new ones are created with pending embeddings.
+    """
+
+    _title, chunk_specs = _parse_markdown_sections(document.content_markdown, path=document.virtual_path)
+    now = timezone.now()
+
+    reusable: dict[str, list[MemoryChunk]] = {}
+    for chunk in MemoryChunk.objects.filter(
         document=document,
         status=MemoryRecordStatus.ACTIVE,
-    ).update(status=MemoryRecordStatus.ARCHIVED, updated_at=timezone.now())
+    ).order_by("position", "id"):
+        reusable.setdefault(_chunk_content_hash(chunk.content_text), []).append(chunk)
 
-    _title, chunk_specs = _parse_markdown_sections(document.content_markdown, path=document.virtual_path)
-    created_chunk_ids: list[int] = []
+    moved: list[MemoryChunk] = []
+    new_chunks: list[MemoryChunk] = []
     for chunk_spec in chunk_specs:
-        chunk = MemoryChunk.objects.create(
-            document=document,
-            heading=chunk_spec["heading"],
-            anchor=chunk_spec["anchor"],
-            position=chunk_spec["position"],
-            content_text=chunk_spec["content_text"],
-            token_count=chunk_spec["token_count"],
-            status=MemoryRecordStatus.ACTIVE,
-        )
-        MemoryChunkEmbedding.objects.create(
-            chunk=chunk,
-            state=MemoryChunkEmbeddingState.PENDING,
-            dimensions=MEMORY_EMBEDDING_DIMENSIONS,
+        candidates = reusable.get(_chunk_content_hash(chunk_spec["content_text"]))
+        if candidates:
+            chunk = candidates.pop(0)
+            if (chunk.heading, chunk.anchor, chunk.position) != (
+                chunk_spec["heading"],
+                chunk_spec["anchor"],
+                chunk_spec["position"],
+            ):
+                chunk.heading = chunk_spec["heading"]
+                chunk.anchor = chunk_spec["anchor"]
+                chunk.position = chunk_spec["position"]
+                chunk.updated_at = now
+                moved.append(chunk)
+            continue
+        new_chunks.append(
+            MemoryChunk(
+                document=document,
+                heading=chunk_spec["heading"],
+                anchor=chunk_spec["anchor"],
+                position=chunk_spec["position"],
+                content_text=chunk_spec["content_text"],
+                token_count=chunk_spec["token_count"],
+                status=MemoryRecordStatus.ACTIVE,
+            )
         )
-        created_chunk_ids.append(chunk.id)
-    return created_chunk_ids
+
+    stale_ids = [chunk.id for chunks in reusable.values() for chunk in chunks]
+    if stale_ids:
+        MemoryChunk.objects.filter(id__in=stale_ids).update(status=MemoryRecordStatus.ARCHIVED, updated_at=now)
+    if moved:
+        MemoryChunk.objects.bulk_update(moved, ["heading", "anchor", "position", "updated_at"])
+    if not new_chunks:
+        return []
+
+    created = MemoryChunk.objects.bulk_create(new_chunks)
+    MemoryChunkEmbedding.objects.bulk_create(
+        [
+            MemoryChunkEmbedding(
+                chunk=chunk,
+                state=MemoryChunkEmbeddingState.PENDING,
+                dimensions=MEMORY_EMBEDDING_DIMENSIONS,
+            )
+            for chunk in created
+        ]
+    )
+    return [chunk.id for chunk in created]
 
 
 async def list_memory_documents_overview(*, user, include_archived: bool = False, q: str = "") -> list[dict[str, Any]]:
@@ -1025,16 +1057,27 @@ async def search_memory_items(
                 "notes": ["match-all mode: empty query or '*' returns recent memory chunks"],
             }
 
+        semantic_hits: list[tuple[int, float]] = []
+        if engine != "postgresql" and vec is not None:
+            semantic_hits = semantic_candidates(
+                user_id=user.id,
+                kind="memory_chunk",
+                vector=vec,
+                limit=50,
+                allowed_ids=qs.values_list("id", flat=True),
+            )
+
         if engine == "postgresql":
-            from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+            from django.contrib.postgres.search import SearchQuery, SearchRank
             from pgvector.django import CosineDistance
 
-            vector = SearchVector("content_text", config="english")
-            search_query = SearchQuery(query_text)
+            vector = F("search_vector")
+            search_query = SearchQuery(query_text, config="english")
             candidate_limit = 50
 
             fts_qs = (
-                qs.annotate(fts_rank=SearchRank(vector, search_query))
+                qs.filter(search_vector=search_query)
+                .annotate(fts_rank=SearchRank(vector, search_query))
                 .filter(fts_rank__gt=0.0)
                 .order_by(F("fts_rank").desc(), F("updated_at").desc())
             )
@@ -1047,7 +1090,8 @@ async def search_memory_items(
                     .annotate(distance=CosineDistance("embedding__vector", vec))
                     .order_by(F("distance").asc(), F("updated_at").desc())
                 )
-                semantic_ids = list(semantic_qs.values_list("id", flat=True)[:candidate_limit])
+                with ann_search(candidate_limit=candidate_limit):
+                    semantic_ids = list(semantic_qs.values_list("id", flat=True)[:candidate_limit])
 
             candidate_ids = list(dict.fromkeys([*semantic_ids, *fts_ids]))
             if not candidate_ids:
@@ -1115,6 +1159,62 @@ async def search_memory_items(
                         "signals": {"fts": True, "semantic": vec is not None},
                     }
                 )
+        elif semantic_hits:
+            # In-process vector index: rank semantic hits with substring matches
+            # standing in for full-text rank.
+            distances = dict(semantic_hits)
+            lexical_ids = set(qs.filter(content_text__icontains=query_text).values_list("id", flat=True)[:50])
+            candidates = list(qs.filter(id__in=[*distances, *lexical_ids]))
+
+            semantic_values = [
+                semantic_similarity_from_distance(distances[chunk.id], enabled=True)
+                for chunk in candidates
+                if chunk.id in distances
+            ]
+            sem_min, sem_max = minmax_bounds(semantic_values)
+
+            scored = []
+            for chunk in candidates:
+                distance = distances.get(chunk.id)
+                semantic_norm = (
+                    minmax_normalize(
+                        semantic_similarity_from_distance(distance, enabled=True),
+                        vmin=sem_min,
+                        vmax=sem_max,
+                    )
+                    if distance is not None
+                    else 0.0
+                )
+                fts_value = 1.0 if chunk.id in lexical_ids else 0.0
+                scored.append(
+                    {
+                        "chunk": chunk,
+                        "score": {
+                            "final": float(blend_semantic_fts(semantic=semantic_norm, fts=fts_value)),
+                            "fts_rank": fts_value,
+                            "cosine_distance": float(distance) if distance is not None else None,
+                        },
+                    }
+                )
+            scored.sort(
+                key=lambda row: (
+                    -row["score"]["final"],
+                    -(row["chunk"].updated_at.timestamp() if getattr(row["chunk"], "updated_at", None) else 0.0),
+                    row["chunk"].id,
+                )
+            )
+            for row in scored[:limit_value]:
+                chunk = row["chunk"]
+                results.append(
+                    {
+                        "path": chunk.document.virtual_path,
+                        "section_heading": chunk.heading,
+                        "section_anchor": chunk.anchor,
+                        "snippet": chunk.content_text[:240],
+                        "score": row["score"],
+                        "signals": {"fts": True, "semantic": True},
+                    }
+                )
         else:
             filtered = qs.filter(content_text__icontains=query_text).order_by(F("updated_at").desc())
             for chunk in filtered[:limit_value]:
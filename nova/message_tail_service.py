@@ -23,6 +23,7 @@ from nova.runtime.compaction import (
     SESSION_KEY_HISTORY_SUMMARY,
     SESSION_KEY_SUMMARY_UNTIL_MESSAGE_ID,
 )
+from nova.storage_deletion import defer_storage_deletion
 from nova.tasks.conversation_tasks import summarize_day_segment_task
 from nova.tasks.runtime_state import reconcile_stale_running_tasks
 from nova.tasks.transcript_index_tasks import index_transcript_append_task
@@ -360,8 +361,8 @@ def delete_message_tail_after(anchor_message: Message, user) -> MessageTailDelet
 
         _clear_compaction_state(anchor_message.thread)
 
-        for user_file in files_to_delete:
-            user_file.delete()
+        with defer_storage_deletion():
+            UserFile.objects.filter(id__in=deleted_file_ids).delete()
 
         Message.objects.filter(id__in=deleted_message_ids).delete()
 
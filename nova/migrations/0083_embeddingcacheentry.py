@@ -0,0 +1,35 @@
+import pgvector.django.vector
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nova", "0082_oidcidentity_oidcidentitylinkaudit_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmbeddingCacheEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("provider_key", models.CharField(max_length=64)),
+                ("model", models.CharField(blank=True, default="", max_length=120)),
+                ("dimensions", models.IntegerField()),
+                ("content_hash", models.CharField(max_length=64)),
+                ("vector", pgvector.django.vector.VectorField(dimensions=1024)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["created_at"], name="idx_embedding_cache_created"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("provider_key", "model", "dimensions", "content_hash"),
+                        name="uniq_embedding_cache_key",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_SOURCES = (
+    ("nova_memorychunk", "content_text"),
+    ("nova_transcriptchunk", "content_text"),
+    ("nova_daysegment", "summary_markdown"),
+)
+
+
+def create_search_vector_triggers(apps, schema_editor):
+    """Maintain `search_vector` columns and their GIN indexes (PostgreSQL only).
+
+    Tests run on SQLite; this migration must be a no-op there. Existing rows
+    are filled by the `backfill_search_vectors` management command.
+    """
+
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table, source in SEARCH_VECTOR_SOURCES:
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_search_vector_update ON {table};")
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_vector_update "
+            f"BEFORE INSERT OR UPDATE ON {table} FOR EACH ROW "
+            f"EXECUTE FUNCTION tsvector_update_trigger(search_vector, 'pg_catalog.english', {source});"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_search_vector_gin "
+            f"ON {table} USING gin (search_vector);"
+        )
+
+
+def drop_search_vector_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table, _source in SEARCH_VECTOR_SOURCES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS idx_{table}_search_vector_gin;")
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_search_vector_update ON {table};")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nova", "0083_embeddingcacheentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="memorychunk",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="transcriptchunk",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="daysegment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        # Triggers and GIN indexes (PostgreSQL only)
+        migrations.RunPython(create_search_vector_triggers, reverse_code=drop_search_vector_triggers),
+    ]
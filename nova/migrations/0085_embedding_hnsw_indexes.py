@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.db import migrations
+
+
+# (table, new index name, index it replaces)
+HNSW_INDEXES = (
+    ("nova_memorychunkembedding", "idx_mem_chunk_emb_vector_hnsw", None),
+    ("nova_daysegmentembedding", "idx_dayseg_emb_vector_hnsw", "idx_daysegment_embedding_vector_hnsw"),
+    ("nova_transcriptchunkembedding", "idx_chunk_emb_vector_hnsw", "idx_transcriptchunk_embedding_vector_hnsw"),
+)
+
+
+def create_hnsw_indexes(apps, schema_editor):
+    """Build tuned pgvector HNSW indexes concurrently (PostgreSQL only).
+
+    Tests run on SQLite; this migration must be a no-op there.
+    """
+
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    m = int(settings.MEMORY_VECTOR_HNSW_M)
+    ef_construction = int(settings.MEMORY_VECTOR_HNSW_EF_CONSTRUCTION)
+    for table, name, replaces in HNSW_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {table} USING hnsw (vector vector_cosine_ops) "
+            f"WITH (m = {m}, ef_construction = {ef_construction});"
+        )
+        if replaces:
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {replaces};")
+
+
+def drop_hnsw_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table, name, replaces in HNSW_INDEXES:
+        if replaces:
+            schema_editor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {replaces} "
+                f"ON {table} USING hnsw (vector vector_cosine_ops);"
+            )
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("nova", "0084_search_vector_columns"),
+    ]
+
+    operations = [
+        # pgvector indexes (PostgreSQL only)
+        migrations.RunPython(create_hnsw_indexes, reverse_code=drop_hnsw_indexes),
+    ]
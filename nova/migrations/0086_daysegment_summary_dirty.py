@@ -0,0 +1,28 @@
+# Generated by Django 6.0.7 on 2026-10-16 22:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nova', '0085_embedding_hnsw_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='daysegment',
+            name='summary_dirty',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddIndex(
+            model_name='daysegment',
+            index=models.Index(
+                condition=models.Q(('summary_dirty', True)),
+                fields=['user', 'day_label'],
+                name='idx_dayseg_dirty_u_day',
+            ),
+        ),
+    ]
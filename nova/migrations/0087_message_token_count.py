@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-16 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nova', '0086_daysegment_summary_dirty'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='token_count',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
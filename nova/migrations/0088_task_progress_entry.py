@@ -0,0 +1,96 @@
+# Generated by Django 6.0.7 on 2026-10-16 23:25
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.utils.dateparse import parse_datetime
+
+
+def _copy_progress_logs_to_entries(apps, schema_editor):
+    Task = apps.get_model("nova", "Task")
+    TaskProgressEntry = apps.get_model("nova", "TaskProgressEntry")
+
+    batch = []
+    tasks = Task.objects.exclude(progress_logs=[]).only("id", "created_at", "progress_logs")
+    for task in tasks.iterator(chunk_size=500):
+        for log in task.progress_logs or []:
+            if not isinstance(log, dict):
+                continue
+            created_at = None
+            try:
+                created_at = parse_datetime(str(log.get("timestamp") or ""))
+            except ValueError:
+                pass
+            batch.append(
+                TaskProgressEntry(
+                    task_id=task.id,
+                    step=str(log.get("step") or ""),
+                    severity=str(log.get("severity") or "info")[:20],
+                    category=str(log.get("category") or "")[:40],
+                    error_details=log.get("error_details"),
+                    created_at=created_at or task.created_at,
+                )
+            )
+        if len(batch) >= 1000:
+            TaskProgressEntry.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        TaskProgressEntry.objects.bulk_create(batch)
+
+
+def _copy_entries_to_progress_logs(apps, schema_editor):
+    Task = apps.get_model("nova", "Task")
+    TaskProgressEntry = apps.get_model("nova", "TaskProgressEntry")
+
+    logs_by_task = {}
+    for entry in TaskProgressEntry.objects.order_by("task_id", "id").iterator(chunk_size=1000):
+        log = {
+            "step": entry.step,
+            "timestamp": str(entry.created_at),
+            "severity": entry.severity,
+        }
+        if entry.category:
+            log["category"] = entry.category
+        if entry.error_details is not None:
+            log["error_details"] = entry.error_details
+        logs_by_task.setdefault(entry.task_id, []).append(log)
+    for task_id, logs in logs_by_task.items():
+        Task.objects.filter(id=task_id).update(progress_logs=logs)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nova', '0087_message_token_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskProgressEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('step', models.TextField()),
+                ('severity', models.CharField(default='info', max_length=20)),
+                ('category', models.CharField(blank=True, default='', max_length=40)),
+                ('error_details', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    'task',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='progress_entries',
+                        to='nova.task',
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['task', 'id'], name='idx_task_progress_task_id')],
+            },
+        ),
+        migrations.RunPython(_copy_progress_logs_to_entries, _copy_entries_to_progress_logs),
+        migrations.RemoveField(
+            model_name='task',
+            name='progress_logs',
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.7 on 2026-10-16 23:32
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nova', '0088_task_progress_entry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTraceEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(default='node', max_length=20)),
+                ('node_id', models.CharField(blank=True, default='', max_length=80)),
+                ('parent_id', models.CharField(blank=True, default='', max_length=80)),
+                ('data', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    'task',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='trace_events',
+                        to='nova.task',
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['task', 'id'], name='idx_task_trace_event_task_id')],
+            },
+        ),
+    ]
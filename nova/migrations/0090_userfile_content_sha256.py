@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-16 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nova', '0089_task_trace_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userfile',
+            name='content_sha256',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 6.0.7 on 2026-10-17 09:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def clear_shared_embedding_cache(apps, schema_editor):
+    # Shared rows cannot be attributed to a user; they are only a cache.
+    EmbeddingCacheEntry = apps.get_model("nova", "EmbeddingCacheEntry")
+    EmbeddingCacheEntry.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nova', '0090_userfile_content_sha256'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_shared_embedding_cache, migrations.RunPython.noop),
+        migrations.RemoveConstraint(
+            model_name='embeddingcacheentry',
+            name='uniq_embedding_cache_key',
+        ),
+        migrations.RemoveIndex(
+            model_name='embeddingcacheentry',
+            name='idx_embedding_cache_created',
+        ),
+        migrations.AddField(
+            model_name='embeddingcacheentry',
+            name='user',
+            field=models.ForeignKey(
+                default=None,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='embedding_cache_entries',
+                to=settings.AUTH_USER_MODEL,
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='embeddingcacheentry',
+            index=models.Index(fields=['user', 'created_at'], name='idx_embedding_cache_user_age'),
+        ),
+        migrations.AddConstraint(
+            model_name='embeddingcacheentry',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'provider_key', 'model', 'dimensions', 'content_hash'),
+                name='uniq_embedding_cache_key',
+            ),
+        ),
+    ]
@@ -1,7 +1,9 @@
 # nova/models/DaySegment.py
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 
@@ -34,6 +36,8 @@ class DaySegment(models.Model):
     )
 
     summary_markdown = models.TextField(blank=True, default="")
+    # Maintained by a PostgreSQL trigger from `summary_markdown` (english config).
+    search_vector = SearchVectorField(null=True, editable=False)
 
     # If a summary is generated, it should conceptually summarize messages from
     # `starts_at_message` up to this message (inclusive). When rebuilding the
@@ -47,6 +51,10 @@ class DaySegment(models.Model):
         verbose_name=_("Summary until message"),
     )
 
+    # Set when messages land in (or leave) the segment after its last summary;
+    # the nightly summarization only visits dirty segments.
+    summary_dirty = models.BooleanField(default=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -59,6 +67,11 @@ class DaySegment(models.Model):
         ]
         indexes = [
             models.Index(fields=["user", "thread", "day_label"]),
+            models.Index(
+                fields=["user", "day_label"],
+                condition=Q(summary_dirty=True),
+                name="idx_dayseg_dirty_u_day",
+            ),
         ]
 
     def __str__(self) -> str:
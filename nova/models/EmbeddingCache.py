@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import models
+
+from pgvector.django import VectorField
+
+
+class EmbeddingCacheEntry(models.Model):
+    """Embedding vector cached by user, provider, model, dimensions and text hash.
+
+    Rows belong to one user so a cached vector never reveals to another user
+    that a text was embedded, and they go away with the user. Memory rebuilds
+    and conversation re-indexing reuse them instead of calling the provider.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="embedding_cache_entries",
+    )
+    provider_key = models.CharField(max_length=64)
+    model = models.CharField(max_length=120, blank=True, default="")
+    dimensions = models.IntegerField()
+    content_hash = models.CharField(max_length=64)
+    vector = VectorField(dimensions=1024)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "provider_key", "model", "dimensions", "content_hash"],
+                name="uniq_embedding_cache_key",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "created_at"], name="idx_embedding_cache_user_age"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.model or 'embedding'}:{self.content_hash[:12]}"
@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from .memory_common import MemoryRecordStatus
@@ -14,6 +15,8 @@ class MemoryChunk(models.Model):
     position = models.IntegerField(default=0)
     content_text = models.TextField(blank=True, default="")
     token_count = models.IntegerField(default=0)
+    # Maintained by a PostgreSQL trigger from `content_text` (english config).
+    search_vector = SearchVectorField(null=True, editable=False)
     status = models.CharField(
         max_length=20,
         choices=MemoryRecordStatus.choices,
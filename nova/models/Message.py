@@ -4,6 +4,8 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.db.models import JSONField
 
+from nova.llm.tokenizer import count_tokens
+
 
 class Actor(models.TextChoices):
     USER = "USR", _("User")
@@ -44,6 +46,16 @@ class Message(models.Model):
         related_name='messages',
         verbose_name=_("Related interaction")
     )
+    # Token count of `text`, computed once with the local tokenizer.
+    token_count = models.PositiveIntegerField(null=True, blank=True, editable=False)
 
     def __str__(self):
         return self.text
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "text" in update_fields:
+            self.token_count = count_tokens(self.text)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "token_count"}
+        super().save(*args, **kwargs)
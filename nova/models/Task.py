@@ -3,6 +3,7 @@ import logging
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 logger = logging.getLogger(__name__)
@@ -35,13 +36,13 @@ class Task(models.Model):
     status = models.CharField(max_length=20,
                               choices=TaskStatus.choices,
                               default=TaskStatus.PENDING)
-    # List of dicts, e.g., [{"step": "Calling tool X", "timestamp": "2025-07-28T03:58:00Z"}]
-    progress_logs = models.JSONField(default=list, blank=True)
     # Current streaming content (HTML) - updated during streaming for reconnection
     current_response = models.TextField(blank=True, null=True)
     # Canonical streamed markdown transcript, used to persist intermediate agent text.
     streamed_markdown = models.TextField(blank=True, default="")
     # Structured, user-safe execution trace for agent runs and nested sub-agents.
+    # Running tasks append to TaskTraceEvent; the log is folded in here when a run
+    # completes, fails or waits for input.
     execution_trace = models.JSONField(default=dict, blank=True)
     # Final output or error message
     result = models.TextField(blank=True, null=True)
@@ -50,3 +51,68 @@ class Task(models.Model):
 
     def __str__(self):
         return f"Task {self.id} for Thread {self.thread.subject} ({self.status})"
+
+
+class TaskProgressEntry(models.Model):
+    """One progress line of a task, appended as the run goes."""
+
+    task = models.ForeignKey(Task,
+                             on_delete=models.CASCADE,
+                             related_name='progress_entries')
+    step = models.TextField()
+    severity = models.CharField(max_length=20, default="info")
+    category = models.CharField(max_length=40, blank=True, default="")
+    error_details = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["task", "id"], name="idx_task_progress_task_id"),
+        ]
+
+    def __str__(self):
+        return f"Task {self.task_id}: {self.step}"
+
+    def as_log(self) -> dict:
+        """Return the entry in the `{"step", "timestamp", "severity"}` log format."""
+        log = {
+            "step": self.step,
+            "timestamp": str(self.created_at),
+            "severity": self.severity,
+        }
+        if self.category:
+            log["category"] = self.category
+        if self.error_details is not None:
+            log["error_details"] = self.error_details
+        return log
+
+
+class TaskTraceEvent(models.Model):
+    """Append-only log of execution trace node updates.
+
+    Each event holds one node's fields (without its children) or a summary
+    update; replaying the events of a task on top of `Task.execution_trace`
+    rebuilds the trace tree.
+    """
+
+    KIND_NODE = "node"
+    KIND_SUMMARY = "summary"
+
+    task = models.ForeignKey(Task,
+                             on_delete=models.CASCADE,
+                             related_name='trace_events')
+    kind = models.CharField(max_length=20, default=KIND_NODE)
+    node_id = models.CharField(max_length=80, blank=True, default="")
+    parent_id = models.CharField(max_length=80, blank=True, default="")
+    data = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["task", "id"], name="idx_task_trace_event_task_id"),
+        ]
+
+    def __str__(self):
+        return f"Task {self.task_id}: {self.kind} {self.node_id}".rstrip()
@@ -3,6 +3,7 @@
 import hashlib
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -50,6 +51,8 @@ class TranscriptChunk(models.Model):
     content_text = models.TextField(help_text=_("Normalized concatenation of message contents"))
     content_hash = models.CharField(max_length=64, db_index=True)
     token_estimate = models.IntegerField(default=0)
+    # Maintained by a PostgreSQL trigger from `content_text` (english config).
+    search_vector = SearchVectorField(null=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -1,6 +1,4 @@
 # nova/models/UserFile.py
-import botocore.config
-import boto3
 import logging
 from botocore.exceptions import ClientError
 from datetime import timedelta
@@ -9,6 +7,8 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+from nova.storage_clients import get_s3_client
+from nova.storage_deletion import defer_storage_key
 from nova.utils import compute_external_base
 
 logger = logging.getLogger(__name__)
@@ -38,6 +38,8 @@ class UserFile(models.Model):
     mime_type = models.CharField(max_length=100)
     # File size in bytes
     size = models.PositiveIntegerField()
+    # SHA-256 of the content, filled on upload or on first sandbox sync
+    content_sha256 = models.CharField(max_length=64, blank=True, default="")
     scope = models.CharField(
         max_length=32,
         choices=Scope.choices,
@@ -87,15 +89,7 @@ class UserFile(models.Model):
             self.delete()
             raise ValueError("File expired and deleted.")
 
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=settings.MINIO_ENDPOINT_URL,
-            aws_access_key_id=settings.MINIO_ACCESS_KEY,
-            aws_secret_access_key=settings.MINIO_SECRET_KEY,
-            config=botocore.config.Config(
-                signature_version='s3v4',
-            ),
-        )
+        s3_client = get_s3_client()
         try:
             # Generate presigned URL
             url = s3_client.generate_presigned_url(
@@ -118,13 +112,11 @@ class UserFile(models.Model):
     def delete_storage_object(self):
         if getattr(self, "_storage_deleted", False):
             return
+        if defer_storage_key(self.key):
+            self._storage_deleted = True
+            return
 
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=settings.MINIO_ENDPOINT_URL,
-            aws_access_key_id=settings.MINIO_ACCESS_KEY,
-            aws_secret_access_key=settings.MINIO_SECRET_KEY
-        )
+        s3_client = get_s3_client()
         try:
             s3_client.delete_object(Bucket=settings.MINIO_BUCKET_NAME,
                                     Key=self.key)
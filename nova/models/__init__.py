@@ -16,6 +16,7 @@ from .TranscriptChunk import TranscriptChunk  # noqa: F401
 from .TaskDefinition import TaskDefinition  # noqa: F401
 from .PushSubscription import PushSubscription  # noqa: F401
 from .EmbeddingsSystemState import EmbeddingsSystemState  # noqa: F401
+from .EmbeddingCache import EmbeddingCacheEntry  # noqa: F401
 from .AgentThreadSession import AgentThreadSession  # noqa: F401
 from .TerminalCommandFailureMetric import TerminalCommandFailureMetric  # noqa: F401
 from .OIDCIdentity import OIDCIdentity, OIDCIdentityLinkAudit  # noqa: F401
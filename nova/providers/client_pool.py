@@ -0,0 +1,197 @@
+"""Provider SDK clients shared across LLM calls.
+
+Building an SDK client per call means a new HTTP connection pool per turn, so
+every request pays DNS resolution, TCP and TLS setup again. Clients are kept
+per event loop (httpx connections cannot be shared across loops) and keyed by
+`(provider id, backend, base URL, credential fingerprint, ...)`, with
+keep-alive limits and HTTP/2 when the `h2` package is installed.
+
+When an `LLMProvider` row changes or is deleted, a shared cache version of the
+provider is bumped so every process drops its clients on their next use; a
+client still serving a request is closed once that request completes. The
+clients of a loop are closed when the loop shuts down (`asyncio.run` and
+`async_to_sync` cancel its remaining tasks), and the egress policy of the base
+URL is checked again every `PROVIDER_EGRESS_RECHECK_SECONDS`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+from django.core.cache import cache
+
+from nova.web.network_policy import assert_allowed_egress_url
+
+PROVIDER_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0,
+)
+PROVIDER_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+PROVIDER_EGRESS_RECHECK_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    client: Any
+    version: int
+    checked_at: float
+    active: int = 0
+    evicted: bool = False
+
+
+@dataclass(slots=True)
+class _LoopPool:
+    clients: dict[tuple, _PooledClient] = field(default_factory=dict)
+    closer: asyncio.Task | None = None
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool] = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def credential_fingerprint(secret: str | None) -> str:
+    return hashlib.sha256(str(secret or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _clients_version_key(provider_id: int | None) -> str:
+    provider_key = provider_id if provider_id is not None else "none"
+    return f"nova:provider_clients_version:{provider_key}"
+
+
+async def _close_clients_when_loop_stops(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        await loop.create_future()
+    except asyncio.CancelledError:
+        with _pools_lock:
+            pool = _pools.pop(loop, None)
+        clients = [entry.client for entry in (pool.clients.values() if pool else ())]
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+        raise
+
+
+def _loop_pool(loop: asyncio.AbstractEventLoop) -> _LoopPool:
+    # Caller holds `_pools_lock` and runs on `loop`.
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = _LoopPool()
+        pool.closer = loop.create_task(_close_clients_when_loop_stops(loop))
+    return pool
+
+
+def _evict(loop: asyncio.AbstractEventLoop, clients: dict[tuple, _PooledClient], key: tuple,
+           idle: list[tuple[asyncio.AbstractEventLoop, Any]]) -> None:
+    # Caller holds `_pools_lock`.
+    entry = clients.pop(key)
+    entry.evicted = True
+    if entry.active == 0:
+        idle.append((loop, entry.client))
+
+
+def _acquire(loop: asyncio.AbstractEventLoop, key: tuple, version: int) -> _PooledClient | None:
+    idle: list[tuple[asyncio.AbstractEventLoop, Any]] = []
+    with _pools_lock:
+        clients = _loop_pool(loop).clients
+        entry = clients.get(key)
+        if entry is not None and entry.version != version:
+            # The provider changed in another process since this client was built.
+            _evict(loop, clients, key, idle)
+            entry = None
+        if entry is not None:
+            entry.active += 1
+    for idle_loop, client in idle:
+        _close_on_loop(idle_loop, client)
+    return entry
+
+
+def _release(entry: _PooledClient) -> bool:
+    with _pools_lock:
+        entry.active -= 1
+        return entry.evicted and entry.active == 0
+
+
+@asynccontextmanager
+async def pooled_client(key: tuple, factory: Callable[[], Any], *,
+                        egress_url: str | None = None,
+                        allowed_private_hosts: tuple[str, ...] = ()) -> AsyncIterator[Any]:
+    """Yield the shared client for `key` on the running loop.
+
+    `key[0]` must be the provider id (or None) so `evict_provider_clients`
+    can find it. `factory` builds the client on first use and checks
+    `egress_url` itself; the client must provide an async `close()`.
+    `egress_url` is checked again once the last check is older than
+    `PROVIDER_EGRESS_RECHECK_SECONDS`.
+    """
+
+    loop = asyncio.get_running_loop()
+    version = await cache.aget(_clients_version_key(key[0]), 0)
+    entry = _acquire(loop, key, version)
+    if entry is None:
+        built = _PooledClient(client=factory(), version=version, checked_at=time.monotonic(), active=1)
+        with _pools_lock:
+            clients = _loop_pool(loop).clients
+            entry = clients.get(key)
+            if entry is None or entry.version != version:
+                entry = clients[key] = built
+            else:
+                entry.active += 1
+        if entry is not built:
+            await built.client.close()
+    elif egress_url and time.monotonic() - entry.checked_at >= PROVIDER_EGRESS_RECHECK_SECONDS:
+        try:
+            await assert_allowed_egress_url(egress_url, allowed_private_hosts=tuple(allowed_private_hosts or ()))
+        except BaseException:
+            if _release(entry):
+                await entry.client.close()
+            raise
+        entry.checked_at = time.monotonic()
+    try:
+        yield entry.client
+    finally:
+        if _release(entry):
+            await entry.client.close()
+
+
+def _close_on_loop(loop: asyncio.AbstractEventLoop, client: Any) -> None:
+    if loop.is_closed():
+        return
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        loop.create_task(client.close())
+        return
+    try:
+        loop.call_soon_threadsafe(lambda: loop.create_task(client.close()))
+    except RuntimeError:
+        pass
+
+
+def evict_provider_clients(provider_id: int | None) -> None:
+    """Drop the pooled clients of one provider in every process."""
+
+    version_key = _clients_version_key(provider_id)
+    cache.add(version_key, 0, timeout=None)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # Evicted between add() and incr(); any new value invalidates.
+        cache.set(version_key, time.time_ns(), timeout=None)
+
+    idle: list[tuple[asyncio.AbstractEventLoop, Any]] = []
+    with _pools_lock:
+        for loop, pool in list(_pools.items()):
+            for key in [key for key in pool.clients if key[0] == provider_id]:
+                _evict(loop, pool.clients, key, idle)
+    for loop, client in idle:
+        _close_on_loop(loop, client)
@@ -39,6 +39,7 @@ class LlamaCppProviderAdapter(BaseProviderAdapter):
             tools=tools,
             normalize_content=self.normalize_multimodal_content,
             allowed_private_hosts=get_llama_cpp_allowed_private_hosts(),
+            provider_id=provider.pk,
         )
 
     async def stream_chat(self, provider, *, messages, tools=None, on_content_delta=None):
@@ -51,6 +52,7 @@ class LlamaCppProviderAdapter(BaseProviderAdapter):
             normalize_content=self.normalize_multimodal_content,
             on_content_delta=on_content_delta,
             allowed_private_hosts=get_llama_cpp_allowed_private_hosts(),
+            provider_id=provider.pk,
         )
 
     def normalize_multimodal_content(self, content):
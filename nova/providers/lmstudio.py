@@ -142,6 +142,7 @@ class LMStudioProviderAdapter(BaseProviderAdapter):
             tools=tools,
             normalize_content=self.normalize_multimodal_content,
             allowed_private_hosts=OPENAI_COMPATIBLE_LOCAL_HOSTS,
+            provider_id=provider.pk,
         )
 
     async def stream_chat(self, provider, *, messages, tools=None, on_content_delta=None):
@@ -154,6 +155,7 @@ class LMStudioProviderAdapter(BaseProviderAdapter):
             normalize_content=self.normalize_multimodal_content,
             on_content_delta=on_content_delta,
             allowed_private_hosts=OPENAI_COMPATIBLE_LOCAL_HOSTS,
+            provider_id=provider.pk,
         )
 
     def normalize_multimodal_content(self, content):
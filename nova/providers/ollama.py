@@ -9,6 +9,11 @@ import ollama
 from django.conf import settings
 
 from nova.providers.base import BaseProviderAdapter, ProviderDefaults
+from nova.providers.client_pool import (
+    PROVIDER_HTTP2_ENABLED,
+    PROVIDER_HTTP_LIMITS,
+    pooled_client,
+)
 from nova.web.network_policy import (
     assert_allowed_egress_url_sync,
     build_allowed_private_hosts,
@@ -25,6 +30,28 @@ def get_ollama_allowed_private_hosts() -> tuple[str, ...]:
     )
 
 
+def _create_ollama_client(host: str) -> ollama.AsyncClient:
+    assert_allowed_egress_url_sync(
+        host,
+        allowed_private_hosts=get_ollama_allowed_private_hosts(),
+    )
+    return ollama.AsyncClient(
+        host=host,
+        limits=PROVIDER_HTTP_LIMITS,
+        http2=PROVIDER_HTTP2_ENABLED,
+    )
+
+
+def _pooled_ollama_client(provider):
+    host = provider.base_url or OLLAMA_DEFAULT_BASE_URL
+    return pooled_client(
+        (provider.pk, "ollama", host),
+        lambda: _create_ollama_client(host),
+        egress_url=host,
+        allowed_private_hosts=get_ollama_allowed_private_hosts(),
+    )
+
+
 def _normalize_ollama_usage(payload: dict[str, Any]) -> dict[str, Any] | None:
     prompt_tokens = payload.get("prompt_eval_count")
     completion_tokens = payload.get("eval_count")
@@ -137,19 +164,14 @@ class OllamaProviderAdapter(BaseProviderAdapter):
         )
 
     async def complete_chat(self, provider, *, messages, tools=None):
-        host = provider.base_url or OLLAMA_DEFAULT_BASE_URL
-        assert_allowed_egress_url_sync(
-            host,
-            allowed_private_hosts=get_ollama_allowed_private_hosts(),
-        )
-        client = ollama.AsyncClient(host=host)
-        response = await client.chat(
-            model=provider.model,
-            messages=[_normalize_ollama_message(message) for message in list(messages or [])],
-            tools=tools or None,
-            stream=False,
-            think=False,
-        )
+        async with _pooled_ollama_client(provider) as client:
+            response = await client.chat(
+                model=provider.model,
+                messages=[_normalize_ollama_message(message) for message in list(messages or [])],
+                tools=tools or None,
+                stream=False,
+                think=False,
+            )
         return _normalize_ollama_response(response.model_dump(mode="json", exclude_none=True))
 
     async def stream_chat(self, provider, *, messages, tools=None, on_content_delta=None):
@@ -158,28 +180,23 @@ class OllamaProviderAdapter(BaseProviderAdapter):
                 "Native streaming with tool calls is not implemented for Ollama."
         )
 
-        host = provider.base_url or OLLAMA_DEFAULT_BASE_URL
-        assert_allowed_egress_url_sync(
-            host,
-            allowed_private_hosts=get_ollama_allowed_private_hosts(),
-        )
-        client = ollama.AsyncClient(host=host)
-        stream = await client.chat(
-            model=provider.model,
-            messages=[_normalize_ollama_message(message) for message in list(messages or [])],
-            stream=True,
-            think=False,
-        )
         content_parts: list[str] = []
         last_payload: dict[str, Any] | None = None
-        async for chunk in stream:
-            payload = chunk.model_dump(mode="json", exclude_none=True)
-            last_payload = payload
-            delta = str((payload.get("message") or {}).get("content") or "")
-            if delta:
-                content_parts.append(delta)
-                if on_content_delta:
-                    await on_content_delta(delta)
+        async with _pooled_ollama_client(provider) as client:
+            stream = await client.chat(
+                model=provider.model,
+                messages=[_normalize_ollama_message(message) for message in list(messages or [])],
+                stream=True,
+                think=False,
+            )
+            async for chunk in stream:
+                payload = chunk.model_dump(mode="json", exclude_none=True)
+                last_payload = payload
+                delta = str((payload.get("message") or {}).get("content") or "")
+                if delta:
+                    content_parts.append(delta)
+                    if on_content_delta:
+                        await on_content_delta(delta)
 
         normalized = _normalize_ollama_response(last_payload or {"message": {}})
         normalized["content"] = "".join(content_parts) or normalized.get("content") or ""
@@ -27,6 +27,7 @@ class OpenAIProviderAdapter(BaseProviderAdapter):
             messages=messages,
             tools=tools,
             normalize_content=self.normalize_multimodal_content,
+            provider_id=provider.pk,
         )
 
     async def stream_chat(self, provider, *, messages, tools=None, on_content_delta=None):
@@ -38,6 +39,7 @@ class OpenAIProviderAdapter(BaseProviderAdapter):
             tools=tools,
             normalize_content=self.normalize_multimodal_content,
             on_content_delta=on_content_delta,
+            provider_id=provider.pk,
         )
 
     def normalize_multimodal_content(self, content):
@@ -6,8 +6,14 @@ import json
 import mimetypes
 from typing import Any, Awaitable, Callable
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
+from nova.providers.client_pool import (
+    PROVIDER_HTTP2_ENABLED,
+    PROVIDER_HTTP_LIMITS,
+    credential_fingerprint,
+    pooled_client,
+)
 from nova.web.network_policy import (
     LOCAL_DEVELOPMENT_HOSTS,
     assert_allowed_egress_url_sync,
@@ -21,6 +27,7 @@ def create_openai_compatible_client(
     api_key: str | None,
     base_url: str | None,
     allowed_private_hosts: tuple[str, ...] = (),
+    http_client=None,
 ) -> AsyncOpenAI:
     """Build an AsyncOpenAI client with Nova's common defaults."""
     if base_url:
@@ -32,6 +39,39 @@ def create_openai_compatible_client(
         api_key=str(api_key or "nova"),
         base_url=base_url,
         max_retries=2,
+        http_client=http_client,
+    )
+
+
+def pooled_openai_compatible_client(
+    *,
+    provider_id: int | None,
+    api_key: str | None,
+    base_url: str | None,
+    allowed_private_hosts: tuple[str, ...] = (),
+):
+    """Async context manager yielding the shared client of this provider config."""
+    allowed_private_hosts = tuple(allowed_private_hosts or ())
+    key = (
+        provider_id,
+        "openai_compatible",
+        base_url or "",
+        credential_fingerprint(api_key),
+        allowed_private_hosts,
+    )
+    return pooled_client(
+        key,
+        lambda: create_openai_compatible_client(
+            api_key=api_key,
+            base_url=base_url,
+            allowed_private_hosts=allowed_private_hosts,
+            http_client=DefaultAsyncHttpxClient(
+                limits=PROVIDER_HTTP_LIMITS,
+                http2=PROVIDER_HTTP2_ENABLED,
+            ),
+        ),
+        egress_url=base_url,
+        allowed_private_hosts=allowed_private_hosts,
     )
 
 
@@ -284,12 +324,8 @@ async def complete_openai_compatible_chat(
     normalize_content,
     extra_kwargs: dict[str, Any] | None = None,
     allowed_private_hosts: tuple[str, ...] = (),
+    provider_id: int | None = None,
 ) -> dict[str, Any]:
-    client = create_openai_compatible_client(
-        api_key=api_key,
-        base_url=base_url,
-        allowed_private_hosts=tuple(allowed_private_hosts or ()),
-    )
     request_payload: dict[str, Any] = {
         "model": model,
         "messages": build_openai_compatible_messages(
@@ -302,7 +338,13 @@ async def complete_openai_compatible_chat(
         request_payload["tools"] = tools
     if extra_kwargs:
         request_payload.update(extra_kwargs)
-    response = await client.chat.completions.create(**request_payload)
+    async with pooled_openai_compatible_client(
+        provider_id=provider_id,
+        api_key=api_key,
+        base_url=base_url,
+        allowed_private_hosts=allowed_private_hosts,
+    ) as client:
+        response = await client.chat.completions.create(**request_payload)
     payload = response.model_dump(mode="json", exclude_none=True)
     return normalize_openai_completion_payload(payload)
 
@@ -318,12 +360,8 @@ async def stream_openai_compatible_chat(
     on_content_delta: Callable[[str], Awaitable[None]] | None = None,
     extra_kwargs: dict[str, Any] | None = None,
     allowed_private_hosts: tuple[str, ...] = (),
+    provider_id: int | None = None,
 ) -> dict[str, Any]:
-    client = create_openai_compatible_client(
-        api_key=api_key,
-        base_url=base_url,
-        allowed_private_hosts=tuple(allowed_private_hosts or ()),
-    )
     request_payload: dict[str, Any] = {
         "model": model,
         "messages": build_openai_compatible_messages(
@@ -337,11 +375,17 @@ async def stream_openai_compatible_chat(
         request_payload["tools"] = tools
     if extra_kwargs:
         request_payload.update(extra_kwargs)
-    stream = await client.chat.completions.create(**request_payload)
-    return await collect_openai_like_stream(
-        stream,
-        on_content_delta=on_content_delta,
-    )
+    async with pooled_openai_compatible_client(
+        provider_id=provider_id,
+        api_key=api_key,
+        base_url=base_url,
+        allowed_private_hosts=allowed_private_hosts,
+    ) as client:
+        stream = await client.chat.completions.create(**request_payload)
+        return await collect_openai_like_stream(
+            stream,
+            on_content_delta=on_content_delta,
+        )
 
 
 def normalize_openai_compatible_multimodal_content(content):
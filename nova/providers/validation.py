@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 
+from django.core.cache import cache
+
 from nova.models.Provider import LLMProvider, VALIDATION_CAPABILITY_ORDER
 from nova.providers.registry import (
     get_provider_adapter,
@@ -19,6 +22,12 @@ SOURCE_PROBE = "probe"
 SOURCE_METADATA = "metadata"
 SOURCE_UNKNOWN = "unknown"
 
+# Probes run concurrently; each one gets its own deadline.
+PROVIDER_VALIDATION_PROBE_TIMEOUT_SECONDS = 90
+# Successful results are reused for an identical configuration (same
+# validation fingerprint, which covers type, model, URL, key and config).
+PROVIDER_VALIDATION_CACHE_TIMEOUT = 60 * 60
+
 _VALIDATION_IMAGE_BASE64 = (
     "/9j/4AAQSkZJRgABAQAASABIAAD/4QBMRXhpZgAATU0AKgAAAAgAAYdpAAQAAAABAAAAGgAAAAAAA6ABAAMAAAABAAEAAKACAAQAAAABAAAAIKADAAQAAAABAAAAIAAAAAD/wAARCAAgACADASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3ePn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3ePn6/9sAQwACAgICAgIDAgIDBQMDAwUGBQUFBQYIBgYGBgYICggICAgICAoKCgoKCgoKDAwMDAwMDg4ODg4PDw8PDw8PDw8P/9sAQwECAgIEBAQHBAQHEAsJCxAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQ/90ABAAC/9oADAMBAAIRAxEAPwD9/KKKKACiiigD/9D9/KKKKACiiigD/9k="
 )
@@ -329,6 +338,65 @@ async def _probe_pdf(provider, adapter) -> dict:
     return _capability_result(STATUS_PASS, message, latency_ms)
 
 
+async def _with_probe_timeout(probe):
+    try:
+        return await asyncio.wait_for(probe, timeout=PROVIDER_VALIDATION_PROBE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError as exc:
+        raise TimeoutError(
+            f"Probe timed out after {PROVIDER_VALIDATION_PROBE_TIMEOUT_SECONDS} seconds."
+        ) from exc
+
+
+def _start_probe(probe, *args) -> asyncio.Future:
+    # The probe coroutine is created inside the task, so cancelling a task
+    # that has not started yet leaves no un-awaited coroutine behind.
+    async def run():
+        return await _with_probe_timeout(probe(*args))
+
+    return asyncio.ensure_future(run())
+
+
+def _probe_outcome(capability: str, outcome) -> dict:
+    if not isinstance(outcome, BaseException):
+        return outcome
+    status = _classify_capability_failure(capability, outcome)
+    return _capability_result(
+        status,
+        _format_exception_message(outcome),
+        None,
+        source=SOURCE_PROBE,
+        metadata_status=STATUS_NOT_RUN,
+        probe_status=status,
+    )
+
+
+def _build_chat_failure_result(capabilities: dict, verified_inputs: dict, exc: Exception) -> dict:
+    error_message = _format_exception_message(exc)
+    capabilities["chat"] = _capability_result(
+        STATUS_FAIL,
+        error_message,
+        None,
+        source=SOURCE_PROBE,
+        metadata_status=STATUS_NOT_RUN,
+        probe_status=STATUS_FAIL,
+    )
+    for capability in ("streaming", "tools", "vision"):
+        capabilities[capability] = _capability_result(
+            STATUS_NOT_RUN,
+            "Skipped because chat validation failed.",
+            None,
+            source=SOURCE_PROBE,
+            metadata_status=STATUS_NOT_RUN,
+            probe_status=STATUS_NOT_RUN,
+        )
+    return {
+        "validation_status": LLMProvider.ValidationStatus.INVALID,
+        "verification_summary": f"Validation failed during chat probe: {error_message}",
+        "verified_operations": capabilities,
+        "verified_inputs": verified_inputs,
+    }
+
+
 async def validate_provider_configuration(provider) -> dict:
     """Validate provider capabilities using provider-specific adapters and shared probes."""
     if not str(getattr(provider, "model", "") or "").strip():
@@ -350,10 +418,12 @@ async def validate_provider_configuration(provider) -> dict:
         )
 
     try:
-        await adapter.complete_chat(
-            provider,
-            messages=[{"role": "user", "content": "Reply with OK."}],
-            tools=None,
+        await _with_probe_timeout(
+            adapter.complete_chat(
+                provider,
+                messages=[{"role": "user", "content": "Reply with OK."}],
+                tools=None,
+            )
         )
     except Exception as exc:
         error_message = _format_exception_message(exc)
@@ -362,64 +432,29 @@ async def validate_provider_configuration(provider) -> dict:
             f"Skipped after connectivity/auth failure: {error_message}",
         )
 
+    probes = {
+        "streaming": _start_probe(_probe_streaming, adapter, provider),
+        "tools": _start_probe(_probe_tools, adapter, provider),
+        "vision": _start_probe(_probe_vision, adapter, provider),
+        "pdf": _start_probe(_probe_pdf, provider, adapter),
+    }
     try:
-        capabilities["chat"] = await _probe_chat(adapter, provider)
-    except Exception as exc:
-        error_message = _format_exception_message(exc)
-        capabilities["chat"] = _capability_result(
-            STATUS_FAIL,
-            error_message,
-            None,
-            source=SOURCE_PROBE,
-            metadata_status=STATUS_NOT_RUN,
-            probe_status=STATUS_FAIL,
-        )
-        for capability in ("streaming", "tools", "vision"):
-            capabilities[capability] = _capability_result(
-                STATUS_NOT_RUN,
-                "Skipped because chat validation failed.",
-                None,
-                source=SOURCE_PROBE,
-                metadata_status=STATUS_NOT_RUN,
-                probe_status=STATUS_NOT_RUN,
-            )
-        return {
-            "validation_status": LLMProvider.ValidationStatus.INVALID,
-            "verification_summary": f"Validation failed during chat probe: {error_message}",
-            "verified_operations": capabilities,
-            "verified_inputs": verified_inputs,
-        }
-
-    for capability, probe in (
-        ("streaming", _probe_streaming),
-        ("tools", _probe_tools),
-        ("vision", _probe_vision),
-    ):
         try:
-            capabilities[capability] = await probe(adapter, provider)
+            chat = await _with_probe_timeout(_probe_chat(adapter, provider))
         except Exception as exc:
-            status = _classify_capability_failure(capability, exc)
-            capabilities[capability] = _capability_result(
-                status,
-                _format_exception_message(exc),
-                None,
-                source=SOURCE_PROBE,
-                metadata_status=STATUS_NOT_RUN,
-                probe_status=status,
-            )
+            # The other probes cannot pass without chat; stop them right away.
+            return _build_chat_failure_result(capabilities, verified_inputs, exc)
+        outcomes = dict(zip(probes, await asyncio.gather(*probes.values(), return_exceptions=True)))
+    finally:
+        for probe in probes.values():
+            probe.cancel()
+        await asyncio.gather(*probes.values(), return_exceptions=True)
 
-    try:
-        verified_inputs["pdf"] = await _probe_pdf(provider, adapter)
-    except Exception as exc:
-        status = _classify_capability_failure("pdf", exc)
-        verified_inputs["pdf"] = _capability_result(
-            status,
-            _format_exception_message(exc),
-            None,
-            source=SOURCE_PROBE,
-            metadata_status=STATUS_NOT_RUN,
-            probe_status=status,
-        )
+    capabilities["chat"] = chat
+
+    for capability in ("streaming", "tools", "vision"):
+        capabilities[capability] = _probe_outcome(capability, outcomes[capability])
+    verified_inputs["pdf"] = _probe_outcome("pdf", outcomes["pdf"])
 
     return {
         "validation_status": LLMProvider.ValidationStatus.VALID,
@@ -430,3 +465,41 @@ async def validate_provider_configuration(provider) -> dict:
         "verified_operations": capabilities,
         "verified_inputs": verified_inputs,
     }
+
+
+def _validation_cache_key(provider) -> str:
+    return f"nova:provider_validation:{provider.compute_validation_fingerprint()}"
+
+
+def get_cached_validation_result(provider) -> dict | None:
+    """Return the stored outcome of a successful validation of this exact configuration.
+
+    The entry holds the verification `result` and the `declared_snapshot` of
+    provider metadata resolved alongside it.
+    """
+    entry = cache.get(_validation_cache_key(provider))
+    if not isinstance(entry, dict) or not isinstance(entry.get("result"), dict):
+        return None
+    return entry
+
+
+def cache_validation_result(provider, result: dict, *, declared_snapshot: dict | None = None) -> None:
+    # Failures are not cached: they are often transient (server down, model loading).
+    if result.get("validation_status") != LLMProvider.ValidationStatus.VALID:
+        return
+    cache.set(
+        _validation_cache_key(provider),
+        {"result": result, "declared_snapshot": declared_snapshot or {}},
+        PROVIDER_VALIDATION_CACHE_TIMEOUT,
+    )
+
+
+def apply_cached_validation_result(provider) -> bool:
+    """Apply a cached validation outcome to `provider`; return False when none is stored."""
+    entry = get_cached_validation_result(provider)
+    if entry is None:
+        return False
+    if entry["declared_snapshot"]:
+        provider.apply_declared_capabilities(entry["declared_snapshot"], save=False)
+    provider.apply_verification_result(entry["result"])
+    return True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import binascii
 import html
@@ -26,6 +27,7 @@ from nova.agent_execution import (
     resolve_effective_response_mode,
 )
 from nova.file_utils import download_file_content
+from nova.llm.tokenizer import count_tokens
 from nova.web.download_service import download_http_file
 from nova.continuous.context_builder import load_continuous_context
 from nova.models.Message import Actor, Message, MessageType
@@ -89,6 +91,16 @@ class ReactTerminalRuntime:
         re.IGNORECASE,
     )
     _HTML_REPAIR_REDIRECTION_RE = re.compile(r"(?:^|\s)(?:>>|>|<)(?:\s|$)")
+    # Upper bound on tool calls of one model turn running at the same time.
+    MAX_CONCURRENT_TOOL_CALLS = 4
+    # Share of the provider context window given to the thread history, and
+    # how many messages are read per query while filling it newest-first.
+    HISTORY_CONTEXT_SHARE = 0.75
+    HISTORY_PAGE_SIZE = 100
+    _HISTORY_FILES_NOTE = (
+        "[New files were added to the terminal filesystem with this message. "
+        "Inspect them with `ls /` if needed.]"
+    )
     _HTML_REPAIR_MARKUP_MARKERS = (
         "<!doctype",
         "<html",
@@ -360,45 +372,83 @@ class ReactTerminalRuntime:
         except (TypeError, ValueError):
             summary_until_message_id = None
 
+        excluded_answer_ids = {
+            int(value)
+            for value in list(excluded_interaction_answer_ids or set())
+            if value is not None
+        }
+        summary_message = self._build_history_summary_message(session_state)
+        token_budget = self._history_token_budget()
+        if token_budget is not None and summary_message:
+            token_budget -= count_tokens(summary_message["content"])
+
         def _load():
-            queryset = Message.objects.filter(thread=self.thread).order_by("created_at", "id")
+            queryset = (
+                Message.objects.filter(thread=self.thread)
+                .exclude(actor=Actor.SYSTEM)
+                .only("id", "text", "actor", "internal_data", "message_type", "interaction_id", "token_count")
+                .order_by("-created_at", "-id")
+            )
             if source_message_id:
                 queryset = queryset.filter(id__lt=source_message_id)
             if summary_until_message_id:
                 queryset = queryset.filter(id__gt=summary_until_message_id)
-            return list(queryset)
+            if excluded_answer_ids:
+                queryset = queryset.exclude(
+                    message_type=MessageType.INTERACTION_ANSWER,
+                    interaction_id__in=excluded_answer_ids,
+                )
+
+            # Walk back from the newest message until the budget is spent; the
+            # newest message is always kept.
+            selected: list[Message] = []
+            uncounted: list[Message] = []
+            used_tokens = 0
+            offset = 0
+            budget_spent = False
+            while not budget_spent:
+                page = list(queryset[offset:offset + self.HISTORY_PAGE_SIZE])
+                for message in page:
+                    if message.token_count is None:
+                        message.token_count = count_tokens(message.text)
+                        uncounted.append(message)
+                    if (
+                        token_budget is not None
+                        and selected
+                        and used_tokens + message.token_count > token_budget
+                    ):
+                        budget_spent = True
+                        break
+                    used_tokens += message.token_count
+                    selected.append(message)
+                if len(page) < self.HISTORY_PAGE_SIZE:
+                    break
+                offset += self.HISTORY_PAGE_SIZE
+            if uncounted:
+                Message.objects.bulk_update(uncounted, ["token_count"])
+            selected.reverse()
+            return selected
 
         messages = await sync_to_async(_load, thread_sensitive=True)()
         history: list[dict] = []
-        summary_message = self._build_history_summary_message(session_state)
         if summary_message:
             history.append(summary_message)
-        excluded_answer_ids = {
-            int(value)
-            for value in list(excluded_interaction_answer_ids or set())
-            if value is not None
-        }
         for message in messages:
-            if message.actor == Actor.SYSTEM:
-                continue
-            if (
-                excluded_answer_ids
-                and message.message_type == MessageType.INTERACTION_ANSWER
-                and getattr(message, "interaction_id", None) in excluded_answer_ids
-            ):
-                continue
             role = "user" if message.actor == Actor.USER else "assistant"
             content = str(message.text or "")
             internal_data = message.internal_data if isinstance(message.internal_data, dict) else {}
             file_ids = internal_data.get("file_ids")
             if role == "user" and isinstance(file_ids, list) and file_ids:
-                content = (
-                    f"{content}\n\n[New files were added to the terminal filesystem with this message. "
-                    "Inspect them with `ls /` if needed.]"
-                ).strip()
+                content = f"{content}\n\n{self._HISTORY_FILES_NOTE}".strip()
             history.append({"role": role, "content": content})
         return history
 
+    def _history_token_budget(self) -> int | None:
+        max_context_tokens = self.provider_client.max_context_tokens if self.provider_client else None
+        if not max_context_tokens or max_context_tokens <= 0:
+            return None
+        return int(max_context_tokens * self.HISTORY_CONTEXT_SHARE)
+
     def _tool_schemas(self) -> list[dict]:
         if not self.tools_enabled:
             return []
@@ -498,26 +548,26 @@ class ReactTerminalRuntime:
         if self.progress_handler and hasattr(self.progress_handler, "complete_markdown_stream"):
             await self.progress_handler.complete_markdown_stream()
 
+    async def _flush_progress_state(self) -> None:
+        if self.progress_handler and hasattr(self.progress_handler, "flush_state"):
+            await self.progress_handler.flush_state()
+
     @staticmethod
     def _approximate_tokens(messages: list[dict], *, final_answer: str = "") -> int:
-        total_bytes = 0
+        total = 0
         for message in list(messages or []):
-            role = str(message.get("role") or "")
-            total_bytes += len(role.encode("utf-8", "ignore"))
+            total += count_tokens(str(message.get("role") or ""))
             content = message.get("content")
-            if isinstance(content, str):
-                total_bytes += len(content.encode("utf-8", "ignore"))
-            else:
-                total_bytes += len(str(content).encode("utf-8", "ignore"))
+            total += count_tokens(content if isinstance(content, str) else str(content))
             tool_calls = list(message.get("tool_calls") or [])
             if tool_calls:
-                total_bytes += len(json.dumps(tool_calls, ensure_ascii=True).encode("utf-8", "ignore"))
+                total += count_tokens(json.dumps(tool_calls, ensure_ascii=True))
             tool_call_id = message.get("tool_call_id")
             if tool_call_id:
-                total_bytes += len(str(tool_call_id).encode("utf-8", "ignore"))
+                total += count_tokens(str(tool_call_id))
         if final_answer:
-            total_bytes += len(str(final_answer).encode("utf-8", "ignore"))
-        return total_bytes // 4 + 1 if total_bytes else 0
+            total += count_tokens(str(final_answer))
+        return total
 
     def _provider_trace_meta(self, *, response_mode: str) -> dict[str, Any]:
         provider = getattr(self.provider_client, "provider", None)
@@ -1111,6 +1161,70 @@ class ReactTerminalRuntime:
                 await self.progress_handler.on_tool_failure(f"Tool '{tool_name}' failed")
             return {"tool_call_id": tool_call_id, "name": tool_name, "content": f"Tool execution error: {exc}"}
 
+    def _concurrent_tool_group(self, tool_call: dict) -> str | None:
+        """Return the group a tool call may run concurrently within, or None.
+
+        Delegations run in their own child runtime; read-only terminal
+        commands neither write files nor change the shared shell state.
+        """
+        tool_name = str(tool_call.get("name") or "").strip()
+        if tool_name == "delegate_to_agent":
+            return tool_name
+        if tool_name != "terminal" or self.terminal is None:
+            return None
+        try:
+            payload = self._decode_tool_payload(tool_name, tool_call.get("arguments"))
+        except ValueError:
+            return None
+        command, _normalization_meta = self._normalize_model_terminal_command(str(payload.get("command") or ""))
+        return tool_name if self.terminal.is_read_only_command(command) else None
+
+    def _delegation_target(self, tool_call: dict) -> str:
+        """Return the sub-agent a delegation targets, as one key per agent."""
+        try:
+            payload = self._decode_tool_payload("delegate_to_agent", tool_call.get("arguments"))
+        except ValueError:
+            return ""
+        selector = str(payload.get("agent_id") or "").strip()
+        match = self._resolve_subagent_match(selector)
+        return str(match.id) if match is not None else selector
+
+    async def _execute_tool_calls(self, tool_calls: list[dict]) -> list[dict]:
+        """Execute the tool calls of one model turn and return results in call order.
+
+        Consecutive calls of the same concurrent group run under `asyncio.gather`
+        (at most `MAX_CONCURRENT_TOOL_CALLS` at once); other calls run alone.
+        Delegations to the same sub-agent share its sandbox workspace, so they
+        never run together.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TOOL_CALLS)
+
+        async def _bounded(tool_call: dict) -> dict:
+            async with semaphore:
+                return await self._execute_tool_call(tool_call)
+
+        results: list[dict] = []
+        batch: list[dict] = []
+        batch_group: str | None = None
+        batch_targets: set[str] = set()
+        for tool_call in tool_calls:
+            group = self._concurrent_tool_group(tool_call)
+            target = self._delegation_target(tool_call) if group == "delegate_to_agent" else None
+            if batch and (group != batch_group or target in batch_targets):
+                results.extend(await asyncio.gather(*(_bounded(item) for item in batch)))
+                batch = []
+                batch_targets = set()
+            if group is None:
+                results.append(await self._execute_tool_call(tool_call))
+                continue
+            batch.append(tool_call)
+            batch_group = group
+            if target is not None:
+                batch_targets.add(target)
+        if batch:
+            results.extend(await asyncio.gather(*(_bounded(item) for item in batch)))
+        return results
+
     @staticmethod
     def _extract_text_content(content: Any) -> str:
         if isinstance(content, str):
@@ -1827,8 +1941,7 @@ class ReactTerminalRuntime:
                         await self._record_progress("Waiting for user input")
                         return interruption
                     await self._complete_stream()
-                    for tool_call in tool_calls:
-                        tool_result = await self._execute_tool_call(tool_call)
+                    for tool_result in await self._execute_tool_calls(tool_calls):
                         messages.append(
                             self._build_tool_result_message(
                                 tool_result["tool_call_id"],
@@ -1856,5 +1969,6 @@ class ReactTerminalRuntime:
                 max_context=self.provider_client.max_context_tokens,
             )
         finally:
+            await self._flush_progress_state()
             if self.terminal is not None:
                 await self.terminal.close()
@@ -0,0 +1,371 @@
+"""Asyncio-native agent worker.
+
+Celery's prefork workers pin one process per in-flight agent run although a
+run mostly waits on LLM I/O. With `AGENT_WORKER_ENABLED`, the `run_ai_task` and
+`resume_ai_task` Celery tasks forward their job to a Redis list consumed by
+`AgentWorker`, which executes many runs concurrently in one event loop:
+
+- at most `AGENT_WORKER_CONCURRENCY` runs at once, and at most
+  `AGENT_WORKER_MAX_RUNS_PER_USER` per user, started round-robin across users;
+  a job pulled for a user already at that limit goes back to the queue so
+  other workers (or this one, later) can take it
+- jobs being worked on are kept in a per-worker processing list; at startup a
+  worker re-queues its own list and the lists of workers whose heartbeat has
+  expired, so a crashed worker's jobs are recovered even if its ID changed
+- runs can be canceled through `request_agent_run_cancel` (the task cancel view)
+- the loop's default executor, which runs the non thread-sensitive ORM work,
+  drops broken or expired database connections before every call, as Django
+  does per request; its threads live as long as the worker
+- on SIGTERM/SIGINT the worker stops pulling jobs, re-queues the ones it has
+  not started and waits up to `AGENT_WORKER_DRAIN_TIMEOUT_SECONDS` for the
+  others before canceling them
+
+Start it with `python manage.py run_agent_worker`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import signal
+import socket
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+JOB_KIND_RUN = "run"
+JOB_KIND_RESUME = "resume"
+
+AGENT_RUN_QUEUE_KEY = "nova:agent_worker:queue"
+AGENT_RUN_PROCESSING_KEY = "nova:agent_worker:processing:{worker_id}"
+AGENT_RUN_CANCEL_KEY = "nova:agent_worker:cancel:{task_id}"
+AGENT_RUN_CANCEL_TTL_SECONDS = 60 * 60
+AGENT_WORKER_ALIVE_KEY = "nova:agent_worker:alive:{worker_id}"
+AGENT_WORKER_ALIVE_TTL_SECONDS = 30
+AGENT_WORKER_HEARTBEAT_SECONDS = 5
+# How long one blocking pull waits before the loop checks cancellations again.
+AGENT_WORKER_POLL_SECONDS = 1
+
+_sync_client = None
+
+
+def _redis_url() -> str:
+    return settings.AGENT_WORKER_REDIS_URL
+
+
+def _get_sync_client():
+    global _sync_client
+    if _sync_client is None:
+        import redis
+
+        _sync_client = redis.Redis.from_url(_redis_url())
+    return _sync_client
+
+
+def enqueue_agent_run(kind: str, *, task_id: int, user_id: int, args: list[Any]) -> None:
+    """Queue an agent run (or resume) for the agent worker."""
+
+    payload = {"kind": kind, "task_id": task_id, "user_id": user_id, "args": list(args)}
+    _get_sync_client().rpush(AGENT_RUN_QUEUE_KEY, json.dumps(payload))
+
+
+def request_agent_run_cancel(task_id: int) -> None:
+    """Ask the agent worker running `task_id` to cancel it."""
+
+    _get_sync_client().set(
+        AGENT_RUN_CANCEL_KEY.format(task_id=task_id),
+        "1",
+        ex=AGENT_RUN_CANCEL_TTL_SECONDS,
+    )
+
+
+@dataclass(slots=True)
+class AgentRunJob:
+    raw: str
+    kind: str
+    task_id: int
+    user_id: int
+    args: list[Any] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: bytes | str) -> "AgentRunJob":
+        text = raw.decode("utf-8") if isinstance(raw, bytes) else str(raw)
+        payload = json.loads(text)
+        return cls(
+            raw=text,
+            kind=str(payload["kind"]),
+            task_id=int(payload["task_id"]),
+            user_id=int(payload["user_id"]),
+            args=list(payload.get("args") or []),
+        )
+
+
+def _with_usable_connections(fn, /, *args, **kwargs):
+    close_old_connections()
+    return fn(*args, **kwargs)
+
+
+class _DatabaseThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool recycling stale database connections before each call."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(_with_usable_connections, fn, *args, **kwargs)
+
+
+def _build_job_executor(job: AgentRunJob):
+    """Return `(executor, interruption_response)` for a job (sync ORM)."""
+    from nova.tasks.tasks import build_resume_executor, build_run_executor
+
+    if job.kind == JOB_KIND_RESUME:
+        return build_resume_executor(*job.args)
+    if job.kind == JOB_KIND_RUN:
+        return build_run_executor(*job.args), None
+    raise ValueError(f"Unknown agent run kind: {job.kind}")
+
+
+class AgentWorker:
+    def __init__(
+        self,
+        *,
+        concurrency: int | None = None,
+        per_user_limit: int | None = None,
+        drain_timeout: float | None = None,
+        worker_id: str | None = None,
+        redis_client=None,
+    ):
+        self.concurrency = max(1, int(concurrency or settings.AGENT_WORKER_CONCURRENCY))
+        self.per_user_limit = max(1, int(per_user_limit or settings.AGENT_WORKER_MAX_RUNS_PER_USER))
+        self.drain_timeout = float(
+            settings.AGENT_WORKER_DRAIN_TIMEOUT_SECONDS if drain_timeout is None else drain_timeout
+        )
+        self.worker_id = worker_id or settings.AGENT_WORKER_ID or socket.gethostname()
+        self.processing_key = AGENT_RUN_PROCESSING_KEY.format(worker_id=self.worker_id)
+        self.alive_key = AGENT_WORKER_ALIVE_KEY.format(worker_id=self.worker_id)
+        self._redis = redis_client
+        # Jobs pulled but not started, per user in round-robin order.
+        self._pending: OrderedDict[int, deque[AgentRunJob]] = OrderedDict()
+        self._running: dict[asyncio.Task, AgentRunJob] = {}
+        self._running_per_user: dict[int, int] = {}
+        self._stopping = asyncio.Event()
+        # Jobs handed back since the loop last waited; bounds queue cycling.
+        self._handed_back: set[str] = set()
+        self._last_heartbeat = 0.0
+
+    # ------------------------------------------------------------------ state
+    @property
+    def pending_count(self) -> int:
+        return sum(len(jobs) for jobs in self._pending.values())
+
+    def user_load(self, user_id: int) -> int:
+        """Runs of `user_id` started or held by this worker."""
+        return self._running_per_user.get(user_id, 0) + len(self._pending.get(user_id, ()))
+
+    def stop(self) -> None:
+        """Stop pulling new jobs and drain the running ones."""
+        self._stopping.set()
+
+    def accept(self, job: AgentRunJob) -> None:
+        self._pending.setdefault(job.user_id, deque()).append(job)
+
+    def start_ready_jobs(self) -> list[asyncio.Task]:
+        """Start pending jobs while slots are free, one user at a time in turn."""
+        started: list[asyncio.Task] = []
+        while len(self._running) < self.concurrency:
+            user_id = next(
+                (
+                    uid
+                    for uid, jobs in self._pending.items()
+                    if jobs and self._running_per_user.get(uid, 0) < self.per_user_limit
+                ),
+                None,
+            )
+            if user_id is None:
+                break
+            jobs = self._pending[user_id]
+            job = jobs.popleft()
+            if jobs:
+                self._pending.move_to_end(user_id)
+            else:
+                del self._pending[user_id]
+            self._running_per_user[user_id] = self._running_per_user.get(user_id, 0) + 1
+            run = asyncio.create_task(self._run_job(job), name=f"agent-run-{job.task_id}")
+            self._running[run] = job
+            run.add_done_callback(self._on_job_done)
+            started.append(run)
+        return started
+
+    def _on_job_done(self, run: asyncio.Task) -> None:
+        job = self._running.pop(run, None)
+        if job is None:
+            return
+        remaining = self._running_per_user.get(job.user_id, 1) - 1
+        if remaining > 0:
+            self._running_per_user[job.user_id] = remaining
+        else:
+            self._running_per_user.pop(job.user_id, None)
+
+    def cancel(self, task_id: int) -> bool:
+        """Cancel the running job of `task_id`."""
+        for run, job in self._running.items():
+            if job.task_id == task_id:
+                run.cancel()
+                return True
+        return False
+
+    # ---------------------------------------------------------------- running
+    async def _execute(self, job: AgentRunJob) -> None:
+        executor, interruption_response = await sync_to_async(_build_job_executor, thread_sensitive=True)(job)
+        try:
+            await executor.execute_or_resume(interruption_response)
+        except asyncio.CancelledError:
+            await asyncio.shield(executor.mark_canceled())
+            raise
+
+    async def _run_job(self, job: AgentRunJob) -> None:
+        try:
+            await self._execute(job)
+        except asyncio.CancelledError:
+            logger.info("Agent run for task %s was canceled.", job.task_id)
+        except Exception:
+            logger.exception("Agent run for task %s failed.", job.task_id)
+        finally:
+            if self._redis is not None:
+                await self._redis.lrem(self.processing_key, 1, job.raw)
+            await sync_to_async(close_old_connections, thread_sensitive=True)()
+
+    async def _requeue_orphans(self) -> None:
+        """Put back jobs taken but not finished by this worker or by dead workers."""
+        pattern = AGENT_RUN_PROCESSING_KEY.format(worker_id="*")
+        prefix = pattern[:-1]
+        async for key in self._redis.scan_iter(match=pattern):
+            key = key.decode("utf-8") if isinstance(key, bytes) else str(key)
+            worker_id = key[len(prefix):]
+            if worker_id != self.worker_id and await self._redis.exists(
+                AGENT_WORKER_ALIVE_KEY.format(worker_id=worker_id)
+            ):
+                continue
+            # One atomic move per job, so concurrent recoveries never duplicate one.
+            moved = 0
+            while await self._redis.lmove(key, AGENT_RUN_QUEUE_KEY, "RIGHT", "LEFT") is not None:
+                moved += 1
+            if moved:
+                logger.warning("Re-queued %s unfinished agent run(s) of worker %s.", moved, worker_id)
+
+    async def _heartbeat(self) -> None:
+        now = asyncio.get_running_loop().time()
+        if now - self._last_heartbeat < AGENT_WORKER_HEARTBEAT_SECONDS:
+            return
+        await self._redis.set(self.alive_key, "1", ex=AGENT_WORKER_ALIVE_TTL_SECONDS)
+        self._last_heartbeat = now
+
+    async def _check_cancellations(self) -> None:
+        # Flags of jobs not started yet stay set until they run.
+        task_ids = [job.task_id for job in self._running.values()]
+        if not task_ids:
+            return
+        keys = [AGENT_RUN_CANCEL_KEY.format(task_id=task_id) for task_id in task_ids]
+        flags = await self._redis.mget(keys)
+        for task_id, key, flag in zip(task_ids, keys, flags):
+            if flag is None:
+                continue
+            await self._redis.delete(key)
+            self.cancel(task_id)
+
+    async def _pull(self) -> bool:
+        """Take one job from the queue.
+
+        Returns False when the loop should wait for a run to finish: the jobs
+        pulled lately all belong to users already at `per_user_limit`.
+        """
+        raw = await self._redis.blmove(
+            AGENT_RUN_QUEUE_KEY,
+            self.processing_key,
+            AGENT_WORKER_POLL_SECONDS,
+            src="LEFT",
+            dest="RIGHT",
+        )
+        if raw is None:
+            return True
+        try:
+            job = AgentRunJob.from_raw(raw)
+        except (ValueError, KeyError, TypeError):
+            logger.error("Dropping malformed agent run job: %r", raw)
+            await self._redis.lrem(self.processing_key, 1, raw)
+            return True
+        if self.user_load(job.user_id) < self.per_user_limit:
+            self.accept(job)
+            return True
+
+        revisited = job.raw in self._handed_back
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(self.processing_key, 1, job.raw)
+            pipe.rpush(AGENT_RUN_QUEUE_KEY, job.raw)
+            await pipe.execute()
+        self._handed_back.add(job.raw)
+        return not revisited and len(self._handed_back) < self.concurrency
+
+    async def _drain(self) -> None:
+        for jobs in self._pending.values():
+            for job in jobs:
+                await self._redis.lrem(self.processing_key, 1, job.raw)
+                await self._redis.lpush(AGENT_RUN_QUEUE_KEY, job.raw)
+        self._pending.clear()
+
+        running = list(self._running)
+        if not running:
+            return
+        logger.info("Draining %s agent run(s) (timeout %ss).", len(running), self.drain_timeout)
+        _done, still_running = await asyncio.wait(running, timeout=self.drain_timeout)
+        for run in still_running:
+            run.cancel()
+        if still_running:
+            await asyncio.wait(still_running)
+
+    async def run(self) -> None:
+        if self._redis is None:
+            import redis.asyncio as redis_asyncio
+
+            self._redis = redis_asyncio.from_url(_redis_url())
+
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(_DatabaseThreadPoolExecutor(thread_name_prefix="agent-worker"))
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        await self._requeue_orphans()
+        await self._heartbeat()
+        stop_waiter = asyncio.create_task(self._stopping.wait())
+        logger.info(
+            "Agent worker %s started (concurrency=%s, per_user_limit=%s).",
+            self.worker_id,
+            self.concurrency,
+            self.per_user_limit,
+        )
+        while not self._stopping.is_set():
+            self.start_ready_jobs()
+            await self._heartbeat()
+            await self._check_cancellations()
+            # Keep the local backlog small so other workers can take the rest;
+            # held jobs can all start as soon as a slot frees up.
+            if self.pending_count < self.concurrency and await self._pull():
+                continue
+            self._handed_back.clear()
+            await asyncio.wait(
+                [*self._running, stop_waiter],
+                timeout=AGENT_WORKER_POLL_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        await self._drain()
+        await self._redis.delete(self.alive_key)
+        logger.info("Agent worker %s stopped.", self.worker_id)
@@ -5,6 +5,7 @@ from typing import Any
 
 from asgiref.sync import sync_to_async
 
+from nova.llm.tokenizer import count_tokens
 from nova.models.AgentThreadSession import AgentThreadSession
 from nova.models.Message import Actor, Message
 from nova.models.Thread import Thread
@@ -149,10 +150,7 @@ def build_compaction_messages(
 
 
 def approximate_token_count_from_text(text: str) -> int:
-    content = str(text or "")
-    if not content:
-        return 0
-    return len(content.encode("utf-8", "ignore")) // 4 + 1
+    return count_tokens(text)
 
 
 async def store_compaction_state(
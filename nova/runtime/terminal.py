@@ -277,6 +277,23 @@ class TerminalExecutor:
         "webapp",
         "wget",
     }
+    # Builtins that never write files, change the cwd or touch shared executor state.
+    READ_ONLY_COMMANDS = {
+        "cat",
+        "date",
+        "file",
+        "find",
+        "grep",
+        "head",
+        "history",
+        "la",
+        "ll",
+        "ls",
+        "pwd",
+        "sort",
+        "tail",
+        "wc",
+    }
     HOST_MEDIATED_PATH_PREFIXES = (
         f"{MEMORY_ROOT}/",
         f"{WEBDAV_VFS_ROOT}/",
@@ -660,6 +677,22 @@ class TerminalExecutor:
     def _command_uses_builtin_output(tokens: list[str]) -> bool:
         return any(token in {"--output", "-o", "-O"} for token in tokens)
 
+    def is_read_only_command(self, command: str) -> bool:
+        """Return True when every stage of `command` is a read-only builtin without redirection."""
+        try:
+            program = self._parse_shell_command(command)
+        except TerminalCommandError:
+            return False
+        for segment in program.segments:
+            if segment.output_path:
+                return False
+            for stage in segment.pipeline:
+                if not stage or stage[0] not in self.READ_ONLY_COMMANDS:
+                    return False
+                if self._command_uses_builtin_output(stage):
+                    return False
+        return True
+
     async def _record_terminal_failure(self, command: str, error: TerminalCommandError) -> None:
         failure_kind = str(getattr(error, "failure_kind", "") or classify_terminal_failure(str(error)))
         sanitized_command = sanitize_terminal_command(command)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import posixpath
 from dataclasses import dataclass
 
@@ -76,6 +77,49 @@ class VFSFile:
     warnings: tuple[str, ...] = ()
 
 
+class _VFSFileIndex:
+    """Path index over the real (UserFile-backed) files visible to one VFS.
+
+    ``files`` maps a normalized path to its file, and ``children`` maps every
+    implicit directory to its direct entries (``None`` marks a sub-directory).
+    A file wins over an implicit directory of the same name, matching how
+    ``list_dir`` historically resolved such collisions.
+    """
+
+    __slots__ = ("files", "children")
+
+    def __init__(self, items: list[VFSFile]):
+        self.files: dict[str, VFSFile] = {}
+        self.children: dict[str, dict[str, VFSFile | None]] = {}
+        for item in items:
+            self.files[item.path] = item
+            parent = posixpath.dirname(item.path)
+            self.children.setdefault(parent, {})[posixpath.basename(item.path)] = item
+            child = parent
+            while child != "/":
+                parent = posixpath.dirname(child)
+                entries = self.children.setdefault(parent, {})
+                name = posixpath.basename(child)
+                if name in entries:
+                    break
+                entries[name] = None
+                child = parent
+
+    def is_dir(self, path: str) -> bool:
+        return path in self.children
+
+    def iter_descendants(self, path: str):
+        pending = [path]
+        while pending:
+            directory = pending.pop()
+            for name, entry in self.children.get(directory, {}).items():
+                child_path = f"{directory.rstrip('/')}/{name}"
+                if entry is not None:
+                    yield entry
+                if child_path in self.children:
+                    pending.append(child_path)
+
+
 def normalize_vfs_path(raw_path: str, *, cwd: str = "/") -> str:
     candidate = str(raw_path or "").strip()
     if not candidate:
@@ -125,6 +169,8 @@ class VirtualFileSystem:
             str(tmp_storage_prefix or self._default_tmp_storage_prefix()).rstrip("/")
         )
         self._source_message_cache = None
+        self._file_index: _VFSFileIndex | None = None
+        self._file_index_summary_marker = None
 
     def _default_tmp_storage_prefix(self) -> str:
         return f"{RUNTIME_STORAGE_ROOT}/{int(self.agent_config.id)}/tmp"
@@ -356,7 +402,23 @@ class VirtualFileSystem:
             return self._root_vfs_path_for_user_file(original_path)
         return None
 
+    def invalidate_file_index(self) -> None:
+        """Drop the cached file index so the next lookup reloads UserFile rows."""
+        self._file_index = None
+
+    async def _get_file_index(self) -> _VFSFileIndex:
+        # The /history projection depends on the compaction boundary, so a
+        # boundary moved mid-run must rebuild the index as well.
+        summary_marker = self.session_state.get(SESSION_KEY_SUMMARY_UNTIL_MESSAGE_ID)
+        if self._file_index is None or summary_marker != self._file_index_summary_marker:
+            self._file_index = _VFSFileIndex(await self._query_real_files())
+            self._file_index_summary_marker = summary_marker
+        return self._file_index
+
     async def _load_real_files(self) -> list[VFSFile]:
+        return list((await self._get_file_index()).files.values())
+
+    async def _query_real_files(self) -> list[VFSFile]:
         history_message_ids = await self._load_history_message_ids()
 
         def _load():
@@ -467,12 +529,8 @@ class VirtualFileSystem:
             return skill_name in self.skill_registry
         if normalized in self._get_session_dirs():
             return True
-        for item in await self._load_real_files():
-            if item.path == normalized:
-                return True
-            if item.path.startswith(f"{normalized.rstrip('/')}/"):
-                return True
-        return False
+        index = await self._get_file_index()
+        return normalized in index.files or index.is_dir(normalized)
 
     async def is_dir(self, path: str) -> bool:
         normalized = normalize_vfs_path(path, cwd=self.cwd)
@@ -502,10 +560,7 @@ class VirtualFileSystem:
             return metadata.get("exists") and metadata.get("type") == "directory"
         if normalized in self._get_session_dirs():
             return True
-        for item in await self._load_real_files():
-            if item.path.startswith(f"{normalized.rstrip('/')}/"):
-                return True
-        return False
+        return (await self._get_file_index()).is_dir(normalized)
 
     async def list_dir(self, path: str | None = None) -> list[dict]:
         normalized = normalize_vfs_path(path or self.cwd, cwd=self.cwd)
@@ -551,7 +606,7 @@ class VirtualFileSystem:
             if self.memory_enabled:
                 entries["memory"] = {"name": "memory", "path": MEMORY_ROOT, "type": "dir"}
 
-        all_files = await self._load_real_files()
+        index = await self._get_file_index()
         session_dirs = self._get_session_dirs()
 
         for directory in sorted(session_dirs):
@@ -561,42 +616,35 @@ class VirtualFileSystem:
                 name = posixpath.basename(directory)
                 entries[name] = {"name": name, "path": directory, "type": "dir"}
 
-        prefix = normalized.rstrip("/") + "/"
-        for item in all_files:
-            if item.path == normalized:
-                name = posixpath.basename(item.path)
-                entries[name] = {
-                    "name": name,
-                    "path": item.path,
-                    "type": "file",
-                    "mime_type": item.mime_type,
-                    "size": item.size,
-                }
-                continue
-            if not item.path.startswith(prefix):
-                continue
-            relative = item.path[len(prefix):]
-            child = relative.split("/", 1)[0]
-            child_path = f"{normalized.rstrip('/')}/{child}" if normalized != "/" else f"/{child}"
-            if "/" in relative:
+        item = index.files.get(normalized)
+        if item is not None:
+            name = posixpath.basename(item.path)
+            entries[name] = {
+                "name": name,
+                "path": item.path,
+                "type": "file",
+                "mime_type": item.mime_type,
+                "size": item.size,
+            }
+
+        for child, child_item in index.children.get(normalized, {}).items():
+            child_path = f"{normalized.rstrip('/')}/{child}"
+            if child_item is None:
                 entries.setdefault(child, {"name": child, "path": child_path, "type": "dir"})
             else:
                 entries[child] = {
                     "name": child,
                     "path": child_path,
                     "type": "file",
-                    "mime_type": item.mime_type,
-                    "size": item.size,
+                    "mime_type": child_item.mime_type,
+                    "size": child_item.size,
                 }
 
         return [entries[key] for key in sorted(entries.keys())]
 
     async def get_real_file(self, path: str) -> VFSFile | None:
         normalized = normalize_vfs_path(path, cwd=self.cwd)
-        for item in await self._load_real_files():
-            if item.path == normalized:
-                return item
-        return None
+        return (await self._get_file_index()).files.get(normalized)
 
     async def read_text(self, path: str) -> str:
         normalized = normalize_vfs_path(path, cwd=self.cwd)
@@ -768,6 +816,7 @@ class VirtualFileSystem:
             if not overwrite:
                 raise VFSError(f"File already exists: {normalized}")
             await sync_to_async(existing.user_file.delete, thread_sensitive=True)()
+            self.invalidate_file_index()
 
         source_message = await self._get_source_message()
 
@@ -784,9 +833,11 @@ class VirtualFileSystem:
                     key=key,
                     scope=scope,
                     source_message=source_message,
+                    content_sha256=hashlib.sha256(b"").hexdigest(),
                 )
 
             user_file = await sync_to_async(_create_empty_file, thread_sensitive=True)()
+            self.invalidate_file_index()
             return VFSFile(
                 path=normalized,
                 user_file=user_file,
@@ -801,6 +852,7 @@ class VirtualFileSystem:
             scope=scope,
             source_message=source_message,
         )
+        self.invalidate_file_index()
         if errors and not created:
             raise VFSError("; ".join(errors))
         created_id = created[0]["id"]
@@ -863,6 +915,7 @@ class VirtualFileSystem:
         item = await self.get_real_file(normalized)
         if item and item.user_file is not None:
             await sync_to_async(item.user_file.delete, thread_sensitive=True)()
+            self.invalidate_file_index()
             return
 
         if await self.is_dir(normalized):
@@ -871,9 +924,13 @@ class VirtualFileSystem:
                 raise VFSError(f"Directory not empty: {normalized}")
             if recursive:
                 prefix = f"{normalized.rstrip('/')}/"
-                for child_item in await self._load_real_files():
-                    if child_item.path.startswith(prefix) and child_item.user_file is not None:
-                        await sync_to_async(child_item.user_file.delete, thread_sensitive=True)()
+                index = await self._get_file_index()
+                try:
+                    for child_item in list(index.iter_descendants(normalized)):
+                        if child_item.user_file is not None:
+                            await sync_to_async(child_item.user_file.delete, thread_sensitive=True)()
+                finally:
+                    self.invalidate_file_index()
                 remaining_dirs = {
                     directory
                     for directory in self._get_session_dirs()
@@ -1006,19 +1063,15 @@ class VirtualFileSystem:
             if await self.path_exists(resolved_destination) and not await self.is_dir(resolved_destination):
                 raise VFSError(f"Cannot move directory over file: {resolved_destination}")
 
-            all_files = await self._load_real_files()
-            moved_file_paths = {
-                item.path for item in all_files if item.path.startswith(source_prefix)
-            }
+            index = await self._get_file_index()
+            moved_items = list(index.iter_descendants(normalized_source))
+            moved_file_paths = {item.path for item in moved_items}
             file_moves: list[tuple[VFSFile, str, str, str]] = []
-            for item in all_files:
-                if not item.path.startswith(source_prefix):
-                    continue
+            for item in moved_items:
                 suffix = item.path[len(normalized_source):]
                 destination_path = normalize_vfs_path(f"{resolved_destination}{suffix}", cwd="/")
-                for candidate in all_files:
-                    if candidate.path == destination_path and candidate.path not in moved_file_paths:
-                        raise VFSError(f"Destination already exists: {destination_path}")
+                if destination_path in index.files and destination_path not in moved_file_paths:
+                    raise VFSError(f"Destination already exists: {destination_path}")
                 actual_src_scope = str(item.user_file.scope or "") if item.user_file is not None else ""
                 dst_scope, dst_storage = self._storage_path_for_vfs_path(destination_path)
                 if actual_src_scope != dst_scope:
@@ -1040,7 +1093,10 @@ class VirtualFileSystem:
                     file_item.user_file.scope = dst_scope
                     file_item.user_file.save(update_fields=["original_filename", "scope", "updated_at"])
 
-            await sync_to_async(_save_directory_move, thread_sensitive=True)()
+            try:
+                await sync_to_async(_save_directory_move, thread_sensitive=True)()
+            finally:
+                self.invalidate_file_index()
             self._set_session_dirs(updated_dirs)
             return resolved_destination
         item = await self.get_real_file(normalized_source)
@@ -1052,6 +1108,7 @@ class VirtualFileSystem:
         destination_existing = await self.get_real_file(resolved_destination)
         if destination_existing and destination_existing.user_file is not None:
             await sync_to_async(destination_existing.user_file.delete, thread_sensitive=True)()
+            self.invalidate_file_index()
 
         actual_src_scope = str(item.user_file.scope or "")
         dst_scope, dst_storage = self._storage_path_for_vfs_path(resolved_destination)
@@ -1065,7 +1122,10 @@ class VirtualFileSystem:
             item.user_file.scope = dst_scope
             item.user_file.save(update_fields=["original_filename", "scope", "updated_at"])
 
-        await sync_to_async(_save, thread_sensitive=True)()
+        try:
+            await sync_to_async(_save, thread_sensitive=True)()
+        finally:
+            self.invalidate_file_index()
         return resolved_destination
 
     async def find(self, start_path: str, term: str = "") -> list[str]:
@@ -1121,10 +1181,13 @@ class VirtualFileSystem:
                         matches.append(full_path)
 
         prefix = normalized_start.rstrip("/") + "/"
-        for item in await self._load_real_files():
-            if item.path == normalized_start or item.path.startswith(prefix):
-                if not term or term.lower() in posixpath.basename(item.path).lower():
-                    matches.append(item.path)
+        index = await self._get_file_index()
+        candidates = list(index.iter_descendants(normalized_start))
+        if normalized_start in index.files:
+            candidates.append(index.files[normalized_start])
+        for item in candidates:
+            if not term or term.lower() in posixpath.basename(item.path).lower():
+                matches.append(item.path)
 
         for directory in sorted(self._get_session_dirs()):
             if directory == normalized_start or directory.startswith(prefix):
@@ -1144,8 +1207,8 @@ class VirtualFileSystem:
         if not basename:
             return None
         lowered = basename.lower()
-        for item in await self._load_real_files():
-            if item.path.startswith(f"{INBOX_ROOT}/") and posixpath.basename(item.path).lower() == lowered:
+        for item in (await self._get_file_index()).iter_descendants(INBOX_ROOT):
+            if posixpath.basename(item.path).lower() == lowered:
                 return item.path
         return None
 
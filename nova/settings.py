@@ -65,6 +65,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'social_django',
     'rest_framework',
     'rest_framework.authtoken',
@@ -122,6 +123,19 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Shared by web, Celery and runtime processes: drain coalescing, provider and
+# validation caches must be visible to all of them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv(
+            'CACHE_REDIS_URL',
+            f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/1",
+        ),
+        'KEY_PREFIX': 'nova',
+    },
+}
+
 # REST authentification methods
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -143,6 +157,10 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'secret'),
         'HOST': os.getenv('DB_HOST', 'db'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # Seconds a connection is reused; long-lived processes such as the
+        # agent worker set it so they do not reconnect for every query.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -298,6 +316,11 @@ def _get_positive_int_env(name: str, default: int) -> int:
     return value
 
 
+# Connections kept per shared S3 client (see nova/storage_clients.py).
+MINIO_MAX_POOL_CONNECTIONS = _get_positive_int_env("MINIO_MAX_POOL_CONNECTIONS", 32)
+# Parts uploaded in parallel (and buffered in memory) per multipart upload.
+MINIO_MULTIPART_CONCURRENCY = _get_positive_int_env("MINIO_MULTIPART_CONCURRENCY", 4)
+
 MESSAGE_ATTACHMENT_MAX_FILES = _get_positive_int_env(
     "MESSAGE_ATTACHMENT_MAX_FILES",
     4,
@@ -349,6 +372,25 @@ LLAMA_CPP_CTX_SIZE = os.getenv('LLAMA_CPP_CTX_SIZE', None)
 MEMORY_EMBEDDINGS_URL = os.getenv('MEMORY_EMBEDDINGS_URL', None)
 MEMORY_EMBEDDINGS_MODEL = os.getenv('MEMORY_EMBEDDINGS_MODEL', None)
 MEMORY_EMBEDDINGS_API_KEY = os.getenv('MEMORY_EMBEDDINGS_API_KEY', None)
+# Maximum number of texts sent in one embeddings request.
+MEMORY_EMBEDDINGS_BATCH_SIZE = _get_positive_int_env('MEMORY_EMBEDDINGS_BATCH_SIZE', 32)
+# Cached vectors older than this are pruned when the user computes new ones
+EMBEDDING_CACHE_MAX_AGE_DAYS = _get_positive_int_env('EMBEDDING_CACHE_MAX_AGE_DAYS', 30)
+# pgvector HNSW parameters for embedding indexes. `M` and `EF_CONSTRUCTION`
+# apply when the indexes are (re)built; `EF_SEARCH` is set per semantic query
+# and raised to the candidate limit when that is larger.
+MEMORY_VECTOR_HNSW_M = _get_positive_int_env('MEMORY_VECTOR_HNSW_M', 16)
+MEMORY_VECTOR_HNSW_EF_CONSTRUCTION = _get_positive_int_env('MEMORY_VECTOR_HNSW_EF_CONSTRUCTION', 64)
+MEMORY_VECTOR_HNSW_EF_SEARCH = _get_positive_int_env('MEMORY_VECTOR_HNSW_EF_SEARCH', 100)
+# In-process vector index used for semantic ranking when the database is not
+# PostgreSQL (pgvector). Set the backend to an empty string to disable it.
+MEMORY_VECTOR_INDEX_BACKEND = os.getenv('MEMORY_VECTOR_INDEX_BACKEND', 'nova.llm.vector_index.NumpyVectorIndex')
+MEMORY_VECTOR_INDEX_DIR = os.getenv('MEMORY_VECTOR_INDEX_DIR', os.path.join(BASE_DIR, 'vector_index'))
+
+# Local tokenizer for context budgets (falls back to a byte heuristic if unavailable)
+TOKENIZER_BACKEND = os.getenv('TOKENIZER_BACKEND', 'nova.llm.tokenizer.TiktokenTokenizer')
+TOKENIZER_ENCODING = os.getenv('TOKENIZER_ENCODING', 'cl100k_base')
+TOKENIZER_HF_FILE = os.getenv('TOKENIZER_HF_FILE', '')
 
 # Get info about a Searxng server if configured
 SEARNGX_SERVER_URL = os.getenv('SEARNGX_SERVER_URL', None)
@@ -375,6 +417,21 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 CELERY_BEAT_SCHEDULE = {}
 
+# Asyncio agent worker (`manage.py run_agent_worker`). When enabled, agent runs
+# and resumes are forwarded from Celery to this worker, which executes many of
+# them concurrently in one event loop.
+AGENT_WORKER_ENABLED = os.getenv('AGENT_WORKER_ENABLED', 'False').lower() == 'true'
+AGENT_WORKER_REDIS_URL = os.getenv('AGENT_WORKER_REDIS_URL', CELERY_BROKER_URL)
+# Stable name of this worker's processing list; defaults to the hostname.
+AGENT_WORKER_ID = os.getenv('AGENT_WORKER_ID', '').strip()
+AGENT_WORKER_CONCURRENCY = _get_positive_int_env('AGENT_WORKER_CONCURRENCY', 32)
+AGENT_WORKER_MAX_RUNS_PER_USER = _get_positive_int_env('AGENT_WORKER_MAX_RUNS_PER_USER', 2)
+AGENT_WORKER_DRAIN_TIMEOUT_SECONDS = _get_positive_int_env('AGENT_WORKER_DRAIN_TIMEOUT_SECONDS', 300)
+
+# Progress lines and stream snapshots of a running task are buffered in memory
+# and written at most once per interval, plus at checkpoints and run end.
+TASK_STATE_FLUSH_INTERVAL_SECONDS = _get_positive_int_env('TASK_STATE_FLUSH_INTERVAL_SECONDS', 2)
+
 # Admin IP restrictions
 ALLOWED_ADMIN_IPS = [ip.strip() for ip in os.getenv('ALLOWED_ADMIN_IPS', '').split(',') if ip.strip()]
 
@@ -22,8 +22,16 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Per-process cache for testing (no Redis required)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
 # Override MinIO settings to use local file storage for testing
 MEDIA_ROOT = tempfile.mkdtemp()  # Temporary directory for test files
+MEMORY_VECTOR_INDEX_DIR = tempfile.mkdtemp()  # In-process vector index for SQLite search
 
 # Ensure file expiration logic is enabled for model tests by default
 # (production can disable via USERFILE_EXPIRATION_DAYS env var)
@@ -5,10 +5,18 @@ from django.conf import settings
 from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
+from nova.continuous.context_builder import invalidate_continuous_context_cache
+from nova.continuous.utils import mark_day_segment_dirty
+from nova.llm.embeddings import invalidate_embeddings_provider_cache
+from nova.models.DaySegment import DaySegment
+from nova.models.Message import Message
+from nova.models.Provider import LLMProvider
 from nova.models.TaskDefinition import TaskDefinition
 from nova.models.UserFile import UserFile
 from nova.models.UserObjects import UserParameters, UserProfile
 from nova.models.Thread import Thread
+from nova.providers.client_pool import evict_provider_clients
+from nova.storage_deletion import defer_storage_deletion
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,48 @@ def create_user_profile_and_params(sender, instance, created, **kwargs):
         UserParameters.objects.create(user=instance)
 
 
+# --------------------------------------------------------------------------
+@receiver(post_save, sender=UserParameters)
+@receiver(post_delete, sender=UserParameters)
+def invalidate_user_embeddings_provider(sender, instance: UserParameters, **kwargs):
+    """Drop the cached embeddings provider when the user's choice changes."""
+    invalidate_embeddings_provider_cache(user_id=instance.user_id)
+
+
+# --------------------------------------------------------------------------
+@receiver(post_save, sender=LLMProvider)
+@receiver(post_delete, sender=LLMProvider)
+def evict_llm_provider_clients(sender, instance: LLMProvider, **kwargs):
+    """Drop pooled HTTP clients built from the provider's previous settings in every process."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not {"provider_type", "base_url", "api_key"} & set(update_fields):
+        return
+    evict_provider_clients(instance.pk)
+
+
+# --------------------------------------------------------------------------
+@receiver(post_save, sender=Message)
+@receiver(post_delete, sender=Message)
+@receiver(post_save, sender=DaySegment)
+@receiver(post_delete, sender=DaySegment)
+def invalidate_thread_continuous_context(sender, instance, **kwargs):
+    """Drop the cached continuous context when its messages or segments change."""
+    invalidate_continuous_context_cache(thread_id=instance.thread_id)
+
+
+@receiver(post_save, sender=Message)
+@receiver(post_delete, sender=Message)
+def flag_day_segment_for_summary(sender, instance: Message, **kwargs):
+    """Mark the day segment a message landed in (or left) as needing a summary refresh."""
+    if kwargs.get("created") is False:
+        return
+    # Only continuous threads have day segments; skip the UPDATE for the others
+    # whenever the thread is already loaded on the message.
+    if Message.thread.is_cached(instance) and instance.thread.mode != Thread.Mode.CONTINUOUS:
+        return
+    mark_day_segment_dirty(instance)
+
+
 # --------------------------------------------------------------------------
 @receiver(post_delete, sender=TaskDefinition)
 def cleanup_task_definition_periodic_task(sender, instance: TaskDefinition, **kwargs):
@@ -46,27 +96,17 @@ def cleanup_thread(sender, instance: Thread, **kwargs):
     """
     # ---------- 1. Minio cleanup ------------------------------
     files_to_delete = instance.files.all()
-    if files_to_delete.exists():
-        file_count = files_to_delete.count()
-        logger.info(f"Deleting {file_count} files for thread {instance.id} ('{instance.subject}')")
-
-        deleted_count = 0
-        failed_count = 0
-
-        for file_obj in files_to_delete:
-            try:
-                file_key = file_obj.key
-                file_obj.delete()  # This handles both DB and MinIO cleanup
-                logger.debug(f"Successfully deleted file {file_key}")
-                deleted_count += 1
-            except Exception as e:
-                logger.error(f"Failed to delete file {file_obj.key}: {e}")
-                failed_count += 1
-
-        logger.info(f"Thread {instance.id} file cleanup completed: {deleted_count} deleted, {failed_count} failed")
+    with defer_storage_deletion():
+        deleted_count, _ = files_to_delete.delete()
+    if deleted_count:
+        logger.info(
+            f"Deleted {deleted_count} files for thread {instance.id} ('{instance.subject}'); "
+            "storage cleanup scheduled"
+        )
     else:
         logger.debug(f"No files to delete for thread {instance.id}")
 
+
 @receiver(pre_delete, sender=UserFile)
 def cleanup_userfile_storage(sender, instance: UserFile, **kwargs):
     """Ensure MinIO cleanup also happens on cascade/queryset deletion paths."""
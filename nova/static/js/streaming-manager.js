@@ -73,7 +73,7 @@
             this.startWebSocket(taskId);
         }
 
-        onStreamChunk(taskId, chunk) {
+        onStreamChunk(taskId, chunk, stableCount = null, tailHtml = null) {
             const stream = this.activeStreams.get(taskId);
             if (!stream) {
                 // Note: for system action (eg. "compact"), there is no activeStream
@@ -82,7 +82,13 @@
 
             // Skip duplicate chunks (server sometimes sends the same content multiple times)
             // Also skip empty chunks
-            if (!chunk || chunk.trim() === '' || chunk === stream.lastChunk) {
+            if (!chunk || chunk.trim() === '') {
+                return;
+            }
+            if (chunk === stream.lastChunk) {
+                if (stream.element) {
+                    this.trackStreamBlocks(stream, stableCount, tailHtml);
+                }
                 return;
             }
 
@@ -96,6 +102,7 @@
             // The server is already sending HTML chunks, so we don't need to process them as Markdown
             // Replace the entire content since server sends complete paragraph updates
             contentEl.innerHTML = chunk;
+            this.trackStreamBlocks(stream, stableCount, tailHtml);
             this.messageManager?.followBottomDuringLayout?.({
                 force: false,
                 behavior: 'auto',
@@ -106,6 +113,51 @@
             stream.lastChunk = chunk;
         }
 
+        // Apply a block-level delta: append the newly completed blocks and
+        // replace the open trailing block. Deltas that do not follow the
+        // blocks shown are ignored until the next full chunk resyncs them.
+        onStreamDelta(taskId, data) {
+            const stream = this.activeStreams.get(taskId);
+            if (!stream?.element || stream.stableCount !== data.start) {
+                return;
+            }
+            const contentEl = stream.element.querySelector('.streaming-content');
+            (stream.tailNodes || []).forEach((node) => node.remove());
+            if (data.stable_html) {
+                contentEl.appendChild(this.htmlFragment(data.stable_html));
+            }
+            const tail = this.htmlFragment(data.tail_html || '');
+            stream.tailNodes = Array.from(tail.childNodes);
+            contentEl.appendChild(tail);
+            stream.stableCount = data.stable_count;
+            stream.lastChunk = null;
+            this.messageManager?.followBottomDuringLayout?.({
+                force: false,
+                behavior: 'auto',
+                observeRoot: stream.element,
+            });
+        }
+
+        // Remember which trailing nodes of a full chunk belong to the open block.
+        trackStreamBlocks(stream, stableCount, tailHtml) {
+            if (!Number.isInteger(stableCount)) {
+                stream.stableCount = null;
+                stream.tailNodes = [];
+                return;
+            }
+            const contentEl = stream.element.querySelector('.streaming-content');
+            const tailCount = this.htmlFragment(tailHtml || '').childNodes.length;
+            const nodes = Array.from(contentEl.childNodes);
+            stream.tailNodes = tailCount ? nodes.slice(-tailCount) : [];
+            stream.stableCount = stableCount;
+        }
+
+        htmlFragment(html) {
+            const template = document.createElement('template');
+            template.innerHTML = html;
+            return template.content;
+        }
+
         onStreamComplete(taskId) {
             const stream = this.activeStreams.get(taskId);
             if (stream) {
@@ -190,7 +242,10 @@
                     this.messageManager?.scheduleExecutionTraceRefresh(taskId);
                 },
                 'response_chunk': (data) => {
-                    this.onStreamChunk(taskId, data.chunk);
+                    this.onStreamChunk(taskId, data.chunk, data.stable_count, data.tail_html);
+                },
+                'response_delta': (data) => {
+                    this.onStreamDelta(taskId, data);
                 },
                 'context_consumption': (data) => {
                     // Get the card for this message
@@ -353,7 +408,10 @@
                 element: null,
                 status: 'reconnecting',
                 isReconnect: true,
-                lastChunk: currentResponse || ''
+                lastChunk: currentResponse || '',
+                // Block deltas apply once the next full chunk arrives.
+                stableCount: null,
+                tailNodes: []
             });
 
             // Show progress area
@@ -0,0 +1,183 @@
+# nova/storage_clients.py
+"""Shared S3 (MinIO) clients.
+
+Building a boto3/aioboto3 client resolves credentials, loads the service
+model and opens a fresh connection pool, so doing it per object dominates
+small reads and writes. This module keeps:
+
+- one synchronous ``boto3`` client per process (boto3 clients are
+  thread-safe), recreated after a fork;
+- one ``aioboto3`` client per running event loop, closed automatically when
+  the loop is shut down through ``asyncio.run``/``async_to_sync``.
+
+Clients are keyed by the effective MinIO settings so ``override_settings``
+in tests, or a reconfigured deployment, never reuses a stale client.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from contextlib import AsyncExitStack
+
+import aioboto3
+import boto3
+import botocore.config
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_POOL_CONNECTIONS = 32
+
+
+def _client_signature() -> tuple:
+    return (
+        settings.MINIO_ENDPOINT_URL,
+        settings.MINIO_ACCESS_KEY,
+        settings.MINIO_SECRET_KEY,
+        int(getattr(settings, "MINIO_MAX_POOL_CONNECTIONS", DEFAULT_MAX_POOL_CONNECTIONS)),
+    )
+
+
+def _client_kwargs(signature: tuple) -> dict:
+    endpoint_url, access_key, secret_key, max_pool_connections = signature
+    return {
+        "endpoint_url": endpoint_url,
+        "aws_access_key_id": access_key,
+        "aws_secret_access_key": secret_key,
+        "config": botocore.config.Config(
+            signature_version="s3v4",
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+        ),
+    }
+
+
+class S3ClientManager:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._sync_client = None
+        self._sync_signature: tuple | None = None
+        self._async_session = None
+        # loop -> (signature, client, holder async generator)
+        self._async_clients: dict[asyncio.AbstractEventLoop, tuple] = {}
+
+    def _reset_after_fork_locked(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        # Pools inherited from the parent process share sockets with it.
+        self._pid = pid
+        self._sync_client = None
+        self._sync_signature = None
+        self._async_session = None
+        self._async_clients = {}
+
+    def get_sync_client(self):
+        signature = _client_signature()
+        with self._lock:
+            self._reset_after_fork_locked()
+            if self._sync_client is None or self._sync_signature != signature:
+                self._sync_client = boto3.client("s3", **_client_kwargs(signature))
+                self._sync_signature = signature
+            return self._sync_client
+
+    def _get_async_session(self):
+        with self._lock:
+            self._reset_after_fork_locked()
+            if self._async_session is None:
+                self._async_session = aioboto3.Session()
+            return self._async_session
+
+    async def _hold_async_client(self, loop, signature):
+        # Kept suspended for the loop lifetime: asyncio.run() calls
+        # shutdown_asyncgens() before closing the loop, which resumes this
+        # generator with GeneratorExit and lets the pool close cleanly.
+        async with AsyncExitStack() as stack:
+            client = await stack.enter_async_context(
+                self._get_async_session().client("s3", **_client_kwargs(signature))
+            )
+            try:
+                yield client
+                yield None
+            finally:
+                with self._lock:
+                    current = self._async_clients.get(loop)
+                    if current is not None and current[1] is client:
+                        self._async_clients.pop(loop, None)
+
+    def _prune_closed_loops_locked(self) -> None:
+        for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+            self._async_clients.pop(loop, None)
+
+    async def get_async_client(self):
+        loop = asyncio.get_running_loop()
+        signature = _client_signature()
+        with self._lock:
+            self._reset_after_fork_locked()
+            self._prune_closed_loops_locked()
+            current = self._async_clients.get(loop)
+        if current is not None:
+            if current[0] == signature:
+                return current[1]
+            await current[2].aclose()
+
+        holder = self._hold_async_client(loop, signature)
+        client = await holder.__anext__()
+        with self._lock:
+            current = self._async_clients.get(loop)
+            if current is None or current[0] != signature:
+                self._async_clients[loop] = (signature, client, holder)
+                return client
+        # Another coroutine on this loop won the race; keep its client.
+        await holder.aclose()
+        return current[1]
+
+    async def aclose_loop_clients(self) -> None:
+        """Close the async client bound to the running event loop, if any."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            current = self._async_clients.pop(loop, None)
+        if current is not None:
+            await current[2].aclose()
+
+    def close(self) -> None:
+        """Release every client owned by this process."""
+        with self._lock:
+            sync_client = self._sync_client
+            async_clients = list(self._async_clients.items())
+            self._sync_client = None
+            self._sync_signature = None
+            self._async_clients = {}
+        if sync_client is not None:
+            try:
+                sync_client.close()
+            except Exception as exc:
+                logger.debug("Could not close S3 client: %s", exc)
+        for loop, (_signature, _client, holder) in async_clients:
+            if loop.is_closed() or not loop.is_running():
+                continue
+            try:
+                asyncio.run_coroutine_threadsafe(holder.aclose(), loop)
+            except RuntimeError:
+                continue
+
+
+s3_clients = S3ClientManager()
+
+
+def get_s3_client():
+    """Return the process-wide synchronous S3 client."""
+    return s3_clients.get_sync_client()
+
+
+async def get_async_s3_client():
+    """Return the S3 client shared by coroutines of the running event loop."""
+    return await s3_clients.get_async_client()
+
+
+def close_s3_clients(**kwargs) -> None:
+    """Shutdown hook for Celery workers and ASGI servers."""
+    s3_clients.close()
@@ -0,0 +1,132 @@
+# nova/storage_deletion.py
+"""Bulk deletion of UserFile storage objects.
+
+Deleting rows one by one used to send one S3 ``DeleteObject`` request per
+file inside the request/response cycle. Code that removes many files wraps
+the deletion in ``defer_storage_deletion()``: ``UserFile.delete_storage_object``
+then only records the key, and the collected keys are removed after the
+transaction commits through ``DeleteObjects`` batches of up to 1000 keys,
+sent concurrently from a Celery task.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import transaction
+
+from nova.storage_clients import get_async_s3_client
+
+logger = logging.getLogger(__name__)
+
+DELETE_OBJECTS_BATCH_SIZE = 1000  # S3 DeleteObjects hard limit
+DELETE_OBJECTS_CONCURRENCY = 4
+
+_deferred_keys: ContextVar[list[str] | None] = ContextVar("nova_deferred_storage_keys", default=None)
+
+
+def defer_storage_key(key: str) -> bool:
+    """Record ``key`` in the active deferral block, if any.
+
+    Returns False when no ``defer_storage_deletion()`` block is active so the
+    caller deletes the object immediately.
+    """
+    batch = _deferred_keys.get()
+    if batch is None:
+        return False
+    if key:
+        batch.append(key)
+    return True
+
+
+@contextmanager
+def defer_storage_deletion():
+    """Collect storage deletions issued inside the block and bulk-delete them.
+
+    Keys are only scheduled when the block exits normally, and only once the
+    surrounding transaction commits, so a rolled-back deletion never removes
+    the objects of rows that still exist. Nested blocks join the outer one.
+    """
+    if _deferred_keys.get() is not None:
+        yield
+        return
+    batch: list[str] = []
+    token = _deferred_keys.set(batch)
+    try:
+        yield
+    finally:
+        _deferred_keys.reset(token)
+    if batch:
+        schedule_storage_deletion(batch)
+
+
+def schedule_storage_deletion(keys: list[str]) -> None:
+    keys = list(dict.fromkeys(key for key in keys if key))
+    if not keys:
+        return
+    transaction.on_commit(lambda: _enqueue_storage_deletion(keys))
+
+
+def _enqueue_storage_deletion(keys: list[str]) -> None:
+    from nova.tasks.storage_tasks import delete_storage_objects_task
+
+    try:
+        delete_storage_objects_task.delay(keys)
+    except Exception as exc:
+        logger.warning("Could not enqueue storage deletion of %s object(s), deleting inline: %s", len(keys), exc)
+        failed = delete_storage_keys_sync(keys)
+        if failed:
+            logger.error("Failed to delete %s storage object(s): %s", len(failed), failed[:20])
+
+
+def _chunk_keys(keys: list[str], size: int) -> list[list[str]]:
+    return [keys[index:index + size] for index in range(0, len(keys), size)]
+
+
+async def delete_storage_keys(
+    keys: list[str],
+    *,
+    concurrency: int = DELETE_OBJECTS_CONCURRENCY,
+) -> list[str]:
+    """Delete ``keys`` with concurrent ``DeleteObjects`` calls; return failed keys."""
+    keys = list(dict.fromkeys(key for key in keys if key))
+    if not keys:
+        return []
+    s3_client = await get_async_s3_client()
+    slots = asyncio.Semaphore(max(1, int(concurrency)))
+
+    async def _delete_batch(batch: list[str]) -> list[str]:
+        async with slots:
+            try:
+                response = await s3_client.delete_objects(
+                    Bucket=settings.MINIO_BUCKET_NAME,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as exc:
+                logger.error("DeleteObjects failed for %s key(s): %s", len(batch), exc)
+                return batch
+        failed = []
+        for error in list((response or {}).get("Errors") or []):
+            if error.get("Code") == "NoSuchKey":
+                continue
+            logger.error(
+                "Failed to delete storage object %s: %s %s",
+                error.get("Key"),
+                error.get("Code"),
+                error.get("Message"),
+            )
+            failed.append(error.get("Key"))
+        return [key for key in failed if key]
+
+    results = await asyncio.gather(
+        *(_delete_batch(batch) for batch in _chunk_keys(keys, DELETE_OBJECTS_BATCH_SIZE))
+    )
+    return [key for failed in results for key in failed]
+
+
+def delete_storage_keys_sync(keys: list[str]) -> list[str]:
+    return async_to_sync(delete_storage_keys)(keys)
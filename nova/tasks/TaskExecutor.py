@@ -1,6 +1,5 @@
 # nova/tasks/TaskExecutor.py
 import asyncio
-import datetime as dt
 import logging
 import time
 from asgiref.sync import sync_to_async
@@ -150,8 +149,7 @@ class TaskExecutor:
             step = "Resuming after user input"
         else:
             step = "Initializing AI task"
-        self.task.progress_logs.append({"step": step, "timestamp": str(dt.datetime.now(dt.timezone.utc)),
-                                        "severity": "info"})
+        self.handler.state_buffer.add_progress(step)
         await sync_to_async(self.task.save, thread_sensitive=False)()
 
     async def _create_llm_agent(self):
@@ -217,8 +215,7 @@ class TaskExecutor:
             await self.trace_handler.mark_root_awaiting_input()
 
         # Mark task awaiting input
-        self.task.progress_logs.append({"step": f"Waiting for user input: {question[:120]}",
-                                        "timestamp": str(dt.datetime.now(dt.timezone.utc)), "severity": "info"})
+        self.handler.state_buffer.add_progress(f"Waiting for user input: {question[:120]}")
         self.task.status = TaskStatus.AWAITING_INPUT
         await sync_to_async(self.task.save, thread_sensitive=False)()
 
@@ -239,14 +236,19 @@ class TaskExecutor:
 
     async def _finalize_task(self):
         """Finalize the task as completed."""
-        self.task.progress_logs.append({"step": "Task completed successfully",
-                                        "timestamp": str(dt.datetime.now(dt.timezone.utc)), "severity": "success"})
+        self.handler.state_buffer.add_progress("Task completed successfully", severity="success")
+        # Write buffered stream state first so it cannot overwrite the final task state.
+        await self.handler.flush_state()
 
         self.task.status = TaskStatus.COMPLETED
         await sync_to_async(self.task.save, thread_sensitive=False)()
 
         await self.handler.on_task_complete(self.task.result, self.thread.id, self.thread.subject)
 
+    async def mark_canceled(self, reason: str = "Agent run canceled.") -> None:
+        """Record a run stopped from outside (e.g. by the agent worker) as failed."""
+        await self._handle_execution_error(RuntimeError(reason))
+
     async def _handle_execution_error(self, error):
         """Handle execution errors with proper categorization."""
         error_category = self._categorize_error(error)
@@ -259,10 +261,12 @@ class TaskExecutor:
         self.task.result = error_msg
 
         # Enhanced error logging
-        error_log = {"step": f"Execution failed: {str(error)}", "category": error_category.value,
-                     "timestamp": str(dt.datetime.now(dt.timezone.utc)), "severity": "error",
-                     "error_details": {"type": type(error).__name__, "message": str(error)}}
-        self.task.progress_logs.append(error_log)
+        self.handler.state_buffer.add_progress(
+            f"Execution failed: {str(error)}",
+            severity="error",
+            category=error_category.value,
+            error_details={"type": type(error).__name__, "message": str(error)},
+        )
         await sync_to_async(self.task.save, thread_sensitive=False)()
 
         try:
@@ -300,6 +304,7 @@ class TaskExecutor:
 
     async def _cleanup(self):
         """Ensure proper cleanup of resources."""
+        await self.handler.flush_state()
         if self.llm and hasattr(self.llm, "cleanup_runtime"):
             cleanup_start = time.perf_counter()
             try:
@@ -321,12 +326,7 @@ class TaskExecutor:
 
     async def _process_result(self, result):
         """Process the agent result and update related data."""
-        self.task.progress_logs.append({
-            "step": "Processing agent result",
-            "timestamp": str(dt.datetime.now(dt.timezone.utc)),
-            "severity": "info"
-        })
-        await sync_to_async(self.task.save, thread_sensitive=False)()
+        self.handler.state_buffer.add_progress("Processing agent result")
 
         # Save result
         self.task.result = result
@@ -3,11 +3,10 @@ import logging
 from uuid import UUID
 from time import monotonic
 from typing import Any, Dict, List, Optional
-from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.utils import timezone
 
-from nova.utils import markdown_to_html
+from nova.markdown_streaming import IncrementalMarkdownRenderer, join_stream_html
+from nova.tasks.task_state_buffer import TaskStateBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +32,23 @@ class TaskProgressHandler:
         self.push_notifications_enabled = push_notifications_enabled
         initial_stream = (initial_streamed_markdown or "")
         self.final_chunks = [initial_stream] if initial_stream else []
+        self._markdown_renderer = IncrementalMarkdownRenderer(initial_stream)
         self.current_tool = None
         self.tool_depth = 0
         self.token_count = 0
-        self._last_persist_count = 0
-        self._persist_interval = 50  # Persist every 50 tokens
+        # Progress lines and stream snapshots are written behind, in batches.
+        self.state_buffer = TaskStateBuffer(task_id)
         self._stream_flush_interval_seconds = 0.25
         self._last_stream_flush_at = monotonic()
         self._last_stream_html = None
         self._stream_has_pending_changes = False
+        # Completed blocks are sent once as deltas; a full snapshot is sent
+        # first, after a reset, and periodically so reconnected clients resync.
+        self._stream_snapshot_interval_seconds = 5.0
+        self._last_stream_snapshot_at = None
+        self._sent_stream_generation = None
+        self._sent_stable_count = 0
         self._runtime_touch_interval_seconds = 15.0
-        self._last_runtime_touch_at = None
         # Insert a markdown paragraph break when a new agent segment starts
         # after an explicit boundary (tool call, interruption/resume).
         self._needs_segment_break = False
@@ -60,6 +65,7 @@ class TaskProgressHandler:
         '''
         flushed_html = await self._flush_stream_chunk()
         await self._persist_stream_state(flushed_html)
+        await self.flush_state()
         if self.final_chunks:
             self._needs_segment_break = True
         await self.publish_update('user_prompt', {'interaction_id': interaction_id, 'question': question,
@@ -77,6 +83,7 @@ class TaskProgressHandler:
         '''
         Send a message to the client when the task is completed
         '''
+        await self.flush_state()
         await self.publish_update('task_complete', {'result': result, 'thread_id': thread_id,
                                                     'thread_subject': thread_subject})
         self._queue_push_notification(status="completed")
@@ -89,6 +96,7 @@ class TaskProgressHandler:
         if self.tool_depth == 0:
             flushed_html = await self._flush_stream_chunk()
         await self._persist_stream_state(flushed_html)
+        await self.flush_state()
         await self.publish_update('task_error', {'message': error_msg, 'category': error_category})
         self._queue_push_notification(status="failed")
 
@@ -101,34 +109,33 @@ class TaskProgressHandler:
 
     async def record_progress(self, message, *, severity: str = "info"):
         """
-        Persist a progress log entry and publish it to the client.
-        Prefer this helper for runtimes that do not manage progress_logs directly.
+        Queue a progress log entry for persistence and publish it to the client.
         """
-        from nova.models.Task import Task
+        self.state_buffer.add_progress(str(message), severity=severity)
+        await self.on_progress(message)
 
-        entry = {
-            "step": str(message),
-            "severity": str(severity or "info"),
-            "timestamp": timezone.now().isoformat(),
-        }
+    async def flush_state(self):
+        """Write the buffered progress entries and stream state now (checkpoint)."""
+        if not self.state_buffer.has_pending:
+            return
         try:
-            def _append_progress():
-                task = Task.objects.get(id=self.task_id)
-                logs = list(task.progress_logs or [])
-                logs.append(entry)
-                task.progress_logs = logs
-                task.save(update_fields=["progress_logs", "updated_at"])
-
-            await sync_to_async(_append_progress, thread_sensitive=True)()
+            await self.state_buffer.flush()
         except Exception as e:
-            logger.error(f"Error persisting progress log: {e}")
-        await self.on_progress(message)
+            logger.error(f"Error persisting task state: {e}")
+
+    async def on_chunk(self, chunk, *, stable_count=None, tail_html=None):
+        '''
+        Send the full rendered response to the client
+        '''
+        await self.publish_update('response_chunk', {'chunk': chunk, 'stable_count': stable_count,
+                                                     'tail_html': tail_html})
 
-    async def on_chunk(self, chunk):
+    async def on_chunk_delta(self, start, stable_html, stable_count, tail_html):
         '''
-        Send a message to the client when a chunk is generated
+        Send the blocks completed since `start` and the re-rendered open block
         '''
-        await self.publish_update('response_chunk', {'chunk': chunk})
+        await self.publish_update('response_delta', {'start': start, 'stable_html': stable_html,
+                                                     'stable_count': stable_count, 'tail_html': tail_html})
 
     async def on_context_consumption(self, real, approx, max):
         '''
@@ -198,7 +205,7 @@ class TaskProgressHandler:
             if self._needs_segment_break:
                 self._append_segment_break_before_token(token)
                 self._needs_segment_break = False
-            self.final_chunks.append(token)
+            self._append_markdown(token)
             self._stream_has_pending_changes = True
             current_html = None
             now = monotonic()
@@ -215,11 +222,10 @@ class TaskProgressHandler:
 
             # Persist periodically for recovery
             self.token_count += 1
-            if self.token_count - self._last_persist_count >= self._persist_interval:
+            if self.state_buffer.is_due():
                 if current_html is None:
                     current_html = self._render_current_response()
                 await self._persist_stream_state(current_html)
-                self._last_persist_count = self.token_count
         else:
             # If a sub agent is generating a response,
             # send it as a progress update every 100 tokens
@@ -237,25 +243,51 @@ class TaskProgressHandler:
         """Replace the current streamed response with a full markdown payload."""
         normalized = str(markdown or "")
         self.final_chunks = [normalized] if normalized else []
+        self._markdown_renderer.reset(normalized)
         self._needs_segment_break = False
         self._stream_has_pending_changes = True
         self._last_stream_html = None
         current_html = await self._flush_stream_chunk()
         await self._persist_stream_state(current_html)
 
+    def _append_markdown(self, text: str) -> None:
+        self.final_chunks.append(text)
+        self._markdown_renderer.feed(text)
+
     def _render_current_response(self):
-        return markdown_to_html(''.join(self.final_chunks))
+        return self._markdown_renderer.render()
 
     async def _flush_stream_chunk(self):
         if not self.final_chunks or not self._stream_has_pending_changes:
             return self._last_stream_html
 
-        clean_html = self._render_current_response()
+        renderer = self._markdown_renderer
+        renderer.update()
+        tail_html = renderer.render_tail()
+        clean_html = join_stream_html(renderer.stable_html, tail_html)
+        stable_count = len(renderer.stable_blocks)
+        now = monotonic()
         if clean_html != self._last_stream_html:
-            await self.on_chunk(clean_html)
+            needs_snapshot = (
+                self._sent_stream_generation != renderer.generation
+                or self._last_stream_snapshot_at is None
+                or (now - self._last_stream_snapshot_at) >= self._stream_snapshot_interval_seconds
+            )
+            if needs_snapshot:
+                await self.on_chunk(clean_html, stable_count=stable_count, tail_html=tail_html)
+                self._sent_stream_generation = renderer.generation
+                self._last_stream_snapshot_at = now
+            else:
+                await self.on_chunk_delta(
+                    self._sent_stable_count,
+                    "\n".join(renderer.stable_blocks[self._sent_stable_count:]),
+                    stable_count,
+                    tail_html,
+                )
+            self._sent_stable_count = stable_count
             self._last_stream_html = clean_html
 
-        self._last_stream_flush_at = monotonic()
+        self._last_stream_flush_at = now
         self._stream_has_pending_changes = False
         return clean_html
 
@@ -317,43 +349,31 @@ class TaskProgressHandler:
             logger.error(f"Error in on_chat_model_start: {e}")
 
     async def _persist_stream_state(self, html_content=None):
-        """Persist stream state to database for recovery and resume continuity."""
-        from nova.models.Task import Task
+        """Stage stream state for recovery and resume continuity.
+
+        It is written with the next flush of the state buffer, at most
+        `TASK_STATE_FLUSH_INTERVAL_SECONDS` later; checkpoints call `flush_state`.
+        """
         try:
             if html_content is None:
                 if self._last_stream_html is not None:
                     html_content = self._last_stream_html
                 elif self.final_chunks:
                     html_content = self._render_current_response()
-            streamed_markdown = self.get_streamed_markdown()
-            await sync_to_async(
-                Task.objects.filter(id=self.task_id).update,
-                thread_sensitive=False
-            )(
+            self.state_buffer.set_fields(
                 current_response=html_content,
-                streamed_markdown=streamed_markdown,
-                updated_at=timezone.now(),
+                streamed_markdown=self.get_streamed_markdown(),
             )
-            self._last_runtime_touch_at = monotonic()
+            await self.state_buffer.maybe_flush()
         except Exception as e:
             logger.error(f"Error persisting stream state: {e}")
 
     async def _touch_task_runtime(self, *, force: bool = False):
-        from nova.models.Task import Task
-
-        now = monotonic()
-        if (
-            not force
-            and self._last_runtime_touch_at is not None
-            and (now - self._last_runtime_touch_at) < self._runtime_touch_interval_seconds
-        ):
-            return
         try:
-            await sync_to_async(
-                Task.objects.filter(id=self.task_id).update,
-                thread_sensitive=False,
-            )(updated_at=timezone.now())
-            self._last_runtime_touch_at = now
+            if force:
+                await self.state_buffer.flush()
+            else:
+                await self.state_buffer.maybe_flush(heartbeat_interval=self._runtime_touch_interval_seconds)
         except Exception as e:
             logger.error(f"Error updating task runtime heartbeat: {e}")
 
@@ -370,9 +390,9 @@ class TaskProgressHandler:
         if current.endswith("\n\n"):
             return
         if current.endswith("\n"):
-            self.final_chunks.append("\n")
+            self._append_markdown("\n")
         else:
-            self.final_chunks.append("\n\n")
+            self._append_markdown("\n\n")
         self._stream_has_pending_changes = True
 
     def _queue_push_notification(self, *, status: str) -> None:
@@ -3,6 +3,8 @@ from . import memory_tasks  # noqa: F401
 from . import memory_rebuild_tasks  # noqa: F401
 from . import conversation_tasks  # noqa: F401
 from . import conversation_embedding_tasks  # noqa: F401
+from . import embedding_queue_tasks  # noqa: F401
 from . import transcript_index_tasks  # noqa: F401
 from . import notification_tasks  # noqa: F401
 from . import provider_validation_tasks  # noqa: F401
+from . import storage_tasks  # noqa: F401
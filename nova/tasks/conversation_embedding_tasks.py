@@ -5,6 +5,7 @@ import logging
 from asgiref.sync import async_to_sync
 from celery import shared_task
 from django.db import transaction
+from django.utils import timezone
 
 from nova.llm.embeddings import compute_embedding, get_embeddings_provider
 from nova.models.ConversationEmbedding import (
@@ -12,6 +13,7 @@ from nova.models.ConversationEmbedding import (
     DaySegmentEmbedding,
     TranscriptChunkEmbedding,
 )
+from nova.tasks.embedding_queue_tasks import schedule_embedding_drain
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +130,8 @@ def compute_transcript_chunk_embedding_task(self, embedding_id: int):
 
 @shared_task(bind=True, name="rebuild_user_conversation_embeddings")
 def rebuild_user_conversation_embeddings_task(self, user_id: int, batch_size: int = 500):
+    # `batch_size` is accepted for messages queued by older releases; pending
+    # rows are now embedded in batches by `drain_user_embeddings`.
     # Ensure rows exist for all current conversation summaries and transcript chunks.
     from nova.models.DaySegment import DaySegment
     from nova.models.TranscriptChunk import TranscriptChunk
@@ -147,40 +151,30 @@ def rebuild_user_conversation_embeddings_task(self, user_id: int, batch_size: in
         for ch in missing_chunks:
             TranscriptChunkEmbedding.objects.create(user_id=user_id, transcript_chunk=ch)
 
-    day_qs = DaySegmentEmbedding.objects.filter(user_id=user_id)
-    chunk_qs = TranscriptChunkEmbedding.objects.filter(user_id=user_id)
-
-    day_ids = list(day_qs.values_list("id", flat=True)[:batch_size])
-    chunk_ids = list(chunk_qs.values_list("id", flat=True)[:batch_size])
-
-    DaySegmentEmbedding.objects.filter(id__in=day_ids).update(
-        state=ConversationEmbeddingState.PENDING,
-        error=None,
-        vector=None,
-    )
-    TranscriptChunkEmbedding.objects.filter(id__in=chunk_ids).update(
-        state=ConversationEmbeddingState.PENDING,
-        error=None,
-        vector=None,
-    )
-
-    for emb_id in day_ids:
-        compute_day_segment_embedding_task.delay(emb_id)
-    for emb_id in chunk_ids:
-        compute_transcript_chunk_embedding_task.delay(emb_id)
-
-    if len(day_ids) == batch_size or len(chunk_ids) == batch_size:
-        rebuild_user_conversation_embeddings_task.delay(user_id, batch_size=batch_size)
+    with transaction.atomic():
+        queued_day = DaySegmentEmbedding.objects.filter(user_id=user_id).update(
+            state=ConversationEmbeddingState.PENDING,
+            error=None,
+            vector=None,
+            updated_at=timezone.now(),
+        )
+        queued_chunk = TranscriptChunkEmbedding.objects.filter(user_id=user_id).update(
+            state=ConversationEmbeddingState.PENDING,
+            error=None,
+            vector=None,
+            updated_at=timezone.now(),
+        )
+        schedule_embedding_drain(user_id)
 
     logger.info(
         "[rebuild_user_conversation_embeddings] user=%s queued_day=%s queued_chunk=%s",
         user_id,
-        len(day_ids),
-        len(chunk_ids),
+        queued_day,
+        queued_chunk,
     )
     return {
         "status": "ok",
         "user_id": user_id,
-        "queued_day": len(day_ids),
-        "queued_chunk": len(chunk_ids),
+        "queued_day": queued_day,
+        "queued_chunk": queued_chunk,
     }
@@ -18,12 +18,15 @@ from nova.models.DaySegment import DaySegment
 from nova.models.Message import Actor, Message
 from nova.models.UserObjects import UserProfile
 from nova.runtime.provider_client import ProviderClient
-from nova.tasks.conversation_embedding_tasks import compute_day_segment_embedding_task
+from nova.tasks.embedding_queue_tasks import schedule_embedding_drain
 from nova.tasks.notification_tasks import send_task_webpush_notification
 from nova.utils import strip_thinking_blocks
 
 logger = logging.getLogger(__name__)
 
+# Max threads of one user summarized at once by the nightly per-user task.
+NIGHTLY_SUMMARY_CONCURRENCY = 4
+
 User = get_user_model()
 
 
@@ -268,6 +271,10 @@ async def _summarize_day_segment_async(day_segment_id: int, mode: str, task_id:
 
     transcript = _format_messages_for_summary(messages)
     if not transcript.strip():
+        await sync_to_async(
+            lambda: DaySegment.objects.filter(id=segment.id).update(summary_dirty=False),
+            thread_sensitive=True,
+        )()
         await _publish_task_update(
             task_id,
             "continuous_summary_ready",
@@ -314,7 +321,9 @@ async def _summarize_day_segment_async(day_segment_id: int, mode: str, task_id:
             seg = DaySegment.objects.select_for_update().get(id=segment.id)
             seg.summary_markdown = summary_md
             seg.summary_until_message_id = messages[-1].id if messages else None
-            seg.save(update_fields=["summary_markdown", "summary_until_message", "updated_at"])
+            # Messages that landed while the summary was generated keep the segment dirty.
+            seg.summary_dirty = _daysegment_needs_nightly_refresh(seg)
+            seg.save(update_fields=["summary_markdown", "summary_until_message", "summary_dirty", "updated_at"])
 
             emb, _ = DaySegmentEmbedding.objects.get_or_create(
                 user=seg.user,
@@ -324,13 +333,7 @@ async def _summarize_day_segment_async(day_segment_id: int, mode: str, task_id:
             emb.error = None
             emb.vector = None
             emb.save(update_fields=["state", "error", "vector", "updated_at"])
-            try:
-                compute_day_segment_embedding_task.delay(emb.id)
-            except Exception:
-                logger.exception(
-                    "[summarize_day_segment] failed to enqueue summary embedding day_segment_id=%s",
-                    seg.id,
-                )
+            schedule_embedding_drain(seg.user_id)
             return seg.day_label.isoformat(), seg.updated_at.isoformat() if seg.updated_at else None, seg.thread_id
 
     day_label_iso, updated_at_iso, thread_id = await sync_to_async(_persist, thread_sensitive=True)()
@@ -458,13 +461,34 @@ def _daysegment_needs_nightly_refresh(seg: DaySegment) -> bool:
     return qs.exists()
 
 
+def _dirty_past_daysegments(*, today, user_id: int | None = None):
+    """Past DaySegments flagged dirty, oldest first (served by a partial index)."""
+
+    qs = DaySegment.objects.select_related("starts_at_message", "thread", "user").filter(
+        summary_dirty=True,
+        day_label__lt=today,
+    )
+    if user_id is not None:
+        qs = qs.filter(user_id=user_id)
+    return qs.order_by("day_label", "id")
+
+
+def _claim_dirty_daysegment(seg: DaySegment) -> bool:
+    """Return True if a dirty segment really needs a summary; clear its flag otherwise."""
+
+    if _daysegment_needs_nightly_refresh(seg):
+        return True
+    DaySegment.objects.filter(id=seg.id).update(summary_dirty=False)
+    return False
+
+
 @shared_task(bind=True, name="continuous_nightly_daysegment_summaries")
 def nightly_summarize_continuous_daysegments_task(self):
     """Nightly maintenance task (celery-beat).
 
     Runs at 02:00 UTC daily.
 
-    For all DaySegments with day_label < today (UTC):
+    For DaySegments with day_label < today (UTC) flagged `summary_dirty`:
     - generate a summary if missing
     - or regenerate if new messages exist after `summary_until_message`
     """
@@ -473,17 +497,10 @@ def nightly_summarize_continuous_daysegments_task(self):
 
     today = timezone.now().date()
 
-    # Prefetch starts_at_message to avoid N+1 on created_at.
-    segs = (
-        DaySegment.objects.select_related("starts_at_message", "thread", "user")
-        .filter(day_label__lt=today)
-        .order_by("day_label", "id")
-    )
-
     queued = 0
-    for seg in segs:
+    for seg in _dirty_past_daysegments(today=today):
         try:
-            if _daysegment_needs_nightly_refresh(seg):
+            if _claim_dirty_daysegment(seg):
                 summarize_day_segment_task.delay(seg.id, mode="nightly")
                 queued += 1
         except Exception:
@@ -493,6 +510,27 @@ def nightly_summarize_continuous_daysegments_task(self):
     return {"status": "ok", "queued": queued}
 
 
+async def _summarize_user_daysegments_async(segments_by_thread: dict[int, list[int]]) -> int:
+    """Summarize dirty segments, threads concurrently and each thread in day order."""
+
+    semaphore = asyncio.Semaphore(NIGHTLY_SUMMARY_CONCURRENCY)
+
+    async def _run_thread(segment_ids: list[int]) -> int:
+        updated = 0
+        async with semaphore:
+            # Chronological order keeps the carry-over (previous summaries) up to date.
+            for segment_id in segment_ids:
+                try:
+                    await _summarize_day_segment_async(day_segment_id=segment_id, mode="nightly")
+                    updated += 1
+                except Exception:
+                    logger.exception("[nightly_summarize_for_user] failed day_segment_id=%s", segment_id)
+        return updated
+
+    results = await asyncio.gather(*(_run_thread(ids) for ids in segments_by_thread.values()))
+    return sum(results)
+
+
 @shared_task(bind=True, name="continuous_nightly_daysegment_summaries_for_user")
 def nightly_summarize_continuous_daysegments_for_user_task(self, user_id: int):
     """Nightly maintenance task, scoped to a single user.
@@ -503,26 +541,19 @@ def nightly_summarize_continuous_daysegments_for_user_task(self, user_id: int):
     from django.utils import timezone
 
     today = timezone.now().date()
-    segs = (
-        DaySegment.objects.select_related("starts_at_message", "thread", "user")
-        .filter(user_id=user_id, day_label__lt=today)
-        .order_by("day_label", "id")
-    )
 
-    # IMPORTANT:
-    # We must process in chronological order and *execute* each summarization before the next,
-    # so that carry-over (yesterday summary) is up-to-date.
     processed = 0
-    updated = 0
-    for seg in segs:
+    segments_by_thread: dict[int, list[int]] = {}
+    for seg in _dirty_past_daysegments(today=today, user_id=user_id):
         processed += 1
         try:
-            if _daysegment_needs_nightly_refresh(seg):
-                asyncio.run(_summarize_day_segment_async(day_segment_id=seg.id, mode="nightly"))
-                updated += 1
+            if _claim_dirty_daysegment(seg):
+                segments_by_thread.setdefault(seg.thread_id, []).append(seg.id)
         except Exception:
             logger.exception("[nightly_summarize_for_user] failed day_segment_id=%s", seg.id)
 
+    updated = asyncio.run(_summarize_user_daysegments_async(segments_by_thread)) if segments_by_thread else 0
+
     logger.info(
         "[nightly_summarize_for_user] user_id=%s processed=%s updated=%s",
         user_id,
@@ -0,0 +1,262 @@
+# nova/tasks/embedding_queue_tasks.py
+
+"""Coalesced embedding work queue.
+
+Memory chunk, day segment and transcript chunk embeddings are queued simply by
+being in the ``pending`` state. Producers request a drain once per write
+instead of enqueuing one task per row; a single ``drain_user_embeddings`` task
+per user then reads pending rows in batches, embeds each batch with one
+``compute_embeddings_batch`` call outside any transaction and bulk-updates the
+vectors of the rows that were not re-queued in the meantime.
+
+The coalescing key and the per-user run lease live in the shared cache, so web
+and worker processes see the same drain state. The lease is what keeps two
+drains of a user from embedding the same rows: rows are not locked or marked
+while they are embedded. If a lease still expires under a running drain, the
+other drain only repeats work, because write-back skips rows changed since
+they were read.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+from asgiref.sync import async_to_sync
+from celery import shared_task
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from nova.llm.embeddings import EmbeddingsProvider, compute_embeddings_batch, get_embeddings_provider
+from nova.models.ConversationEmbedding import (
+    ConversationEmbeddingState,
+    DaySegmentEmbedding,
+    TranscriptChunkEmbedding,
+)
+from nova.models.MemoryChunkEmbedding import MemoryChunkEmbedding
+from nova.models.memory_common import MemoryChunkEmbeddingState, MemoryRecordStatus
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DRAIN_BATCH_SIZE = 64
+EMBEDDING_DRAIN_MAX_BATCHES_PER_RUN = 20
+# A queued drain for a user absorbs further requests until it starts running.
+EMBEDDING_DRAIN_PENDING_TIMEOUT = 120
+# Lease of a running drain, renewed after every batch; it expires if its worker dies.
+EMBEDDING_DRAIN_RUN_TIMEOUT = 900
+# Delay before a drain retries while another drain of the same user runs.
+EMBEDDING_DRAIN_BUSY_COUNTDOWN = 30
+
+
+@dataclass(frozen=True)
+class _EmbeddingKind:
+    name: str
+    pending: Callable[[int], QuerySet]
+    text: Callable[[object], str]
+    empty_error: str
+    pending_state: str
+    ready_state: str
+    error_state: str
+
+
+_EMBEDDING_KINDS = (
+    _EmbeddingKind(
+        name="memory_chunk",
+        pending=lambda user_id: MemoryChunkEmbedding.objects.filter(
+            chunk__document__user_id=user_id,
+            chunk__document__status=MemoryRecordStatus.ACTIVE,
+            chunk__status=MemoryRecordStatus.ACTIVE,
+            state=MemoryChunkEmbeddingState.PENDING,
+        ).select_related("chunk"),
+        text=lambda row: (row.chunk.content_text or "").strip(),
+        empty_error="empty_content",
+        pending_state=MemoryChunkEmbeddingState.PENDING,
+        ready_state=MemoryChunkEmbeddingState.READY,
+        error_state=MemoryChunkEmbeddingState.ERROR,
+    ),
+    _EmbeddingKind(
+        name="day_segment",
+        pending=lambda user_id: DaySegmentEmbedding.objects.filter(
+            user_id=user_id,
+            state=ConversationEmbeddingState.PENDING,
+        ).select_related("day_segment"),
+        text=lambda row: (row.day_segment.summary_markdown or "").strip(),
+        empty_error="empty_summary",
+        pending_state=ConversationEmbeddingState.PENDING,
+        ready_state=ConversationEmbeddingState.READY,
+        error_state=ConversationEmbeddingState.ERROR,
+    ),
+    _EmbeddingKind(
+        name="transcript_chunk",
+        pending=lambda user_id: TranscriptChunkEmbedding.objects.filter(
+            user_id=user_id,
+            state=ConversationEmbeddingState.PENDING,
+        ).select_related("transcript_chunk"),
+        text=lambda row: (row.transcript_chunk.content_text or "").strip(),
+        empty_error="empty_content",
+        pending_state=ConversationEmbeddingState.PENDING,
+        ready_state=ConversationEmbeddingState.READY,
+        error_state=ConversationEmbeddingState.ERROR,
+    ),
+)
+
+
+def _drain_pending_key(user_id: int) -> str:
+    return f"nova:embedding_drain_pending:{user_id}"
+
+
+def _drain_running_key(user_id: int) -> str:
+    return f"nova:embedding_drain_running:{user_id}"
+
+
+def enqueue_embedding_drain(user_id: int) -> bool:
+    """Queue a drain of the user's pending embeddings now.
+
+    Returns False if the task could not be queued. Requests made while a drain
+    is already queued for the user are coalesced into it.
+    """
+
+    key = _drain_pending_key(user_id)
+    if not cache.add(key, 1, timeout=EMBEDDING_DRAIN_PENDING_TIMEOUT):
+        return True
+    try:
+        drain_user_embeddings_task.delay(user_id)
+    except Exception:
+        cache.delete(key)
+        logger.warning("[embedding_queue] failed to enqueue drain user=%s", user_id, exc_info=True)
+        return False
+    return True
+
+
+def schedule_embedding_drain(user_id: int) -> None:
+    """Queue a drain once the current transaction commits."""
+
+    transaction.on_commit(lambda: enqueue_embedding_drain(user_id))
+
+
+def _drain_batch(
+    kind: _EmbeddingKind,
+    *,
+    user_id: int,
+    provider: EmbeddingsProvider,
+    batch_size: int,
+    mark_errors: bool,
+) -> int:
+    """Embed one batch of pending rows; return the number of rows claimed.
+
+    The caller holds the user's drain lease, so rows are read without a lock
+    and no transaction is open across the embeddings call. Only rows still
+    pending with the `updated_at` seen at claim time are written; rows
+    re-queued meanwhile stay pending for the next batch.
+    """
+
+    rows = list(kind.pending(user_id).order_by("id")[:batch_size])
+    if not rows:
+        return 0
+
+    texts = [kind.text(row) for row in rows]
+    embeddable = [(row, text) for row, text in zip(rows, texts) if text]
+    claimed_at = {row.id: row.updated_at for row in rows}
+
+    now = timezone.now()
+    for row, text in zip(rows, texts):
+        if not text:
+            row.state = kind.error_state
+            row.error = kind.empty_error
+            row.updated_at = now
+
+    try:
+        vectors = async_to_sync(compute_embeddings_batch)(
+            [text for _row, text in embeddable],
+            provider_override=provider,
+            user_id=user_id,
+        )
+    except Exception as exc:
+        if not mark_errors:
+            raise
+        logger.exception("[embedding_queue] %s batch failed user=%s", kind.name, user_id)
+        for row, _text in embeddable:
+            row.state = kind.error_state
+            row.error = str(exc)
+            row.updated_at = now
+    else:
+        for (row, _text), vector in zip(embeddable, vectors or []):
+            row.provider_type = provider.provider_type
+            row.model = provider.model
+            row.dimensions = len(vector)
+            row.vector = vector
+            row.state = kind.ready_state
+            row.error = None
+            row.updated_at = now
+
+    model = type(rows[0])
+    with transaction.atomic():
+        unchanged = {
+            row_id
+            for row_id, updated_at in model.objects.select_for_update()
+            .filter(id__in=claimed_at, state=kind.pending_state)
+            .values_list("id", "updated_at")
+            if updated_at == claimed_at[row_id]
+        }
+        model.objects.bulk_update(
+            [row for row in rows if row.id in unchanged],
+            ["provider_type", "model", "dimensions", "vector", "state", "error", "updated_at"],
+        )
+    return len(rows)
+
+
+@shared_task(bind=True, name="drain_user_embeddings", max_retries=3)
+def drain_user_embeddings_task(self, user_id: int, batch_size: int = EMBEDDING_DRAIN_BATCH_SIZE):
+    """Embed a user's pending memory and conversation rows in batches."""
+
+    running_key = _drain_running_key(user_id)
+    if not cache.add(running_key, 1, timeout=EMBEDDING_DRAIN_RUN_TIMEOUT):
+        # Another drain of this user is embedding; run again once it is done.
+        drain_user_embeddings_task.apply_async((user_id, batch_size), countdown=EMBEDDING_DRAIN_BUSY_COUNTDOWN)
+        return {"status": "busy", "user_id": user_id}
+    try:
+        # Requests arriving from now on must queue a new drain.
+        cache.delete(_drain_pending_key(user_id))
+        result = _drain_user_embeddings(self, user_id, batch_size)
+    finally:
+        cache.delete(running_key)
+
+    if result.get("batches", 0) >= EMBEDDING_DRAIN_MAX_BATCHES_PER_RUN:
+        # Yield the worker between long drains; the next run picks up the rest.
+        enqueue_embedding_drain(user_id)
+    return result
+
+
+def _drain_user_embeddings(task, user_id: int, batch_size: int) -> dict:
+    provider = get_embeddings_provider(user_id=user_id)
+    if not provider:
+        logger.info("[drain_user_embeddings] embeddings disabled; skipping user=%s", user_id)
+        return {"status": "disabled", "user_id": user_id}
+
+    mark_errors = task.request.retries >= task.max_retries
+    claimed: dict[str, int] = {}
+    batches = 0
+    try:
+        for kind in _EMBEDDING_KINDS:
+            while batches < EMBEDDING_DRAIN_MAX_BATCHES_PER_RUN:
+                count = _drain_batch(
+                    kind,
+                    user_id=user_id,
+                    provider=provider,
+                    batch_size=batch_size,
+                    mark_errors=mark_errors,
+                )
+                if not count:
+                    break
+                batches += 1
+                claimed[kind.name] = claimed.get(kind.name, 0) + count
+                cache.touch(_drain_running_key(user_id), EMBEDDING_DRAIN_RUN_TIMEOUT)
+    except Exception as exc:
+        logger.warning("[drain_user_embeddings] failed user=%s; retrying", user_id, exc_info=True)
+        raise task.retry(countdown=60, exc=exc)
+
+    logger.info("[drain_user_embeddings] user=%s batches=%s claimed=%s", user_id, batches, claimed)
+    return {"status": "ok", "user_id": user_id, "batches": batches, "claimed": claimed}
@@ -5,6 +5,7 @@ import json
 import logging
 import re
 import threading
+from collections import Counter
 from copy import deepcopy
 from typing import Any
 from uuid import UUID, uuid4
@@ -162,7 +163,19 @@ def _coerce_vfs_paths(value: Any) -> list[str]:
         return _sanitize_string(value)
 
 
+def _node_event_data(node: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in node.items() if key != "children"}
+
+
 class TaskExecutionTraceHandler:
+    """Record the execution trace of a task.
+
+    Nodes are indexed by id in memory. Every change appends the changed nodes
+    to the `TaskTraceEvent` log instead of rewriting the whole trace; the log
+    is folded into `Task.execution_trace` when the root run completes, fails or
+    waits for input. Use `load_execution_trace` to read a trace.
+    """
+
     def __init__(
         self,
         task,
@@ -180,16 +193,15 @@ class TaskExecutionTraceHandler:
             if str(name or "").strip()
         }
         if shared_state is None:
-            existing_trace = (
-                deepcopy(getattr(task, "execution_trace", {}))
-                if isinstance(getattr(task, "execution_trace", {}), dict)
-                else {}
-            )
-            trace = existing_trace if existing_trace.get("version") else self._build_default_trace()
+            # The trace is loaded on first use, from sync code.
             shared_state = {
-                "trace": trace,
+                "trace": None,
                 "lock": threading.RLock(),
                 "run_nodes": {},
+                "nodes": {},
+                "type_counts": Counter(),
+                "output_paths": {},
+                "parents": {},
             }
         self._state = shared_state
 
@@ -216,6 +228,11 @@ class TaskExecutionTraceHandler:
             if str(name or "").strip()
         )
 
+    def get_trace(self) -> dict[str, Any]:
+        """Return the current trace, loading it and its pending events on first use."""
+        with self._state["lock"]:
+            return self._get_trace()
+
     def _build_default_trace(self) -> dict[str, Any]:
         root_started_at = _utc_now_iso()
         return {
@@ -253,23 +270,78 @@ class TaskExecutionTraceHandler:
 
     def _get_trace(self) -> dict[str, Any]:
         trace = self._state.get("trace")
-        if not isinstance(trace, dict) or not trace.get("version"):
+        if trace is None:
+            trace = self._load_trace()
+        elif not isinstance(trace, dict) or not trace.get("version"):
+            trace = self._set_trace(self._build_default_trace())
+        return trace
+
+    def _set_trace(self, trace: dict[str, Any]) -> dict[str, Any]:
+        self._state["trace"] = trace
+        self._state["nodes"] = {}
+        self._state["type_counts"] = Counter()
+        self._state["output_paths"] = {}
+        self._state["parents"] = {}
+        pending = [(trace.get("root") or {}, None)]
+        while pending:
+            node, parent_id = pending.pop()
+            self._index_node(node, parent_id)
+            pending.extend((child, node.get("id")) for child in reversed(node.get("children") or []))
+        return trace
+
+    def _load_trace(self) -> dict[str, Any]:
+        existing_trace = getattr(self.task, "execution_trace", {})
+        trace = deepcopy(existing_trace) if isinstance(existing_trace, dict) else {}
+        if not trace.get("version"):
             trace = self._build_default_trace()
-            self._state["trace"] = trace
+        self._set_trace(trace)
+        if self.task_id:
+            try:
+                from nova.models.Task import TaskTraceEvent
+
+                for event in TaskTraceEvent.objects.filter(task_id=self.task_id).order_by("id").iterator():
+                    self._apply_event(event.kind, event.node_id, event.parent_id, event.data)
+            except Exception:
+                logger.exception("Could not load execution trace events for task %s", self.task_id)
+        trace["summary"] = self._build_summary()
+        setattr(self.task, "execution_trace", trace)
         return trace
 
-    def _find_node(self, node_id: str | None, current: dict[str, Any] | None = None) -> dict[str, Any] | None:
+    def _apply_event(self, kind: str, node_id: str, parent_id: str, data: Any) -> None:
+        if not isinstance(data, dict):
+            return
+        trace = self._state["trace"]
+        if kind == "summary":
+            trace["summary"] = {**(trace.get("summary") or {}), **data}
+            return
+        node = self._state["nodes"].get(node_id)
+        if node is None:
+            node = {**data, "id": node_id, "children": []}
+            self._append_child(parent_id or None, node)
+        else:
+            node.update({key: value for key, value in data.items() if key not in {"id", "children"}})
+            self._index_node(node, None)
+
+    def _index_node(self, node: dict[str, Any], parent_id: str | None) -> None:
+        node_id = node.get("id")
+        if not node_id:
+            return
+        if node_id not in self._state["nodes"]:
+            self._state["type_counts"][str(node.get("type") or "").strip()] += 1
+        self._state["nodes"][node_id] = node
+        if parent_id is not None:
+            self._state["parents"][node_id] = parent_id
+        paths = self._collect_output_paths(node.get("meta"))
+        if paths:
+            self._state["output_paths"][node_id] = paths
+        else:
+            self._state["output_paths"].pop(node_id, None)
+
+    def _find_node(self, node_id: str | None) -> dict[str, Any] | None:
         if not node_id:
             return None
-        trace = self._get_trace()
-        root = current or trace.get("root") or {}
-        if root.get("id") == node_id:
-            return root
-        for child in root.get("children", []) or []:
-            found = self._find_node(node_id, current=child)
-            if found is not None:
-                return found
-        return None
+        self._get_trace()
+        return self._state["nodes"].get(node_id)
 
     def _new_node(
         self,
@@ -299,13 +371,11 @@ class TaskExecutionTraceHandler:
 
     def _append_child(self, parent_node_id: str | None, node: dict[str, Any]) -> None:
         trace = self._get_trace()
-        if parent_node_id:
-            parent_node = self._find_node(parent_node_id)
-        else:
-            parent_node = trace.get("root")
+        parent_node = self._find_node(parent_node_id) if parent_node_id else None
         if parent_node is None:
             parent_node = trace.get("root")
         parent_node.setdefault("children", []).append(node)
+        self._index_node(node, parent_node.get("id"))
 
     def _complete_node(
         self,
@@ -333,40 +403,18 @@ class TaskExecutionTraceHandler:
         return sorted(dict.fromkeys(paths))
 
     def _find_latest_interaction_node(self) -> dict[str, Any] | None:
+        self._get_trace()
         latest: dict[str, Any] | None = None
-        for node in self._iter_nodes():
-            if str(node.get("type") or "").strip() != "interaction":
-                continue
-            latest = node
+        for node in self._state["nodes"].values():
+            if str(node.get("type") or "").strip() == "interaction":
+                latest = node
         return latest
 
-    def _iter_nodes(self, node: dict[str, Any] | None = None):
-        trace = self._get_trace()
-        current = node or trace.get("root") or {}
-        yield current
-        for child in current.get("children", []) or []:
-            yield from self._iter_nodes(child)
-
     def _build_summary(self) -> dict[str, Any]:
         trace = self._get_trace()
         root = trace.get("root") or {}
-        tool_calls = 0
-        subagent_calls = 0
-        interaction_count = 0
-        error_count = 0
-        output_paths: list[str] = []
-
-        for node in self._iter_nodes(root):
-            node_type = str(node.get("type") or "").strip()
-            if node_type == "tool":
-                tool_calls += 1
-            elif node_type == "subagent":
-                subagent_calls += 1
-            elif node_type == "interaction":
-                interaction_count += 1
-            elif node_type == "error":
-                error_count += 1
-            output_paths.extend(self._collect_output_paths(node.get("meta")))
+        type_counts = self._state["type_counts"]
+        output_paths = [path for paths in self._state["output_paths"].values() for path in paths]
 
         root_meta = dict(root.get("meta") or {})
         unique_output_paths = sorted(dict.fromkeys(path for path in output_paths if path))
@@ -374,10 +422,10 @@ class TaskExecutionTraceHandler:
         return {
             "has_trace": bool(root.get("id")),
             "status": str(root.get("status") or "").strip() or "unknown",
-            "tool_calls": tool_calls,
-            "subagent_calls": subagent_calls,
-            "interaction_count": interaction_count,
-            "error_count": error_count,
+            "tool_calls": type_counts["tool"],
+            "subagent_calls": type_counts["subagent"],
+            "interaction_count": type_counts["interaction"],
+            "error_count": type_counts["error"],
             "duration_ms": root.get("duration_ms"),
             "started_at": root.get("started_at"),
             "finished_at": root.get("finished_at"),
@@ -392,18 +440,60 @@ class TaskExecutionTraceHandler:
     async def _run_serialized(self, fn, /, *args, **kwargs):
         return await sync_to_async(fn, thread_sensitive=True)(*args, **kwargs)
 
-    def _persist_locked(self) -> None:
+    def _persist_locked(self, *nodes: dict[str, Any], summary: dict[str, Any] | None = None) -> None:
+        """Append the changed nodes (or summary fields) to the event log."""
+        trace = self._get_trace()
+        for node in nodes:
+            self._index_node(node, None)
+        if summary:
+            trace["summary"] = {**(trace.get("summary") or {}), **summary}
+        self._refresh_summary_locked()
+        if not self.task_id:
+            return
+        try:
+            from nova.models.Task import TaskTraceEvent
+
+            events = [
+                TaskTraceEvent(
+                    task_id=self.task_id,
+                    kind=TaskTraceEvent.KIND_NODE,
+                    node_id=node["id"],
+                    parent_id=str(self._state["parents"].get(node["id"]) or ""),
+                    data=_node_event_data(node),
+                )
+                for node in nodes
+            ]
+            if summary:
+                events.append(
+                    TaskTraceEvent(task_id=self.task_id, kind=TaskTraceEvent.KIND_SUMMARY, data=summary)
+                )
+            TaskTraceEvent.objects.bulk_create(events)
+        except Exception:
+            logger.exception("Could not persist execution trace for task %s", self.task_id)
+
+    def _refresh_summary_locked(self) -> dict[str, Any]:
         trace = self._get_trace()
         trace["summary"] = self._build_summary()
         setattr(self.task, "execution_trace", trace)
+        return trace
+
+    def _compact_locked(self, *nodes: dict[str, Any]) -> None:
+        """Fold the event log into `Task.execution_trace`."""
+        for node in nodes:
+            self._index_node(node, None)
+        trace = self._refresh_summary_locked()
         if not self.task_id:
             return
         try:
-            from nova.models.Task import Task
+            from django.db import transaction
 
-            Task.objects.filter(id=self.task_id).update(execution_trace=trace)
+            from nova.models.Task import Task, TaskTraceEvent
+
+            with transaction.atomic():
+                Task.objects.filter(id=self.task_id).update(execution_trace=trace)
+                TaskTraceEvent.objects.filter(task_id=self.task_id).delete()
         except Exception:
-            logger.exception("Could not persist execution trace for task %s", self.task_id)
+            logger.exception("Could not compact execution trace for task %s", self.task_id)
 
     def _ensure_root_run_sync(
         self,
@@ -417,7 +507,7 @@ class TaskExecutionTraceHandler:
             trace = self._get_trace()
             root = trace.get("root") or {}
             if not root:
-                trace.update(self._build_default_trace())
+                trace = self._set_trace(self._build_default_trace())
                 root = trace["root"]
             root["label"] = sanitize_preview(label) or root.get("label") or "Agent run"
             root["status"] = "running"
@@ -433,7 +523,7 @@ class TaskExecutionTraceHandler:
             if resumed:
                 meta["resumed"] = True
             root["meta"] = _sanitize_meta(meta)
-            self._persist_locked()
+            self._persist_locked(root)
 
     async def ensure_root_run(
         self,
@@ -459,15 +549,12 @@ class TaskExecutionTraceHandler:
         max_context: int | None,
     ) -> None:
         with self._state["lock"]:
-            trace = self._get_trace()
-            summary = dict(trace.get("summary") or {})
-            summary["context"] = {
+            context = {
                 "real_tokens": real_tokens,
                 "approx_tokens": approx_tokens,
                 "max_context": max_context,
             }
-            trace["summary"] = summary
-            self._persist_locked()
+            self._persist_locked(summary={"context": context})
 
     async def set_context_consumption(
         self,
@@ -489,7 +576,7 @@ class TaskExecutionTraceHandler:
         with self._state["lock"]:
             root = (self._get_trace().get("root") or {})
             root["meta"] = _merge_meta(root.get("meta"), meta)
-            self._persist_locked()
+            self._persist_locked(root)
 
     async def update_root_meta(self, meta: dict[str, Any] | None = None) -> None:
         await self._run_serialized(self._update_root_meta_sync, meta)
@@ -498,7 +585,7 @@ class TaskExecutionTraceHandler:
         with self._state["lock"]:
             root = (self._get_trace().get("root") or {})
             self._complete_node(root, status="completed", output_preview=output_preview)
-            self._persist_locked()
+            self._compact_locked(root)
 
     async def complete_root_run(self, output_preview: Any = None) -> None:
         await self._run_serialized(self._complete_root_run_sync, output_preview)
@@ -509,7 +596,7 @@ class TaskExecutionTraceHandler:
             root["status"] = "awaiting_input"
             root["finished_at"] = None
             root["duration_ms"] = None
-            self._persist_locked()
+            self._compact_locked(root)
 
     async def mark_root_awaiting_input(self) -> None:
         await self._run_serialized(self._mark_root_awaiting_input_sync)
@@ -532,7 +619,7 @@ class TaskExecutionTraceHandler:
             )
             self._complete_node(error_node, status="failed", output_preview=error)
             self._append_child(None, error_node)
-            self._persist_locked()
+            self._compact_locked(root, error_node)
 
     async def fail_root_run(self, error: Any, *, category: str | None = None) -> None:
         await self._run_serialized(self._fail_root_run_sync, error, category=category)
@@ -559,7 +646,7 @@ class TaskExecutionTraceHandler:
             )
             self._complete_node(node, status="awaiting_input", output_preview="")
             self._append_child(None, node)
-            self._persist_locked()
+            self._persist_locked(node)
             return node["id"]
 
     async def record_interaction(
@@ -602,7 +689,7 @@ class TaskExecutionTraceHandler:
                 output_preview=preview,
                 meta={"interaction_status": normalized_status},
             )
-            self._persist_locked()
+            self._persist_locked(node)
 
     async def resolve_latest_interaction(
         self,
@@ -631,7 +718,7 @@ class TaskExecutionTraceHandler:
                 meta=meta,
             )
             self._append_child(self.parent_node_id, node)
-            self._persist_locked()
+            self._persist_locked(node)
             return node["id"]
 
     async def start_subagent(
@@ -663,7 +750,7 @@ class TaskExecutionTraceHandler:
                 meta=meta,
             )
             self._append_child(self.parent_node_id, node)
-            self._persist_locked()
+            self._persist_locked(node)
             return node["id"]
 
     async def start_model_call(
@@ -697,7 +784,7 @@ class TaskExecutionTraceHandler:
                 output_preview=output_preview,
                 meta=meta,
             )
-            self._persist_locked()
+            self._persist_locked(node)
 
     async def complete_model_call(
         self,
@@ -734,7 +821,7 @@ class TaskExecutionTraceHandler:
             )
             self._complete_node(error_node, status="failed", output_preview=error, meta=meta)
             self._append_child(node_id, error_node)
-            self._persist_locked()
+            self._persist_locked(node, error_node)
 
     async def fail_model_call(
         self,
@@ -767,7 +854,7 @@ class TaskExecutionTraceHandler:
                 output_preview=output_preview,
                 meta=meta,
             )
-            self._persist_locked()
+            self._persist_locked(node)
 
     async def complete_subagent(
         self,
@@ -804,7 +891,7 @@ class TaskExecutionTraceHandler:
             )
             self._complete_node(error_node, status="failed", output_preview=error, meta=meta)
             self._append_child(node_id, error_node)
-            self._persist_locked()
+            self._persist_locked(node, error_node)
 
     async def fail_subagent(
         self,
@@ -856,7 +943,7 @@ class TaskExecutionTraceHandler:
             )
             self._state["run_nodes"][str(run_id)] = node["id"]
             self._append_child(self.parent_node_id, node)
-            self._persist_locked()
+            self._persist_locked(node)
         return None
 
     async def on_tool_start(
@@ -907,7 +994,9 @@ class TaskExecutionTraceHandler:
                 )
                 self._complete_node(error_node, status="failed", output_preview=output, meta=metadata)
                 self._append_child(node_id, error_node)
-            self._persist_locked()
+                self._persist_locked(node, error_node)
+            else:
+                self._persist_locked(node)
         return None
 
     async def on_tool_end(
@@ -951,7 +1040,7 @@ class TaskExecutionTraceHandler:
             )
             self._complete_node(error_node, status="failed", output_preview=error_text, meta=metadata)
             self._append_child(node_id, error_node)
-            self._persist_locked()
+            self._persist_locked(node, error_node)
         return None
 
     async def on_tool_error(
@@ -969,3 +1058,13 @@ class TaskExecutionTraceHandler:
             run_id=run_id,
             metadata=metadata,
         )
+
+
+def load_execution_trace(task) -> dict[str, Any]:
+    """Return the trace of `task`, with the events not yet compacted applied."""
+    from nova.models.Task import TaskTraceEvent
+
+    trace = task.execution_trace if isinstance(task.execution_trace, dict) else {}
+    if not TaskTraceEvent.objects.filter(task_id=task.id).exists():
+        return trace
+    return TaskExecutionTraceHandler(task).get_trace()
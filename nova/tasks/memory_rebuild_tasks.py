@@ -2,18 +2,23 @@ import logging
 
 from celery import shared_task
 from django.db import transaction
+from django.utils import timezone
 
 from nova.models.MemoryChunk import MemoryChunk
 from nova.models.MemoryChunkEmbedding import MemoryChunkEmbedding
 from nova.models.memory_common import MemoryChunkEmbeddingState, MemoryRecordStatus
-from nova.tasks.memory_tasks import compute_memory_chunk_embedding_task
+from nova.tasks.embedding_queue_tasks import schedule_embedding_drain
 
 logger = logging.getLogger(__name__)
 
 
 @shared_task(bind=True, name="rebuild_user_memory_embeddings")
 def rebuild_user_memory_embeddings_task(self, user_id: int, batch_size: int = 500):
-    """Mark all of a user's memory chunk embeddings as pending and enqueue recomputation."""
+    """Mark all of a user's memory chunk embeddings as pending and enqueue recomputation.
+
+    `batch_size` is accepted for messages queued by older releases; pending
+    rows are now embedded in batches by `drain_user_embeddings`.
+    """
 
     active_chunks = MemoryChunk.objects.filter(
         document__user_id=user_id,
@@ -39,24 +44,17 @@ def rebuild_user_memory_embeddings_task(self, user_id: int, batch_size: int = 50
     )
 
     with transaction.atomic():
-        qs.update(
+        queued = qs.update(
             state=MemoryChunkEmbeddingState.PENDING,
             error=None,
             vector=None,
+            updated_at=timezone.now(),
         )
-
-    chunk_ids = list(qs.values_list("chunk_id", flat=True)[:batch_size])
-    for chunk_id in chunk_ids:
-        compute_memory_chunk_embedding_task.delay(chunk_id)
-
-    remaining = qs.count() - len(chunk_ids)
-    if remaining > 0:
-        rebuild_user_memory_embeddings_task.delay(user_id, batch_size=batch_size)
+        schedule_embedding_drain(user_id)
 
     logger.info(
-        "[rebuild_user_memory_embeddings] user=%s created=%s queued=%s remaining=%s",
+        "[rebuild_user_memory_embeddings] user=%s created=%s queued=%s",
         user_id,
         chunks_without_embeddings.count(),
-        len(chunk_ids),
-        max(remaining, 0),
+        queued,
     )
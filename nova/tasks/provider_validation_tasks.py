@@ -10,6 +10,7 @@ from celery import shared_task
 from nova.llm.provider_validation import validate_provider_configuration
 from nova.models.Provider import LLMProvider
 from nova.providers import resolve_provider_capability_snapshot
+from nova.providers.validation import cache_validation_result
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,7 @@ def validate_provider_configuration_task(self, provider_pk: int, expected_finger
     try:
         declared_snapshot = _resolve_declared_metadata_snapshot(provider)
         result = async_to_sync(validate_provider_configuration)(provider)
+        cache_validation_result(provider, result, declared_snapshot=declared_snapshot)
     except Exception as exc:
         logger.exception("Provider validation task %s failed for provider %s.", task_id, provider_pk)
         declared_snapshot = {}
@@ -4,7 +4,7 @@ import logging
 from django.conf import settings
 from django.utils import timezone
 
-from nova.models.Task import Task, TaskStatus
+from nova.models.Task import Task, TaskProgressEntry, TaskStatus
 
 logger = logging.getLogger(__name__)
 
@@ -51,29 +51,25 @@ def reconcile_stale_running_tasks(*, thread=None, user=None, now=None) -> list[i
             thread=thread,
             user=user,
             now=reference_time,
-        ).only("id", "progress_logs", "status", "result")
+        ).only("id", "status", "result")
     )
     reconciled_ids: list[int] = []
-    timestamp = str(reference_time.astimezone(dt.timezone.utc))
 
     for task in stale_tasks:
-        progress_logs = list(task.progress_logs or [])
-        progress_logs.append(
-            {
-                "step": "Task marked as failed after its runtime heartbeat expired",
-                "category": "system_error",
-                "timestamp": timestamp,
-                "severity": "error",
-                "error_details": {
-                    "type": "OrphanedTask",
-                    "message": ORPHANED_TASK_RESULT,
-                },
-            }
+        TaskProgressEntry.objects.create(
+            task=task,
+            step="Task marked as failed after its runtime heartbeat expired",
+            category="system_error",
+            severity="error",
+            error_details={
+                "type": "OrphanedTask",
+                "message": ORPHANED_TASK_RESULT,
+            },
+            created_at=reference_time,
         )
         task.status = TaskStatus.FAILED
         task.result = ORPHANED_TASK_RESULT
-        task.progress_logs = progress_logs
-        task.save(update_fields=["status", "result", "progress_logs", "updated_at"])
+        task.save(update_fields=["status", "result", "updated_at"])
         reconciled_ids.append(task.id)
 
     if reconciled_ids:
@@ -0,0 +1,29 @@
+import logging
+
+from celery import shared_task
+
+from nova.storage_deletion import delete_storage_keys_sync
+
+logger = logging.getLogger(__name__)
+
+STORAGE_DELETION_MAX_RETRIES = 5
+
+
+@shared_task(bind=True, name="delete_storage_objects", max_retries=STORAGE_DELETION_MAX_RETRIES)
+def delete_storage_objects_task(self, keys: list[str]):
+    failed = delete_storage_keys_sync(list(keys or []))
+    if not failed:
+        return {"deleted": len(keys or []), "failed": 0}
+
+    if self.request.retries >= STORAGE_DELETION_MAX_RETRIES:
+        logger.error(
+            "[delete_storage_objects] giving up on %s storage object(s) after %s retries: %s",
+            len(failed),
+            self.request.retries,
+            failed[:20],
+        )
+        return {"deleted": len(keys) - len(failed), "failed": len(failed)}
+
+    # Retry only the keys that could not be deleted.
+    countdown = 60 * (2 ** self.request.retries)
+    raise self.retry(args=[failed], countdown=countdown)
@@ -0,0 +1,104 @@
+"""Write-behind persistence of a running task's progress and stream state.
+
+Progress lines and stream snapshots are kept in memory and written together:
+one `bulk_create` of the new `TaskProgressEntry` rows and one UPDATE of the
+changed `Task` columns. A write happens at most every
+`TASK_STATE_FLUSH_INTERVAL_SECONDS`, or right away when the caller reaches a
+checkpoint (interruption, error, end of the run).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from nova.models.Task import Task, TaskProgressEntry
+
+
+class TaskStateBuffer:
+    def __init__(self, task_id, *, flush_interval: float | None = None):
+        self.task_id = task_id
+        self.flush_interval = float(
+            settings.TASK_STATE_FLUSH_INTERVAL_SECONDS if flush_interval is None else flush_interval
+        )
+        self._entries: list[TaskProgressEntry] = []
+        self._fields: dict[str, Any] = {}
+        self._last_flush_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._entries or self._fields)
+
+    def add_progress(
+        self,
+        step: str,
+        *,
+        severity: str = "info",
+        category: str = "",
+        error_details: dict | None = None,
+    ) -> TaskProgressEntry:
+        entry = TaskProgressEntry(
+            task_id=self.task_id,
+            step=str(step),
+            severity=str(severity or "info"),
+            category=str(category or ""),
+            error_details=error_details,
+            created_at=timezone.now(),
+        )
+        self._entries.append(entry)
+        return entry
+
+    def set_fields(self, **fields: Any) -> None:
+        """Stage new values for `Task` columns; only the latest one is written."""
+        self._fields.update(fields)
+
+    def seconds_since_flush(self) -> float | None:
+        if self._last_flush_at is None:
+            return None
+        return monotonic() - self._last_flush_at
+
+    def is_due(self) -> bool:
+        elapsed = self.seconds_since_flush()
+        return elapsed is None or elapsed >= self.flush_interval
+
+    async def maybe_flush(self, *, heartbeat_interval: float | None = None) -> bool:
+        """Flush pending state when the interval elapsed.
+
+        With `heartbeat_interval`, also write `updated_at` alone when nothing
+        was written for that long, so the task does not look stale.
+        """
+        elapsed = self.seconds_since_flush()
+        due = elapsed is None or (self.has_pending and elapsed >= self.flush_interval)
+        if not due and heartbeat_interval is not None:
+            due = elapsed >= heartbeat_interval
+        if not due:
+            return False
+        await self.flush()
+        return True
+
+    async def flush(self) -> None:
+        async with self._lock:
+            entries, self._entries = self._entries, []
+            fields, self._fields = self._fields, {}
+            try:
+                await sync_to_async(self._write, thread_sensitive=False)(entries, fields)
+            except Exception:
+                # Keep the state so the next flush retries it, without
+                # overwriting values staged in the meantime.
+                self._entries[:0] = entries
+                self._fields = {**fields, **self._fields}
+                raise
+            self._last_flush_at = monotonic()
+
+    def _write(self, entries: list[TaskProgressEntry], fields: dict[str, Any]) -> None:
+        with transaction.atomic():
+            if entries:
+                TaskProgressEntry.objects.bulk_create(entries)
+            Task.objects.filter(id=self.task_id).update(**fields, updated_at=timezone.now())
@@ -1,6 +1,5 @@
 # nova/tasks/tasks.py
 import asyncio
-import datetime as dt
 import logging
 import time
 from asgiref.sync import sync_to_async, async_to_sync
@@ -8,6 +7,7 @@ from celery import current_app
 from celery import shared_task
 from channels.layers import get_channel_layer
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.utils import timezone
 
@@ -15,7 +15,7 @@ from nova.models.AgentConfig import AgentConfig
 from nova.models.Interaction import Interaction
 from nova.models.Message import Message
 from nova.models.Message import Actor
-from nova.models.Task import Task, TaskStatus
+from nova.models.Task import Task, TaskProgressEntry, TaskStatus
 from nova.models.TaskDefinition import TaskDefinition
 from nova.models.Thread import Thread
 from nova.file_utils import download_file_content
@@ -31,6 +31,7 @@ from nova.tasks.task_definition_runner import (
 )
 from nova.thread_titles import is_default_thread_subject, normalize_generated_thread_title
 from nova.utils import strip_thinking_blocks, markdown_to_html
+from nova.runtime.agent_worker import JOB_KIND_RESUME, JOB_KIND_RUN, enqueue_agent_run
 from nova.runtime.provider_client import ProviderClient
 from nova.runtime.task_executor import (
     ReactTerminalSummarizationTaskExecutor,
@@ -180,14 +181,8 @@ def create_and_dispatch_agent_task(
         thread=thread,
         agent_config=agent_config,
         status=TaskStatus.PENDING,
-        progress_logs=[
-            {
-                "step": "Task queued for dispatch",
-                "timestamp": str(dt.datetime.now(dt.timezone.utc)),
-                "severity": "info",
-            }
-        ],
     )
+    TaskProgressEntry.objects.create(task=task, step="Task queued for dispatch")
 
     dispatcher_task.delay(
         task.id,
@@ -265,32 +260,77 @@ def generate_thread_title_task(
         raise
 
 
+def build_run_executor(task_pk, user_pk, thread_pk, agent_pk, message_pk) -> ReactTerminalTaskExecutor:
+    """Load the runtime objects of a queued run and build its executor."""
+    # Optimized database queries with select_related
+    task = Task.objects.select_related('user', 'thread').get(pk=task_pk)
+    user = User.objects.get(pk=user_pk)
+    thread = Thread.objects.select_related('user').get(pk=thread_pk)
+
+    agent_config = None
+    if agent_pk:
+        agent_config = AgentConfig.objects.select_related('llm_provider').get(pk=agent_pk)
+
+    message = Message.objects.select_related('thread', 'user').get(pk=message_pk)
+    prompt_text = message.text or ""
+
+    return ReactTerminalTaskExecutor(
+        task,
+        user,
+        thread,
+        agent_config,
+        prompt_text,
+        source_message_id=message.id,
+        push_notifications_enabled=True,
+    )
+
+
+def build_resume_executor(interaction_pk: int) -> tuple[ReactTerminalTaskExecutor, dict]:
+    """Load an answered interaction and build the executor resuming its task."""
+    interaction = Interaction.objects.select_related(
+        'task',
+        'task__user',
+        'thread',
+        'agent_config',
+        'agent_config__llm_provider',
+    ).get(pk=interaction_pk)
+    task = interaction.task
+    thread = interaction.thread
+    user = task.user
+    agent_config = interaction.agent_config
+
+    # Build the interruption_response
+    interruption_response = {
+        'action': "user_response",
+        'user_response': interaction.answer,
+        'interaction_id': interaction.id,
+        'interaction_status': interaction.status,
+        'resume_context': dict(getattr(interaction, "resume_context", {}) or {}),
+    }
+
+    executor = ReactTerminalTaskExecutor(task, user, thread, agent_config, interaction)
+    return executor, interruption_response
+
+
 @shared_task(bind=True, name="run_ai_task")
 def run_ai_task_celery(self, task_pk, user_pk, thread_pk, agent_pk, message_pk):
     """
     Optimized Celery task with batched database queries and the Nova executor.
-    """
-    try:
-        # Optimized database queries with select_related
-        task = Task.objects.select_related('user', 'thread').get(pk=task_pk)
-        user = User.objects.get(pk=user_pk)
-        thread = Thread.objects.select_related('user').get(pk=thread_pk)
-
-        agent_config = None
-        if agent_pk:
-            agent_config = AgentConfig.objects.select_related('llm_provider').get(pk=agent_pk)
 
-        message = Message.objects.select_related('thread', 'user').get(pk=message_pk)
-        prompt_text = message.text or ""
-
-        execute_agent_task_with_executor(
-            task,
-            user,
-            thread,
-            agent_config,
-            prompt_text,
-            source_message_id=message.id,
+    With `AGENT_WORKER_ENABLED`, the run is forwarded to the asyncio agent worker.
+    """
+    if settings.AGENT_WORKER_ENABLED:
+        enqueue_agent_run(
+            JOB_KIND_RUN,
+            task_id=task_pk,
+            user_id=user_pk,
+            args=[task_pk, user_pk, thread_pk, agent_pk, message_pk],
         )
+        return {"status": "forwarded", "task_id": task_pk}
+
+    try:
+        executor = build_run_executor(task_pk, user_pk, thread_pk, agent_pk, message_pk)
+        asyncio.run(executor.execute_or_resume())
 
     except (
         Task.DoesNotExist,
@@ -316,30 +356,23 @@ def resume_ai_task_celery(self, interaction_pk: int):
     """
     Resume an agent execution after user input.
     Uses the same thread and streams via the same WS group (task_id).
+
+    With `AGENT_WORKER_ENABLED`, the resume is forwarded to the asyncio agent worker.
     """
+    if settings.AGENT_WORKER_ENABLED:
+        owner = Interaction.objects.filter(pk=interaction_pk).values_list("task_id", "task__user_id").first()
+        if owner is None:
+            logger.warning(
+                "Skipping resume_ai_task for interaction %s because it no longer exists.",
+                interaction_pk,
+            )
+            return {"status": "skipped", "reason": "missing_interaction"}
+        task_id, user_id = owner
+        enqueue_agent_run(JOB_KIND_RESUME, task_id=task_id, user_id=user_id, args=[interaction_pk])
+        return {"status": "forwarded", "task_id": task_id}
+
     try:
-        interaction = Interaction.objects.select_related(
-            'task',
-            'task__user',
-            'thread',
-            'agent_config',
-            'agent_config__llm_provider',
-        ).get(pk=interaction_pk)
-        task = interaction.task
-        thread = interaction.thread
-        user = task.user
-        agent_config = interaction.agent_config
-
-        # Build the interruption_response
-        interruption_response = {
-            'action': "user_response",
-            'user_response': interaction.answer,
-            'interaction_id': interaction.id,
-            'interaction_status': interaction.status,
-            'resume_context': dict(getattr(interaction, "resume_context", {}) or {}),
-        }
-
-        executor = ReactTerminalTaskExecutor(task, user, thread, agent_config, interaction)
+        executor, interruption_response = build_resume_executor(interaction_pk)
         asyncio.run(executor.execute_or_resume(interruption_response))
 
     except Interaction.DoesNotExist:
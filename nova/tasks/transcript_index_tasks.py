@@ -9,19 +9,23 @@ can query `TranscriptChunk` instead of raw Message rows.
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import Iterator, List
 
 from celery import shared_task
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
-from nova.models.ConversationEmbedding import TranscriptChunkEmbedding
+from nova.models.ConversationEmbedding import ConversationEmbeddingState, TranscriptChunkEmbedding
 from nova.models.DaySegment import DaySegment
 from nova.models.Message import Actor, Message
 from nova.models.TranscriptChunk import TranscriptChunk
-from nova.tasks.conversation_embedding_tasks import compute_transcript_chunk_embedding_task
+from nova.tasks.embedding_queue_tasks import schedule_embedding_drain
 
 logger = logging.getLogger(__name__)
 
+TRANSCRIPT_INDEX_PAGE_SIZE = 500
+
 
 def _normalize_message_text(m: Message) -> str:
     # Ignore system messages in chunks.
@@ -42,51 +46,31 @@ def _estimate_tokens(text: str) -> int:
     return len(text) // 4 + 1
 
 
-def _index_transcript_append(day_segment_id: int) -> dict:
-    """Append-only transcript chunk creation.
-
-    IMPORTANT: this task runs in a normal Celery worker process.
-    Django ORM is synchronous, so keep this function synchronous to avoid
-    `SynchronousOnlyOperation`.
-    """
+def _iter_messages_from(*, user_id: int, thread_id: int, start: Message) -> Iterator[Message]:
+    """Yield thread messages from `start` (inclusive) in keyset-paginated pages."""
 
-    seg = (
-        DaySegment.objects.select_related("thread", "user", "starts_at_message")
-        .filter(id=day_segment_id)
-        .first()
+    qs = Message.objects.filter(user_id=user_id, thread_id=thread_id).only("id", "actor", "text", "created_at")
+    page = list(
+        qs.filter(Q(created_at__gt=start.created_at) | Q(created_at=start.created_at, id__gte=start.id))
+        .order_by("created_at", "id")[:TRANSCRIPT_INDEX_PAGE_SIZE]
     )
-    if not seg:
-        return {"status": "not_found", "day_segment_id": day_segment_id}
+    while page:
+        yield from page
+        last = page[-1]
+        page = list(
+            qs.filter(Q(created_at__gt=last.created_at) | Q(created_at=last.created_at, id__gt=last.id))
+            .order_by("created_at", "id")[:TRANSCRIPT_INDEX_PAGE_SIZE]
+        )
 
-    # Find last indexed end message within this day segment.
-    last_chunk = (
-        TranscriptChunk.objects.filter(user=seg.user, thread=seg.thread, day_segment=seg)
-        .order_by("-end_message__created_at", "-end_message_id")
-        .select_related("end_message")
-        .first()
-    )
-    from_dt = seg.starts_at_message.created_at
-    if last_chunk:
-        from_dt = last_chunk.end_message.created_at
-
-    # Collect new messages for this day (best effort):
-    # - created_at >= from_dt
-    # - same thread/user
-    msgs = list(
-        Message.objects.filter(
-            user=seg.user,
-            thread=seg.thread,
-            created_at__gte=from_dt,
-        ).order_by("created_at", "id")
-    )
-    if not msgs:
-        return {"status": "ok", "day_segment_id": day_segment_id, "created": 0}
 
-    # Build chunks ~600 tokens with ~100 token overlap.
+def _build_chunk_specs(msgs: List[Message]) -> List[dict]:
+    """Split messages into ~600-token chunks with ~100 tokens of overlap."""
+
     target_tokens = 600
     overlap_tokens = 100
 
-    created = 0
+    lines = [_normalize_message_text(m) for m in msgs]
+    specs: List[dict] = []
     i = 0
     while i < len(msgs):
         start_idx = i
@@ -96,8 +80,8 @@ def _index_transcript_append(day_segment_id: int) -> dict:
         end_msg = None
 
         while i < len(msgs) and tok < target_tokens:
+            line = lines[i]
             m = msgs[i]
-            line = _normalize_message_text(m)
             i += 1
             if not line:
                 continue
@@ -111,73 +95,119 @@ def _index_transcript_append(day_segment_id: int) -> dict:
             break
 
         content_text = "\n".join(buf_lines)
-        content_hash = TranscriptChunk.compute_hash(content_text, start_msg.id, end_msg.id)
-
-        with transaction.atomic():
-            obj, was_created = TranscriptChunk.objects.get_or_create(
-                user=seg.user,
-                thread=seg.thread,
-                day_segment=seg,
-                start_message=start_msg,
-                end_message=end_msg,
-                defaults={
-                    "content_text": content_text,
-                    "content_hash": content_hash,
-                    "token_estimate": tok,
-                },
-            )
-            if not was_created:
-                # Best-effort update if content hash differs.
-                if obj.content_hash != content_hash:
-                    obj.content_text = content_text
-                    obj.content_hash = content_hash
-                    obj.token_estimate = tok
-                    obj.save(update_fields=["content_text", "content_hash", "token_estimate", "updated_at"])
-                    emb, _ = TranscriptChunkEmbedding.objects.get_or_create(
-                        user=seg.user,
-                        transcript_chunk=obj,
-                    )
-                    emb.state = "pending"
-                    emb.error = None
-                    emb.vector = None
-                    emb.save(update_fields=["state", "error", "vector", "updated_at"])
-                    try:
-                        compute_transcript_chunk_embedding_task.delay(emb.id)
-                    except Exception:
-                        logger.exception(
-                            "[index_transcript_append] failed to enqueue embedding chunk_id=%s",
-                            obj.id,
-                        )
-            else:
-                created += 1
-                emb, _ = TranscriptChunkEmbedding.objects.get_or_create(
-                    user=seg.user,
-                    transcript_chunk=obj,
-                )
-                emb.state = "pending"
-                emb.error = None
-                emb.vector = None
-                emb.save(update_fields=["state", "error", "vector", "updated_at"])
-                try:
-                    compute_transcript_chunk_embedding_task.delay(emb.id)
-                except Exception:
-                    logger.exception(
-                        "[index_transcript_append] failed to enqueue embedding chunk_id=%s",
-                        obj.id,
-                    )
+        specs.append(
+            {
+                "start_message_id": start_msg.id,
+                "end_message_id": end_msg.id,
+                "content_text": content_text,
+                "content_hash": TranscriptChunk.compute_hash(content_text, start_msg.id, end_msg.id),
+                "token_estimate": tok,
+            }
+        )
 
         # Apply overlap: rewind index by some messages until we have overlap_tokens.
         if overlap_tokens > 0 and i < len(msgs):
             back_tok = 0
             j = i - 1
             while j > start_idx and back_tok < overlap_tokens:
-                line = _normalize_message_text(msgs[j])
-                if line:
-                    back_tok += _estimate_tokens(line)
+                if lines[j]:
+                    back_tok += _estimate_tokens(lines[j])
                 j -= 1
             i = max(j + 1, start_idx + 1)
 
-    return {"status": "ok", "day_segment_id": day_segment_id, "created": created}
+    return specs
+
+
+def _index_transcript_append(day_segment_id: int) -> dict:
+    """Append-only transcript chunk creation.
+
+    New messages are read by keyset cursor, chunked in memory and written in a
+    single transaction with bulk inserts; changed chunks get their embeddings
+    reset and one embedding drain is scheduled for the whole batch.
+
+    IMPORTANT: this task runs in a normal Celery worker process.
+    Django ORM is synchronous, so keep this function synchronous to avoid
+    `SynchronousOnlyOperation`.
+    """
+
+    seg = (
+        DaySegment.objects.select_related("thread", "user", "starts_at_message")
+        .filter(id=day_segment_id)
+        .first()
+    )
+    if not seg:
+        return {"status": "not_found", "day_segment_id": day_segment_id}
+
+    # Resume from the start of the last indexed chunk within this day segment:
+    # re-chunking from there reproduces its start, so unchanged transcripts are
+    # a no-op and a short tail chunk grows in place into the appended messages.
+    last_chunk = (
+        TranscriptChunk.objects.filter(user=seg.user, thread=seg.thread, day_segment=seg)
+        .order_by("-end_message__created_at", "-end_message_id")
+        .select_related("start_message")
+        .first()
+    )
+    start = last_chunk.start_message if last_chunk else seg.starts_at_message
+
+    msgs = list(_iter_messages_from(user_id=seg.user_id, thread_id=seg.thread_id, start=start))
+    specs = _build_chunk_specs(msgs)
+    if not specs:
+        return {"status": "ok", "day_segment_id": day_segment_id, "created": 0}
+
+    def _existing_by_start() -> dict:
+        return {
+            chunk.start_message_id: chunk
+            for chunk in TranscriptChunk.objects.filter(
+                user=seg.user,
+                thread=seg.thread,
+                start_message_id__in={spec["start_message_id"] for spec in specs},
+            ).only("id", "start_message_id", "end_message_id", "content_hash")
+        }
+
+    with transaction.atomic():
+        existing = _existing_by_start()
+        new_chunks = []
+        changed_ids = []
+        for spec in specs:
+            chunk = existing.get(spec["start_message_id"])
+            if chunk is None:
+                new_chunks.append(TranscriptChunk(user=seg.user, thread=seg.thread, day_segment=seg, **spec))
+            elif chunk.content_hash != spec["content_hash"]:
+                # The hash covers both bounds: a grown tail chunk or edited content.
+                TranscriptChunk.objects.filter(id=chunk.id).update(
+                    end_message_id=spec["end_message_id"],
+                    content_text=spec["content_text"],
+                    content_hash=spec["content_hash"],
+                    token_estimate=spec["token_estimate"],
+                    updated_at=timezone.now(),
+                )
+                changed_ids.append(chunk.id)
+
+        created_ids = []
+        if new_chunks:
+            TranscriptChunk.objects.bulk_create(new_chunks, ignore_conflicts=True)
+            created_ids = [
+                chunk.id
+                for start_message_id, chunk in _existing_by_start().items()
+                if start_message_id not in existing
+            ]
+
+        pending_ids = [*created_ids, *changed_ids]
+        if pending_ids:
+            TranscriptChunkEmbedding.objects.bulk_create(
+                [TranscriptChunkEmbedding(user=seg.user, transcript_chunk_id=chunk_id) for chunk_id in pending_ids],
+                ignore_conflicts=True,
+            )
+            TranscriptChunkEmbedding.objects.filter(transcript_chunk_id__in=pending_ids).update(
+                state=ConversationEmbeddingState.PENDING,
+                error=None,
+                vector=None,
+                updated_at=timezone.now(),
+            )
+            # One coalesced drain embeds every chunk marked pending above.
+            schedule_embedding_drain(seg.user_id)
+
+    return {"status": "ok", "day_segment_id": day_segment_id, "created": len(created_ids)}
 
 
 @shared_task(bind=True, name="index_transcript_append")
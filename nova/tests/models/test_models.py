@@ -553,8 +553,8 @@ class UserFileModelsTest(BaseTestCase):
         expected_key = f"users/{self.user.id}/threads/{self.thread.id}/.message_attachments/message_1/photo.png"
         self.assertEqual(user_file.key, expected_key)
 
-    @patch('boto3.client')
-    def test_user_file_message_delete_preserves_file_and_clears_source_message(self, mock_boto3_client):
+    @patch('nova.models.UserFile.get_s3_client')
+    def test_user_file_message_delete_preserves_file_and_clears_source_message(self, mock_get_s3_client):
         message = self.thread.add_message("Attachment source", actor=Actor.USER)
         user_file = UserFile.objects.create(
             user=self.user,
@@ -568,7 +568,7 @@ class UserFileModelsTest(BaseTestCase):
         )
 
         mock_s3_client = MagicMock()
-        mock_boto3_client.return_value = mock_s3_client
+        mock_get_s3_client.return_value = mock_s3_client
 
         message.delete()
 
@@ -594,10 +594,10 @@ class UserFileModelsTest(BaseTestCase):
         user_file.expiration_date = timezone.now() - timedelta(days=1)
         user_file.save()
 
-        # Mock boto3.client to avoid actual MinIO connection
-        with patch('boto3.client') as mock_boto3_client:
+        # Mock the shared S3 client to avoid actual MinIO connection
+        with patch('nova.models.UserFile.get_s3_client') as mock_get_s3_client:
             mock_s3_client = MagicMock()
-            mock_boto3_client.return_value = mock_s3_client
+            mock_get_s3_client.return_value = mock_s3_client
 
             # The method should check expiration and raise ValueError
             with self.assertRaises(ValueError) as context:
@@ -630,10 +630,10 @@ class UserFileModelsTest(BaseTestCase):
             size=100,
         )
 
-        # Mock boto3.client and its methods
-        with patch('boto3.client') as mock_boto3_client:
+        # Mock the shared S3 client and its methods
+        with patch('nova.models.UserFile.get_s3_client') as mock_get_s3_client:
             mock_s3_client = MagicMock()
-            mock_boto3_client.return_value = mock_s3_client
+            mock_get_s3_client.return_value = mock_s3_client
 
             # Mock the presigned URL generation
             mock_s3_client.generate_presigned_url.return_value = 'http://minio:9000/test-bucket/test-key?signature=mock'
@@ -643,15 +643,6 @@ class UserFileModelsTest(BaseTestCase):
             # Verify the URL was modified to use external base
             self.assertEqual(url, 'http://localhost:8080/test-bucket/test-key?signature=mock')
 
-            # Verify boto3.client was called with correct parameters
-            mock_boto3_client.assert_called_once_with(
-                's3',
-                endpoint_url='http://minio:9000',
-                aws_access_key_id='test-key',
-                aws_secret_access_key='test-secret',
-                config=mock_boto3_client.call_args[1]['config']  # Config object
-            )
-
             # Verify generate_presigned_url was called correctly
             mock_s3_client.generate_presigned_url.assert_called_once_with(
                 'get_object',
@@ -0,0 +1,273 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from nova.runtime.agent_worker import (
+    AGENT_RUN_CANCEL_KEY,
+    AGENT_RUN_QUEUE_KEY,
+    AGENT_WORKER_ALIVE_KEY,
+    JOB_KIND_RUN,
+    AgentRunJob,
+    AgentWorker,
+    _DatabaseThreadPoolExecutor,
+)
+from nova.tasks import tasks
+
+
+class _FakeAsyncRedis:
+    def __init__(self):
+        self.lists: dict[str, list[str]] = {}
+        self.values: dict[str, str] = {}
+
+    async def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def lrem(self, key, count, value):
+        items = self.lists.get(key, [])
+        if value in items:
+            items.remove(value)
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+        self.lists.pop(key, None)
+
+    async def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+
+    async def lmove(self, src, dest, wherefrom, whereto):
+        items = self.lists.get(src)
+        if not items:
+            return None
+        value = items.pop(-1 if wherefrom == "RIGHT" else 0)
+        target = self.lists.setdefault(dest, [])
+        target.insert(0 if whereto == "LEFT" else len(target), value)
+        return value
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        for key in list(self.lists):
+            if key.startswith(prefix):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def lrem(self, *args):
+        self._calls.append(self._redis.lrem(*args))
+
+    def rpush(self, *args):
+        self._calls.append(self._redis.rpush(*args))
+
+    async def execute(self):
+        return [await call for call in self._calls]
+
+
+def _fake_blmove(redis: _FakeAsyncRedis):
+    async def blmove(first, second, timeout, src="LEFT", dest="RIGHT"):
+        return await redis.lmove(first, second, src, dest)
+
+    return blmove
+
+
+def _job(task_id: int, user_id: int) -> AgentRunJob:
+    payload = {"kind": JOB_KIND_RUN, "task_id": task_id, "user_id": user_id, "args": [task_id]}
+    return AgentRunJob.from_raw(json.dumps(payload))
+
+
+class AgentWorkerTests(SimpleTestCase):
+    def _worker(self, **kwargs) -> AgentWorker:
+        kwargs.setdefault("drain_timeout", 0)
+        return AgentWorker(worker_id="test", redis_client=_FakeAsyncRedis(), **kwargs)
+
+    def test_starts_jobs_round_robin_within_user_and_global_limits(self):
+        async def scenario():
+            worker = self._worker(concurrency=3, per_user_limit=2)
+            release = asyncio.Event()
+            started: list[int] = []
+
+            async def fake_execute(job):
+                started.append(job.task_id)
+                await release.wait()
+
+            with patch.object(worker, "_execute", side_effect=fake_execute), \
+                    patch("nova.runtime.agent_worker.close_old_connections"):
+                for task_id in (1, 2, 3):
+                    worker.accept(_job(task_id, user_id=10))
+                worker.accept(_job(4, user_id=20))
+
+                worker.start_ready_jobs()
+                await asyncio.sleep(0)
+                first_wave = list(started)
+
+                release.set()
+                await asyncio.sleep(0.01)
+                worker.start_ready_jobs()
+                await asyncio.sleep(0.01)
+            return first_wave, started, worker.pending_count
+
+        first_wave, started, pending = asyncio.run(scenario())
+
+        # User 20 is served before user 10's second job; user 10 is capped at two runs.
+        self.assertEqual(first_wave, [1, 4, 2])
+        self.assertEqual(started, [1, 4, 2, 3])
+        self.assertEqual(pending, 0)
+
+    def test_cancel_flag_cancels_running_job_and_frees_its_slot(self):
+        async def scenario():
+            worker = self._worker(concurrency=1, per_user_limit=1)
+            cancelled = asyncio.Event()
+
+            async def fake_execute(job):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            with patch.object(worker, "_execute", side_effect=fake_execute), \
+                    patch("nova.runtime.agent_worker.close_old_connections"):
+                worker.accept(_job(1, user_id=10))
+                worker.accept(_job(2, user_id=10))
+                worker.start_ready_jobs()
+                await asyncio.sleep(0)
+
+                worker._redis.values[AGENT_RUN_CANCEL_KEY.format(task_id=1)] = "1"
+                await worker._check_cancellations()
+                await asyncio.sleep(0.01)
+                next_ids = [worker._running[run].task_id for run in worker.start_ready_jobs()]
+                worker.stop()
+                await worker._drain()
+            return cancelled.is_set(), next_ids, worker._redis.values
+
+        was_cancelled, next_ids, values = asyncio.run(scenario())
+
+        self.assertTrue(was_cancelled)
+        self.assertEqual(next_ids, [2])
+        self.assertEqual(values, {})
+
+    def test_drain_requeues_unstarted_jobs_and_cancels_after_timeout(self):
+        async def scenario():
+            worker = self._worker(concurrency=1, per_user_limit=1, drain_timeout=0.01)
+            redis = worker._redis
+            first, second = _job(1, user_id=10), _job(2, user_id=10)
+            redis.lists[worker.processing_key] = [first.raw, second.raw]
+
+            async def fake_execute(job):
+                await asyncio.sleep(10)
+
+            with patch.object(worker, "_execute", side_effect=fake_execute), \
+                    patch("nova.runtime.agent_worker.close_old_connections"):
+                worker.accept(first)
+                worker.accept(second)
+                worker.start_ready_jobs()
+                await asyncio.sleep(0)
+                await worker._drain()
+            return redis.lists, worker._running
+
+        lists, running = asyncio.run(scenario())
+
+        self.assertEqual(lists[AGENT_RUN_QUEUE_KEY], [_job(2, user_id=10).raw])
+        self.assertEqual(lists["nova:agent_worker:processing:test"], [])
+        self.assertEqual(running, {})
+
+    def test_pull_hands_back_jobs_of_users_at_their_limit(self):
+        async def scenario():
+            worker = self._worker(concurrency=2, per_user_limit=1)
+            redis = worker._redis
+            redis.lists[AGENT_RUN_QUEUE_KEY] = [_job(2, user_id=10).raw, _job(3, user_id=20).raw]
+
+            redis.blmove = _fake_blmove(redis)
+            worker.accept(_job(1, user_id=10))
+            results = [await worker._pull(), await worker._pull()]
+            return results, redis.lists, worker._pending
+
+        results, lists, pending = asyncio.run(scenario())
+
+        # User 10's second job goes back to the queue for another worker; user 20's job is held.
+        self.assertEqual(results, [True, True])
+        self.assertEqual(lists[AGENT_RUN_QUEUE_KEY], [_job(2, user_id=10).raw])
+        self.assertEqual(lists["nova:agent_worker:processing:test"], [_job(3, user_id=20).raw])
+        self.assertEqual([job.task_id for job in pending[20]], [3])
+
+    def test_pull_waits_once_the_same_job_comes_back(self):
+        async def scenario():
+            worker = self._worker(concurrency=2, per_user_limit=1)
+            redis = worker._redis
+            redis.lists[AGENT_RUN_QUEUE_KEY] = [_job(2, user_id=10).raw]
+
+            redis.blmove = _fake_blmove(redis)
+            worker.accept(_job(1, user_id=10))
+            return [await worker._pull(), await worker._pull()], redis.lists
+
+        results, lists = asyncio.run(scenario())
+
+        self.assertEqual(results, [True, False])
+        self.assertEqual(lists[AGENT_RUN_QUEUE_KEY], [_job(2, user_id=10).raw])
+
+    def test_startup_requeues_jobs_of_dead_workers_only(self):
+        async def scenario():
+            worker = self._worker()
+            redis = worker._redis
+            redis.lists["nova:agent_worker:processing:test"] = [_job(1, user_id=10).raw]
+            redis.lists["nova:agent_worker:processing:gone"] = [_job(2, user_id=10).raw]
+            redis.lists["nova:agent_worker:processing:busy"] = [_job(3, user_id=10).raw]
+            redis.values[AGENT_WORKER_ALIVE_KEY.format(worker_id="busy")] = "1"
+            await worker._requeue_orphans()
+            return redis.lists
+
+        lists = asyncio.run(scenario())
+
+        self.assertCountEqual(
+            lists[AGENT_RUN_QUEUE_KEY],
+            [_job(1, user_id=10).raw, _job(2, user_id=10).raw],
+        )
+        self.assertEqual(lists["nova:agent_worker:processing:busy"], [_job(3, user_id=10).raw])
+
+    def test_default_executor_recycles_stale_connections_before_each_call(self):
+        calls: list[str] = []
+        with patch(
+            "nova.runtime.agent_worker.close_old_connections",
+            side_effect=lambda: calls.append("close_old_connections"),
+        ), _DatabaseThreadPoolExecutor(max_workers=1) as executor:
+            for index in range(2):
+                self.assertEqual(executor.submit(lambda value: calls.append(value) or value, index).result(), index)
+
+        self.assertEqual(calls, ["close_old_connections", 0, "close_old_connections", 1])
+
+
+class AgentWorkerForwardingTests(SimpleTestCase):
+    @override_settings(AGENT_WORKER_ENABLED=True)
+    @patch("nova.tasks.tasks.build_run_executor")
+    @patch("nova.tasks.tasks.enqueue_agent_run")
+    def test_run_ai_task_forwards_to_agent_worker_when_enabled(self, mocked_enqueue, mocked_build):
+        result = tasks.run_ai_task_celery.run(1, 2, 3, 4, 5)
+
+        self.assertEqual(result, {"status": "forwarded", "task_id": 1})
+        mocked_enqueue.assert_called_once_with(JOB_KIND_RUN, task_id=1, user_id=2, args=[1, 2, 3, 4, 5])
+        mocked_build.assert_not_called()
@@ -0,0 +1,13 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class BackfillSearchVectorsCommandTests(TestCase):
+    def test_is_a_noop_outside_postgresql(self):
+        out = StringIO()
+
+        call_command("backfill_search_vectors", stdout=out)
+
+        self.assertIn("only used on PostgreSQL", out.getvalue())
@@ -1,7 +1,10 @@
 import datetime as dt
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from nova.continuous.context_builder import load_continuous_context
 from nova.models.DaySegment import DaySegment
@@ -20,6 +23,7 @@ class ContinuousContextBuilderTests(TestCase):
             password="testpass123",
         )
         self.thread = Thread.objects.create(user=self.user, subject="Continuous", mode=Thread.Mode.CONTINUOUS)
+        cache.clear()
 
     def _mk_msg(self, text: str):
         return Message.objects.create(user=self.user, thread=self.thread, actor=Actor.USER, text=text)
@@ -262,3 +266,52 @@ class ContinuousContextBuilderTests(TestCase):
         self.assertTrue(any("today-before-1" in c for c in rendered))
         self.assertTrue(any("today-before-2" in c for c in rendered))
         self.assertTrue(any("today-after" in c for c in rendered))
+
+    def _mk_today_segment(self):
+        m1 = self._mk_msg("today-1")
+        self._mk_msg("today-2")
+        return DaySegment.objects.create(
+            user=self.user,
+            thread=self.thread,
+            day_label=dt.datetime.now(dt.timezone.utc).date(),
+            starts_at_message=m1,
+        )
+
+    def test_reuses_cached_context_until_thread_changes(self):
+        self._mk_today_segment()
+        first_snapshot, first_messages = load_continuous_context(self.user, self.thread)
+
+        with CaptureQueriesContext(connection) as cached_queries:
+            snapshot, messages = load_continuous_context(self.user, self.thread)
+
+        self.assertEqual(messages, first_messages)
+        self.assertEqual(snapshot, first_snapshot)
+        self.assertFalse(any("nova_daysegment" in q["sql"] and "day_label" in q["sql"] for q in cached_queries))
+
+        latest = self._mk_msg("today-3")
+        snapshot, messages = load_continuous_context(self.user, self.thread)
+
+        self.assertEqual(snapshot.today_last_message_id, latest.id)
+        self.assertTrue(any("today-3" in str(m.get("content") or "") for m in messages))
+
+    def test_cached_context_applies_per_call_exclusions(self):
+        self._mk_today_segment()
+        latest = self._mk_msg("today-3")
+        load_continuous_context(self.user, self.thread)
+
+        snapshot, messages = load_continuous_context(self.user, self.thread, exclude_message_id=latest.id)
+
+        self.assertFalse(any("today-3" in str(m.get("content") or "") for m in messages))
+        self.assertNotEqual(snapshot.today_last_message_id, latest.id)
+
+    def test_summary_update_invalidates_cached_context(self):
+        segment = self._mk_today_segment()
+        load_continuous_context(self.user, self.thread)
+
+        segment.summary_markdown = "Fresh summary"
+        segment.summary_until_message = segment.starts_at_message
+        segment.save(update_fields=["summary_markdown", "summary_until_message", "updated_at"])
+        _, messages = load_continuous_context(self.user, self.thread)
+
+        self.assertIn("Fresh summary", "\n".join(self._system_contents(messages)))
+        self.assertFalse(any("today-1" == str(m.get("content") or "") for m in messages))
@@ -280,15 +280,8 @@ class ConversationEmbeddingTasksTests(TestCase):
         self.assertEqual(emb.error, "boom")
         mocked_retry.assert_called_once()
 
-    @patch("nova.tasks.conversation_embedding_tasks.rebuild_user_conversation_embeddings_task.delay")
-    @patch("nova.tasks.conversation_embedding_tasks.compute_transcript_chunk_embedding_task.delay")
-    @patch("nova.tasks.conversation_embedding_tasks.compute_day_segment_embedding_task.delay")
-    def test_rebuild_user_conversation_embeddings_creates_rows_and_queues_pending_batches(
-        self,
-        mock_day_delay,
-        mock_chunk_delay,
-        mock_rebuild_delay,
-    ):
+    @patch("nova.tasks.conversation_embedding_tasks.schedule_embedding_drain")
+    def test_rebuild_user_conversation_embeddings_creates_rows_and_schedules_drain(self, mock_drain):
         result = rebuild_user_conversation_embeddings_task.run(self.user.id, batch_size=10)
 
         day_embedding = DaySegmentEmbedding.objects.get(day_segment=self.seg)
@@ -303,19 +296,10 @@ class ConversationEmbeddingTasksTests(TestCase):
         self.assertEqual(chunk_embedding.state, ConversationEmbeddingState.PENDING)
         self.assertIsNone(chunk_embedding.error)
         self.assertIsNone(chunk_embedding.vector)
-        mock_day_delay.assert_called_once_with(day_embedding.id)
-        mock_chunk_delay.assert_called_once_with(chunk_embedding.id)
-        mock_rebuild_delay.assert_not_called()
-
-    @patch("nova.tasks.conversation_embedding_tasks.rebuild_user_conversation_embeddings_task.delay")
-    @patch("nova.tasks.conversation_embedding_tasks.compute_transcript_chunk_embedding_task.delay")
-    @patch("nova.tasks.conversation_embedding_tasks.compute_day_segment_embedding_task.delay")
-    def test_rebuild_user_conversation_embeddings_reschedules_when_batch_is_full(
-        self,
-        mock_day_delay,
-        mock_chunk_delay,
-        mock_rebuild_delay,
-    ):
+        mock_drain.assert_called_once_with(self.user.id)
+
+    @patch("nova.tasks.conversation_embedding_tasks.schedule_embedding_drain")
+    def test_rebuild_user_conversation_embeddings_marks_all_rows_pending_in_one_pass(self, mock_drain):
         second_segment, second_chunk = self._create_additional_segment_and_chunk("second")
         first_day_embedding = DaySegmentEmbedding.objects.create(
             user=self.user,
@@ -336,8 +320,8 @@ class ConversationEmbeddingTasksTests(TestCase):
 
         first_day_embedding.refresh_from_db()
         first_chunk_embedding.refresh_from_db()
-        self.assertEqual(result["queued_day"], 1)
-        self.assertEqual(result["queued_chunk"], 1)
+        self.assertEqual(result["queued_day"], 2)
+        self.assertEqual(result["queued_chunk"], 2)
         self.assertEqual(first_day_embedding.state, ConversationEmbeddingState.PENDING)
         self.assertIsNone(first_day_embedding.error)
         self.assertIsNone(first_day_embedding.vector)
@@ -346,9 +330,7 @@ class ConversationEmbeddingTasksTests(TestCase):
         self.assertIsNone(first_chunk_embedding.vector)
         self.assertTrue(DaySegmentEmbedding.objects.filter(day_segment=second_segment).exists())
         self.assertTrue(TranscriptChunkEmbedding.objects.filter(transcript_chunk=second_chunk).exists())
-        mock_day_delay.assert_called_once_with(first_day_embedding.id)
-        mock_chunk_delay.assert_called_once_with(first_chunk_embedding.id)
-        mock_rebuild_delay.assert_called_once_with(self.user.id, batch_size=1)
+        mock_drain.assert_called_once_with(self.user.id)
 
 
 class ConversationSearchFallbackTests(TestCase):
@@ -183,10 +183,10 @@ class ConversationTasksDbTests(TransactionTestCase):
         mocked_completion.assert_not_awaited()
         self.assertTrue(any(call.args[1] == "task_complete" for call in mocked_publish.await_args_list))
 
-    @patch("nova.tasks.conversation_tasks.compute_day_segment_embedding_task.delay")
+    @patch("nova.tasks.conversation_tasks.schedule_embedding_drain")
     @patch("nova.tasks.conversation_tasks.ProviderClient.create_chat_completion", new_callable=AsyncMock)
     @patch("nova.tasks.conversation_tasks._publish_task_update", new_callable=AsyncMock)
-    def test_summarize_day_segment_async_persists_summary(self, mocked_publish, mocked_completion, mocked_delay):
+    def test_summarize_day_segment_async_persists_summary(self, mocked_publish, mocked_completion, mocked_drain):
         m1 = self.thread.add_message("Yesterday plan", actor=Actor.USER)
         m2 = self.thread.add_message("Today's action", actor=Actor.AGENT)
         seg = DaySegment.objects.create(
@@ -213,18 +213,19 @@ class ConversationTasksDbTests(TransactionTestCase):
         self.assertIn("## Summary", seg.summary_markdown)
         self.assertNotIn("[THINK]", seg.summary_markdown)
         self.assertEqual(seg.summary_until_message_id, m2.id)
+        self.assertFalse(seg.summary_dirty)
         emb = DaySegmentEmbedding.objects.get(day_segment=seg)
         self.assertEqual(emb.state, "pending")
-        mocked_delay.assert_called_once_with(emb.id)
+        mocked_drain.assert_called_once_with(self.user.id)
         mocked_completion.assert_awaited_once()
         prompt = mocked_completion.await_args.kwargs["messages"][1]["content"]
         self.assertIn("Messages for this day:", prompt)
         self.assertTrue(any(call.args[1] == "continuous_summary_ready" for call in mocked_publish.await_args_list))
 
-    @patch("nova.tasks.conversation_tasks.compute_day_segment_embedding_task.delay")
+    @patch("nova.tasks.conversation_tasks.schedule_embedding_drain")
     @patch("nova.tasks.conversation_tasks.ProviderClient.create_chat_completion", new_callable=AsyncMock)
     @patch("nova.tasks.conversation_tasks._publish_task_update", new_callable=AsyncMock)
-    def test_manual_regenerate_ignores_delta_boundary(self, mocked_publish, mocked_completion, mocked_delay):
+    def test_manual_regenerate_ignores_delta_boundary(self, mocked_publish, mocked_completion, mocked_drain):
         m1 = self.thread.add_message("Initial context", actor=Actor.USER)
         m2 = self.thread.add_message("Initial answer", actor=Actor.AGENT)
         seg = DaySegment.objects.create(
@@ -255,8 +256,8 @@ class ConversationTasksDbTests(TransactionTestCase):
         seg.refresh_from_db()
         self.assertEqual(seg.summary_markdown, "## Summary\nRegenerated")
         self.assertEqual(seg.summary_until_message_id, m2.id)
-        emb = DaySegmentEmbedding.objects.get(day_segment=seg)
-        mocked_delay.assert_called_once_with(emb.id)
+        self.assertTrue(DaySegmentEmbedding.objects.filter(day_segment=seg, state="pending").exists())
+        mocked_drain.assert_called_once_with(self.user.id)
         self.assertTrue(any(call.args[1] == "task_complete" for call in mocked_publish.await_args_list))
 
     @patch("nova.tasks.conversation_tasks.summarize_day_segment_task.delay")
@@ -273,6 +274,47 @@ class ConversationTasksDbTests(TransactionTestCase):
         self.assertEqual(mocked_needs_refresh.call_count, 2)
         self.assertNotEqual(seg1.id, seg2.id)
 
+    @patch("nova.tasks.conversation_tasks.summarize_day_segment_task.delay")
+    @patch("nova.tasks.conversation_tasks._daysegment_needs_nightly_refresh")
+    def test_nightly_task_skips_clean_segments_and_clears_false_positives(self, mocked_needs_refresh, mocked_delay):
+        clean, _ = self._create_segment(day_offset=-3, summary="Summary")
+        other_clean, _ = self._create_segment(day_offset=-2, summary="Summary")
+        dirty, _ = self._create_segment(day_offset=-1, summary="Summary")
+        DaySegment.objects.filter(id__in=[clean.id, other_clean.id]).update(summary_dirty=False)
+        mocked_needs_refresh.return_value = False
+
+        result = conversation_tasks.nightly_summarize_continuous_daysegments_task.run()
+
+        self.assertEqual(result, {"status": "ok", "queued": 0})
+        mocked_delay.assert_not_called()
+        # Only the dirty segment is inspected, then its flag is cleared.
+        self.assertEqual([call.args[0].id for call in mocked_needs_refresh.call_args_list], [dirty.id])
+        dirty.refresh_from_db()
+        self.assertFalse(dirty.summary_dirty)
+
+    def test_new_message_marks_containing_segment_dirty(self):
+        older, _ = self._create_segment(day_offset=-2, summary="Summary")
+        latest, _ = self._create_segment(day_offset=-1, summary="Summary")
+        DaySegment.objects.filter(id__in=[older.id, latest.id]).update(summary_dirty=False)
+
+        self.thread.add_message("late reply", actor=Actor.AGENT)
+
+        older.refresh_from_db()
+        latest.refresh_from_db()
+        self.assertFalse(older.summary_dirty)
+        self.assertTrue(latest.summary_dirty)
+
+    @patch("nova.signals.mark_day_segment_dirty")
+    def test_message_edits_and_non_continuous_threads_skip_dirty_marking(self, mocked_mark):
+        message = self.thread.add_message("hello", actor=Actor.USER)
+        self.assertEqual(mocked_mark.call_count, 1)
+
+        message.text = "edited"
+        message.save()
+        Thread.objects.create(user=self.user, subject="regular").add_message("hi", actor=Actor.USER)
+
+        self.assertEqual(mocked_mark.call_count, 1)
+
     @patch("nova.tasks.conversation_tasks._summarize_day_segment_async", new_callable=AsyncMock)
     @patch("nova.tasks.conversation_tasks._daysegment_needs_nightly_refresh")
     def test_nightly_task_for_user_runs_sequential_updates(self, mocked_needs_refresh, mocked_summarize):
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from datetime import date, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -20,6 +21,7 @@ from nova.continuous.tools.conversation_tools import (
     conversation_get,
     conversation_search,
 )
+from nova.models.ConversationEmbedding import ConversationEmbeddingState, TranscriptChunkEmbedding
 from nova.models.DaySegment import DaySegment
 from nova.models.Message import Actor, Message
 from nova.models.Thread import Thread
@@ -427,6 +429,23 @@ class ConversationSearchTests(ConversationToolsBaseTest):
         self.assertNotIn("last month", joined.lower())
         self.assertNotIn("another thread", joined.lower())
 
+    @patch("nova.continuous.tools.conversation_tools.resolve_query_vector", new_callable=AsyncMock)
+    def test_conversation_search_uses_vector_index_for_semantic_hits_on_sqlite(self, mocked_vector):
+        rollback_vector = [1.0] + [0.0] * 1023
+        TranscriptChunkEmbedding.objects.create(
+            user=self.user,
+            transcript_chunk=self.chunk_two,
+            state=ConversationEmbeddingState.READY,
+            vector=rollback_vector,
+        )
+        mocked_vector.return_value = rollback_vector
+
+        out = async_to_sync(conversation_search)(query="undo release", agent=self.agent, limit=10)
+
+        self.assertEqual(out["results"][0]["kind"], "message")
+        self.assertEqual(out["results"][0]["message_id"], self.msg3.id)
+        self.assertIn("semantic ranking enabled", out["notes"][0])
+
     @patch("nova.continuous.tools.conversation_tools.resolve_query_vector", new_callable=AsyncMock)
     def test_conversation_search_postgresql_branch_with_semantic_candidates(self, mocked_vector):
         mocked_vector.return_value = [0.1, 0.2, 0.3]
@@ -465,13 +484,17 @@ class ConversationSearchTests(ConversationToolsBaseTest):
         ), patch(
             "nova.continuous.tools.conversation_tools.TranscriptChunk.objects.filter",
             return_value=chunk_qs,
-        ):
+        ), patch(
+            "nova.continuous.tools.conversation_tools.ann_search",
+            return_value=nullcontext(),
+        ) as mocked_ann_search:
             out = async_to_sync(conversation_search)(
                 query="deploy",
                 agent=self.agent,
                 limit=10,
             )
 
+        mocked_ann_search.assert_called_once_with(candidate_limit=200)
         self.assertEqual(len(out["results"]), 2)
         self.assertEqual(out["results"][0]["kind"], "summary")
         self.assertEqual(out["results"][1]["kind"], "message")
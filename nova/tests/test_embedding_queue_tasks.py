@@ -0,0 +1,189 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from nova.models.ConversationEmbedding import ConversationEmbeddingState, DaySegmentEmbedding
+from nova.models.DaySegment import DaySegment
+from nova.models.MemoryChunk import MemoryChunk
+from nova.models.MemoryChunkEmbedding import MemoryChunkEmbedding
+from nova.models.MemoryDocument import MemoryDocument
+from nova.models.Message import Actor, Message
+from nova.models.Thread import Thread
+from nova.models.memory_common import MemoryChunkEmbeddingState, MemoryRecordStatus
+from nova.tasks.embedding_queue_tasks import (
+    _drain_running_key,
+    drain_user_embeddings_task,
+    enqueue_embedding_drain,
+)
+
+
+User = get_user_model()
+
+
+class EmbeddingQueueTasksTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="embedding-queue-user",
+            email="embedding-queue@example.com",
+            password="testpass123",
+        )
+        self.provider = SimpleNamespace(provider_type="custom_http", model="e5")
+
+    def _create_memory_embedding(self, index: int, text: str) -> MemoryChunkEmbedding:
+        document = MemoryDocument.objects.create(
+            user=self.user,
+            virtual_path=f"/memory/item-{index}.md",
+            title="Memory",
+            content_markdown=f"# Memory\n\n{text}",
+            status=MemoryRecordStatus.ACTIVE,
+        )
+        chunk = MemoryChunk.objects.create(
+            document=document,
+            heading="Memory",
+            anchor="memory",
+            position=0,
+            content_text=text,
+            token_count=len(text.split()),
+            status=MemoryRecordStatus.ACTIVE,
+        )
+        return MemoryChunkEmbedding.objects.create(chunk=chunk, state=MemoryChunkEmbeddingState.PENDING)
+
+    @patch("nova.tasks.embedding_queue_tasks.drain_user_embeddings_task.delay")
+    def test_enqueue_coalesces_requests_until_drain_starts(self, mocked_delay):
+        self.assertTrue(enqueue_embedding_drain(self.user.id))
+        self.assertTrue(enqueue_embedding_drain(self.user.id))
+
+        mocked_delay.assert_called_once_with(self.user.id)
+
+    @patch(
+        "nova.tasks.embedding_queue_tasks.drain_user_embeddings_task.delay",
+        side_effect=RuntimeError("broker down"),
+    )
+    def test_enqueue_returns_false_and_releases_slot_when_broker_fails(self, mocked_delay):
+        self.assertFalse(enqueue_embedding_drain(self.user.id))
+        self.assertFalse(enqueue_embedding_drain(self.user.id))
+
+        self.assertEqual(mocked_delay.call_count, 2)
+
+    @patch("nova.tasks.embedding_queue_tasks.compute_embeddings_batch", new_callable=AsyncMock)
+    @patch("nova.tasks.embedding_queue_tasks.get_embeddings_provider")
+    def test_drain_embeds_pending_rows_with_one_batched_call(self, mocked_provider, mocked_batch):
+        mocked_provider.return_value = self.provider
+        first = self._create_memory_embedding(0, "first fact")
+        second = self._create_memory_embedding(1, "second fact")
+        empty = self._create_memory_embedding(2, "   ")
+        mocked_batch.return_value = [[0.1] * 1024, [0.2] * 1024]
+
+        result = drain_user_embeddings_task.run(self.user.id)
+
+        mocked_batch.assert_awaited_once()
+        self.assertEqual(mocked_batch.await_args.args[0], ["first fact", "second fact"])
+        self.assertEqual(result["claimed"], {"memory_chunk": 3})
+        for embedding in (first, second):
+            embedding.refresh_from_db()
+            self.assertEqual(embedding.state, MemoryChunkEmbeddingState.READY)
+            self.assertEqual(embedding.model, "e5")
+            self.assertEqual(embedding.dimensions, 1024)
+        empty.refresh_from_db()
+        self.assertEqual(empty.state, MemoryChunkEmbeddingState.ERROR)
+        self.assertEqual(empty.error, "empty_content")
+
+    @patch("nova.tasks.embedding_queue_tasks.compute_embeddings_batch", new_callable=AsyncMock)
+    @patch("nova.tasks.embedding_queue_tasks.get_embeddings_provider")
+    def test_drain_embeds_day_segment_summaries(self, mocked_provider, mocked_batch):
+        mocked_provider.return_value = self.provider
+        thread = Thread.objects.create(user=self.user, subject="Continuous", mode=Thread.Mode.CONTINUOUS)
+        message = Message.objects.create(user=self.user, thread=thread, actor=Actor.USER, text="hello")
+        segment = DaySegment.objects.create(
+            user=self.user,
+            thread=thread,
+            day_label=message.created_at.date(),
+            starts_at_message=message,
+            summary_markdown="Summary",
+        )
+        emb = DaySegmentEmbedding.objects.create(user=self.user, day_segment=segment)
+        mocked_batch.return_value = [[0.3] * 1024]
+
+        drain_user_embeddings_task.run(self.user.id)
+
+        emb.refresh_from_db()
+        self.assertEqual(emb.state, ConversationEmbeddingState.READY)
+        self.assertEqual(mocked_batch.await_args.args[0], ["Summary"])
+
+    @patch("nova.tasks.embedding_queue_tasks.compute_embeddings_batch", new_callable=AsyncMock)
+    @patch("nova.tasks.embedding_queue_tasks.get_embeddings_provider", return_value=None)
+    def test_drain_leaves_rows_pending_when_embeddings_are_disabled(self, mocked_provider, mocked_batch):
+        embedding = self._create_memory_embedding(0, "fact")
+
+        result = drain_user_embeddings_task.run(self.user.id)
+
+        self.assertEqual(result["status"], "disabled")
+        embedding.refresh_from_db()
+        self.assertEqual(embedding.state, MemoryChunkEmbeddingState.PENDING)
+        mocked_batch.assert_not_awaited()
+
+    @patch("nova.tasks.embedding_queue_tasks.compute_embeddings_batch", new_callable=AsyncMock)
+    @patch("nova.tasks.embedding_queue_tasks.get_embeddings_provider")
+    def test_drain_keeps_rows_requeued_while_embedding_pending(self, mocked_provider, mocked_batch):
+        mocked_provider.return_value = self.provider
+        kept = self._create_memory_embedding(0, "kept fact")
+        requeued = self._create_memory_embedding(1, "old fact")
+
+        async def embed(texts, **kwargs):
+            if mocked_batch.await_count == 1:
+                # The chunk is re-queued while the first batch is in flight.
+                await MemoryChunkEmbedding.objects.filter(id=requeued.id).aupdate(
+                    updated_at=timezone.now() + timedelta(seconds=1),
+                )
+            return [[0.1] * 1024 for _ in texts]
+
+        mocked_batch.side_effect = embed
+
+        drain_user_embeddings_task.run(self.user.id, batch_size=2)
+
+        kept.refresh_from_db()
+        requeued.refresh_from_db()
+        self.assertEqual(kept.state, MemoryChunkEmbeddingState.READY)
+        self.assertEqual(requeued.state, MemoryChunkEmbeddingState.READY)
+        self.assertEqual(mocked_batch.await_count, 2)
+        self.assertEqual(mocked_batch.await_args_list[1].args[0], ["old fact"])
+
+    @patch("nova.tasks.embedding_queue_tasks.drain_user_embeddings_task.apply_async")
+    @patch("nova.tasks.embedding_queue_tasks.compute_embeddings_batch", new_callable=AsyncMock)
+    @patch("nova.tasks.embedding_queue_tasks.get_embeddings_provider")
+    def test_drain_defers_while_another_drain_of_the_user_runs(self, mocked_provider, mocked_batch, mocked_apply):
+        mocked_provider.return_value = self.provider
+        embedding = self._create_memory_embedding(0, "fact")
+        cache.add(_drain_running_key(self.user.id), 1)
+
+        result = drain_user_embeddings_task.run(self.user.id)
+
+        self.assertEqual(result["status"], "busy")
+        mocked_batch.assert_not_awaited()
+        mocked_apply.assert_called_once()
+        embedding.refresh_from_db()
+        self.assertEqual(embedding.state, MemoryChunkEmbeddingState.PENDING)
+
+    @patch("nova.tasks.embedding_queue_tasks.compute_embeddings_batch", new_callable=AsyncMock)
+    @patch("nova.tasks.embedding_queue_tasks.get_embeddings_provider")
+    def test_drain_renews_its_lease_after_every_batch(self, mocked_provider, mocked_batch):
+        mocked_provider.return_value = self.provider
+        for index in range(3):
+            self._create_memory_embedding(index, f"fact {index}")
+        mocked_batch.side_effect = lambda texts, **kwargs: [[0.1] * 8 for _text in texts]
+
+        with patch.object(cache, "touch", wraps=cache.touch) as mocked_touch:
+            result = drain_user_embeddings_task.run(self.user.id, batch_size=2)
+
+        self.assertEqual(result["batches"], 2)
+        self.assertEqual(
+            [call.args[0] for call in mocked_touch.call_args_list],
+            [_drain_running_key(self.user.id)] * 2,
+        )
+        self.assertIsNone(cache.get(_drain_running_key(self.user.id)))
@@ -1,19 +1,26 @@
-from unittest.mock import Mock, patch
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
 
 from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase, override_settings
+from django.utils import timezone
 
 from nova.llm.embeddings import (
     EmbeddingsProvider,
+    _embedding_content_hash,
     aget_embeddings_provider,
     compute_embedding,
+    compute_embeddings_batch,
     get_embeddings_provider,
     get_resolved_embeddings_provider,
+    invalidate_embeddings_provider_cache,
 )
+from nova.models.EmbeddingCache import EmbeddingCacheEntry
 from nova.models.EmbeddingsSystemState import EmbeddingsSystemState
 from nova.models.UserObjects import MemoryEmbeddingsSource, UserParameters
-from nova.web.network_policy import LOCAL_DEVELOPMENT_HOSTS
+from nova.web.network_policy import LOCAL_DEVELOPMENT_HOSTS, NetworkPolicyError
 
 
 User = get_user_model()
@@ -196,6 +203,77 @@ class EmbeddingsProviderResolutionTests(TestCase):
         self.assertIsNone(async_to_sync(aget_embeddings_provider)(user_id=self.user.id))
 
 
+class EmbeddingsProviderCacheTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="emb-cache-user",
+            email="emb-cache-user@example.com",
+            password="testpass123",
+        )
+        self.params, _ = UserParameters.objects.get_or_create(user=self.user)
+        self.params.memory_embeddings_source = MemoryEmbeddingsSource.CUSTOM
+        self.params.memory_embeddings_url = "http://user-embed:8080/v1"
+        self.params.memory_embeddings_model = "user-model"
+        self.params.save()
+
+    def test_cached_provider_skips_database_lookups(self):
+        first = get_embeddings_provider(user_id=self.user.id)
+
+        with self.assertNumQueries(0):
+            second = get_embeddings_provider(user_id=self.user.id)
+            third = async_to_sync(aget_embeddings_provider)(user_id=self.user.id)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+
+    def test_user_parameters_change_invalidates_cached_provider(self):
+        self.assertEqual(get_embeddings_provider(user_id=self.user.id).model, "user-model")
+
+        self.params.memory_embeddings_model = "user-model-v2"
+        self.params.save(update_fields=["memory_embeddings_model"])
+
+        self.assertEqual(get_embeddings_provider(user_id=self.user.id).model, "user-model-v2")
+
+        self.params.memory_embeddings_source = MemoryEmbeddingsSource.DISABLED
+        self.params.save(update_fields=["memory_embeddings_source"])
+
+        self.assertIsNone(async_to_sync(aget_embeddings_provider)(user_id=self.user.id))
+
+    def test_invalidation_from_another_process_drops_local_provider(self):
+        self.assertEqual(get_embeddings_provider(user_id=self.user.id).model, "user-model")
+
+        # Another process saves the parameters: only the shared version moves.
+        UserParameters.objects.filter(id=self.params.id).update(memory_embeddings_model="remote-model")
+        self.assertEqual(get_embeddings_provider(user_id=self.user.id).model, "user-model")
+        invalidate_embeddings_provider_cache(user_id=self.user.id)
+
+        self.assertEqual(get_embeddings_provider(user_id=self.user.id).model, "remote-model")
+
+    def test_api_key_is_never_written_to_the_shared_cache(self):
+        self.params.memory_embeddings_api_key = "sk-user-secret"
+        self.params.save(update_fields=["memory_embeddings_api_key"])
+        shared = Mock(wraps=cache)
+
+        with patch("nova.llm.embeddings.cache", shared):
+            provider = get_embeddings_provider(user_id=self.user.id)
+            async_to_sync(aget_embeddings_provider)(user_id=self.user.id)
+
+        self.assertEqual(provider.api_key, "sk-user-secret")
+        self.assertNotIn("sk-user-secret", repr(shared.mock_calls))
+
+    def test_system_settings_change_bypasses_cached_provider(self):
+        self.params.memory_embeddings_source = MemoryEmbeddingsSource.SYSTEM
+        self.params.save(update_fields=["memory_embeddings_source"])
+
+        with patch("nova.tasks.memory_rebuild_tasks.rebuild_user_memory_embeddings_task.delay"), patch(
+            "nova.tasks.conversation_embedding_tasks.rebuild_user_conversation_embeddings_task.delay"
+        ):
+            with override_settings(MEMORY_EMBEDDINGS_URL="http://system-embed:8080/v1", MEMORY_EMBEDDINGS_MODEL="a"):
+                self.assertEqual(get_embeddings_provider(user_id=self.user.id).model, "a")
+            with override_settings(MEMORY_EMBEDDINGS_URL="http://system-embed:8080/v1", MEMORY_EMBEDDINGS_MODEL="b"):
+                self.assertEqual(get_embeddings_provider(user_id=self.user.id).model, "b")
+
+
 class EmbeddingsSystemBackfillTests(TestCase):
     def setUp(self):
         self.system_user = User.objects.create_user(
@@ -345,3 +423,149 @@ class EmbeddingRequestPolicyTests(TestCase):
             mocked_request.await_args.kwargs["allowed_private_hosts"],
             LOCAL_DEVELOPMENT_HOSTS,
         )
+
+
+@patch("nova.llm.embeddings.assert_allowed_egress_url", new=AsyncMock())
+class EmbeddingBatchCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="emb-batch-user", password="pass")
+        self.provider = EmbeddingsProvider(
+            provider_type="custom_http",
+            base_url="http://embed.example.com/v1",
+            model="text-embedding-model",
+            max_batch_size=2,
+        )
+
+    @staticmethod
+    def _response_for(payload_inputs):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        # Return rows out of order to exercise index-based ordering.
+        response.json.return_value = {
+            "data": [
+                {"index": index, "embedding": [float(len(text)), float(index)]}
+                for index, text in reversed(list(enumerate(payload_inputs)))
+            ]
+        }
+        return response
+
+    def _embed(self, texts, *, provider=None, user_id=None):
+        return async_to_sync(compute_embeddings_batch)(
+            texts,
+            provider_override=provider or self.provider,
+            user_id=user_id or self.user.id,
+        )
+
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_batch_honours_provider_batch_size_and_deduplicates(self, mocked_request):
+        mocked_request.side_effect = lambda *args, **kwargs: self._response_for(kwargs["json"]["input"])
+
+        vectors = self._embed(["a", "bb", "a", "ccc"])
+
+        self.assertEqual(mocked_request.await_count, 2)
+        self.assertEqual(
+            [call.kwargs["json"]["input"] for call in mocked_request.await_args_list],
+            [["a", "bb"], ["ccc"]],
+        )
+        self.assertEqual([vector[:2] for vector in vectors], [[1.0, 0.0], [2.0, 1.0], [1.0, 0.0], [3.0, 0.0]])
+        self.assertTrue(all(len(vector) == 1024 for vector in vectors))
+        self.assertEqual(EmbeddingCacheEntry.objects.filter(user=self.user).count(), 3)
+
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_cached_texts_skip_the_provider(self, mocked_request):
+        mocked_request.side_effect = lambda *args, **kwargs: self._response_for(kwargs["json"]["input"])
+        first = self._embed(["a", "bb"])
+        mocked_request.reset_mock()
+
+        second = self._embed(["bb", "dddd", "a"])
+
+        mocked_request.assert_awaited_once()
+        self.assertEqual(mocked_request.await_args.kwargs["json"]["input"], ["dddd"])
+        self.assertEqual(second[0], first[1])
+        self.assertEqual(second[2], first[0])
+
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_cache_is_scoped_to_provider_model(self, mocked_request):
+        mocked_request.side_effect = lambda *args, **kwargs: self._response_for(kwargs["json"]["input"])
+        other_model = EmbeddingsProvider(
+            provider_type="custom_http",
+            base_url="http://embed.example.com/v1",
+            model="other-model",
+        )
+
+        self._embed(["hello"])
+        self._embed(["hello"], provider=other_model)
+
+        self.assertEqual(mocked_request.await_count, 2)
+
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_cache_is_scoped_to_user_and_deleted_with_them(self, mocked_request):
+        mocked_request.side_effect = lambda *args, **kwargs: self._response_for(kwargs["json"]["input"])
+        other = User.objects.create_user(username="emb-batch-other", password="pass")
+
+        self._embed(["hello"])
+        self._embed(["hello"], user_id=other.id)
+        async_to_sync(compute_embedding)("hello", provider_override=self.provider)
+
+        self.assertEqual(mocked_request.await_count, 3)
+        self.assertEqual(EmbeddingCacheEntry.objects.count(), 2)
+        other.delete()
+        self.assertEqual(list(EmbeddingCacheEntry.objects.values_list("user_id", flat=True)), [self.user.id])
+
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_network_policy_is_checked_before_serving_cached_vectors(self, mocked_request):
+        mocked_request.side_effect = lambda *args, **kwargs: self._response_for(kwargs["json"]["input"])
+        self._embed(["hello"])
+
+        with patch(
+            "nova.llm.embeddings.assert_allowed_egress_url",
+            new=AsyncMock(side_effect=NetworkPolicyError("blocked")),
+        ):
+            with self.assertRaises(NetworkPolicyError):
+                self._embed(["hello"])
+
+    @override_settings(EMBEDDING_CACHE_MAX_AGE_DAYS=7)
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_new_vectors_prune_expired_entries_of_the_user(self, mocked_request):
+        mocked_request.side_effect = lambda *args, **kwargs: self._response_for(kwargs["json"]["input"])
+        other = User.objects.create_user(username="emb-batch-other", password="pass")
+        self._embed(["old"])
+        self._embed(["old"], user_id=other.id)
+        EmbeddingCacheEntry.objects.update(created_at=timezone.now() - timedelta(days=8))
+
+        self._embed(["old", "new"])
+
+        self.assertEqual(mocked_request.await_args.kwargs["json"]["input"], ["old", "new"])
+        self.assertEqual(EmbeddingCacheEntry.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(EmbeddingCacheEntry.objects.filter(user=other).count(), 1)
+
+    @override_settings(EMBEDDING_CACHE_MAX_AGE_DAYS=7)
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_expired_entries_are_refreshed_and_pruned_at_most_once_per_interval(self, mocked_request):
+        mocked_request.side_effect = lambda *args, **kwargs: self._response_for(kwargs["json"]["input"])
+        self._embed(["first"])
+        self._embed(["second"])
+        EmbeddingCacheEntry.objects.update(created_at=timezone.now() - timedelta(days=8))
+
+        self._embed(["third"])
+        self.assertEqual(EmbeddingCacheEntry.objects.count(), 3)
+
+        self._embed(["first"])
+        self._embed(["first"])
+
+        self.assertEqual(mocked_request.await_count, 4)
+        self.assertEqual(EmbeddingCacheEntry.objects.count(), 3)
+        refreshed = EmbeddingCacheEntry.objects.get(content_hash=_embedding_content_hash("first"))
+        self.assertGreater(refreshed.created_at, timezone.now() - timedelta(days=1))
+
+    @patch("nova.llm.embeddings.safe_http_request")
+    def test_mismatched_response_length_raises(self, mocked_request):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {"data": [{"index": 0, "embedding": [0.1]}]}
+        mocked_request.return_value = response
+
+        with self.assertRaises(ValueError):
+            self._embed(["a", "b"])
+        self.assertFalse(EmbeddingCacheEntry.objects.exists())
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import builtins
+import hashlib
 import io
 import json
 import os
 from pathlib import Path
+import sys
+import tarfile
 import tempfile
 from typing import Any, cast
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from time import monotonic
+from unittest.mock import AsyncMock, Mock, patch
 
 from django.test import SimpleTestCase, override_settings
 
@@ -18,17 +22,28 @@ from nova.exec_runner.docker_backend import (
     SESSION_ROOT_IN_CONTAINER,
     SITECUSTOMIZE_PATH,
     WORKSPACE_ROOT_IN_CONTAINER,
+    _SANDBOX_AGENT_SCRIPT,
+    COMMAND_PATH,
+    CWD_PATH,
     DockerExecRunnerBackend,
     ExecRunnerConfig,
     ExecSession,
+    SandboxAgentConnection,
+    SandboxAgentStopped,
+    WarmSandbox,
     load_exec_runner_config_from_env,
 )
 from nova.exec_runner import service as exec_runner_service
 from nova.exec_runner.shared import (
+    ExecRunnerError,
+    ExecRunnerSyncConflict,
     ExecSessionSelector,
     PYTHON_WORKSPACE_SITECUSTOMIZE_SOURCE,
     RUNNER_INTERNAL_DIRNAME,
+    SYNC_MODE_DELTA,
     SandboxShellResult,
+    SandboxSyncPlan,
+    manifest_digest,
     rewrite_output_paths_from_workspace,
     rewrite_shell_command_for_workspace,
 )
@@ -84,8 +99,8 @@ class ExecRunnerServiceTests(SimpleTestCase):
         mocked_parse_response,
         mocked_apply_diff,
     ):
-        mocked_build_bundle.return_value = b"sync-bundle"
-        mocked_request.return_value = SimpleNamespace(status_code=200)
+        mocked_build_bundle.return_value = (SandboxSyncPlan(), b"sync-bundle")
+        mocked_request.return_value = SimpleNamespace(status_code=200, json=lambda: {"files": {}})
         mocked_parse_response.return_value = (
             {
                 "stdout": "ok\n",
@@ -127,6 +142,92 @@ class ExecRunnerServiceTests(SimpleTestCase):
         self.assertEqual(metadata["cwd"], "/")
         self.assertEqual(metadata["command"], "pwd")
         self.assertEqual(metadata["selector"]["thread_id"], 2)
+        self.assertEqual(metadata["sync"]["mode"], "full")
+
+    @override_settings(
+        EXEC_RUNNER_ENABLED=True,
+        EXEC_RUNNER_BASE_URL="http://exec-runner:8080",
+        EXEC_RUNNER_SHARED_TOKEN="runner-token",
+    )
+    @patch("nova.exec_runner.service._apply_diff_bundle", new_callable=AsyncMock)
+    @patch("nova.exec_runner.service._parse_multipart_response")
+    @patch("nova.exec_runner.service._post_exec_request", new_callable=AsyncMock)
+    @patch("nova.exec_runner.service._fetch_runner_manifest", new_callable=AsyncMock)
+    @patch("nova.exec_runner.service._build_sync_bundle", new_callable=AsyncMock)
+    def test_execute_sandbox_shell_command_replaces_workspace_after_sync_conflict(
+        self,
+        mocked_build_bundle,
+        mocked_fetch_manifest,
+        mocked_post,
+        mocked_parse_response,
+        mocked_apply_diff,
+    ):
+        delta_plan = SandboxSyncPlan(mode=SYNC_MODE_DELTA, base_manifest_digest="stale")
+        mocked_fetch_manifest.return_value = {"/a.txt": "digest"}
+        mocked_build_bundle.side_effect = [(delta_plan, b"delta"), (SandboxSyncPlan(), b"full")]
+        mocked_post.side_effect = [ExecRunnerSyncConflict("changed"), SimpleNamespace(status_code=200)]
+        mocked_parse_response.return_value = ({"status": 0, "cwd_after": "/"}, b"")
+        mocked_apply_diff.return_value = {"synced_paths": [], "removed_paths": []}
+        mock_vfs = SimpleNamespace(
+            user=SimpleNamespace(id=1),
+            thread=SimpleNamespace(id=2),
+            agent_config=SimpleNamespace(id=3),
+            session_state={"cwd": "/"},
+        )
+        mock_vfs.set_cwd = lambda cwd: mock_vfs.session_state.__setitem__("cwd", cwd)
+
+        asyncio.run(exec_runner_service.execute_sandbox_shell_command(vfs=cast(Any, mock_vfs), command="ls"))
+
+        self.assertEqual(mocked_build_bundle.await_args_list[0].kwargs, {"runner_files": {"/a.txt": "digest"}})
+        self.assertEqual(mocked_build_bundle.await_args_list[1].kwargs, {})
+        self.assertEqual([call.args[2] for call in mocked_post.await_args_list], [b"delta", b"full"])
+
+    @patch("nova.exec_runner.service._store_content_digest")
+    def test_build_sync_bundle_ships_only_files_whose_digest_changed(self, mocked_store_digest):
+        contents = {
+            "/notes.txt": b"unchanged",
+            "/report.csv": b"a,b\n1,2\n",
+            "/inbox/big.bin": b"x" * 1024,
+        }
+
+        class _FakeVFS:
+            async def find(self, start_path, term=""):
+                return [path for path in contents if path.startswith(start_path.rstrip("/") + "/")]
+
+            async def is_dir(self, path):
+                return path not in contents
+
+            async def path_exists(self, path):
+                return any(item.startswith(path + "/") for item in contents)
+
+            async def get_real_file(self, path):
+                digest = hashlib.sha256(contents[path]).hexdigest() if path == "/inbox/big.bin" else ""
+                return SimpleNamespace(user_file=SimpleNamespace(id=5, content_sha256=digest))
+
+            async def read_bytes(self, path):
+                if path == "/inbox/big.bin":
+                    raise AssertionError("Cached digests must not download the file.")
+                return contents[path], "application/octet-stream"
+
+        runner_files = {
+            "/notes.txt": hashlib.sha256(b"unchanged").hexdigest(),
+            "/report.csv": hashlib.sha256(b"old").hexdigest(),
+            "/inbox/big.bin": hashlib.sha256(contents["/inbox/big.bin"]).hexdigest(),
+            "/deleted.txt": hashlib.sha256(b"gone").hexdigest(),
+        }
+
+        plan, bundle = asyncio.run(
+            exec_runner_service._build_sync_bundle(cast(Any, _FakeVFS()), runner_files=runner_files)
+        )
+
+        with tarfile.open(fileobj=io.BytesIO(bundle), mode="r:gz") as archive:
+            shipped = [member.name for member in archive.getmembers() if member.isfile()]
+        self.assertEqual(shipped, ["report.csv"])
+        self.assertEqual(plan.mode, SYNC_MODE_DELTA)
+        self.assertEqual(plan.base_manifest_digest, manifest_digest(runner_files))
+        self.assertEqual(plan.removed_paths, ("/deleted.txt",))
+        self.assertIn("/inbox", plan.directory_paths)
+        self.assertEqual(mocked_store_digest.call_count, 2)
 
     @override_settings(
         EXEC_RUNNER_ENABLED=True,
@@ -221,79 +322,133 @@ class DockerExecRunnerBackendTests(SimpleTestCase):
 
         self.assertFalse(config.sandbox_no_new_privileges)
 
-    def test_write_bytes_into_container_streams_content_over_stdin(self):
+    def test_agent_command_starts_agent_over_docker_exec_stdin(self):
         backend = self._build_backend()
-        backend._run_process = AsyncMock(return_value=("", "", 0))
 
+        command = backend._agent_command("nova-exec-test")
+
+        self.assertEqual(command[:6], ["docker", "exec", "-i", "-u", "nova", "nova-exec-test"])
+        self.assertEqual(command[6:9], ["python3", "-c", _SANDBOX_AGENT_SCRIPT])
+        self.assertEqual(command[9:11], [str(WORKSPACE_ROOT_IN_CONTAINER), RUNNER_INTERNAL_DIRNAME])
+
+    def test_sync_workspace_sends_full_or_delta_requests_to_agent(self):
+        backend = self._build_backend()
+        backend._agent_request = AsyncMock(return_value=({"ok": True}, b""))
+        session = self._build_session()
+
+        asyncio.run(backend._sync_workspace(session, b"full-bundle"))
         asyncio.run(
-            backend._write_bytes_into_container(
-                "nova-exec-test",
-                Path("/tmp/example.txt"),
-                b"hello world",
+            backend._sync_workspace(
+                session,
+                b"delta-bundle",
+                SandboxSyncPlan(
+                    mode=SYNC_MODE_DELTA,
+                    base_manifest_digest="abc",
+                    removed_paths=("/old.txt",),
+                    directory_paths=("/new",),
+                ),
             )
         )
 
-        await_args = backend._run_process.await_args
-        assert await_args is not None
-        command = await_args.args[0]
-        self.assertEqual(command[:6], ["docker", "exec", "-i", "-u", "nova", "nova-exec-test"])
-        self.assertEqual(command[-1], "/tmp/example.txt")
+        full_call, delta_call = backend._agent_request.await_args_list
+        self.assertEqual(full_call.args, (session, "sync"))
+        self.assertEqual(full_call.kwargs, {"payload": b"full-bundle", "mode": "full"})
         self.assertEqual(
-            await_args.kwargs["input_bytes"],
-            b"hello world",
+            delta_call.kwargs,
+            {
+                "payload": b"delta-bundle",
+                "mode": "delta",
+                "base_manifest_digest": "abc",
+                "removed_paths": ["/old.txt"],
+                "directory_paths": ["/new"],
+            },
         )
 
-    def test_write_text_into_container_delegates_to_binary_writer(self):
+    def test_ensure_session_skips_docker_checks_while_agent_responds(self):
         backend = self._build_backend()
-        backend._write_bytes_into_container = AsyncMock()
+        backend._agent_responds = AsyncMock(return_value=True)
+        backend._ensure_volume = AsyncMock()
+        backend._container_exists = AsyncMock()
+        backend._schedule_warm_pool_refill = Mock()
 
-        asyncio.run(
-            backend._write_text_into_container(
-                "nova-exec-test",
-                Path("/srv/nova-session/workspace/.nova_runner/command.sh"),
-                "echo test",
+        session = asyncio.run(backend._ensure_session(ExecSessionSelector(user_id=1, thread_id=2, agent_id=3)))
+
+        self.assertEqual(session.container_name, "nova-exec-user-1--thread-2--agent-3")
+        backend._agent_responds.assert_awaited_once_with("nova-exec-user-1--thread-2--agent-3")
+        backend._ensure_volume.assert_not_awaited()
+        backend._container_exists.assert_not_awaited()
+
+    def test_ensure_session_claims_warm_sandbox_for_new_session(self):
+        with tempfile.TemporaryDirectory() as state_dir:
+            backend = self._build_backend(state_root=Path(state_dir))
+            agent = SimpleNamespace(is_alive=True)
+            spare = WarmSandbox(
+                container_name="nova-exec-pool-abc",
+                volume_name="nova-exec-session-pool-abc",
+                user_id="1",
+                created_at=monotonic(),
             )
-        )
+            backend._warm_pool["1"] = [spare]
+            backend._agents[spare.container_name] = agent
+            backend._run_docker = AsyncMock(return_value="")
+            backend._ensure_volume = AsyncMock()
+            backend._schedule_warm_pool_refill = Mock()
+            selector = ExecSessionSelector(user_id=1, thread_id=2, agent_id=3)
+
+            session = asyncio.run(backend._ensure_session(selector))
+            recorded = asyncio.run(backend._recorded_session(selector))
 
-        backend._write_bytes_into_container.assert_awaited_once_with(
-            "nova-exec-test",
-            Path("/srv/nova-session/workspace/.nova_runner/command.sh"),
-            b"echo test",
+        self.assertEqual(session.container_name, "nova-exec-user-1--thread-2--agent-3")
+        self.assertEqual(session.volume_name, "nova-exec-session-pool-abc")
+        self.assertEqual(recorded, session)
+        backend._run_docker.assert_awaited_once_with(
+            "rename", "nova-exec-pool-abc", "nova-exec-user-1--thread-2--agent-3"
         )
+        backend._ensure_volume.assert_not_awaited()
+        backend._schedule_warm_pool_refill.assert_called_once()
+        self.assertIs(backend._agents["nova-exec-user-1--thread-2--agent-3"], agent)
+        self.assertEqual(backend._warm_pool["1"], [])
 
-    def test_sync_bundle_uses_container_writer_instead_of_docker_cp(self):
+    def test_maintain_warm_pool_expires_idle_spares_and_refills_recent_users(self):
         backend = self._build_backend()
-        backend._write_bytes_into_container = AsyncMock()
-        backend._docker_exec = AsyncMock()
-        session = self._build_session()
+        backend._initialized = True
+        expired = WarmSandbox(
+            container_name="nova-exec-pool-old",
+            volume_name="nova-exec-session-pool-old",
+            user_id="1",
+            created_at=monotonic() - 10_000,
+        )
+        fresh = WarmSandbox(
+            container_name="nova-exec-pool-new",
+            volume_name="nova-exec-session-pool-new",
+            user_id="1",
+            created_at=monotonic(),
+        )
+        backend._warm_pool["1"] = [expired]
+        backend._agents[expired.container_name] = SimpleNamespace(is_alive=True)
+        backend._warm_pool_demand = {"1": monotonic(), "2": monotonic() - 10_000}
+        backend._discard_warm_sandbox = AsyncMock()
+        backend._provision_warm_sandbox = AsyncMock(return_value=fresh)
 
-        asyncio.run(backend._sync_bundle_into_session(session, b"sync-bundle"))
+        summary = asyncio.run(backend.maintain_warm_pool())
 
-        backend._write_bytes_into_container.assert_awaited_once_with(
-            "nova-exec-test",
-            Path("/tmp/nova-sync.tar.gz"),
-            b"sync-bundle",
-        )
-        backend._docker_exec.assert_awaited_once()
+        self.assertEqual(summary, {"warm_sandboxes_created": 1, "warm_sandboxes_removed": 1, "errors": 0})
+        backend._discard_warm_sandbox.assert_awaited_once_with(expired)
+        backend._provision_warm_sandbox.assert_awaited_once_with("1")
+        self.assertEqual(backend._warm_pool["1"], [fresh])
+        self.assertNotIn("2", backend._warm_pool_demand)
 
-    def test_sync_bundle_unlocks_and_replaces_projected_roots_before_extracting(self):
+    def test_remove_container_closes_its_agent(self):
         backend = self._build_backend()
-        backend._write_bytes_into_container = AsyncMock()
-        backend._docker_exec = AsyncMock()
-        session = self._build_session()
+        agent = SimpleNamespace(close=AsyncMock())
+        backend._agents["nova-exec-test"] = agent
+        backend._run_docker = AsyncMock(return_value="")
 
-        asyncio.run(backend._sync_bundle_into_session(session, b"sync-bundle"))
+        self.assertTrue(asyncio.run(backend._remove_container("nova-exec-test")))
 
-        await_args = backend._docker_exec.await_args
-        assert await_args is not None
-        script = str(await_args.args[1])
-        self.assertIn(f'for root in "{WORKSPACE_ROOT_IN_CONTAINER / "skills"}"', script)
-        self.assertIn(f'"{WORKSPACE_ROOT_IN_CONTAINER / "inbox"}"', script)
-        self.assertIn(f'"{WORKSPACE_ROOT_IN_CONTAINER / "history"}"', script)
-        self.assertIn('chmod -R u+w "$root" || true', script)
-        self.assertIn('rm -rf "$root"', script)
-        self.assertIn(f'! -name "{RUNNER_INTERNAL_DIRNAME}"', script)
-        self.assertIn('! -name "skills" ! -name "inbox" ! -name "history"', script)
+        agent.close.assert_awaited_once()
+        self.assertNotIn("nova-exec-test", backend._agents)
+        backend._run_docker.assert_awaited_once_with("rm", "-f", "nova-exec-test")
 
     def test_create_container_includes_no_new_privileges_when_enabled(self):
         backend = self._build_backend(sandbox_no_new_privileges=True)
@@ -356,6 +511,7 @@ class DockerExecRunnerBackendTests(SimpleTestCase):
         backend._remove_container = AsyncMock(return_value=True)
         backend._create_container = AsyncMock()
         backend._ensure_container_running = AsyncMock()
+        backend._schedule_warm_pool_refill = Mock()
 
         session = asyncio.run(backend._ensure_session(ExecSessionSelector(user_id=1, thread_id=2, agent_id=3)))
 
@@ -363,6 +519,7 @@ class DockerExecRunnerBackendTests(SimpleTestCase):
         backend._remove_container.assert_awaited_once_with("nova-exec-user-1--thread-2--agent-3")
         backend._create_container.assert_awaited_once()
         backend._ensure_container_running.assert_not_awaited()
+        backend._schedule_warm_pool_refill.assert_called_once()
 
     def test_delete_sessions_for_thread_removes_matching_resources(self):
         with tempfile.TemporaryDirectory() as state_dir:
@@ -499,19 +656,173 @@ class DockerExecRunnerBackendTests(SimpleTestCase):
         self.assertFalse(created)
         backend._run_docker.assert_not_awaited()
 
-    def test_cleanup_processes_excludes_its_own_shell(self):
-        backend = self._build_backend()
-        backend._docker_exec = AsyncMock(return_value=None)
 
-        asyncio.run(backend._cleanup_processes("nova-exec-test"))
+class SandboxAgentTests(SimpleTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.workspace = Path(self._tmp.name)
+        self.internal_root = self.workspace / RUNNER_INTERNAL_DIRNAME
+        self.internal_root.mkdir()
+
+    def tearDown(self):
+        # Projected roots are left read-only by the agent.
+        for current_root, _dirnames, _filenames in os.walk(self.workspace):
+            os.chmod(current_root, 0o755)
+        self._tmp.cleanup()
+
+    def _start_agent(self):
+        return SandboxAgentConnection.start(
+            [
+                sys.executable,
+                "-c",
+                _SANDBOX_AGENT_SCRIPT,
+                str(self.workspace),
+                RUNNER_INTERNAL_DIRNAME,
+                str(self.internal_root / "manifest.json"),
+            ]
+        )
 
-        await_args = backend._docker_exec.await_args
-        assert await_args is not None
-        self.assertEqual(await_args.args[0], "nova-exec-test")
-        cleanup_script = await_args.args[1]
-        self.assertIn("self_pid=$$", cleanup_script)
-        self.assertIn("$1 != 1 && $1 != self", cleanup_script)
-        self.assertTrue(cleanup_script.endswith("exit 0"))
+    def _run(self, scenario):
+        async def runner():
+            agent = await self._start_agent()
+            try:
+                return await scenario(agent)
+            finally:
+                await agent.close()
+
+        return asyncio.run(runner())
+
+    def _manifest(self) -> dict:
+        return json.loads((self.internal_root / "manifest.json").read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _bundle(files: dict[str, bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for name, content in files.items():
+                info = tarfile.TarInfo(name=name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+        return buffer.getvalue()
+
+    def _exec(self, agent, script: str, **params):
+        return agent.request(
+            "exec",
+            timeout=30,
+            payload=script.encode("utf-8"),
+            command_path=str(self.internal_root / "command.sh"),
+            cwd_path=str(self.internal_root / "cwd.txt"),
+            command_timeout=params.pop("command_timeout", 20),
+            **params,
+        )
+
+    def test_exec_and_diff_report_only_changed_paths_over_one_connection(self):
+        bundle = self._bundle({"inbox/data.bin": b"x" * 4096, "script.py": b"print(1)\n", "old.txt": b"old"})
+        cwd_path = self.internal_root / "cwd.txt"
+
+        async def scenario(agent):
+            await agent.request("sync", timeout=30, payload=bundle, mode="full")
+            manifest = self._manifest()
+            # A stale digest with matching size and mtime is trusted, not recomputed.
+            manifest["files"]["/inbox/data.bin"]["sha256"] = "cached"
+            (self.internal_root / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+            exec_reply = await self._exec(
+                agent,
+                f'cd "{self.workspace}" && rm old.txt && echo a,b > result.csv && echo done '
+                f'&& echo oops >&2 && pwd > "{cwd_path}"; exit 4',
+            )
+            return exec_reply, await agent.request("diff", timeout=30)
+
+        (exec_meta, output), (metadata, diff_bundle) = self._run(scenario)
+
+        self.assertEqual(exec_meta["status"], 4)
+        self.assertEqual(exec_meta["cwd"].strip(), str(self.workspace))
+        self.assertEqual(output[: exec_meta["stdout_size"]], b"done\n")
+        self.assertTrue(output[exec_meta["stdout_size"]:].endswith(b"oops\n"))
+        self.assertEqual(os.stat(self.workspace / "inbox" / "data.bin").st_mode & 0o222, 0)
+        self.assertEqual(metadata["changed_paths"], ["/result.csv"])
+        self.assertEqual(metadata["removed_paths"], ["/old.txt"])
+        self.assertNotIn("/inbox", metadata["directory_paths"])
+        self.assertEqual(self._manifest()["files"]["/inbox/data.bin"]["sha256"], "cached")
+        with tarfile.open(fileobj=io.BytesIO(diff_bundle), mode="r:gz") as archive:
+            self.assertEqual(archive.getnames(), ["result.csv"])
+
+    def test_delta_sync_updates_changed_files_and_rejects_stale_base(self):
+        initial = self._bundle({"keep.txt": b"keep", "edit.txt": b"v1", "gone/file.txt": b"bye"})
+        delta = self._bundle({"edit.txt": b"v2", "new/added.txt": b"added"})
+
+        async def scenario(agent):
+            await agent.request("sync", timeout=30, payload=initial, mode="full")
+            reply, _payload = await agent.request("manifest", timeout=30)
+            with self.assertRaises(ExecRunnerSyncConflict):
+                await agent.request("sync", timeout=30, payload=delta, mode="delta", base_manifest_digest="stale")
+            self.assertEqual((self.workspace / "edit.txt").read_text(encoding="utf-8"), "v1")
+            await agent.request(
+                "sync",
+                timeout=30,
+                payload=delta,
+                mode="delta",
+                base_manifest_digest=manifest_digest(reply["files"]),
+                removed_paths=["/gone/file.txt"],
+                directory_paths=["/new"],
+            )
+
+        self._run(scenario)
+
+        self.assertEqual((self.workspace / "edit.txt").read_text(encoding="utf-8"), "v2")
+        self.assertEqual((self.workspace / "keep.txt").read_text(encoding="utf-8"), "keep")
+        self.assertFalse((self.workspace / "gone").exists())
+        manifest_files = self._manifest()["files"]
+        self.assertEqual(sorted(manifest_files), ["/edit.txt", "/keep.txt", "/new/added.txt"])
+        self.assertEqual(manifest_files["/edit.txt"]["sha256"], hashlib.sha256(b"v2").hexdigest())
+
+    def test_timed_out_command_keeps_agent_usable(self):
+        target = self.internal_root / "env.json"
+
+        async def scenario(agent):
+            with self.assertRaisesMessage(ExecRunnerError, "The sandbox command timed out."):
+                await self._exec(agent, "sleep 30", command_timeout=0.2)
+            await agent.request("write_file", timeout=30, payload=b"{}", path=str(target))
+            missing, _payload = await agent.request("read_file", timeout=30, path=str(self.workspace / "none"))
+            return agent.is_alive, missing, await agent.request("read_file", timeout=30, path=str(target))
+
+        alive, missing, (found, content) = self._run(scenario)
+
+        self.assertTrue(alive)
+        self.assertFalse(missing["exists"])
+        self.assertTrue(found["exists"])
+        self.assertEqual(content, b"{}")
+
+    def test_command_killing_the_agent_leaves_its_result_for_a_new_agent(self):
+        cwd_path = self.internal_root / "cwd.txt"
+        # Same effect as `pkill -f python` in the sandbox, limited to this test's agent.
+        script = (
+            "echo before\n"
+            'kill -9 "$(cut -d" " -f4 /proc/$PPID/stat)"\n'
+            "sleep 0.2\n"
+            f'echo after && pwd > "{cwd_path}"\n'
+            "exit 3\n"
+        )
+
+        async def scenario(agent):
+            with self.assertRaises(SandboxAgentStopped):
+                await self._exec(agent, f'cd "{self.workspace}"\n{script}')
+            replacement = await self._start_agent()
+            try:
+                return await replacement.request(
+                    "exec_result",
+                    timeout=30,
+                    command_path=str(self.internal_root / "command.sh"),
+                    cwd_path=str(cwd_path),
+                )
+            finally:
+                await replacement.close()
+
+        exec_meta, output = self._run(scenario)
+
+        self.assertEqual(exec_meta["status"], 3)
+        self.assertEqual(exec_meta["cwd"].strip(), str(self.workspace))
+        self.assertEqual(output[: exec_meta["stdout_size"]], b"before\nafter\n")
 
 
 class ExecRunnerSharedTests(SimpleTestCase):
@@ -639,12 +950,9 @@ class ExecRunnerSharedTests(SimpleTestCase):
             )
         )
         backend._load_persisted_env = AsyncMock(return_value={})
-        backend._write_text_into_container = AsyncMock()
-        backend._docker_exec_capture = AsyncMock(
-            return_value=("", "", 0)
+        backend._agent_request = AsyncMock(
+            return_value=({"ok": True, "status": 0, "cwd": str(WORKSPACE_ROOT_IN_CONTAINER), "stdout_size": 0}, b"")
         )
-        backend._cleanup_processes = AsyncMock()
-        backend._read_text_from_container = AsyncMock(return_value=str(WORKSPACE_ROOT_IN_CONTAINER))
 
         asyncio.run(
             backend._run_session_command(
@@ -661,16 +969,66 @@ class ExecRunnerSharedTests(SimpleTestCase):
             )
         )
 
-        await_calls = backend._write_text_into_container.await_args_list
-        self.assertGreaterEqual(len(await_calls), 2)
-        self.assertEqual(await_calls[0].args[1], SITECUSTOMIZE_PATH)
-        self.assertIn("_nova_install_python_workspace_shims", await_calls[0].args[2])
-        command_script = await_calls[1].args[2]
+        await_calls = backend._agent_request.await_args_list
+        self.assertEqual([call.args[1] for call in await_calls], ["write_file", "exec"])
+        self.assertEqual(await_calls[0].kwargs["path"], str(SITECUSTOMIZE_PATH))
+        self.assertIn(b"_nova_install_python_workspace_shims", await_calls[0].kwargs["payload"])
+        self.assertTrue(await_calls[1].kwargs["reap_processes"])
+        command_script = await_calls[1].kwargs["payload"].decode("utf-8")
         self.assertIn('export NOVA_WORKSPACE_ROOT="/srv/nova-session/workspace"', command_script)
         self.assertIn('export PYTHONPATH="/srv/nova-session/workspace/.nova_runner"', command_script)
         self.assertIn("unset NOVA_WORKSPACE_ROOT", command_script)
         self.assertIn("unset PYTHONPATH", command_script)
 
+    def test_run_session_command_collects_result_after_the_command_kills_the_agent(self):
+        backend = DockerExecRunnerBackend(
+            ExecRunnerConfig(
+                shared_token="runner-token",
+                state_root=Path("/tmp/nova-exec-runner-tests"),
+                session_ttl_seconds=14400,
+                gc_interval_seconds=900,
+                sandbox_image="amairesse/nova:latest",
+                sandbox_network="nova_exec-sandbox-net",
+                sandbox_memory_limit_mb=1024,
+                sandbox_cpu_limit="1.0",
+                sandbox_pids_limit=256,
+                sandbox_no_new_privileges=True,
+                max_sync_bytes=50 * 1024 * 1024,
+                max_diff_bytes=50 * 1024 * 1024,
+                proxy_url="http://exec-runner:8091",
+                cache_max_bytes=5 * 1024 * 1024 * 1024,
+                cache_target_bytes=3 * 1024 * 1024 * 1024,
+                cache_max_age_days=14,
+            )
+        )
+        backend._load_persisted_env = AsyncMock(return_value={})
+        backend._agent_request = AsyncMock(
+            side_effect=[
+                SandboxAgentStopped("The sandbox agent stopped responding."),
+                ({"ok": True, "status": 0, "cwd": str(WORKSPACE_ROOT_IN_CONTAINER), "stdout_size": 5}, b"done\n"),
+            ]
+        )
+
+        result = asyncio.run(
+            backend._run_session_command(
+                ExecSession(
+                    selector=ExecSessionSelector(user_id=1, thread_id=2, agent_id=3),
+                    container_name="nova-exec-test",
+                    volume_name="nova-exec-session-test",
+                    metadata_dir=Path("/tmp/nova-exec-runner-tests/sessions/test"),
+                    metadata_path=Path("/tmp/nova-exec-runner-tests/sessions/test/session.json"),
+                ),
+                command="pkill -f python; echo done",
+                cwd="/",
+            )
+        )
+
+        self.assertEqual(result.stdout, "done\n")
+        exec_call, result_call = backend._agent_request.await_args_list
+        self.assertEqual([exec_call.args[1], result_call.args[1]], ["exec", "exec_result"])
+        self.assertEqual(result_call.kwargs["command_path"], str(COMMAND_PATH))
+        self.assertTrue(result_call.kwargs["reap_processes"])
+
     def test_run_session_command_does_not_install_python_workspace_sitecustomize_for_non_python_commands(self):
         backend = DockerExecRunnerBackend(
             ExecRunnerConfig(
@@ -693,12 +1051,9 @@ class ExecRunnerSharedTests(SimpleTestCase):
             )
         )
         backend._load_persisted_env = AsyncMock(return_value={})
-        backend._write_text_into_container = AsyncMock()
-        backend._docker_exec_capture = AsyncMock(
-            return_value=("", "", 0)
+        backend._agent_request = AsyncMock(
+            return_value=({"ok": True, "status": 0, "cwd": str(WORKSPACE_ROOT_IN_CONTAINER), "stdout_size": 0}, b"")
         )
-        backend._cleanup_processes = AsyncMock()
-        backend._read_text_from_container = AsyncMock(return_value=str(WORKSPACE_ROOT_IN_CONTAINER))
 
         asyncio.run(
             backend._run_session_command(
@@ -715,9 +1070,10 @@ class ExecRunnerSharedTests(SimpleTestCase):
             )
         )
 
-        await_calls = backend._write_text_into_container.await_args_list
+        await_calls = backend._agent_request.await_args_list
         self.assertEqual(len(await_calls), 1)
-        self.assertEqual(await_calls[0].args[1].name, "command.sh")
-        command_script = await_calls[0].args[2]
+        self.assertEqual(await_calls[0].kwargs["command_path"], str(COMMAND_PATH))
+        self.assertEqual(await_calls[0].kwargs["cwd_path"], str(CWD_PATH))
+        command_script = await_calls[0].kwargs["payload"].decode("utf-8")
         self.assertNotIn("NOVA_WORKSPACE_ROOT", command_script)
         self.assertNotIn("sitecustomize.py", command_script)
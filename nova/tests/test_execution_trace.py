@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from copy import deepcopy
 from types import SimpleNamespace
 from unittest import TestCase
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from uuid import UUID
 
-from nova.tasks.execution_trace import TaskExecutionTraceHandler
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase
+
+from nova.models.Task import Task, TaskStatus, TaskTraceEvent
+from nova.models.Thread import Thread
+from nova.tasks.execution_trace import TaskExecutionTraceHandler, load_execution_trace
 
 
 class TaskExecutionTraceHandlerTests(IsolatedAsyncioTestCase):
@@ -149,20 +156,17 @@ class TaskExecutionTraceHandlerTests(IsolatedAsyncioTestCase):
 
 
 class TaskExecutionTraceHandlerCrossLoopTests(TestCase):
-    @patch("nova.models.Task.Task.objects.filter")
-    def test_tool_callbacks_remain_safe_across_event_loops(self, mock_filter):
+    @patch("nova.models.Task.TaskTraceEvent.objects.bulk_create")
+    def test_tool_callbacks_remain_safe_across_event_loops(self, mock_bulk_create):
         update_started = threading.Event()
         release_update = threading.Event()
 
-        mock_qs = MagicMock()
-
-        def slow_update(**kwargs):
+        def slow_bulk_create(events):
             update_started.set()
             release_update.wait(timeout=2.0)
-            return 1
+            return events
 
-        mock_qs.update.side_effect = slow_update
-        mock_filter.return_value = mock_qs
+        mock_bulk_create.side_effect = slow_bulk_create
 
         task = SimpleNamespace(id=903, execution_trace={})
         handler = TaskExecutionTraceHandler(task)
@@ -194,3 +198,60 @@ class TaskExecutionTraceHandlerCrossLoopTests(TestCase):
 
         self.assertEqual(errors, [])
         self.assertEqual(task.execution_trace["summary"]["tool_calls"], 1)
+
+
+class TaskExecutionTraceEventLogTests(TransactionTestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="trace-user", password="pass")
+        thread = Thread.objects.create(user=user, subject="Traced")
+        self.task = Task.objects.create(user=user, thread=thread, status=TaskStatus.RUNNING)
+
+    def test_running_trace_is_appended_as_events_and_compacted_on_completion(self):
+        handler = TaskExecutionTraceHandler(self.task)
+
+        async def run_tools():
+            await handler.ensure_root_run(label="Planner")
+            await handler.on_tool_start({"name": "web_search"}, '{"query": "nova"}', run_id=UUID(int=1))
+            await handler.on_tool_end({"result": "ok"}, run_id=UUID(int=1))
+            subagent_node_id = await handler.start_subagent(label="Delegate")
+            child_handler = handler.clone_for_parent(parent_node_id=subagent_node_id)
+            await child_handler.on_tool_start({"name": "web_fetch"}, "{}", run_id=UUID(int=2))
+            await child_handler.on_tool_error(RuntimeError("timeout"), run_id=UUID(int=2))
+
+        async_to_sync(run_tools)()
+
+        # One event per changed node; the trace column is not rewritten.
+        self.assertEqual(TaskTraceEvent.objects.filter(task=self.task).count(), 7)
+        stored = Task.objects.get(id=self.task.id)
+        self.assertEqual(stored.execution_trace, {})
+
+        live_trace = deepcopy(self.task.execution_trace)
+        self.assertEqual(load_execution_trace(stored), live_trace)
+        subagent = live_trace["root"]["children"][1]
+        self.assertEqual(subagent["children"][0]["children"][0]["type"], "error")
+        self.assertEqual(live_trace["summary"]["tool_calls"], 2)
+        self.assertEqual(live_trace["summary"]["error_count"], 1)
+
+        async_to_sync(handler.complete_root_run)("Done")
+
+        stored.refresh_from_db()
+        self.assertFalse(TaskTraceEvent.objects.filter(task=self.task).exists())
+        self.assertEqual(stored.execution_trace["root"]["status"], "completed")
+        self.assertEqual(stored.execution_trace, self.task.execution_trace)
+
+    def test_new_handler_resumes_from_column_and_pending_events(self):
+        first_handler = TaskExecutionTraceHandler(self.task)
+        async_to_sync(first_handler.ensure_root_run)(label="Planner")
+        async_to_sync(first_handler.mark_root_awaiting_input)()
+        async_to_sync(first_handler.ensure_root_run)(label="Planner", resumed=True)
+        node_id = async_to_sync(first_handler.start_model_call)(label="Model call")
+
+        stored = Task.objects.get(id=self.task.id)
+        resumed_handler = TaskExecutionTraceHandler(stored)
+        async_to_sync(resumed_handler.complete_model_call)(node_id, output_preview="Answer")
+
+        trace = load_execution_trace(Task.objects.get(id=self.task.id))
+        self.assertTrue(trace["root"]["meta"]["resumed"])
+        self.assertEqual([node["id"] for node in trace["root"]["children"]], [node_id])
+        self.assertEqual(trace["root"]["children"][0]["status"], "completed")
+        self.assertEqual(trace["root"]["children"][0]["output_preview"], "Answer")
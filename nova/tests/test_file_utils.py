@@ -1,10 +1,13 @@
 # nova/tests/test_file_utils.py
-from unittest.mock import AsyncMock, patch
+import asyncio
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
 from django.contrib.auth import get_user_model
 
 from nova.tests.base import BaseTestCase
 from nova.file_utils import (
     detect_mime, sanitize_user_path, upload_file_to_minio,
+    upload_stream_to_minio, iter_file_content,
     auto_rename_path, build_virtual_tree,
     check_thread_access, batch_upload_files,
     MAX_FILE_SIZE, MULTIPART_THRESHOLD
@@ -110,11 +113,11 @@ class FileUtilsTest(BaseTestCase):
         sanitized = sanitize_user_path('')
         self.assertEqual(sanitized, '/')
 
-    @patch('nova.file_utils.aioboto3.Session')
-    async def test_upload_file_to_minio_small_file(self, mock_session):
+    @patch('nova.file_utils.get_async_s3_client', new_callable=AsyncMock)
+    async def test_upload_file_to_minio_small_file(self, mock_get_client):
         """Test uploading small file to MinIO."""
         mock_s3_client = AsyncMock()
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_s3_client
+        mock_get_client.return_value = mock_s3_client
 
         content = b'small file content'
         path = '/test.txt'
@@ -129,11 +132,11 @@ class FileUtilsTest(BaseTestCase):
             **{'ContentType': mime}
         )
 
-    @patch('nova.file_utils.aioboto3.Session')
-    async def test_upload_file_to_minio_large_file(self, mock_session):
+    @patch('nova.file_utils.get_async_s3_client', new_callable=AsyncMock)
+    async def test_upload_file_to_minio_large_file(self, mock_get_client):
         """Test uploading large file with multipart upload."""
         mock_s3_client = AsyncMock()
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_s3_client
+        mock_get_client.return_value = mock_s3_client
 
         # Create content larger than MULTIPART_THRESHOLD
         content = b'x' * (MULTIPART_THRESHOLD + 1)
@@ -154,11 +157,11 @@ class FileUtilsTest(BaseTestCase):
         mock_s3_client.create_multipart_upload.assert_called_once()
         mock_s3_client.complete_multipart_upload.assert_called_once()
 
-    @patch('nova.file_utils.aioboto3.Session')
-    async def test_upload_file_to_minio_error(self, mock_session):
+    @patch('nova.file_utils.get_async_s3_client', new_callable=AsyncMock)
+    async def test_upload_file_to_minio_error(self, mock_get_client):
         """Test upload error handling."""
         mock_s3_client = AsyncMock()
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_s3_client
+        mock_get_client.return_value = mock_s3_client
         mock_s3_client.put_object.side_effect = Exception("S3 error")
 
         content = b'content'
@@ -170,6 +173,101 @@ class FileUtilsTest(BaseTestCase):
                 await upload_file_to_minio(content, path, mime, self.thread, self.user)
             self.assertIn("Error uploading to MinIO", cm.output[0])
 
+    @patch('nova.file_utils.MULTIPART_PART_SIZE', 4)
+    @patch('nova.file_utils.get_async_s3_client', new_callable=AsyncMock)
+    async def test_upload_stream_to_minio_uploads_parts_concurrently(self, mock_get_client):
+        """Test streaming upload re-chunks an async iterator and bounds in-flight parts."""
+        mock_s3_client = AsyncMock()
+        mock_get_client.return_value = mock_s3_client
+        mock_s3_client.create_multipart_upload.return_value = {'UploadId': 'stream-upload'}
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_upload_part(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'ETag': f'"etag-{kwargs["PartNumber"]}"'}
+
+        mock_s3_client.upload_part.side_effect = fake_upload_part
+
+        async def chunks():
+            for chunk in (b'ab', b'cdef', b'ghijk', b'lm'):
+                yield chunk
+
+        key, size = await upload_stream_to_minio(
+            chunks(), '/stream.bin', 'application/octet-stream', self.thread, self.user,
+            part_size=4, concurrency=2,
+        )
+
+        self.assertEqual(key, f"users/{self.user.id}/threads/{self.thread.id}/stream.bin")
+        self.assertEqual(size, 13)
+        bodies = [call.kwargs['Body'] for call in mock_s3_client.upload_part.call_args_list]
+        self.assertEqual(bodies, [b'abcd', b'efgh', b'ijkl', b'm'])
+        self.assertLessEqual(max_in_flight, 2)
+        completed = mock_s3_client.complete_multipart_upload.call_args.kwargs['MultipartUpload']['Parts']
+        self.assertEqual([part['PartNumber'] for part in completed], [1, 2, 3, 4])
+        mock_s3_client.put_object.assert_not_called()
+
+    @patch('nova.file_utils.MULTIPART_PART_SIZE', 4)
+    @patch('nova.file_utils.get_async_s3_client', new_callable=AsyncMock)
+    async def test_upload_stream_to_minio_aborts_multipart_upload_on_part_failure(self, mock_get_client):
+        """Test failed parts abort the multipart upload."""
+        mock_s3_client = AsyncMock()
+        mock_get_client.return_value = mock_s3_client
+        mock_s3_client.create_multipart_upload.return_value = {'UploadId': 'broken-upload'}
+        mock_s3_client.upload_part.side_effect = Exception("S3 error")
+
+        with self.assertLogs('nova.file_utils', level='ERROR'):
+            with self.assertRaises(Exception):
+                await upload_stream_to_minio(
+                    io.BytesIO(b'x' * 12), '/broken.bin', 'application/octet-stream',
+                    self.thread, self.user, part_size=4,
+                )
+
+        mock_s3_client.abort_multipart_upload.assert_called_once()
+        mock_s3_client.complete_multipart_upload.assert_not_called()
+
+    @patch('nova.file_utils.get_async_s3_client', new_callable=AsyncMock)
+    async def test_upload_stream_to_minio_uses_single_put_for_small_file_objects(self, mock_get_client):
+        """Test a stream that fits in one part is sent with put_object."""
+        mock_s3_client = AsyncMock()
+        mock_get_client.return_value = mock_s3_client
+
+        key, size = await upload_stream_to_minio(
+            io.BytesIO(b'small'), '/small.txt', 'text/plain', self.thread, self.user,
+        )
+
+        self.assertEqual(size, 5)
+        mock_s3_client.put_object.assert_called_once_with(
+            Bucket='test-bucket', Key=key, Body=b'small', ContentType='text/plain',
+        )
+        mock_s3_client.create_multipart_upload.assert_not_called()
+
+    @patch('nova.file_utils.get_async_s3_client', new_callable=AsyncMock)
+    async def test_iter_file_content_requests_inclusive_byte_range(self, mock_get_client):
+        """Test ranged download passes an HTTP Range and streams body chunks."""
+        async def iter_chunks(chunk_size):
+            yield b'hel'
+            yield b'lo'
+
+        body = MagicMock()
+        body.__aenter__ = AsyncMock(return_value=body)
+        body.__aexit__ = AsyncMock(return_value=False)
+        body.iter_chunks = iter_chunks
+        mock_s3_client = AsyncMock()
+        mock_s3_client.get_object.return_value = {'Body': body}
+        mock_get_client.return_value = mock_s3_client
+
+        chunks = [chunk async for chunk in iter_file_content('users/1/file.txt', 10, 14)]
+
+        self.assertEqual(chunks, [b'hel', b'lo'])
+        mock_s3_client.get_object.assert_called_once_with(
+            Bucket='test-bucket', Key='users/1/file.txt', Range='bytes=10-14',
+        )
+
     async def test_auto_rename_path_no_conflict(self):
         """Test auto-rename when no conflict exists."""
         path = await auto_rename_path(self.thread, '/newfile.txt')
@@ -335,6 +433,40 @@ class FileUtilsTest(BaseTestCase):
         self.assertEqual(created[0]['path'], '/test.txt')
         self.assertEqual(created[0]['request_id'], 'spec-1')
 
+    @patch('nova.file_utils.upload_file_to_minio')
+    @patch('nova.file_utils.upload_stream_to_minio')
+    @patch('nova.file_utils.auto_rename_path')
+    async def test_batch_upload_files_streams_source_items(self, mock_auto_rename, mock_stream, mock_upload):
+        """Items carrying a file object are streamed instead of read into memory."""
+        import hashlib
+
+        mock_auto_rename.return_value = '/notes.txt'
+        received = []
+
+        async def fake_stream(chunks, path, mime, thread, user):
+            async for chunk in chunks:
+                received.append(chunk)
+            return 'streamed-key', sum(len(chunk) for chunk in received)
+
+        mock_stream.side_effect = fake_stream
+        payload = b'hello streamed world\n' * 10
+
+        created, errors = await batch_upload_files(self.thread, self.user, [{
+            'path': '/notes.txt',
+            'source': io.BytesIO(payload),
+            'size': len(payload),
+        }])
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(created), 1)
+        self.assertEqual(b''.join(received), payload)
+        mock_upload.assert_not_called()
+        self.assertEqual(mock_stream.call_args.args[2], 'text/plain')
+        user_file = await UserFile.objects.aget(id=created[0]['id'])
+        self.assertEqual(user_file.key, 'streamed-key')
+        self.assertEqual(user_file.size, len(payload))
+        self.assertEqual(user_file.content_sha256, hashlib.sha256(payload).hexdigest())
+
     @patch('nova.file_utils.upload_file_to_minio')
     @patch('nova.file_utils.auto_rename_path')
     @patch('nova.file_utils.detect_mime')
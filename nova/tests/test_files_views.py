@@ -147,6 +147,8 @@ class FilesViewsTests(TestCase):
         file_specs = mocked_batch_upload.await_args.args[2]
         self.assertEqual(file_specs[0]["path"], "/a.bin")
         self.assertEqual(file_specs[0]["mime_type"], "application/x-custom")
+        self.assertNotIn("content", file_specs[0])
+        self.assertEqual(file_specs[0]["size"], file_specs[0]["source"].size)
         mocked_publish_update.assert_awaited_once()
 
     @patch("nova.views.files_views.batch_upload_files", new_callable=AsyncMock)
@@ -167,7 +169,7 @@ class FilesViewsTests(TestCase):
         self.assertEqual(response.status_code, 403)
         self.assertIn("error", response.json())
 
-    @patch("nova.models.UserFile.boto3.client")
+    @patch("nova.models.UserFile.get_s3_client")
     @patch("nova.views.files_views.async_to_sync")
     def test_file_delete_success(self, mocked_async_to_sync, mocked_client):
         mocked_s3 = MagicMock()
@@ -3,6 +3,10 @@ from __future__ import annotations
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, patch
 
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
 import nova.llm.hybrid_search as hybrid_search
 
 
@@ -29,3 +33,12 @@ class ResolveQueryVectorTests(IsolatedAsyncioTestCase):
         self.assertIsNone(result)
         mocked_compute.assert_awaited_once_with("deploy", user_id=7)
         self.assertIn("Falling back to lexical search", "\n".join(logs.output))
+
+
+class AnnSearchTests(TestCase):
+    def test_runs_inside_atomic_block_without_postgres_settings(self):
+        with CaptureQueriesContext(connection) as queries:
+            with hybrid_search.ann_search(candidate_limit=200):
+                self.assertTrue(connection.in_atomic_block)
+
+        self.assertFalse(any("set_config" in query["sql"] for query in queries.captured_queries))
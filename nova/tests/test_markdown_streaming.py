@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase
+
+from nova.markdown_streaming import IncrementalMarkdownRenderer
+from nova.utils import markdown_to_html
+
+_DOCUMENT = """# Title
+
+Intro paragraph with **bold**
+and a second line.
+
+- one
+- two
+
+- three loose
+  continued
+
+1. first
+2. second
+
+> quote one
+
+> quote two
+
+```python
+def f():
+
+    return 1
+```
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+Final paragraph.
+"""
+
+
+class IncrementalMarkdownRendererTests(SimpleTestCase):
+    def _stream(self, text: str, step: int) -> IncrementalMarkdownRenderer:
+        renderer = IncrementalMarkdownRenderer()
+        for start in range(0, len(text), step):
+            renderer.feed(text[start:start + step])
+            renderer.update()
+        return renderer
+
+    def test_incremental_render_matches_full_render(self):
+        for step in (1, 4, 9):
+            with self.subTest(step=step):
+                renderer = self._stream(_DOCUMENT, step)
+
+                self.assertEqual(renderer.render(), markdown_to_html(_DOCUMENT))
+                self.assertEqual(len(renderer.stable_blocks), 6)
+
+    def test_blank_lines_inside_lists_quotes_and_fences_do_not_close_block(self):
+        renderer = self._stream("- a\n\n- b\n\n> c\n\n> d\n\n```\nx\n\ny\n```\n\ntail", 1)
+
+        self.assertEqual(len(renderer.stable_blocks), 2)
+        self.assertIn("<li>\n<p>b</p>", renderer.stable_blocks[0])
+        self.assertIn("<p>d</p>", renderer.stable_blocks[1])
+        # The open block closes only once the next line is complete.
+        self.assertIn("x\n\ny", renderer.render_tail())
+
+    def test_reference_definition_falls_back_to_full_render(self):
+        text = "See [the docs][docs].\n\nMore text.\n\n[docs]: https://example.com\n"
+        renderer = self._stream(text, 3)
+
+        self.assertTrue(renderer.full_render)
+        self.assertEqual(renderer.generation, 1)
+        self.assertEqual(renderer.stable_blocks, [])
+        self.assertIn('href="https://example.com"', renderer.render())
@@ -188,6 +188,38 @@ class MemoryDocumentServiceTests(TestCase):
         self.assertIn("Deadline is Friday", result["results"][0]["snippet"])
         mocked_provider.assert_awaited()
 
+    @patch("nova.memory.service.resolve_query_vector", new_callable=AsyncMock)
+    @patch("nova.memory.service.aget_embeddings_provider", new_callable=AsyncMock, return_value=None)
+    def test_search_memory_items_ranks_semantic_hits_from_vector_index_on_sqlite(
+        self,
+        mocked_provider,
+        mocked_query_vector,
+    ):
+        async_to_sync(write_memory_document)(
+            user=self.user,
+            path="/memory/travel.md",
+            text="# Travel\n\n## Flights\nBooked a plane to Lisbon",
+        )
+        async_to_sync(write_memory_document)(
+            user=self.user,
+            path="/memory/food.md",
+            text="# Food\n\n## Dinner\nPasta on Thursday",
+        )
+        travel_vector = [1.0] + [0.0] * 1023
+        food_vector = [0.0, 1.0] + [0.0] * 1022
+        for path, vector in (("/memory/travel.md", travel_vector), ("/memory/food.md", food_vector)):
+            MemoryChunkEmbedding.objects.filter(chunk__document__virtual_path=path).update(
+                state=MemoryChunkEmbeddingState.READY,
+                vector=vector,
+            )
+        mocked_query_vector.return_value = travel_vector
+
+        result = async_to_sync(search_memory_items)(query="airline trip", user=self.user)
+
+        self.assertEqual(result["results"][0]["path"], "/memory/travel.md")
+        self.assertTrue(result["results"][0]["signals"]["semantic"])
+        self.assertAlmostEqual(result["results"][0]["score"]["cosine_distance"], 0.0, places=5)
+
     @patch("nova.memory.service.aget_embeddings_provider", new_callable=AsyncMock, return_value=None)
     def test_large_markdown_documents_are_split_into_multiple_chunks(self, mocked_provider):
         large_paragraph = " ".join(f"word-{index}" for index in range(700))
@@ -208,12 +240,55 @@ class MemoryDocumentServiceTests(TestCase):
         self.assertTrue(all(chunk.token_count > 0 for chunk in chunks))
         mocked_provider.assert_awaited()
 
-    @patch("nova.tasks.memory_tasks.compute_memory_chunk_embedding_task.delay")
+    @patch("nova.tasks.embedding_queue_tasks.enqueue_embedding_drain", return_value=True)
+    @patch("nova.memory.service.aget_embeddings_provider", new_callable=AsyncMock)
+    def test_rewriting_memory_document_keeps_unchanged_chunks_and_embeddings(self, mocked_provider, mocked_drain):
+        mocked_provider.return_value = object()
+        async_to_sync(write_memory_document)(
+            user=self.user,
+            path="/memory/plan.md",
+            text="# Plan\n\n## Goals\nShip v2\n\n## Risks\nHiring is slow\n\n## Budget\nApproved",
+        )
+        original = {
+            chunk.heading: chunk
+            for chunk in MemoryChunk.objects.filter(document__virtual_path="/memory/plan.md", status="active")
+        }
+        MemoryChunkEmbedding.objects.filter(chunk__in=original.values()).update(
+            state=MemoryChunkEmbeddingState.READY,
+            vector=[0.1] * 1024,
+        )
+        mocked_drain.reset_mock()
+
+        async_to_sync(write_memory_document)(
+            user=self.user,
+            path="/memory/plan.md",
+            text="# Plan\n\n## Objectives\nShip v2\n\n## Risks\nHiring is faster now\n\n## Budget\nApproved",
+        )
+
+        active = {
+            chunk.heading: chunk
+            for chunk in MemoryChunk.objects.filter(
+                document__virtual_path="/memory/plan.md",
+                status="active",
+            ).select_related("embedding")
+        }
+        self.assertEqual(set(active), {"Objectives", "Risks", "Budget"})
+        self.assertEqual(active["Objectives"].id, original["Goals"].id)
+        self.assertEqual(active["Objectives"].anchor, "objectives")
+        self.assertEqual(active["Budget"].id, original["Budget"].id)
+        self.assertEqual(active["Budget"].embedding.state, MemoryChunkEmbeddingState.READY)
+        self.assertNotEqual(active["Risks"].id, original["Risks"].id)
+        self.assertEqual(active["Risks"].embedding.state, MemoryChunkEmbeddingState.PENDING)
+        original["Risks"].refresh_from_db()
+        self.assertEqual(original["Risks"].status, "archived")
+        mocked_drain.assert_called_once_with(self.user.id)
+
+    @patch("nova.tasks.embedding_queue_tasks.enqueue_embedding_drain", return_value=True)
     @patch("nova.memory.service.aget_embeddings_provider", new_callable=AsyncMock)
     def test_write_memory_document_creates_embeddings_and_queues_immediately_when_provider_is_available(
         self,
         mocked_provider,
-        mocked_delay,
+        mocked_drain,
     ):
         mocked_provider.return_value = object()
 
@@ -234,16 +309,15 @@ class MemoryDocumentServiceTests(TestCase):
         self.assertEqual(len(chunks), 1)
         self.assertEqual(len(embeddings), 1)
         self.assertEqual(embeddings[0].state, MemoryChunkEmbeddingState.PENDING)
-        self.assertEqual(mocked_delay.call_count, 1)
-        self.assertEqual(mocked_delay.call_args.args[0], chunks[0].id)
+        mocked_drain.assert_called_once_with(self.user.id)
         self.assertEqual(written.warnings, ())
 
-    @patch("nova.tasks.memory_tasks.compute_memory_chunk_embedding_task.delay")
+    @patch("nova.tasks.embedding_queue_tasks.enqueue_embedding_drain")
     @patch("nova.memory.service.aget_embeddings_provider", new_callable=AsyncMock, return_value=None)
     def test_write_memory_document_creates_pending_embeddings_without_immediate_queue_when_provider_is_unavailable(
         self,
         mocked_provider,
-        mocked_delay,
+        mocked_drain,
     ):
         written = async_to_sync(write_memory_document)(
             user=self.user,
@@ -260,19 +334,16 @@ class MemoryDocumentServiceTests(TestCase):
         self.assertEqual(len(chunks), 1)
         self.assertEqual(len(embeddings), 1)
         self.assertEqual(embeddings[0].state, MemoryChunkEmbeddingState.PENDING)
-        mocked_delay.assert_not_called()
+        mocked_drain.assert_not_called()
         self.assertEqual(written.warnings, ())
         mocked_provider.assert_awaited()
 
-    @patch(
-        "nova.tasks.memory_tasks.compute_memory_chunk_embedding_task.delay",
-        side_effect=RuntimeError("broker down"),
-    )
+    @patch("nova.tasks.embedding_queue_tasks.enqueue_embedding_drain", return_value=False)
     @patch("nova.memory.service.aget_embeddings_provider", new_callable=AsyncMock)
     def test_write_memory_document_logs_and_returns_warning_when_enqueue_fails(
         self,
         mocked_provider,
-        mocked_delay,
+        mocked_drain,
     ):
         mocked_provider.return_value = object()
 
@@ -290,7 +361,7 @@ class MemoryDocumentServiceTests(TestCase):
 
         self.assertEqual(len(embeddings), 1)
         self.assertEqual(embeddings[0].state, MemoryChunkEmbeddingState.PENDING)
-        self.assertEqual(mocked_delay.call_count, 1)
+        mocked_drain.assert_called_once_with(self.user.id)
         self.assertEqual(
             written.warnings,
             (
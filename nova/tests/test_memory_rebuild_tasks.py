@@ -41,13 +41,8 @@ class MemoryRebuildTasksTests(TestCase):
             status=MemoryRecordStatus.ACTIVE,
         )
 
-    @patch("nova.tasks.memory_rebuild_tasks.rebuild_user_memory_embeddings_task.delay")
-    @patch("nova.tasks.memory_rebuild_tasks.compute_memory_chunk_embedding_task.delay")
-    def test_creates_missing_embeddings_marks_all_pending_and_queues_batch(
-        self,
-        mocked_compute_delay,
-        mocked_rebuild_delay,
-    ):
+    @patch("nova.tasks.memory_rebuild_tasks.schedule_embedding_drain")
+    def test_creates_missing_embeddings_marks_all_pending_and_schedules_drain(self, mocked_drain):
         existing_chunk = self._create_chunk("/memory/existing.md", "existing")
         missing_chunk = self._create_chunk("/memory/missing.md", "missing")
         existing_embedding = MemoryChunkEmbedding.objects.create(
@@ -73,26 +68,10 @@ class MemoryRebuildTasksTests(TestCase):
         self.assertEqual(existing_embedding.state, MemoryChunkEmbeddingState.PENDING)
         self.assertIsNone(existing_embedding.error)
         self.assertIsNone(existing_embedding.vector)
+        mocked_drain.assert_called_once_with(self.user.id)
 
-        queued_ids = {call.args[0] for call in mocked_compute_delay.call_args_list}
-        self.assertEqual(
-            queued_ids,
-            set(
-                MemoryChunkEmbedding.objects.filter(chunk__document__user=self.user).values_list(
-                    "chunk_id",
-                    flat=True,
-                )
-            ),
-        )
-        mocked_rebuild_delay.assert_not_called()
-
-    @patch("nova.tasks.memory_rebuild_tasks.rebuild_user_memory_embeddings_task.delay")
-    @patch("nova.tasks.memory_rebuild_tasks.compute_memory_chunk_embedding_task.delay")
-    def test_requeues_itself_when_more_embeddings_remain_than_batch_size(
-        self,
-        mocked_compute_delay,
-        mocked_rebuild_delay,
-    ):
+    @patch("nova.tasks.memory_rebuild_tasks.schedule_embedding_drain")
+    def test_marks_every_embedding_pending_regardless_of_batch_size(self, mocked_drain):
         for index in range(3):
             chunk = self._create_chunk(f"/memory/item-{index}.md", f"item-{index}")
             MemoryChunkEmbedding.objects.create(
@@ -103,8 +82,7 @@ class MemoryRebuildTasksTests(TestCase):
 
         rebuild_user_memory_embeddings_task.run(self.user.id, batch_size=2)
 
-        self.assertEqual(mocked_compute_delay.call_count, 2)
-        mocked_rebuild_delay.assert_called_once_with(self.user.id, batch_size=2)
+        mocked_drain.assert_called_once_with(self.user.id)
         self.assertEqual(
             MemoryChunkEmbedding.objects.filter(
                 chunk__document__user=self.user,
@@ -115,14 +93,14 @@ class MemoryRebuildTasksTests(TestCase):
             3,
         )
 
-    @patch("nova.tasks.memory_rebuild_tasks.rebuild_user_memory_embeddings_task.delay")
-    @patch("nova.tasks.memory_rebuild_tasks.compute_memory_chunk_embedding_task.delay")
+    @patch("nova.tasks.memory_rebuild_tasks.schedule_embedding_drain")
+    @patch("nova.tasks.embedding_queue_tasks.enqueue_embedding_drain")
     @patch("nova.memory.service.aget_embeddings_provider", new_callable=AsyncMock, return_value=None)
     def test_rebuild_queues_pending_embeddings_created_while_provider_was_unavailable(
         self,
         mocked_provider,
-        mocked_compute_delay,
-        mocked_rebuild_delay,
+        mocked_enqueue,
+        mocked_drain,
     ):
         async_to_sync(write_memory_document)(
             user=self.user,
@@ -135,11 +113,11 @@ class MemoryRebuildTasksTests(TestCase):
         )
         self.assertEqual(len(embeddings), 1)
         self.assertEqual(embeddings[0].state, MemoryChunkEmbeddingState.PENDING)
-        mocked_compute_delay.assert_not_called()
+        mocked_enqueue.assert_not_called()
 
         rebuild_user_memory_embeddings_task.run(self.user.id, batch_size=10)
 
-        queued_ids = {call.args[0] for call in mocked_compute_delay.call_args_list}
-        self.assertEqual(queued_ids, {embeddings[0].chunk_id})
-        mocked_rebuild_delay.assert_not_called()
+        embeddings[0].refresh_from_db()
+        self.assertEqual(embeddings[0].state, MemoryChunkEmbeddingState.PENDING)
+        mocked_drain.assert_called_once_with(self.user.id)
         mocked_provider.assert_awaited()
@@ -0,0 +1,99 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from nova.providers.client_pool import _clients_version_key, evict_provider_clients, pooled_client
+from nova.web.network_policy import NetworkPolicyError
+
+
+def _fake_client():
+    return Mock(close=AsyncMock())
+
+
+class ProviderClientPoolTests(SimpleTestCase):
+    def test_reuses_client_per_key_on_the_same_loop(self):
+        factory = Mock(side_effect=_fake_client)
+
+        async def scenario():
+            clients = []
+            for key in [(101, "a"), (101, "a"), (101, "b")]:
+                async with pooled_client(key, factory) as client:
+                    clients.append(client)
+            return clients
+
+        first, second, other = asyncio.run(scenario())
+        again = asyncio.run(scenario())[0]
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertIsNot(first, again)
+        self.assertEqual(factory.call_count, 4)
+
+    def test_evicted_client_is_closed_after_its_last_request(self):
+        async def scenario():
+            async with pooled_client((202, "a"), _fake_client) as busy:
+                evict_provider_clients(202)
+                busy.close.assert_not_awaited()
+            busy.close.assert_awaited_once()
+
+            async with pooled_client((202, "a"), _fake_client) as fresh:
+                pass
+            evict_provider_clients(202)
+            await asyncio.sleep(0)
+            fresh.close.assert_awaited_once()
+            return busy, fresh
+
+        busy, fresh = asyncio.run(scenario())
+
+        self.assertIsNot(busy, fresh)
+
+    def test_eviction_in_another_process_is_seen_through_the_shared_version(self):
+        async def scenario():
+            async with pooled_client((303, "a"), _fake_client) as stale:
+                pass
+            # Another process bumped the version; this one has no local eviction.
+            cache.set(_clients_version_key(303), cache.get(_clients_version_key(303), 0) + 1, timeout=None)
+            async with pooled_client((303, "a"), _fake_client) as fresh:
+                pass
+            await asyncio.sleep(0)
+            stale.close.assert_awaited_once()
+            fresh.close.assert_not_awaited()
+            return stale, fresh
+
+        stale, fresh = asyncio.run(scenario())
+
+        self.assertIsNot(stale, fresh)
+
+    def test_clients_are_closed_when_their_loop_shuts_down(self):
+        async def scenario():
+            async with pooled_client((404, "a"), _fake_client) as client:
+                pass
+            client.close.assert_not_awaited()
+            return client
+
+        client = asyncio.run(scenario())
+
+        client.close.assert_awaited_once()
+
+    def test_egress_policy_is_checked_again_for_reused_clients(self):
+        check = AsyncMock(side_effect=[None, NetworkPolicyError("blocked")])
+
+        async def scenario():
+            kwargs = {"egress_url": "https://llm.example.test/v1", "allowed_private_hosts": ("llm",)}
+            async with pooled_client((505, "a"), _fake_client, **kwargs) as first:
+                pass
+            check.assert_not_awaited()
+            async with pooled_client((505, "a"), _fake_client, **kwargs) as second:
+                self.assertIs(second, first)
+            with self.assertRaises(NetworkPolicyError):
+                async with pooled_client((505, "a"), _fake_client, **kwargs):
+                    pass
+
+        with patch("nova.providers.client_pool.assert_allowed_egress_url", check), \
+                patch("nova.providers.client_pool.PROVIDER_EGRESS_RECHECK_SECONDS", 0):
+            asyncio.run(scenario())
+
+        self.assertEqual(check.await_count, 2)
+        check.assert_awaited_with("https://llm.example.test/v1", allowed_private_hosts=("llm",))
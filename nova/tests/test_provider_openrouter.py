@@ -336,6 +336,7 @@ class OpenRouterProviderTests(SimpleTestCase):
             messages=[{"role": "user", "content": "Hello"}],
             tools=None,
             normalize_content=adapter.normalize_multimodal_content,
+            provider_id=None,
         )
 
     @patch("nova.providers.openrouter.fetch_openrouter_model_catalog", new_callable=AsyncMock)
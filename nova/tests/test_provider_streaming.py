@@ -180,6 +180,7 @@ class ProviderStreamingTests(SimpleTestCase):
             tools=None,
             normalize_content=adapter.normalize_multimodal_content,
             on_content_delta=None,
+            provider_id=None,
         )
 
     def test_ollama_stream_chat_requires_fallback_when_tools_are_enabled(self):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 from asgiref.sync import async_to_sync
 from django.test import SimpleTestCase
@@ -114,6 +115,56 @@ class _FallbackStreamingAdapter(_HappyAdapter):
         }
 
 
+class _SlowAdapter(_HappyAdapter):
+    def __init__(self, *, stream_delay: float = 0.0):
+        super().__init__()
+        self.stream_delay = stream_delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _track(self, call):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await call
+        finally:
+            self.in_flight -= 1
+
+    async def complete_chat(self, provider, *, messages, tools=None):
+        return await self._track(super().complete_chat(provider, messages=messages, tools=tools))
+
+    async def stream_chat(self, provider, *, messages, tools=None, on_content_delta=None):
+        await asyncio.sleep(self.stream_delay)
+        return await self._track(
+            super().stream_chat(provider, messages=messages, tools=tools, on_content_delta=on_content_delta)
+        )
+
+
+class _ChatProbeFailsAdapter(_HappyAdapter):
+    """Passes the connectivity probe, then fails the chat probe while streaming hangs."""
+
+    def __init__(self):
+        super().__init__()
+        self.plain_chat_calls = 0
+        self.stream_cancelled = False
+
+    async def complete_chat(self, provider, *, messages, tools=None):
+        if messages[0]["content"] == "Reply with OK.":
+            self.plain_chat_calls += 1
+            if self.plain_chat_calls > 1:
+                await asyncio.sleep(0.01)
+                raise RuntimeError("model overloaded")
+        return await super().complete_chat(provider, messages=messages, tools=tools)
+
+    async def stream_chat(self, provider, *, messages, tools=None, on_content_delta=None):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            self.stream_cancelled = True
+            raise
+
+
 class ProviderValidationServiceTests(SimpleTestCase):
     def _provider(self, provider_type=ProviderType.OPENAI, **kwargs) -> LLMProvider:
         return LLMProvider(
@@ -135,6 +186,38 @@ class ProviderValidationServiceTests(SimpleTestCase):
         self.assertEqual(result["verified_operations"]["vision"]["status"], "pass")
         self.assertEqual(result["verified_inputs"]["pdf"]["status"], "pass")
 
+    def test_validate_provider_configuration_runs_capability_probes_concurrently(self):
+        adapter = _SlowAdapter()
+
+        with patch("nova.providers.validation.get_provider_adapter", return_value=adapter):
+            result = async_to_sync(validate_provider_configuration)(self._provider())
+
+        self.assertEqual(result["validation_status"], LLMProvider.ValidationStatus.VALID)
+        self.assertEqual(adapter.max_in_flight, 5)
+
+    def test_validate_provider_configuration_stops_other_probes_when_chat_fails(self):
+        adapter = _ChatProbeFailsAdapter()
+
+        with patch("nova.providers.validation.get_provider_adapter", return_value=adapter):
+            result = async_to_sync(validate_provider_configuration)(self._provider())
+
+        self.assertEqual(result["validation_status"], LLMProvider.ValidationStatus.INVALID)
+        self.assertIn("chat probe: model overloaded", result["verification_summary"])
+        self.assertEqual(result["verified_operations"]["streaming"]["status"], "not_run")
+        self.assertTrue(adapter.stream_cancelled)
+
+    @patch("nova.providers.validation.PROVIDER_VALIDATION_PROBE_TIMEOUT_SECONDS", 0.05)
+    def test_validate_provider_configuration_fails_probe_that_times_out(self):
+        adapter = _SlowAdapter(stream_delay=1)
+
+        with patch("nova.providers.validation.get_provider_adapter", return_value=adapter):
+            result = async_to_sync(validate_provider_configuration)(self._provider())
+
+        self.assertEqual(result["validation_status"], LLMProvider.ValidationStatus.VALID)
+        self.assertEqual(result["verified_operations"]["streaming"]["status"], "fail")
+        self.assertIn("timed out", result["verified_operations"]["streaming"]["message"])
+        self.assertEqual(result["verified_operations"]["tools"]["status"], "pass")
+
     def test_validate_provider_configuration_requires_model(self):
         result = async_to_sync(validate_provider_configuration)(self._provider(model=""))
 
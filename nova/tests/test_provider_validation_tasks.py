@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
+from django.core.cache import cache
+
 from nova.models.Provider import LLMProvider, ProviderType
+from nova.providers.validation import get_cached_validation_result
 from nova.tasks.provider_validation_tasks import validate_provider_configuration_task
 from nova.tests.base import BaseTestCase
 
@@ -24,6 +27,42 @@ def _validation_result() -> dict:
 
 
 class ProviderValidationTaskTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    @patch("nova.tasks.provider_validation_tasks.resolve_provider_capability_snapshot", new_callable=AsyncMock)
+    def test_validation_task_probes_again_and_refreshes_cached_result(self, mocked_snapshot):
+        mocked_snapshot.return_value = {}
+        providers = [
+            LLMProvider.objects.create(
+                user=self.user,
+                name=name,
+                provider_type=ProviderType.OPENAI,
+                model="gpt-4o-mini",
+                api_key="secret-a",
+            )
+            for name in ("First Provider", "Second Provider")
+        ]
+
+        with patch(
+            "nova.tasks.provider_validation_tasks.validate_provider_configuration",
+            new_callable=AsyncMock,
+        ) as mocked_validate:
+            mocked_validate.return_value = _validation_result()
+            for index, provider in enumerate(providers):
+                fingerprint = provider.compute_validation_fingerprint()
+                provider.mark_validation_started(task_id=f"task-{index}", requested_fingerprint=fingerprint)
+                validate_provider_configuration_task.apply(args=[provider.pk, fingerprint], task_id=f"task-{index}")
+
+        # "Test provider" is an explicit request: identical configurations are probed again.
+        self.assertEqual(mocked_validate.await_count, 2)
+        self.assertEqual(mocked_snapshot.await_count, 2)
+        for provider in providers:
+            provider.refresh_from_db()
+            self.assertEqual(provider.validation_status, LLMProvider.ValidationStatus.VALID)
+        self.assertIsNotNone(get_cached_validation_result(providers[0]))
+
     @patch("nova.tasks.provider_validation_tasks.resolve_provider_capability_snapshot", new_callable=AsyncMock)
     def test_validation_task_applies_result_when_request_is_current(self, mocked_snapshot):
         provider = LLMProvider.objects.create(
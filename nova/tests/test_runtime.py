@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import html
 import ipaddress
@@ -23,7 +24,7 @@ from nova.models.AgentThreadSession import AgentThreadSession
 from nova.models.DaySegment import DaySegment
 from nova.models.Interaction import Interaction, InteractionStatus
 from nova.models.TerminalCommandFailureMetric import TerminalCommandFailureMetric
-from nova.models.Message import Actor, MessageType
+from nova.models.Message import Actor, Message, MessageType
 from nova.models.Provider import LLMProvider, ProviderType
 from nova.models.Task import Task, TaskStatus
 from nova.models.Thread import Thread
@@ -53,7 +54,7 @@ from nova.runtime.terminal import (
 )
 from nova.runtime.vfs import VirtualFileSystem
 from nova.tasks.tasks import build_source_message_prompt
-from nova.tasks.execution_trace import TaskExecutionTraceHandler
+from nova.tasks.execution_trace import TaskExecutionTraceHandler, load_execution_trace
 from nova.tasks.TaskProgressHandler import TaskProgressHandler
 from nova.thread_titles import build_default_thread_subject
 from nova.web.download_service import DEFAULT_DOWNLOAD_USER_AGENT, download_http_file
@@ -291,6 +292,23 @@ class TerminalExecutorTests(TestCase):
         self.assertEqual(cwd, "/tmp")
         self.assertEqual(pwd, "/tmp")
 
+    def test_terminal_classifies_read_only_commands(self):
+        vfs = VirtualFileSystem(
+            thread=SimpleNamespace(id=1),
+            user=SimpleNamespace(id=1),
+            agent_config=SimpleNamespace(id=42),
+            session_state={"cwd": "/", "history": [], "directories": ["/tmp"]},
+            skill_registry={},
+        )
+        executor = TerminalExecutor(vfs=vfs, capabilities=TerminalCapabilities())
+
+        self.assertTrue(executor.is_read_only_command("ls /tmp"))
+        self.assertTrue(executor.is_read_only_command("cat /tmp/a.txt | grep foo | wc -l"))
+        self.assertFalse(executor.is_read_only_command("cat /tmp/a.txt > /tmp/b.txt"))
+        self.assertFalse(executor.is_read_only_command("cd /tmp"))
+        self.assertFalse(executor.is_read_only_command("ls /tmp && rm /tmp/a.txt"))
+        self.assertFalse(executor.is_read_only_command("search cats"))
+
 
 class TerminalExecutorCommandTests(TransactionTestCase):
     def setUp(self):
@@ -1783,6 +1801,80 @@ class ReactTerminalRuntimeTests(TransactionTestCase):
 
         self.assertNotIn("ask_user", tool_names)
 
+    def test_execute_tool_calls_runs_independent_calls_concurrently_in_order(self):
+        runtime = async_to_sync(
+            ReactTerminalRuntime(
+                user=self.user,
+                thread=self.thread,
+                agent_config=self.agent,
+            ).initialize
+        )()
+        in_flight = 0
+        max_in_flight = 0
+        started: list[str] = []
+
+        async def fake_execute_tool_call(tool_call):
+            nonlocal in_flight, max_in_flight
+            started.append(tool_call["id"])
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01 if tool_call["id"] == "d1" else 0)
+            in_flight -= 1
+            return {"tool_call_id": tool_call["id"], "name": tool_call["name"], "content": tool_call["id"]}
+
+        def _call(call_id, name, payload):
+            return {"id": call_id, "name": name, "arguments": json.dumps(payload)}
+
+        tool_calls = [
+            _call("d1", "delegate_to_agent", {"agent_id": "a", "question": "q1"}),
+            _call("d2", "delegate_to_agent", {"agent_id": "b", "question": "q2"}),
+            _call("t1", "terminal", {"command": "mkdir /tmp/out"}),
+            _call("t2", "terminal", {"command": "ls /tmp"}),
+            _call("t3", "terminal", {"command": "cat /tmp/a.txt"}),
+        ]
+        with patch.object(runtime, "_execute_tool_call", side_effect=fake_execute_tool_call):
+            results = async_to_sync(runtime._execute_tool_calls)(tool_calls)
+
+        self.assertEqual([item["tool_call_id"] for item in results], ["d1", "d2", "t1", "t2", "t3"])
+        self.assertEqual(max_in_flight, 2)
+        # The mutating terminal command only starts once both delegations finished.
+        self.assertEqual(started[:3], ["d1", "d2", "t1"])
+
+    def test_execute_tool_calls_runs_delegations_to_the_same_subagent_one_at_a_time(self):
+        runtime = async_to_sync(
+            ReactTerminalRuntime(
+                user=self.user,
+                thread=self.thread,
+                agent_config=self.agent,
+            ).initialize
+        )()
+        events: list[str] = []
+
+        async def fake_execute_tool_call(tool_call):
+            events.append(f"start:{tool_call['id']}")
+            await asyncio.sleep(0.01)
+            events.append(f"end:{tool_call['id']}")
+            return {"tool_call_id": tool_call["id"], "name": tool_call["name"], "content": tool_call["id"]}
+
+        def _delegate(call_id, agent_id):
+            payload = {"agent_id": agent_id, "question": call_id}
+            return {"id": call_id, "name": "delegate_to_agent", "arguments": json.dumps(payload)}
+
+        writer = SimpleNamespace(id=7, name="Writer")
+        tool_calls = [_delegate("d1", "7"), _delegate("d2", "Writer"), _delegate("d3", "other")]
+        with patch.object(
+            runtime,
+            "_resolve_subagent_match",
+            side_effect=lambda selector: writer if selector in {"7", "Writer"} else None,
+        ), patch.object(runtime, "_execute_tool_call", side_effect=fake_execute_tool_call):
+            results = async_to_sync(runtime._execute_tool_calls)(tool_calls)
+
+        self.assertEqual([item["tool_call_id"] for item in results], ["d1", "d2", "d3"])
+        # Both calls target agent 7: the second starts once the first is done,
+        # alongside the delegation to another agent.
+        self.assertEqual(events[:2], ["start:d1", "end:d1"])
+        self.assertEqual(sorted(events[2:4]), ["start:d2", "start:d3"])
+
     def test_runtime_returns_interrupt_result_for_ask_user(self):
         runtime = async_to_sync(
             ReactTerminalRuntime(
@@ -1873,7 +1965,6 @@ class ReactTerminalRuntimeTests(TransactionTestCase):
                 thread=self.thread,
                 agent_config=self.agent,
                 status=TaskStatus.AWAITING_INPUT,
-                progress_logs=[],
             ),
             thread=self.thread,
             agent_config=self.agent,
@@ -2624,7 +2715,7 @@ class ReactTerminalRuntimeTests(TransactionTestCase):
                     return found
             return None
 
-        tool_node = _find_first_tool_node(task.execution_trace.get("root"))
+        tool_node = _find_first_tool_node(load_execution_trace(task).get("root"))
 
         self.assertNotIn("Tool execution error", tool_result["content"])
         self.assertTrue(async_to_sync(runtime.vfs.path_exists)("/x/a.txt"))
@@ -2795,7 +2886,7 @@ class ReactTerminalRuntimeTests(TransactionTestCase):
                     return found
             return None
 
-        model_node = _find_first_model_node(task.execution_trace.get("root"))
+        model_node = _find_first_model_node(load_execution_trace(task).get("root"))
 
         self.assertEqual(result.final_answer, "Fallback answer.")
         self.assertEqual(task.streamed_markdown, "Fallback answer.")
@@ -2867,6 +2958,36 @@ class ReactTerminalRuntimeTests(TransactionTestCase):
         self.assertFalse(any(item["content"] == "Initial requirement" for item in history[1:]))
         self.assertTrue(any(item["content"] == "Recent context" for item in history[1:]))
 
+    def test_runtime_loads_newest_history_within_token_budget(self):
+        created = [
+            self.thread.add_message(f"{index}" * 400, Actor.USER if index % 2 == 0 else Actor.AGENT)
+            for index in range(4)
+        ]
+        Message.objects.filter(thread=self.thread).update(token_count=None)
+
+        runtime = async_to_sync(
+            ReactTerminalRuntime(
+                user=self.user,
+                thread=self.thread,
+                agent_config=self.agent,
+            ).initialize
+        )()
+        runtime.provider_client.provider.max_context_tokens = 350
+        with patch("nova.runtime.agent.count_tokens", side_effect=lambda text: len(text or "") // 4):
+            history = async_to_sync(runtime._load_history_messages)()
+
+        self.assertEqual(
+            history,
+            [
+                {"role": "user", "content": "2" * 400},
+                {"role": "assistant", "content": "3" * 400},
+            ],
+        )
+        self.assertEqual(
+            [Message.objects.get(id=message.id).token_count for message in created],
+            [None, 100, 100, 100],
+        )
+
     def test_runtime_loads_continuous_context_and_rewrites_history_guidance(self):
         continuous_thread = Thread.objects.create(
             user=self.user,
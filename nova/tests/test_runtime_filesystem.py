@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from asgiref.sync import async_to_sync
 
 from nova.runtime.capabilities import TerminalCapabilities
@@ -424,3 +426,34 @@ class FilesystemCommandTests(TerminalExecutorCommandTestCase):
 
         self.assertIn("Binary file cannot be displayed as text", str(binary_error.exception))
         self.assertEqual(str(flag_error.exception), "Unsupported sort flag: -r")
+
+    def test_vfs_reuses_file_index_until_a_write_invalidates_it(self):
+        executor = self._build_executor()
+        vfs = executor.vfs
+
+        async_to_sync(vfs.write_file)("/reports/q1/summary.txt", b"q1", mime_type="text/plain")
+        async_to_sync(vfs.write_file)("/reports/q2.txt", b"q2", mime_type="text/plain")
+
+        with patch.object(vfs, "_query_real_files", wraps=vfs._query_real_files) as query_mock:
+            self.assertTrue(async_to_sync(vfs.is_dir)("/reports/q1"))
+            self.assertTrue(async_to_sync(vfs.path_exists)("/reports/q2.txt"))
+            self.assertEqual(
+                [entry["name"] for entry in async_to_sync(vfs.list_dir)("/reports")],
+                ["q1", "q2.txt"],
+            )
+            self.assertEqual(
+                async_to_sync(vfs.find)("/reports", "summary"),
+                ["/reports/q1/summary.txt"],
+            )
+            self.assertEqual(query_mock.call_count, 1)
+
+            async_to_sync(vfs.move)("/reports/q1", "/archive")
+
+            self.assertFalse(async_to_sync(vfs.path_exists)("/reports/q1/summary.txt"))
+            self.assertIsNotNone(async_to_sync(vfs.get_real_file)("/archive/summary.txt"))
+            self.assertEqual(query_mock.call_count, 2)
+
+            async_to_sync(vfs.remove)("/archive", recursive=True)
+
+            self.assertFalse(async_to_sync(vfs.is_dir)("/archive"))
+            self.assertEqual(query_mock.call_count, 3)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from nova.storage_clients import S3ClientManager
+
+
+class _FakeAsyncClientContext:
+    def __init__(self, client):
+        self.client = client
+        self.closed = False
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.closed = True
+        return False
+
+
+class S3ClientManagerTests(SimpleTestCase):
+    @override_settings(
+        MINIO_ENDPOINT_URL="http://minio:9000",
+        MINIO_ACCESS_KEY="test-key",
+        MINIO_SECRET_KEY="test-secret",
+        MINIO_MAX_POOL_CONNECTIONS=7,
+    )
+    def test_sync_client_is_shared_and_built_from_settings(self):
+        manager = S3ClientManager()
+
+        with patch("nova.storage_clients.boto3.client") as mocked_client:
+            first = manager.get_sync_client()
+            second = manager.get_sync_client()
+
+        self.assertIs(first, second)
+        mocked_client.assert_called_once()
+        args, kwargs = mocked_client.call_args
+        self.assertEqual(args, ("s3",))
+        self.assertEqual(kwargs["endpoint_url"], "http://minio:9000")
+        self.assertEqual(kwargs["aws_access_key_id"], "test-key")
+        self.assertEqual(kwargs["aws_secret_access_key"], "test-secret")
+        self.assertEqual(kwargs["config"].max_pool_connections, 7)
+        self.assertEqual(kwargs["config"].signature_version, "s3v4")
+
+    def test_sync_client_is_rebuilt_when_settings_change(self):
+        manager = S3ClientManager()
+
+        with patch("nova.storage_clients.boto3.client", side_effect=[MagicMock(), MagicMock()]) as mocked_client:
+            first = manager.get_sync_client()
+            with override_settings(MINIO_ENDPOINT_URL="http://other-minio:9000"):
+                second = manager.get_sync_client()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(mocked_client.call_count, 2)
+
+    def test_async_client_is_shared_per_loop_and_closed_with_the_loop(self):
+        manager = S3ClientManager()
+        contexts: list[_FakeAsyncClientContext] = []
+
+        def _client(*args, **kwargs):
+            context = _FakeAsyncClientContext(AsyncMock())
+            contexts.append(context)
+            return context
+
+        fake_session = MagicMock()
+        fake_session.client.side_effect = _client
+
+        async def _use_client():
+            first = await manager.get_async_client()
+            second = await manager.get_async_client()
+            return first, second
+
+        with patch("nova.storage_clients.aioboto3.Session", return_value=fake_session):
+            first, second = asyncio.run(_use_client())
+            asyncio.run(_use_client())
+
+        self.assertIs(first, second)
+        self.assertEqual(len(contexts), 2)
+        self.assertTrue(all(context.closed for context in contexts))
+        self.assertEqual(manager._async_clients, {})
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from nova.models.Thread import Thread
+from nova.models.UserFile import UserFile
+from nova.storage_deletion import (
+    defer_storage_deletion,
+    defer_storage_key,
+    delete_storage_keys_sync,
+)
+from nova.tasks.storage_tasks import delete_storage_objects_task
+
+User = get_user_model()
+
+
+@override_settings(MINIO_BUCKET_NAME="test-bucket")
+class DeleteStorageKeysTests(SimpleTestCase):
+    def test_keys_are_sent_in_batches_of_one_thousand(self):
+        s3_client = AsyncMock()
+        s3_client.delete_objects.return_value = {}
+        keys = [f"users/1/file-{index}" for index in range(2500)]
+
+        with patch("nova.storage_deletion.get_async_s3_client", new=AsyncMock(return_value=s3_client)):
+            failed = delete_storage_keys_sync(keys + keys[:10])
+
+        self.assertEqual(failed, [])
+        batch_sizes = sorted(
+            len(call.kwargs["Delete"]["Objects"]) for call in s3_client.delete_objects.await_args_list
+        )
+        self.assertEqual(batch_sizes, [500, 1000, 1000])
+        for call in s3_client.delete_objects.await_args_list:
+            self.assertEqual(call.kwargs["Bucket"], "test-bucket")
+            self.assertTrue(call.kwargs["Delete"]["Quiet"])
+
+    def test_failed_keys_are_returned_and_missing_keys_ignored(self):
+        s3_client = AsyncMock()
+        s3_client.delete_objects.return_value = {
+            "Errors": [
+                {"Key": "a", "Code": "AccessDenied", "Message": "denied"},
+                {"Key": "b", "Code": "NoSuchKey", "Message": "missing"},
+            ]
+        }
+
+        with patch("nova.storage_deletion.get_async_s3_client", new=AsyncMock(return_value=s3_client)):
+            failed = delete_storage_keys_sync(["a", "b", "c"])
+
+        self.assertEqual(failed, ["a"])
+
+    def test_defer_storage_key_is_a_no_op_outside_a_deferral_block(self):
+        self.assertFalse(defer_storage_key("users/1/file"))
+
+
+class DeferStorageDeletionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="storage-user", password="pass")
+        self.thread = Thread.objects.create(user=self.user, subject="Storage thread")
+
+    def _create_file(self, key: str, thread=None) -> UserFile:
+        return UserFile.objects.create(
+            user=self.user,
+            thread=thread or self.thread,
+            key=key,
+            original_filename=key.rsplit("/", 1)[-1],
+            mime_type="text/plain",
+            size=1,
+        )
+
+    @patch("nova.tasks.storage_tasks.delete_storage_objects_task.delay")
+    @patch("nova.models.UserFile.get_s3_client")
+    def test_thread_deletion_schedules_a_single_bulk_task(self, mocked_get_s3_client, mocked_delay):
+        self._create_file("users/1/threads/1/a.txt")
+        self._create_file("users/1/threads/1/b.txt")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.thread.delete()
+
+        mocked_get_s3_client.return_value.delete_object.assert_not_called()
+        mocked_delay.assert_called_once()
+        self.assertCountEqual(
+            mocked_delay.call_args.args[0],
+            ["users/1/threads/1/a.txt", "users/1/threads/1/b.txt"],
+        )
+        self.assertFalse(UserFile.objects.filter(user=self.user).exists())
+
+    @patch("nova.tasks.storage_tasks.delete_storage_objects_task.delay")
+    def test_nothing_is_scheduled_when_the_block_raises(self, mocked_delay):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError):
+                with defer_storage_deletion():
+                    self.assertTrue(defer_storage_key("users/1/a.txt"))
+                    raise RuntimeError("boom")
+
+        self.assertEqual(callbacks, [])
+        mocked_delay.assert_not_called()
+
+    @patch("nova.tasks.storage_tasks.delete_storage_objects_task.delay")
+    def test_nested_blocks_schedule_once(self, mocked_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            with defer_storage_deletion():
+                defer_storage_key("users/1/a.txt")
+                with defer_storage_deletion():
+                    defer_storage_key("users/1/b.txt")
+
+        mocked_delay.assert_called_once_with(["users/1/a.txt", "users/1/b.txt"])
+
+    @patch("nova.storage_deletion.delete_storage_keys_sync", return_value=[])
+    @patch(
+        "nova.tasks.storage_tasks.delete_storage_objects_task.delay",
+        side_effect=RuntimeError("broker down"),
+    )
+    def test_falls_back_to_inline_deletion_when_enqueue_fails(self, _mocked_delay, mocked_delete):
+        with self.captureOnCommitCallbacks(execute=True):
+            with defer_storage_deletion():
+                defer_storage_key("users/1/a.txt")
+
+        mocked_delete.assert_called_once_with(["users/1/a.txt"])
+
+
+class DeleteStorageObjectsTaskTests(SimpleTestCase):
+    def test_task_retries_only_failed_keys(self):
+        retry_error = RuntimeError("retry")
+        with (
+            patch("nova.tasks.storage_tasks.delete_storage_keys_sync", return_value=["b"]),
+            patch.object(delete_storage_objects_task, "retry", return_value=retry_error) as mocked_retry,
+        ):
+            with self.assertRaises(RuntimeError):
+                delete_storage_objects_task.run(["a", "b"])
+
+        mocked_retry.assert_called_once()
+        self.assertEqual(mocked_retry.call_args.kwargs["args"], [["b"]])
+
+    def test_task_reports_deleted_count(self):
+        with patch("nova.tasks.storage_tasks.delete_storage_keys_sync", return_value=[]):
+            result = delete_storage_objects_task.run(["a", "b"])
+
+        self.assertEqual(result, {"deleted": 2, "failed": 0})
+
+
+class UserFileDeferredDeletionTests(SimpleTestCase):
+    def test_delete_storage_object_defers_inside_a_block(self):
+        user_file = UserFile(key="users/1/a.txt")
+        with patch("nova.models.UserFile.get_s3_client") as mocked_get_s3_client:
+            mocked_get_s3_client.return_value = MagicMock()
+            with patch("nova.storage_deletion.schedule_storage_deletion") as mocked_schedule:
+                with defer_storage_deletion():
+                    user_file.delete_storage_object()
+
+        mocked_get_s3_client.assert_not_called()
+        mocked_schedule.assert_called_once_with(["users/1/a.txt"])
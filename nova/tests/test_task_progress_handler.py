@@ -139,22 +139,63 @@ class TaskProgressHandlerTests(IsolatedAsyncioTestCase):
         handler = TaskProgressHandler(task_id=789, channel_layer=channel_layer)
         handler._stream_flush_interval_seconds = 60
         handler.on_chunk = AsyncMock()
+        handler.on_chunk_delta = AsyncMock()
 
-        with patch("nova.tasks.TaskProgressHandler.markdown_to_html", side_effect=lambda text: f"<p>{text}</p>"):
-            await handler.on_llm_new_token("Hello", run_id=UUID(int=1))
-            await handler.on_llm_new_token(" world", run_id=UUID(int=1))
-            handler.on_chunk.assert_not_awaited()
+        await handler.on_llm_new_token("Hello", run_id=UUID(int=1))
+        await handler.on_llm_new_token(" world", run_id=UUID(int=1))
+        handler.on_chunk.assert_not_awaited()
 
-            await handler.on_llm_new_token(".", run_id=UUID(int=1))
-            self.assertEqual(handler.on_chunk.await_count, 1)
-            self.assertIn("Hello world.", handler.on_chunk.await_args_list[0].args[0])
+        await handler.on_llm_new_token(".", run_id=UUID(int=1))
+        self.assertEqual(handler.on_chunk.await_count, 1)
+        self.assertIn("Hello world.", handler.on_chunk.await_args_list[0].args[0])
 
-            await handler.on_llm_new_token(" Next", run_id=UUID(int=1))
-            self.assertEqual(handler.on_chunk.await_count, 1)
+        await handler.on_llm_new_token(" Next", run_id=UUID(int=1))
+        handler.on_chunk_delta.assert_not_awaited()
 
-            await handler.on_llm_end(response={}, run_id=UUID(int=1))
-            self.assertEqual(handler.on_chunk.await_count, 2)
-            self.assertIn("Hello world. Next", handler.on_chunk.await_args_list[1].args[0])
+        await handler.on_llm_end(response={}, run_id=UUID(int=1))
+        self.assertEqual(handler.on_chunk.await_count, 1)
+        handler.on_chunk_delta.assert_awaited_once()
+        self.assertIn("Hello world. Next", handler.on_chunk_delta.await_args.args[3])
+
+    async def test_streaming_sends_completed_blocks_once_as_deltas(self):
+        channel_layer = AsyncMock()
+        handler = TaskProgressHandler(task_id=790, channel_layer=channel_layer)
+        handler._stream_flush_interval_seconds = 60
+        handler._stream_snapshot_interval_seconds = 60
+
+        for token in ("# Title\n", "\n", "First paragraph.\n", "\n", "Second paragraph\n", "Third"):
+            await handler.on_llm_new_token(token, run_id=UUID(int=1))
+        await handler.complete_markdown_stream()
+
+        payloads = [call.args[1]["message"] for call in channel_layer.group_send.await_args_list]
+        self.assertEqual(payloads[0]["type"], "response_chunk")
+        self.assertEqual(payloads[0]["chunk"], "<h1>Title</h1>")
+        self.assertEqual(payloads[0]["stable_count"], 0)
+
+        deltas = [payload for payload in payloads if payload["type"] == "response_delta"]
+        self.assertEqual(
+            [(delta["start"], delta["stable_html"], delta["stable_count"]) for delta in deltas],
+            [(0, "<h1>Title</h1>", 1), (1, "<p>First paragraph.</p>", 2), (2, "", 2)],
+        )
+        self.assertEqual(deltas[-1]["tail_html"], "<p>Second paragraph<br>\nThird</p>")
+        self.assertEqual(
+            handler._last_stream_html,
+            "<h1>Title</h1>\n<p>First paragraph.</p>\n<p>Second paragraph<br>\nThird</p>",
+        )
+
+    async def test_replace_streamed_markdown_sends_full_snapshot(self):
+        channel_layer = AsyncMock()
+        handler = TaskProgressHandler(task_id=791, channel_layer=channel_layer)
+        handler._stream_snapshot_interval_seconds = 60
+        handler._persist_stream_state = AsyncMock()
+
+        await handler.append_markdown_delta("Draft.\n\nMore.\n")
+        await handler.replace_streamed_markdown("Final answer.")
+
+        payload = channel_layer.group_send.await_args.args[1]["message"]
+        self.assertEqual(payload["type"], "response_chunk")
+        self.assertEqual(payload["chunk"], "<p>Final answer.</p>")
+        self.assertEqual(payload["stable_count"], 0)
 
     async def test_on_llm_end_persists_stream_state(self):
         channel_layer = AsyncMock()
@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase
+
+from nova.models.Task import Task, TaskProgressEntry, TaskStatus
+from nova.models.Thread import Thread
+from nova.tasks.task_state_buffer import TaskStateBuffer
+from nova.tasks.TaskProgressHandler import TaskProgressHandler
+
+
+class TaskStateBufferTests(TransactionTestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="buffer-user", password="pass")
+        thread = Thread.objects.create(user=user, subject="Buffered")
+        self.task = Task.objects.create(user=user, thread=thread, status=TaskStatus.RUNNING)
+
+    def test_flush_writes_entries_and_latest_fields_together(self):
+        buffer = TaskStateBuffer(self.task.id, flush_interval=60)
+        buffer.add_progress("Preparing context")
+        buffer.add_progress("Calling model (1/10)")
+        buffer.set_fields(current_response="<p>a</p>", streamed_markdown="a")
+        buffer.set_fields(current_response="<p>ab</p>", streamed_markdown="ab")
+
+        async_to_sync(buffer.flush)()
+
+        self.task.refresh_from_db()
+        self.assertEqual(
+            list(self.task.progress_entries.values_list("step", flat=True)),
+            ["Preparing context", "Calling model (1/10)"],
+        )
+        self.assertEqual(self.task.current_response, "<p>ab</p>")
+        self.assertEqual(self.task.streamed_markdown, "ab")
+        self.assertFalse(buffer.has_pending)
+
+    def test_maybe_flush_waits_for_interval(self):
+        buffer = TaskStateBuffer(self.task.id, flush_interval=60)
+
+        self.assertTrue(async_to_sync(buffer.maybe_flush)())
+        buffer.add_progress("Running Nova agent")
+        self.assertFalse(async_to_sync(buffer.maybe_flush)())
+        self.assertFalse(TaskProgressEntry.objects.filter(task=self.task).exists())
+
+        with patch("nova.tasks.task_state_buffer.monotonic", return_value=10**9):
+            self.assertTrue(async_to_sync(buffer.maybe_flush)())
+        self.assertEqual(self.task.progress_entries.get().step, "Running Nova agent")
+
+    def test_failed_flush_keeps_state_for_retry(self):
+        buffer = TaskStateBuffer(self.task.id, flush_interval=60)
+        buffer.add_progress("Processing final response")
+        buffer.set_fields(streamed_markdown="old")
+
+        with patch.object(TaskProgressEntry.objects, "bulk_create", side_effect=RuntimeError("db down")):
+            with self.assertRaises(RuntimeError):
+                async_to_sync(buffer.flush)()
+        buffer.set_fields(streamed_markdown="new")
+        async_to_sync(buffer.flush)()
+
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.progress_entries.get().step, "Processing final response")
+        self.assertEqual(self.task.streamed_markdown, "new")
+
+    def test_handler_buffers_progress_until_checkpoint(self):
+        class _ChannelLayer:
+            async def group_send(self, group, message):
+                pass
+
+        handler = TaskProgressHandler(self.task.id, _ChannelLayer())
+        handler.state_buffer.flush_interval = 60
+
+        async def scenario():
+            await handler.record_progress("Preparing context")
+            await handler.record_progress("Calling model (1/10)")
+            await handler.record_progress("Finalizing response")
+            written_before_checkpoint = await TaskProgressEntry.objects.filter(task_id=self.task.id).acount()
+            await handler.flush_state()
+            return written_before_checkpoint
+
+        written_before_checkpoint = async_to_sync(scenario)()
+
+        # The first progress line is written right away, the others at the checkpoint.
+        self.assertEqual(written_before_checkpoint, 1)
+        self.assertEqual(
+            list(self.task.progress_entries.values_list("step", flat=True)),
+            ["Preparing context", "Calling model (1/10)", "Finalizing response"],
+        )
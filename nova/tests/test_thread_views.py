@@ -14,7 +14,7 @@ from nova.file_utils import build_message_attachment_path
 from nova.models.AgentConfig import AgentConfig
 from nova.models.Message import Actor
 from nova.models.Provider import ProviderType, LLMProvider
-from nova.models.Task import Task, TaskStatus
+from nova.models.Task import Task, TaskProgressEntry, TaskStatus
 from nova.models.Thread import Thread
 from nova.models.Tool import Tool
 from nova.models.UserFile import UserFile
@@ -827,6 +827,8 @@ class MainViewsTests(TestCase):
         stale_task = Task.objects.create(user=self.user, thread=thread, status=TaskStatus.RUNNING)
         awaiting_task = Task.objects.create(user=self.user, thread=thread, status=TaskStatus.AWAITING_INPUT)
         Task.objects.filter(id=stale_task.id).update(updated_at=timezone.now() - timedelta(minutes=5))
+        TaskProgressEntry.objects.create(task=fresh_task, step="Initializing AI task")
+        TaskProgressEntry.objects.create(task=fresh_task, step="Calling model (1/10)")
 
         self.client.login(username="alice", password="pass")
         resp = self.client.get(reverse("running_tasks", args=[thread.id]))
@@ -834,11 +836,47 @@ class MainViewsTests(TestCase):
         self.assertEqual(resp.status_code, 200)
         tasks_data = resp.json().get("running_tasks", [])
         self.assertEqual([task["id"] for task in tasks_data], [fresh_task.id])
+        self.assertEqual(tasks_data[0]["last_progress"]["step"], "Calling model (1/10)")
         stale_task.refresh_from_db()
         awaiting_task.refresh_from_db()
         self.assertEqual(stale_task.status, TaskStatus.FAILED)
+        self.assertEqual(stale_task.progress_entries.get().severity, "error")
         self.assertEqual(awaiting_task.status, TaskStatus.AWAITING_INPUT)
 
+    @override_settings(AGENT_WORKER_ENABLED=True)
+    @patch("nova.views.task_views.request_agent_run_cancel")
+    def test_cancel_task_flags_running_task_for_the_agent_worker(self, mocked_cancel):
+        thread = Thread.objects.create(user=self.user, subject="T")
+        running = Task.objects.create(user=self.user, thread=thread, status=TaskStatus.RUNNING)
+        done = Task.objects.create(user=self.user, thread=thread, status=TaskStatus.COMPLETED)
+        foreign = Task.objects.create(
+            user=self.other,
+            thread=Thread.objects.create(user=self.other, subject="V"),
+            status=TaskStatus.RUNNING,
+        )
+        self.client.login(username="alice", password="pass")
+
+        resp = self.client.post(reverse("task_cancel", args=[running.id]))
+        self.assertEqual(resp.json()["status"], "cancel_requested")
+        resp = self.client.post(reverse("task_cancel", args=[done.id]))
+        self.assertEqual(resp.json()["status"], "ignored")
+        resp = self.client.post(reverse("task_cancel", args=[foreign.id]))
+        self.assertEqual(resp.status_code, 404)
+
+        mocked_cancel.assert_called_once_with(running.id)
+
+    @override_settings(AGENT_WORKER_ENABLED=False)
+    @patch("nova.views.task_views.request_agent_run_cancel")
+    def test_cancel_task_requires_the_agent_worker(self, mocked_cancel):
+        thread = Thread.objects.create(user=self.user, subject="T")
+        task = Task.objects.create(user=self.user, thread=thread, status=TaskStatus.RUNNING)
+        self.client.login(username="alice", password="pass")
+
+        resp = self.client.post(reverse("task_cancel", args=[task.id]))
+
+        self.assertEqual(resp.status_code, 409)
+        mocked_cancel.assert_not_called()
+
     def test_execution_trace_endpoint_requires_task_ownership(self):
         thread = Thread.objects.create(user=self.user, subject="Trace thread")
         foreign_thread = Thread.objects.create(user=self.other, subject="Foreign trace")
@@ -0,0 +1,25 @@
+from django.test import SimpleTestCase, override_settings
+
+from nova.llm import tokenizer
+from nova.llm.tokenizer import HeuristicTokenizer, count_tokens, get_tokenizer
+
+
+class _WordTokenizer:
+    def count(self, text: str) -> int:
+        return len(str(text or "").split())
+
+
+class TokenizerTests(SimpleTestCase):
+    def tearDown(self):
+        tokenizer._tokenizer = None
+        tokenizer._tokenizer_path = None
+
+    @override_settings(TOKENIZER_BACKEND="nova.tests.test_tokenizer._WordTokenizer")
+    def test_uses_configured_backend(self):
+        self.assertEqual(count_tokens("three little words"), 3)
+
+    @override_settings(TOKENIZER_BACKEND="nova.llm.tokenizer.MissingTokenizer")
+    def test_falls_back_to_byte_heuristic_when_backend_is_unavailable(self):
+        self.assertIsInstance(get_tokenizer(), HeuristicTokenizer)
+        self.assertEqual(count_tokens(""), 0)
+        self.assertEqual(count_tokens("a" * 40), 11)
@@ -41,8 +41,8 @@ class TranscriptIndexTasksTests(TestCase):
         result = _index_transcript_append(day_segment_id=999999)
         self.assertEqual(result["status"], "not_found")
 
-    @patch("nova.tasks.transcript_index_tasks.compute_transcript_chunk_embedding_task.delay")
-    def test_index_transcript_append_creates_chunk_and_embedding(self, mocked_delay):
+    @patch("nova.tasks.transcript_index_tasks.schedule_embedding_drain")
+    def test_index_transcript_append_creates_chunk_and_embedding(self, mocked_drain):
         m1 = self.thread.add_message("Hello", actor=Actor.USER)
         m2 = self.thread.add_message("Hi there", actor=Actor.AGENT)
         seg = DaySegment.objects.create(
@@ -62,10 +62,10 @@ class TranscriptIndexTasksTests(TestCase):
 
         emb = TranscriptChunkEmbedding.objects.get(transcript_chunk=chunk)
         self.assertEqual(emb.state, "pending")
-        mocked_delay.assert_called_once_with(emb.id)
+        mocked_drain.assert_called_once_with(self.user.id)
 
-    @patch("nova.tasks.transcript_index_tasks.compute_transcript_chunk_embedding_task.delay")
-    def test_index_transcript_append_updates_existing_chunk_when_hash_changes(self, mocked_delay):
+    @patch("nova.tasks.transcript_index_tasks.schedule_embedding_drain")
+    def test_index_transcript_append_updates_existing_chunk_when_hash_changes(self, mocked_drain):
         m1 = self.thread.add_message("Initial message", actor=Actor.USER)
         seg = DaySegment.objects.create(
             user=self.user,
@@ -94,5 +94,80 @@ class TranscriptIndexTasksTests(TestCase):
 
         emb = TranscriptChunkEmbedding.objects.get(transcript_chunk=chunk)
         self.assertEqual(emb.state, "pending")
-        mocked_delay.assert_called_once_with(emb.id)
+        mocked_drain.assert_called_once_with(self.user.id)
 
+    @patch("nova.tasks.transcript_index_tasks.schedule_embedding_drain")
+    def test_index_transcript_append_bulk_indexes_long_thread_in_one_pass(self, mocked_drain):
+        messages = [self.thread.add_message("word " * 200, actor=Actor.USER) for _ in range(8)]
+        seg = DaySegment.objects.create(
+            user=self.user,
+            thread=self.thread,
+            day_label=messages[0].created_at.date(),
+            starts_at_message=messages[0],
+        )
+
+        with patch("nova.tasks.transcript_index_tasks.TRANSCRIPT_INDEX_PAGE_SIZE", 3):
+            result = _index_transcript_append(day_segment_id=seg.id)
+
+        chunks = list(TranscriptChunk.objects.filter(day_segment=seg).order_by("start_message__created_at"))
+        self.assertEqual(result["created"], len(chunks))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(chunks[0].start_message_id, messages[0].id)
+        self.assertEqual(chunks[-1].end_message_id, messages[-1].id)
+        self.assertEqual(
+            TranscriptChunkEmbedding.objects.filter(transcript_chunk__in=chunks, state="pending").count(),
+            len(chunks),
+        )
+        mocked_drain.assert_called_once_with(self.user.id)
+
+    @patch("nova.tasks.transcript_index_tasks.schedule_embedding_drain")
+    def test_index_transcript_append_rerun_without_new_messages_is_noop(self, mocked_drain):
+        messages = [self.thread.add_message("word " * 200, actor=Actor.USER) for _ in range(4)]
+        seg = DaySegment.objects.create(
+            user=self.user,
+            thread=self.thread,
+            day_label=messages[0].created_at.date(),
+            starts_at_message=messages[0],
+        )
+        _index_transcript_append(day_segment_id=seg.id)
+        chunks = list(TranscriptChunk.objects.filter(day_segment=seg).values_list("id", "content_hash"))
+        mocked_drain.reset_mock()
+
+        again = _index_transcript_append(day_segment_id=seg.id)
+
+        self.assertEqual(again["created"], 0)
+        self.assertEqual(
+            list(TranscriptChunk.objects.filter(day_segment=seg).values_list("id", "content_hash")),
+            chunks,
+        )
+        mocked_drain.assert_not_called()
+
+    @patch("nova.tasks.transcript_index_tasks.schedule_embedding_drain")
+    def test_index_transcript_append_resumes_with_new_messages(self, mocked_drain):
+        m1 = self.thread.add_message("Hello", actor=Actor.USER)
+        seg = DaySegment.objects.create(
+            user=self.user,
+            thread=self.thread,
+            day_label=m1.created_at.date(),
+            starts_at_message=m1,
+        )
+        _index_transcript_append(day_segment_id=seg.id)
+        tail = TranscriptChunk.objects.get(day_segment=seg)
+        TranscriptChunkEmbedding.objects.filter(transcript_chunk=tail).update(state="ready")
+        m2 = self.thread.add_message("Hi there", actor=Actor.AGENT)
+
+        result = _index_transcript_append(day_segment_id=seg.id)
+
+        # The short tail chunk grows in place and is re-embedded.
+        self.assertEqual(result["created"], 0)
+        tail.refresh_from_db()
+        self.assertEqual((tail.start_message_id, tail.end_message_id), (m1.id, m2.id))
+        self.assertEqual(TranscriptChunkEmbedding.objects.get(transcript_chunk=tail).state, "pending")
+
+        for index in range(6):
+            self.thread.add_message(f"message {index} " + "word " * 150, actor=Actor.USER)
+            _index_transcript_append(day_segment_id=seg.id)
+
+        starts = list(TranscriptChunk.objects.filter(day_segment=seg).values_list("start_message_id", flat=True))
+        self.assertGreater(len(starts), 1)
+        self.assertEqual(len(starts), len(set(starts)))
@@ -0,0 +1,137 @@
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from nova.llm.vector_index import NumpyVectorIndex, sync_vector_index
+from nova.models.MemoryChunk import MemoryChunk
+from nova.models.MemoryChunkEmbedding import MemoryChunkEmbedding
+from nova.models.MemoryDocument import MemoryDocument
+from nova.models.memory_common import MemoryChunkEmbeddingState, MemoryRecordStatus
+
+
+User = get_user_model()
+
+
+def _unit(index: int, dim: int = 4) -> list[float]:
+    vector = [0.0] * dim
+    vector[index] = 1.0
+    return vector
+
+
+class NumpyVectorIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.index = NumpyVectorIndex(root=self.root)
+
+    def test_search_returns_nearest_rows_first(self):
+        self.index.upsert(
+            user_id=1,
+            kind="memory_chunk",
+            items=[(10, 1.0, _unit(0)), (11, 1.0, [1.0, 1.0, 0.0, 0.0]), (12, 1.0, _unit(2))],
+        )
+
+        hits = self.index.search(user_id=1, kind="memory_chunk", vector=_unit(0), k=2)
+
+        self.assertEqual([item_id for item_id, _distance in hits], [10, 11])
+        self.assertAlmostEqual(hits[0][1], 0.0, places=5)
+
+    def test_search_respects_allowed_ids_and_removed_rows(self):
+        self.index.upsert(
+            user_id=1,
+            kind="memory_chunk",
+            items=[(10, 1.0, _unit(0)), (11, 1.0, _unit(0)), (12, 1.0, _unit(1))],
+        )
+        self.index.remove(user_id=1, kind="memory_chunk", ids=[10])
+
+        hits = self.index.search(user_id=1, kind="memory_chunk", vector=_unit(0), k=5, allowed_ids=[10, 12])
+
+        self.assertEqual([item_id for item_id, _distance in hits], [12])
+
+    def test_upsert_replaces_existing_rows_and_persists_across_instances(self):
+        self.index.upsert(user_id=1, kind="memory_chunk", items=[(10, 1.0, _unit(0))])
+        self.index.upsert(user_id=1, kind="memory_chunk", items=[(10, 2.0, _unit(1))])
+
+        reopened = NumpyVectorIndex(root=self.root)
+
+        self.assertEqual(reopened.stamps(user_id=1, kind="memory_chunk"), {10: 2.0})
+        hits = reopened.search(user_id=1, kind="memory_chunk", vector=_unit(1), k=1)
+        self.assertEqual(hits[0][0], 10)
+        self.assertAlmostEqual(hits[0][1], 0.0, places=5)
+
+    def test_grows_past_initial_capacity(self):
+        items = [(item_id, 1.0, _unit(item_id % 4)) for item_id in range(1, 600)]
+
+        self.index.upsert(user_id=1, kind="memory_chunk", items=items)
+
+        self.assertEqual(len(self.index.stamps(user_id=1, kind="memory_chunk")), 599)
+        hits = self.index.search(user_id=1, kind="memory_chunk", vector=_unit(3), k=3)
+        self.assertTrue(all(item_id % 4 == 3 for item_id, _distance in hits))
+
+    def test_search_runs_without_holding_the_process_lock(self):
+        self.index.upsert(user_id=1, kind="memory_chunk", items=[(10, 1.0, _unit(0))])
+        segment = self.index._segments[(1, "memory_chunk")]
+        original_search = segment.search
+        held = []
+
+        def search(*args, **kwargs):
+            held.append(self.index._lock.locked())
+            return original_search(*args, **kwargs)
+
+        with patch.object(segment, "search", side_effect=search):
+            hits = self.index.search(user_id=1, kind="memory_chunk", vector=_unit(0), k=1)
+
+        self.assertEqual(hits[0][0], 10)
+        self.assertEqual(held, [False])
+
+
+class SyncVectorIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="vector-index-user",
+            email="vector-index@example.com",
+            password="testpass123",
+        )
+        self.index = NumpyVectorIndex(root=tempfile.mkdtemp())
+
+    def _create_embedding(self, index: int, vector) -> MemoryChunkEmbedding:
+        document = MemoryDocument.objects.create(
+            user=self.user,
+            virtual_path=f"/memory/item-{index}.md",
+            title="Memory",
+            content_markdown="# Memory",
+            status=MemoryRecordStatus.ACTIVE,
+        )
+        chunk = MemoryChunk.objects.create(
+            document=document,
+            heading="Memory",
+            anchor="memory",
+            position=0,
+            content_text="text",
+            status=MemoryRecordStatus.ACTIVE,
+        )
+        return MemoryChunkEmbedding.objects.create(
+            chunk=chunk,
+            state=MemoryChunkEmbeddingState.READY,
+            vector=vector,
+        )
+
+    def test_sync_appends_ready_rows_and_drops_stale_ones(self):
+        kept = self._create_embedding(0, _unit(0, 1024))
+        dropped = self._create_embedding(1, _unit(1, 1024))
+
+        sync_vector_index(self.index, user_id=self.user.id, kind="memory_chunk")
+        self.assertEqual(
+            set(self.index.stamps(user_id=self.user.id, kind="memory_chunk")),
+            {kept.chunk_id, dropped.chunk_id},
+        )
+
+        dropped.state = MemoryChunkEmbeddingState.PENDING
+        dropped.vector = None
+        dropped.save(update_fields=["state", "vector", "updated_at"])
+        sync_vector_index(self.index, user_id=self.user.id, kind="memory_chunk")
+
+        self.assertEqual(set(self.index.stamps(user_id=self.user.id, kind="memory_chunk")), {kept.chunk_id})
+        hits = self.index.search(user_id=self.user.id, kind="memory_chunk", vector=_unit(0, 1024), k=5)
+        self.assertEqual([item_id for item_id, _distance in hits], [kept.chunk_id])
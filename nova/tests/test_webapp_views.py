@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
+from asgiref.sync import sync_to_async
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from nova.file_utils import DOWNLOAD_CHUNK_SIZE
 from nova.models.Thread import Thread
 from nova.models.UserFile import UserFile
 from nova.models.WebApp import WebApp
@@ -268,3 +271,70 @@ class WebAppViewsTests(TestCase):
 
         response = self.client.get(reverse("serve_webapp_file", args=[app.slug, "secrets.py"]))
         self.assertEqual(response.status_code, 404)
+
+    def _patch_ranged_storage(self):
+        calls = []
+
+        async def fake_iter_file_content(key, start=None, end=None):
+            calls.append((start, end))
+            content = self._stored_contents.get(key, b"")
+            yield content[start or 0:None if end is None else end + 1]
+
+        patcher = patch("nova.webapp.service.iter_file_content", new=fake_iter_file_content)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return calls
+
+    async def _streamed_body(self, response) -> bytes:
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    async def test_serve_webapp_streams_byte_ranges(self):
+        payload = bytes(range(256)) * 4
+        app = await sync_to_async(self._create_live_webapp)(
+            name="Media app",
+            source_root="/webapps/media",
+            files={"index.html": b"<h1>Main</h1>", "assets/clip.png": payload},
+        )
+        calls = self._patch_ranged_storage()
+        await self.async_client.aforce_login(self.user)
+        url = reverse("serve_webapp_file", args=[app.slug, "assets/clip.png"])
+
+        response = await self.async_client.get(url, headers={"Range": "bytes=100-199"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 100-199/{len(payload)}")
+        self.assertEqual(response["Content-Length"], "100")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("sandbox", response["Content-Security-Policy"])
+        self.assertEqual(await self._streamed_body(response), payload[100:200])
+
+        response = await self.async_client.get(url, headers={"Range": "bytes=-24"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(await self._streamed_body(response), payload[-24:])
+
+        response = await self.async_client.get(url, headers={"Range": "bytes=5000-"})
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(payload)}")
+
+        response = await self.async_client.get(url, headers={"Range": "bytes=0-1,5-6"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(await self._streamed_body(response), payload)
+        self.assertEqual(calls, [(100, 199), (len(payload) - 24, len(payload) - 1), (None, None)])
+
+    async def test_serve_webapp_streams_large_files_without_buffering(self):
+        payload = b"x" * (DOWNLOAD_CHUNK_SIZE + 1)
+        app = await sync_to_async(self._create_live_webapp)(
+            name="Large app",
+            source_root="/webapps/large",
+            files={"index.html": b"<h1>Main</h1>", "assets/big.js": payload},
+        )
+        calls = self._patch_ranged_storage()
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(reverse("serve_webapp_file", args=[app.slug, "assets/big.js"]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Length"], str(len(payload)))
+        self.assertIn("charset=utf-8", response["Content-Type"])
+        self.assertEqual(await self._streamed_body(response), payload)
+        self.assertEqual(calls, [(None, None)])
@@ -44,17 +44,6 @@ def file_list(request, thread_id):
     return JsonResponse({'files': tree}, status=200)
 
 
-async def async_read_file(file) -> bytes:
-    """Async-safe file reading with chunking to avoid RAM overload."""
-    @sync_to_async
-    def sync_read():
-        content = b''
-        for chunk in file.chunks():  # Use Django's chunked reading
-            content += chunk
-        return content
-    return await sync_read()
-
-
 @csrf_protect
 @require_GET
 @login_required(login_url='login')
@@ -115,10 +104,11 @@ async def file_upload(request, thread_id):
                 f"thread_{thread_id}_files",
                 {"type": "file_progress", "progress": progress}
             )
-            content = await async_read_file(file)
+            # The uploaded file is streamed to storage, not read into memory.
             return {
                 'path': path,
-                'content': content,
+                'source': file,
+                'size': file.size,
                 'mime_type': str(getattr(file, 'content_type', '') or '').strip().lower(),
             }
 
@@ -2,17 +2,22 @@
 from copy import deepcopy
 import posixpath
 
+from django.conf import settings
 from django.urls import reverse
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.csrf import csrf_protect
+from django.views.decorators.http import require_POST
 from nova.message_attachments import (
     build_explicit_message_attachment_query,
     build_message_attachment_inbox_paths,
 )
-from nova.models.Task import Task, TaskStatus
+from nova.models.Task import Task, TaskProgressEntry, TaskStatus
 from nova.models.Thread import Thread
 from nova.models.UserFile import UserFile
+from nova.runtime.agent_worker import request_agent_run_cancel
+from nova.tasks.execution_trace import load_execution_trace
 from nova.tasks.runtime_state import reconcile_stale_running_tasks
 
 TRACE_FILE_META_KEYS = {
@@ -160,20 +165,40 @@ def running_tasks(request, thread_id):
         thread=thread,
         user=request.user,
         status=TaskStatus.RUNNING,
-    ).values('id', 'status', 'current_response', 'progress_logs')
+    ).values('id', 'status', 'current_response')
 
     tasks_data = []
     for task in running_tasks:
+        last_entry = TaskProgressEntry.objects.filter(task_id=task['id']).order_by('-id').first()
         tasks_data.append({
             'id': task['id'],
             'status': task['status'],
             'current_response': task['current_response'],
-            'last_progress': task['progress_logs'][-1] if task['progress_logs'] else None
+            'last_progress': last_entry.as_log() if last_entry else None
         })
 
     return JsonResponse({'running_tasks': tasks_data})
 
 
+@csrf_protect
+@require_POST
+@login_required(login_url='login')
+def cancel_task(request, task_id):
+    """Ask the agent worker to stop a running task."""
+    task = get_object_or_404(Task.objects.only("id", "status"), id=task_id, user=request.user)
+    if task.status != TaskStatus.RUNNING:
+        return JsonResponse({
+            'status': 'ignored',
+            'reason': f'Task already {task.status}',
+            'task_id': task.id,
+        })
+    if not settings.AGENT_WORKER_ENABLED:
+        return JsonResponse({'error': 'Running tasks can only be canceled with the agent worker.'}, status=409)
+
+    request_agent_run_cancel(task.id)
+    return JsonResponse({'status': 'cancel_requested', 'task_id': task.id})
+
+
 @login_required
 def execution_trace(request, task_id):
     task = get_object_or_404(
@@ -186,7 +211,7 @@ def execution_trace(request, task_id):
             "status": "OK",
             "task_status": task.status,
             "execution_trace": _enrich_execution_trace(
-                task.execution_trace if isinstance(task.execution_trace, dict) else {},
+                load_execution_trace(task),
                 user=request.user,
                 thread=task.thread,
             ),
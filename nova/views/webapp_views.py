@@ -3,20 +3,47 @@ from urllib.parse import quote, urlsplit
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.views import redirect_to_login
-from django.http import Http404, HttpResponse, HttpResponseRedirect, JsonResponse
+from django.http import Http404, HttpResponse, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.clickjacking import xframe_options_exempt
 from django.views.decorators.http import require_http_methods
 from asgiref.sync import async_to_sync
 
+from nova.file_utils import DOWNLOAD_CHUNK_SIZE
 from nova.models.WebApp import WebApp
 from nova.models.Thread import Thread
 from nova.webapp.service import delete_webapp as delete_live_webapp
 from nova.webapp.service import describe_webapp as describe_live_webapp
 from nova.utils import compute_external_base, compute_webapp_public_url
 from nova.webapp.service import get_live_file_for_public_webapp, get_live_file_for_webapp, load_live_webapp_content
-from nova.webapp.service import list_thread_webapps
+from nova.webapp.service import list_thread_webapps, stream_live_webapp_content
+
+
+def _parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    """Return the inclusive ``(start, end)`` of a single ``bytes=`` range.
+
+    Multiple or malformed ranges return None so the full file is served;
+    ranges outside the file raise ValueError.
+    """
+    unit, _, spec = str(header or "").strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    first, last = first.strip(), last.strip()
+    if not sep or not (first or last) or any(part and not part.isdigit() for part in (first, last)):
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("Unsatisfiable range")
+    return start, min(int(last) if last else size - 1, size - 1)
 
 
 def _configured_webapp_origin() -> str:
@@ -92,12 +119,37 @@ def serve_webapp(request, slug: str, path: str | None = None):
     if live_file is None:
         raise Http404("Webapp file not found.")
 
-    content = load_live_webapp_content(live_file)
     mime = str(live_file.mime_type or "application/octet-stream")
     if mime.startswith("text/") or mime in {"application/javascript", "application/json", "application/manifest+json"}:
-        response = HttpResponse(content, content_type=f"{mime}; charset=utf-8")
+        content_type = f"{mime}; charset=utf-8"
+    else:
+        content_type = mime
+
+    size = int(live_file.user_file.size or 0)
+    range_header = request.META.get("HTTP_RANGE", "")
+    if not range_header and size <= DOWNLOAD_CHUNK_SIZE:
+        response = HttpResponse(load_live_webapp_content(live_file), content_type=content_type)
     else:
-        response = HttpResponse(content, content_type=mime)
+        # Large assets and range requests are streamed from storage.
+        try:
+            byte_range = _parse_byte_range(range_header, size) if range_header else None
+        except ValueError:
+            response = HttpResponse(status=416, content_type=content_type)
+            response.headers['Content-Range'] = f"bytes */{size}"
+        else:
+            if byte_range is None:
+                response = StreamingHttpResponse(stream_live_webapp_content(live_file), content_type=content_type)
+                response.headers['Content-Length'] = str(size)
+            else:
+                start, end = byte_range
+                response = StreamingHttpResponse(
+                    stream_live_webapp_content(live_file, start, end),
+                    status=206,
+                    content_type=content_type,
+                )
+                response.headers['Content-Range'] = f"bytes {start}-{end}/{size}"
+                response.headers['Content-Length'] = str(end - start + 1)
+        response.headers['Accept-Ranges'] = 'bytes'
 
     response.headers['Content-Security-Policy'] = _webapp_csp(public_origin_request=is_webapp_origin)
     response.headers['Cache-Control'] = 'no-store'
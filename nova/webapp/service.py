@@ -10,7 +10,7 @@ from channels.layers import get_channel_layer
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
-from nova.file_utils import download_file_content
+from nova.file_utils import download_file_content, iter_file_content
 from nova.models.UserFile import UserFile
 from nova.models.WebApp import WebApp
 from nova.realtime.sidebar_updates import publish_webapps_update
@@ -533,3 +533,7 @@ async def maybe_touch_impacted_webapps(
 
 def load_live_webapp_content(live_file: LiveWebAppFile) -> bytes:
     return async_to_sync(download_file_content)(live_file.user_file)
+
+
+def stream_live_webapp_content(live_file: LiveWebAppFile, start: int | None = None, end: int | None = None):
+    return iter_file_content(live_file.user_file.key, start, end)
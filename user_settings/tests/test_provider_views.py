@@ -4,10 +4,12 @@ from unittest.mock import patch
 from unittest.mock import AsyncMock
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 
 from nova.models.Provider import LLMProvider, ProviderType
+from nova.providers.validation import cache_validation_result
 
 User = get_user_model()
 
@@ -29,6 +31,7 @@ class ProviderViewsTests(TestCase):
             password="pass123",
         )
         self.client.login(username="provider-user", password="pass123")
+        cache.clear()
 
     def _payload(self, **overrides):
         payload = {
@@ -79,6 +82,65 @@ class ProviderViewsTests(TestCase):
             r'id="test-provider-btn"[^>]*disabled',
         )
 
+    def _create_provider_with_cached_validation(self) -> LLMProvider:
+        provider = LLMProvider.objects.create(
+            user=self.user,
+            name="Vision Provider",
+            provider_type=ProviderType.OPENAI,
+            model="gpt-4o-mini",
+            api_key="dummy-secret",
+            max_context_tokens=4096,
+        )
+        cache_validation_result(
+            provider,
+            {
+                "validation_status": LLMProvider.ValidationStatus.VALID,
+                "verification_summary": "Validated successfully.",
+                "verified_operations": _verified_operations(),
+            },
+            declared_snapshot={
+                "metadata_source_label": "OpenRouter models API",
+                "inputs": {"text": "pass", "image": "pass"},
+                "outputs": {"text": "pass"},
+                "operations": {"chat": "pass", "tools": "pass"},
+                "limits": {},
+                "model_state": {},
+            },
+        )
+        return provider
+
+    @patch("user_settings.views.provider.validate_provider_configuration_task.apply_async")
+    def test_save_reuses_cached_result_of_identical_configuration(self, mocked_apply_async):
+        provider = self._create_provider_with_cached_validation()
+
+        self.client.post(
+            reverse("user_settings:provider-edit", args=[provider.pk]),
+            data=self._payload(api_key=""),
+        )
+
+        mocked_apply_async.assert_not_called()
+        provider.refresh_from_db()
+        self.assertEqual(provider.validation_status, LLMProvider.ValidationStatus.VALID)
+        self.assertEqual(provider.validated_fingerprint, provider.compute_validation_fingerprint())
+        self.assertEqual(provider.known_image_input_status, "pass")
+        self.assertIn("Metadata: OpenRouter models API.", provider.capability_profile_summary)
+
+    @patch("user_settings.views.provider.validate_provider_configuration_task.apply_async")
+    def test_test_provider_action_probes_even_when_a_result_is_cached(self, mocked_apply_async):
+        provider = self._create_provider_with_cached_validation()
+
+        self.client.post(
+            reverse("user_settings:provider-edit", args=[provider.pk]),
+            data=self._payload(action="test_provider", api_key=""),
+        )
+
+        provider.refresh_from_db()
+        self.assertEqual(provider.validation_status, LLMProvider.ValidationStatus.TESTING)
+        mocked_apply_async.assert_called_once_with(
+            args=[provider.pk, provider.validation_requested_fingerprint],
+            task_id=provider.validation_task_id,
+        )
+
     def test_save_without_test_keeps_provider_untested(self):
         response = self.client.post(
             reverse("user_settings:provider-add"),
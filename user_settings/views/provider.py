@@ -23,6 +23,7 @@ from nova.providers import (
     list_provider_models,
     resolve_provider_capability_snapshot,
 )
+from nova.providers.validation import apply_cached_validation_result
 from nova.tasks.provider_validation_tasks import validate_provider_configuration_task
 from user_settings.forms import LLMProviderForm
 from user_settings.mixins import (
@@ -100,6 +101,7 @@ class ProviderVerificationActionMixin:
             provider.user = self.request.user
         provider.save()
 
+        # An explicit verification always probes; the cache only serves plain saves.
         previous_state = {
             "validation_status": provider.validation_status,
             "validated_fingerprint": provider.validated_fingerprint,
@@ -175,6 +177,17 @@ class ProviderVerificationActionMixin:
         )
         return redirect(self._build_edit_url(provider))
 
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        provider = self.object
+        if provider.has_model_configured and provider.validation_status in {
+            LLMProvider.ValidationStatus.UNTESTED,
+            LLMProvider.ValidationStatus.STALE,
+        }:
+            # Saving a configuration that was verified recently reuses that result.
+            apply_cached_validation_result(provider)
+        return response
+
     def post(self, request, *args, **kwargs):
         if request.POST.get("action") == self.test_action_name:
             return self._handle_provider_verification_action()